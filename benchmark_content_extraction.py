@@ -0,0 +1,180 @@
+"""
+Benchmark: single-pass ComponentIndex vs. per-call subtree scans in the content extractor.
+
+Usage:
+    python benchmark_content_extraction.py [page.html ...] [--sections N] [--extra-rules N] [--repeat N]
+
+Saved pages (e.g. purina.fr articles saved from the browser) are benchmarked
+as given; without files a synthetic purina.fr-like article is generated with
+N text blocks, text-image components and an articles list. Both runs must
+produce the same document. "DOM queries" is the time spent building the index
+and answering the component handlers' lookups; the rest of a build is spent in
+python-docx. --extra-rules adds component rules that never match, to show
+that the single pass does not slow down with the number of rules.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+import soupsieve
+
+from config import EXTRACTION_RULES_DIR
+from utils.content_extraction import ContentDocxBuilder, ComponentIndex
+from utils.extraction_rules import DEFAULT_RULES_FILE, ExtractionRules, read_rules
+
+TEXT_BLOCK = "clearfix text-formatted field field--name-field-c-text field--type-text-long field--label-hidden field__item"
+
+
+class ScanIndex:
+    """Previous behaviour: every question re-scans the subtree with bs4 (soupsieve selectors)."""
+
+    def __init__(self, root, rules):
+        self.rules = rules
+
+    def _marker(self, tag, key):
+        selector = self.rules.markers[key]
+        return bool(selector) and soupsieve.match(selector, tag)
+
+    def is_excluded(self, tag):
+        return self._marker(tag, "exclude")
+
+    def is_text_block(self, tag):
+        return self._marker(tag, "text_block")
+
+    def is_block(self, tag):
+        return self._marker(tag, "block_marker")
+
+    def component(self, tag):
+        if self.rules.component_tags and tag.name not in self.rules.component_tags:
+            return None
+        for rule in self.rules.components:
+            if soupsieve.match(rule["match"], tag):
+                return rule, ExtractionRules.component_name(rule, tag)
+        return None
+
+    def find(self, tag, kind):
+        return tag.select_one(kind)
+
+    def find_all(self, tag, kind):
+        return tag.select(kind)
+
+    def inside(self, tag, kind):
+        return any(soupsieve.match(kind, parent) for parent in tag.parents if parent.name != "[document]")
+
+
+def benchmark_rules(extra: int) -> ExtractionRules:
+    """Default rules plus `extra` component rules that never match (cost of the rule count)."""
+    data = read_rules(os.path.join(EXTRACTION_RULES_DIR, DEFAULT_RULES_FILE))
+    unused = [
+        {"name": f"Unused {i}", "match": f".unused-{i}", "handler": "summary", "text": f".unused-{i}--text"}
+        for i in range(extra)
+    ]
+    data["components"] = unused + data["components"]
+    return ExtractionRules(data, source="benchmark")
+
+
+def timed(index_class):
+    """Subclass of `index_class` accumulating the time spent in its methods."""
+    spent = [0.0]
+
+    def wrap(method):
+        def inner(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                spent[0] += time.perf_counter() - start
+        return inner
+
+    names = ("__init__", "is_excluded", "is_text_block", "is_block", "component", "find", "find_all", "inside")
+    cls = type(f"Timed{index_class.__name__}", (index_class,),
+               {name: wrap(getattr(index_class, name)) for name in names})
+    return cls, spent
+
+
+def synthetic_article(sections: int) -> str:
+    """purina.fr-like article: hero, nested text blocks, text-image components, articles list."""
+    parts = [
+        "<html><head><title>Prénoms japonais pour chien</title>"
+        "<meta name='description' content='Idées de prénoms.'></head><body>"
+        "<header><nav><a href='/'>Accueil</a></nav></header><main>"
+        "<div class='article--hero'><div class='hero--article-category'><a href='/chien'>Chien</a></div>"
+        "<div class='hero--image'><img src='/img/hero.jpg' alt='Chiot'></div><h1>Prénoms japonais</h1></div>"
+    ]
+    for i in range(sections):
+        parts.append(
+            f"<div class='layout'><div class='region'><div class='{TEXT_BLOCK}'>"
+            f"<h2>Section {i}</h2><p>Texte de la section {i} avec un <a href='/lien/{i}'>lien</a> "
+            f"et du <strong>gras</strong>.</p><ul><li>Akira {i}</li><li>Haru {i}</li></ul></div></div></div>"
+            f"<div class='component--text-image'><div class='media'><img src='/img/{i}.jpg' alt='Image {i}'></div>"
+            f"<div class='text-content'><h3>Conseil {i}</h3><p>Un paragraphe de conseil numéro {i}.</p></div></div>"
+        )
+    cards = "".join(
+        f"<div class='card'><div class='field--name-field-article-category'><a href='/cat'>Chien</a></div>"
+        f"<div class='wrap'><div class='inner'><a href='/article/{i}'><img src='/img/a{i}.jpg'></a></div>"
+        f"<div class='field--name-title'>Article {i}</div></div></div>"
+        for i in range(sections)
+    )
+    parts.append(
+        f"<div class='component--articles-list'><h2>À lire aussi</h2><div class='view'>{cards}</div>"
+        f"<div class='more'><a href='/articles'>Voir tous les articles</a></div></div>"
+    )
+    parts.append("<div class='component--newsletter'><p>Newsletter</p></div></main><footer></footer></body></html>")
+    return "".join(parts)
+
+
+def body_text(doc) -> str:
+    return doc.element.body.xml
+
+
+def time_build(url, soup, index_class, rules, repeat):
+    """Best (total, DOM query) seconds over `repeat` builds, and the last document."""
+    best = None
+    doc = None
+    for _ in range(repeat):
+        cls, spent = timed(index_class)
+        start = time.perf_counter()
+        doc = ContentDocxBuilder(url, index_class=cls, rules=rules).build(soup)
+        elapsed = (time.perf_counter() - start, spent[0])
+        best = elapsed if best is None or elapsed[0] < best[0] else best
+    return best, doc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pages", nargs="*", help="Saved HTML pages")
+    parser.add_argument("--sections", type=int, default=400, help="Sections of the synthetic article")
+    parser.add_argument("--extra-rules", type=int, default=0,
+                        help="Non-matching component rules added before the default ones")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.pages:
+        cases = [(os.path.basename(p), open(p, encoding="utf-8", errors="replace").read()) for p in args.pages]
+    else:
+        cases = [(f"synthetic ({args.sections} sections)", synthetic_article(args.sections))]
+
+    rules = benchmark_rules(args.extra_rules)
+    ok = True
+    for name, html in cases:
+        soup = BeautifulSoup(html, "lxml")
+        url = "https://www.purina.fr/benchmark"
+        scan_time, scan_doc = time_build(url, soup, ScanIndex, rules, args.repeat)
+        index_time, index_doc = time_build(url, soup, ComponentIndex, rules, args.repeat)
+        same = body_text(scan_doc) == body_text(index_doc)
+        ok = ok and same
+        print(f"{name}:")
+        print(f"  {'':16}{'total':>12}{'DOM queries':>14}")
+        print(f"  {'subtree scans':16}{scan_time[0] * 1000:9.1f} ms{scan_time[1] * 1000:11.1f} ms")
+        print(f"  {'ComponentIndex':16}{index_time[0] * 1000:9.1f} ms{index_time[1] * 1000:11.1f} ms"
+              f"  ({scan_time[1] / max(index_time[1], 1e-9):.1f}x on queries)")
+        print(f"  identical document: {'yes' if same else 'NO'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Benchmark: python-docx table API vs. the bulk DocxXmlWriter.
+
+Usage:
+    python benchmark_docx_tables.py [--rows 100 500 2000] [--cols 4] [--repeat 3]
+
+Each case builds a document with one styled table (bold header row, a link
+column) of rows x cols cells, then reads the cell texts back to check both
+documents hold the same content.
+"""
+
+import argparse
+import sys
+import time
+
+from docx import Document
+from docx.shared import RGBColor
+
+from utils.docx_writer import DocxXmlWriter, run_xml
+
+STYLE = "Light Grid Accent 1"
+
+
+def sample_rows(rows: int, cols: int):
+    header = [f"Column {j}" for j in range(cols)]
+    body = [
+        [f"https://www.purina.fr/articles/{i}" if j == cols - 1 else f"Cell {i}.{j}" for j in range(cols)]
+        for i in range(rows)
+    ]
+    return [header] + body
+
+
+def build_with_api(data):
+    """Previous approach: add_table, then runs added cell by cell."""
+    doc = Document()
+    table = doc.add_table(rows=len(data), cols=len(data[0]))
+    table.style = STYLE
+    for i, (row, values) in enumerate(zip(table.rows, data)):
+        cells = row.cells
+        for j, value in enumerate(values):
+            r = cells[j].paragraphs[0].add_run(value)
+            if i == 0:
+                r.bold = True
+            elif value.startswith("http"):
+                r.font.color.rgb = RGBColor(0, 0, 255)
+                r.font.underline = True
+    return doc
+
+
+def build_with_writer(data):
+    doc = Document()
+    writer = DocxXmlWriter(doc)
+    rows = []
+    for i, values in enumerate(data):
+        cells = []
+        for value in values:
+            if i == 0:
+                cells.append(run_xml(value, bold=True))
+            elif value.startswith("http"):
+                cells.append(writer.hyperlink(value, run_xml(value, color="0000FF", underline=True)))
+            else:
+                cells.append(run_xml(value))
+        rows.append(cells)
+    writer.table(rows, STYLE, header_rows=1)
+    writer.flush()
+    return doc
+
+
+def cell_texts(doc):
+    return [[cell.text for cell in row.cells] for row in doc.tables[0].rows]
+
+
+def best_of(fn, data, repeat):
+    best, doc = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        doc = fn(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, doc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--cols", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ok = True
+    print(f"{'cells':>8}{'python-docx':>14}{'DocxXmlWriter':>16}{'speedup':>10}  same")
+    for rows in args.rows:
+        data = sample_rows(rows, args.cols)
+        api_time, api_doc = best_of(build_with_api, data, args.repeat)
+        xml_time, xml_doc = best_of(build_with_writer, data, args.repeat)
+        same = cell_texts(api_doc) == cell_texts(xml_doc)
+        ok = ok and same
+        print(f"{(rows + 1) * args.cols:>8}{api_time * 1000:>11.1f} ms{xml_time * 1000:>13.1f} ms"
+              f"{api_time / xml_time:>9.1f}x  {'yes' if same else 'NO'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Benchmark: serial Pillow compression vs. the CompressionEngine process pool.
+
+Usage:
+    python benchmark_image_compression.py [folder] [--count N] [--format webp] [--quality 80] [--processes N ...]
+
+Without a folder, N synthetic product photos (1600x1200 JPEG) are
+generated. Each run compresses every file of the folder into a temporary
+output folder; the speedup approaches the process count on an otherwise
+idle machine with that many cores.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+from config import SUPPORTED_IMAGE_FORMATS
+from utils.image_compression import CompressionEngine, compress_file
+
+
+def sample_photos(folder, count):
+    for i in range(count):
+        Image.effect_noise((1600, 1200), 30 + i % 20).convert("RGB").save(
+            os.path.join(folder, f"product_{i:04d}.jpg"), quality=95
+        )
+
+
+def jobs_for(source_dir, output_dir, fmt):
+    names = sorted(f for f in os.listdir(source_dir) if f.lower().endswith(SUPPORTED_IMAGE_FORMATS))
+    return [(os.path.join(source_dir, f), os.path.join(output_dir, f"{os.path.splitext(f)[0]}.{fmt}")) for f in names]
+
+
+def run_serial(jobs, fmt, quality):
+    return [compress_file(src, out, fmt, quality) for src, out in jobs]
+
+
+def run_engine(jobs, fmt, quality, processes):
+    with CompressionEngine(fmt, quality, processes) as engine:
+        return list(engine.compress_all(jobs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("folder", nargs="?")
+    parser.add_argument("--count", type=int, default=48)
+    parser.add_argument("--format", default="webp")
+    parser.add_argument("--quality", type=int, default=80)
+    parser.add_argument("--processes", type=int, nargs="+",
+                        default=sorted({2, max(1, (os.cpu_count() or 2) - 1), os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = args.folder
+        if not source:
+            source = os.path.join(tmp, "photos")
+            os.makedirs(source)
+            sample_photos(source, args.count)
+        out = os.path.join(tmp, "out")
+        os.makedirs(out)
+        jobs = jobs_for(source, out, args.format)
+        print(f"{len(jobs)} files, {os.cpu_count()} CPUs")
+
+        start = time.perf_counter()
+        serial = run_serial(jobs, args.format, args.quality)
+        serial_time = time.perf_counter() - start
+        saved = sum(r.original_size - r.compressed_size for r in serial if not r.error)
+        print(f"{'serial':>12}{serial_time:>9.2f} s   {saved / (1024 * 1024):.1f} MB saved")
+
+        ok = True
+        for processes in args.processes:
+            start = time.perf_counter()
+            results = run_engine(jobs, args.format, args.quality, processes)
+            elapsed = time.perf_counter() - start
+            same = sorted(r[:4] for r in results) == sorted(r[:4] for r in serial)
+            ok = ok and same
+            print(f"{f'{processes} proc':>12}{elapsed:>9.2f} s{serial_time / elapsed:>7.1f}x  "
+                  f"same output: {'yes' if same else 'NO'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,7 @@ MAX_EXCEL_CELL_LENGTH = 32767
 RESOURCES_DIR = os.path.join(os.path.dirname(__file__), 'resources')
 DARK_THEME_PATH = os.path.join(RESOURCES_DIR, 'dark_theme.qss')
 LOGO_PATH = os.path.join(RESOURCES_DIR, 'nestle_logo.png')
+EXTRACTION_RULES_DIR = os.path.join(RESOURCES_DIR, 'extraction_rules')
 
 # HTTP Request Configuration
 HEADERS = {
@@ -29,6 +30,25 @@ TIMEOUT_SHORT = 15     # Quick checks (HEAD requests)
 MAX_CONCURRENCY = 10      # Default concurrent requests
 MAX_CONCURRENCY_META = 8  # Meta checker concurrency
 MAX_CONCURRENCY_PRODUCT = 8  # Product sheet checker concurrency
+MAX_CONCURRENCY_REDIRECT = 32  # Redirect map validation (HEAD requests only)
+MAX_CONCURRENCY_IMAGE_PAGES = 4  # Pages fetched at once by the image downloader
+MAX_CONCURRENCY_IMAGES = 16  # Image downloads shared by all pages of the image downloader
+MAX_CONCURRENCY_PER_HOST = 8  # Connections per host for image list downloads
+
+# Asset Check Settings
+MAX_ASSET_SIZE_KB = 500  # Assets larger than this are reported as oversized
+
+# Content Extractor image thumbnails
+THUMBNAIL_MAX_PX = 320  # Longest side of thumbnails embedded in extracted documents
+THUMBNAIL_MAX_DOWNLOAD_MB = 20  # Larger source images are skipped
+THUMBNAIL_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.mtv2', 'thumbnails')
+
+# Redirect Settings
+MAX_REDIRECT_HOPS = 10  # Maximum hops followed when resolving a redirect chain
+
+# Product Catalog (SQLite index built by the crawler from JSON-LD)
+PRODUCT_CATALOG_PATH = os.path.join(os.path.dirname(__file__), 'data', 'product_catalog.sqlite3')
+PRODUCT_CATALOG_MAX_AGE_HOURS = 24  # Catalog records older than this are refetched
 
 # SSL Configuration
 # Note: ssl=False is maintained for backward compatibility per user request
@@ -39,6 +59,13 @@ SSL_VERIFY = False  # Set to True to enable SSL certificate verification
 SUPPORTED_IMAGE_FORMATS = ('.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp', '.avif')
 DEFAULT_IMAGE_QUALITY = 85
 DEFAULT_IMAGE_FORMAT = 'jpg'
+IMAGE_MAX_DOWNLOAD_MB = 50  # Larger downloads are aborted by the image downloaders
+IMAGE_DOWNLOAD_RETRIES = 3  # Extra attempts after connection errors, timeouts and 408/429/5xx
+IMAGE_STORE_DIR = os.path.join(os.path.dirname(__file__), 'data', 'image_store')  # Content-addressed downloads
+IMAGE_SRCSET_POLICY = 'largest'  # srcset candidate to download: largest, smallest, <N>w, <N>x or all
+TARGET_SIZE_MIN_QUALITY = 20  # Lowest encoder quality the target-file-size search goes down to
+RESPONSIVE_WIDTHS = (320, 640, 1024, 1920)  # Default widths of a responsive image set
+RESPONSIVE_FORMATS = ('jpg', 'webp')  # Default formats of a responsive image set
 
 # UI Configuration
 DEFAULT_WINDOW_WIDTH = 1000
@@ -33,6 +33,10 @@ class BaseDownloaderGUI(QWidget):
         self.format_combo = QComboBox()
         self.format_combo.addItems(["jpg", "png", "webp", "gif", "avif"])
         self.quality_spin = QSpinBox(minimum=1, maximum=100, value=85)
+        self.max_kb_spin = QSpinBox(minimum=0, maximum=100000, value=0, suffix=" KB", singleStep=50)
+        self.max_kb_spin.setSpecialValueText("Off")
+        self.max_kb_spin.setToolTip("Target file size: each image gets the highest quality (up to Quality) "
+                                    "that fits; the original is kept when re-encoding would be larger")
         
         format_quality_group = QGroupBox("Format and Compression")
         format_quality_layout = QHBoxLayout(format_quality_group)
@@ -41,6 +45,9 @@ class BaseDownloaderGUI(QWidget):
         format_quality_layout.addSpacing(20)
         format_quality_layout.addWidget(QLabel("Quality:"))
         format_quality_layout.addWidget(self.quality_spin)
+        format_quality_layout.addSpacing(20)
+        format_quality_layout.addWidget(QLabel("Max size:"))
+        format_quality_layout.addWidget(self.max_kb_spin)
         
         self.status_label = QLabel("Status: Ready")
         self.progress_bar_download = QProgressBar()
@@ -69,6 +76,10 @@ class BaseDownloaderGUI(QWidget):
         return [output_layout, format_quality_group, self.status_label, 
                 download_layout, compress_layout, button_layout]
     
+    def max_kb(self):
+        """Target file size in KB, or None when the size limit is off."""
+        return self.max_kb_spin.value() or None
+
     def processing_finished(self, status):
         """
         Handle the completion of image processing.
@@ -9,12 +9,16 @@ import datetime
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QRadioButton,
     QLineEdit, QLabel, QProgressBar, QFileDialog, QCheckBox, QMessageBox,
-    QGroupBox
+    QGroupBox, QSpinBox
 )
 from openpyxl import Workbook
 
+from config import MAX_ASSET_SIZE_KB
 from workers.broken_link_worker import BrokenLinkWorker
 
+ASSET_HEADERS = ["Asset URL", "Type", "Status", "Category", "Content-Type", "Size (KB)",
+                 "Oversized", "Pages", "Found On", "Final URL", "Error"]
+
 
 class BrokenLinkInspectorGUI(QWidget):
     """Sub-tab 'Broken Link Inspector' within the Crawler."""
@@ -56,6 +60,16 @@ class BrokenLinkInspectorGUI(QWidget):
         self.same_domain_cb.setChecked(True)
         layout.addWidget(self.same_domain_cb)
 
+        asset_layout = QHBoxLayout()
+        self.assets_cb = QCheckBox("Check page assets instead of links (images, CSS, JS, PDFs)")
+        self.max_asset_spin = QSpinBox(minimum=1, maximum=100000, value=MAX_ASSET_SIZE_KB)
+        self.max_asset_spin.setSuffix(" KB")
+        asset_layout.addWidget(self.assets_cb)
+        asset_layout.addWidget(QLabel("Oversized above:"))
+        asset_layout.addWidget(self.max_asset_spin)
+        asset_layout.addStretch()
+        layout.addLayout(asset_layout)
+
         # --------- Controls ----------
         controls = QHBoxLayout()
         self.run_btn = QPushButton("Run check")
@@ -98,6 +112,7 @@ class BrokenLinkInspectorGUI(QWidget):
 
         # Connections
         self.mode_single.toggled.connect(self._on_mode_change)
+        self.assets_cb.toggled.connect(self._on_mode_change)
         self.run_btn.clicked.connect(self.start_check)
         self.stop_btn.clicked.connect(self.stop_check)
         self.export_btn.clicked.connect(self.export_results)
@@ -108,10 +123,11 @@ class BrokenLinkInspectorGUI(QWidget):
     def _on_mode_change(self, is_single: bool):
         if self.mode_single.isChecked():
             self.url_input.setPlaceholderText("Ex (single): https://www.site.com/page")
-            self.same_domain_cb.setEnabled(True)
+            self.same_domain_cb.setEnabled(not self.assets_cb.isChecked())
         else:
             self.url_input.setPlaceholderText("Ex (sitemap): https://www.site.com/sitemap.xml")
             self.same_domain_cb.setEnabled(False)
+        self.max_asset_spin.setEnabled(self.assets_cb.isChecked())
 
     def log(self, msg: str):
         self.log_box.append(msg)
@@ -160,7 +176,10 @@ class BrokenLinkInspectorGUI(QWidget):
         self.run_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
 
-        self.worker = BrokenLinkWorker(mode=mode, root_url=url, same_domain_only=same_domain)
+        self.worker = BrokenLinkWorker(
+            mode=mode, root_url=url, same_domain_only=same_domain,
+            check_assets=self.assets_cb.isChecked(), max_asset_kb=self.max_asset_spin.value()
+        )
         self.worker.progress_update.connect(self.progress.setValue)
         self.worker.log_update.connect(self.log)
         self.worker.finished.connect(self.on_worker_finished)
@@ -192,13 +211,19 @@ class BrokenLinkInspectorGUI(QWidget):
         c4 = sum(1 for r in self.results if r["category"] == "client_error")
         c5 = sum(1 for r in self.results if r["category"] == "server_error")
         err = sum(1 for r in self.results if r["category"] == "network_error")
+        oversized = [r for r in self.results if r.get("oversized")]
 
-        self.stats_label.setText(
-            f"Checked: {total} | OK: {ok} | Redirect: {redirect} | 4xx: {c4} | 5xx: {c5} | Errors: {err}"
-        )
+        stats = f"Checked: {total} | OK: {ok} | Redirect: {redirect} | 4xx: {c4} | 5xx: {c5} | Errors: {err}"
+        if self._is_asset_results():
+            stats += f" | Oversized: {len(oversized)}"
+        self.stats_label.setText(stats)
 
         def fmt(r):
             status = r["status"] if r["status"] is not None else "ERR"
+            if "asset_type" in r:
+                size = self._size_kb(r)
+                size_txt = f" {size} KB" if size != "" else ""
+                return f"[{status}] ({r['asset_type']}{size_txt}) {r['url']}"
             return f"[{status}] ({r['category']}) {r['url']}"
 
         broken_first = [
@@ -215,6 +240,11 @@ class BrokenLinkInspectorGUI(QWidget):
             lines.extend(fmt(r) for r in broken_first)
             lines.append("")
 
+        if oversized:
+            lines.append("=== OVERSIZED ===")
+            lines.extend(fmt(r) for r in sorted(oversized, key=lambda r: -(r["content_length"] or 0)))
+            lines.append("")
+
         if redirects:
             lines.append("=== REDIRECTS ===")
             lines.extend(fmt(r) for r in redirects)
@@ -226,6 +256,29 @@ class BrokenLinkInspectorGUI(QWidget):
 
         self.results_box.setPlainText("\n".join(lines))
 
+    def _is_asset_results(self) -> bool:
+        return bool(self.results) and "asset_type" in self.results[0]
+
+    @staticmethod
+    def _size_kb(r):
+        length = r.get("content_length")
+        return round(length / 1024, 1) if length else ""
+
+    def _asset_row(self, r):
+        return [
+            r["url"],
+            r["asset_type"],
+            r["status"],
+            r["category"],
+            r["content_type"],
+            self._size_kb(r),
+            "TRUE" if r["oversized"] else "FALSE",
+            r["pages"],
+            r["found_on"],
+            r["final_url"],
+            r["error"],
+        ]
+
     def export_results(self):
         if not self.results:
             QMessageBox.warning(self, "No data", "No results to export.")
@@ -238,7 +291,9 @@ class BrokenLinkInspectorGUI(QWidget):
 
         ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         mode = "single" if self.mode_single.isChecked() else "sitemap"
-        filename = f"broken_links_{mode}_{ts}.xlsx"
+        is_assets = self._is_asset_results()
+        prefix = "broken_assets" if is_assets else "broken_links"
+        filename = f"{prefix}_{mode}_{ts}.xlsx"
         path = os.path.join(folder, filename)
 
         wb = Workbook()
@@ -261,6 +316,31 @@ class BrokenLinkInspectorGUI(QWidget):
         ws_sum.append(["Client error (4xx)", c4])
         ws_sum.append(["Server error (5xx)", c5])
         ws_sum.append(["Network / other errors", err])
+        if is_assets:
+            ws_sum.append(["Oversized assets", sum(1 for r in self.results if r["oversized"])])
+
+        if is_assets:
+            ws_all = wb.create_sheet("All")
+            ws_all.append(ASSET_HEADERS)
+            for r in self.results:
+                ws_all.append(self._asset_row(r))
+
+            ws_broken = wb.create_sheet("Broken")
+            ws_broken.append(ASSET_HEADERS)
+            for r in self.results:
+                if r["category"] in ("client_error", "server_error", "network_error"):
+                    ws_broken.append(self._asset_row(r))
+
+            ws_big = wb.create_sheet("Oversized")
+            ws_big.append(ASSET_HEADERS)
+            for r in sorted(self.results, key=lambda r: -(r["content_length"] or 0)):
+                if r["oversized"]:
+                    ws_big.append(self._asset_row(r))
+
+            wb.save(path)
+            self.log(f"[EXPORT] Excel report saved to: {path}")
+            QMessageBox.information(self, "Export", f"Report saved to:\n{path}")
+            return
 
         # All results
         ws_all = wb.create_sheet("All")
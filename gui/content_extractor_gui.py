@@ -1,14 +1,18 @@
 """
 Content Extractor GUI Tab.
 
-Allows users to extract structured content from a URL and save it as a Word document.
+Allows users to extract structured content from a URL and save it as a Word document
+(or Markdown / HTML), or to convert a whole URL list / sitemap in batch.
 """
 
+import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
-    QLabel, QTextEdit, QFileDialog, QMessageBox
+    QLabel, QTextEdit, QFileDialog, QMessageBox, QRadioButton, QGroupBox,
+    QSpinBox, QCheckBox, QProgressBar
 )
 
+from config import MAX_CONCURRENCY
 from workers.content_extractor_worker import ContentExtractorWorker
 
 
@@ -23,13 +27,46 @@ class ContentExtractorGUI(QWidget):
     def initUI(self):
         layout = QVBoxLayout()
 
+        # Mode
+        mode_group = QGroupBox("Mode")
+        mode_layout = QHBoxLayout()
+        self.mode_single = QRadioButton("Single URL")
+        self.mode_batch = QRadioButton("Batch (URL list / sitemap)")
+        self.mode_single.setChecked(True)
+        mode_layout.addWidget(self.mode_single)
+        mode_layout.addWidget(self.mode_batch)
+        mode_group.setLayout(mode_layout)
+        layout.addWidget(mode_group)
+
         # URL Input
-        url_layout = QHBoxLayout()
+        self.single_widget = QWidget()
+        url_layout = QHBoxLayout(self.single_widget)
+        url_layout.setContentsMargins(0, 0, 0, 0)
         url_layout.addWidget(QLabel("URL:"))
         self.url_input = QLineEdit()
         self.url_input.setPlaceholderText("https://example.com/article")
         url_layout.addWidget(self.url_input)
-        layout.addLayout(url_layout)
+        layout.addWidget(self.single_widget)
+
+        # Batch Input
+        self.batch_group = QGroupBox("Batch input")
+        batch_layout = QVBoxLayout()
+        self.urls_input = QTextEdit()
+        self.urls_input.setPlaceholderText("One page URL or sitemap.xml per line")
+        batch_layout.addWidget(self.urls_input)
+        opts = QHBoxLayout()
+        opts.addWidget(QLabel("Concurrent fetches:"))
+        self.concurrency_spin = QSpinBox(minimum=1, maximum=64, value=MAX_CONCURRENCY)
+        opts.addWidget(self.concurrency_spin)
+        opts.addWidget(QLabel("Processes:"))
+        self.processes_spin = QSpinBox(minimum=1, maximum=64, value=max(1, (os.cpu_count() or 2) - 1))
+        opts.addWidget(self.processes_spin)
+        self.zip_cb = QCheckBox("Write a single .zip")
+        opts.addWidget(self.zip_cb)
+        opts.addStretch()
+        batch_layout.addLayout(opts)
+        self.batch_group.setLayout(batch_layout)
+        layout.addWidget(self.batch_group)
 
         # Output Folder
         output_layout = QHBoxLayout()
@@ -41,13 +78,43 @@ class ContentExtractorGUI(QWidget):
         output_layout.addWidget(self.browse_btn)
         layout.addLayout(output_layout)
 
+        # Output Formats
+        formats_layout = QHBoxLayout()
+        formats_layout.addWidget(QLabel("Formats:"))
+        self.format_cbs = {
+            "docx": QCheckBox("Word (.docx)"),
+            "md": QCheckBox("Markdown (.md)"),
+            "html": QCheckBox("HTML (.html)"),
+        }
+        self.format_cbs["docx"].setChecked(True)
+        for cb in self.format_cbs.values():
+            formats_layout.addWidget(cb)
+        self.save_model_cb = QCheckBox("Keep content model (.json)")
+        self.save_model_cb.setToolTip("Cached models can be re-rendered to any format without refetching the page")
+        formats_layout.addWidget(self.save_model_cb)
+        self.embed_images_cb = QCheckBox("Embed image thumbnails")
+        self.embed_images_cb.setToolTip("Download the component images and show them in the Word tables (cached on disk)")
+        formats_layout.addWidget(self.embed_images_cb)
+        formats_layout.addStretch()
+        self.render_cached_btn = QPushButton("Render cached models...")
+        self.render_cached_btn.clicked.connect(self.render_cached_models)
+        formats_layout.addWidget(self.render_cached_btn)
+        layout.addLayout(formats_layout)
+
         # Buttons
         button_layout = QHBoxLayout()
         self.start_btn = QPushButton("Extract to Word")
         self.start_btn.clicked.connect(self.start_extraction)
+        self.stop_btn = QPushButton("Stop")
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.clicked.connect(self.stop_extraction)
         button_layout.addWidget(self.start_btn)
+        button_layout.addWidget(self.stop_btn)
         layout.addLayout(button_layout)
 
+        self.progress = QProgressBar()
+        layout.addWidget(self.progress)
+
         # Log Output
         layout.addWidget(QLabel("Log:"))
         self.log_output = QTextEdit()
@@ -56,6 +123,37 @@ class ContentExtractorGUI(QWidget):
 
         self.setLayout(layout)
 
+        self.mode_single.toggled.connect(self._on_mode_change)
+        self._on_mode_change()
+
+    def _on_mode_change(self):
+        batch = self.mode_batch.isChecked()
+        self.single_widget.setVisible(not batch)
+        self.batch_group.setVisible(batch)
+        self.start_btn.setText("Extract batch" if batch else "Extract")
+
+    def _selected_formats(self):
+        return [fmt for fmt, cb in self.format_cbs.items() if cb.isChecked()]
+
+    def render_cached_models(self):
+        """Render saved .json content models into the selected formats."""
+        formats = self._selected_formats()
+        output_folder = self.output_folder.text().strip()
+        if not formats or not output_folder:
+            QMessageBox.warning(self, "Input Error", "Please select an output folder and at least one format.")
+            return
+        paths, _ = QFileDialog.getOpenFileNames(self, "Select Content Models", output_folder, "Content models (*.json)")
+        if not paths:
+            return
+        try:
+            written = ContentExtractorWorker.render_cached(
+                paths, output_folder, formats, embed_images=self.embed_images_cb.isChecked()
+            )
+        except Exception as e:
+            self.extraction_error(str(e))
+            return
+        self.log_output.append(f"✓ Rendered {len(written)} file(s) from {len(paths)} cached model(s)")
+
     def browse_output_folder(self):
         """Open folder selection dialog."""
         folder = QFileDialog.getExistingDirectory(self, "Select Output Folder")
@@ -64,10 +162,15 @@ class ContentExtractorGUI(QWidget):
 
     def start_extraction(self):
         """Start the extraction process."""
-        url = self.url_input.text().strip()
         output_folder = self.output_folder.text().strip()
+        batch = self.mode_batch.isChecked()
+        url = self.url_input.text().strip()
+        urls = [u.strip() for u in self.urls_input.toPlainText().splitlines() if u.strip()]
 
-        if not url:
+        if batch and not urls:
+            QMessageBox.warning(self, "Input Error", "Please enter at least one URL or sitemap.")
+            return
+        if not batch and not url:
             QMessageBox.warning(self, "Input Error", "Please enter a URL.")
             return
 
@@ -75,17 +178,47 @@ class ContentExtractorGUI(QWidget):
             QMessageBox.warning(self, "Input Error", "Please select an output folder.")
             return
 
+        formats = self._selected_formats()
+        if not formats:
+            QMessageBox.warning(self, "Input Error", "Please select at least one output format.")
+            return
+
         self.log_output.clear()
-        self.log_output.append(f"Starting extraction for: {url}")
+        self.progress.setValue(0)
         self.start_btn.setEnabled(False)
 
         # Create and start worker
-        self.worker = ContentExtractorWorker(url, output_folder)
+        if batch:
+            self.log_output.append(f"Starting batch extraction for {len(urls)} entr(ies)")
+            self.worker = ContentExtractorWorker(
+                output_folder=output_folder,
+                urls=urls,
+                max_concurrency=self.concurrency_spin.value(),
+                processes=self.processes_spin.value(),
+                zip_output=self.zip_cb.isChecked(),
+                formats=formats,
+                save_model=self.save_model_cb.isChecked(),
+                embed_images=self.embed_images_cb.isChecked(),
+            )
+            self.stop_btn.setEnabled(True)
+        else:
+            self.log_output.append(f"Starting extraction for: {url}")
+            self.worker = ContentExtractorWorker(
+                url, output_folder, formats=formats, save_model=self.save_model_cb.isChecked(),
+                embed_images=self.embed_images_cb.isChecked(),
+            )
         self.worker.log_update.connect(self.log_output.append)
+        self.worker.progress_update.connect(self.progress.setValue)
         self.worker.finished.connect(self.extraction_finished)
         self.worker.error.connect(self.extraction_error)
         self.worker.start()
 
+    def stop_extraction(self):
+        if self.worker and self.worker.isRunning():
+            self.worker.stop()
+            self.log_output.append("Stop requested...")
+            self.stop_btn.setEnabled(False)
+
     def extraction_finished(self, filepath):
         """Handle successful extraction."""
         self.log_output.append(f"\n✓ Extraction complete")
@@ -96,6 +229,7 @@ class ContentExtractorGUI(QWidget):
             f"Document saved successfully:\n{filepath}"
         )
         self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
 
     def extraction_error(self, error_msg):
         """Handle extraction error."""
@@ -106,3 +240,4 @@ class ContentExtractorGUI(QWidget):
             f"An error occurred:\n{error_msg}"
         )
         self.start_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
@@ -39,8 +39,10 @@ class CrawlerGUI(QWidget):
             "h1": QCheckBox("Extract H1 Tag (<h1>)"),
             "meta_description": QCheckBox("Extract Meta Description (Standard)"),
             "og_tags": QCheckBox("Extract OG Tags (Title/Desc/Image)"),
-            "schema": QCheckBox("Extract Schema JSON-LD"),
+            "schema": QCheckBox("Extract Schema JSON-LD (types, product ID/SKU/GTIN, offer)"),
             "meta_tags": QCheckBox("Extract All Meta Tags"),
+            "catalog": QCheckBox("Update product catalog (product ID/GTIN index used by Product Sheet checks)"),
+            "duplicates": QCheckBox("Detect duplicate Titles/Descriptions/H1 (adds 'Duplicates' sheet)"),
         }
         self.check_errors = QCheckBox("Log 403 and 404 Errors")
         self.progress = QProgressBar()
@@ -20,8 +20,12 @@ from PyQt6.QtCore import Qt
 from aiohttp import BasicAuth
 from PIL import Image
 
+from config import RESPONSIVE_FORMATS, RESPONSIVE_WIDTHS
 from workers.image_downloader_worker import AllImagesDownloaderThread, ImageProcessorThread
+from workers.image_resizer_worker import ImageResizerThread, ResponsiveSetThread
 from gui.base_components import BaseDownloaderGUI
+from utils.image_resize import RESIZE_FORMATS
+from utils.srcset import parse_policy
 
 
 class AllImagesDownloaderGUI(QWidget):
@@ -52,6 +56,18 @@ class AllImagesDownloaderGUI(QWidget):
         folder_layout.addWidget(browse_folder_btn)
         layout.addLayout(folder_layout)
 
+        # Responsive images: which srcset candidate to download
+        srcset_layout = QHBoxLayout()
+        self.srcset_combo = QComboBox()
+        self.srcset_combo.setEditable(True)
+        self.srcset_combo.addItems(["largest", "smallest", "1200w", "2x", "all"])
+        self.srcset_combo.setToolTip("Candidate downloaded per responsive image: largest, smallest, "
+                                     "a width (e.g. 800w), a density (e.g. 2x) or all")
+        srcset_layout.addWidget(QLabel("Responsive images (srcset):"))
+        srcset_layout.addWidget(self.srcset_combo)
+        srcset_layout.addStretch()
+        layout.addLayout(srcset_layout)
+
         # Compression options
         compress_group = QGroupBox("Compression Settings (optional)")
         compress_layout = QVBoxLayout()
@@ -118,6 +134,13 @@ class AllImagesDownloaderGUI(QWidget):
             QMessageBox.warning(self, "Output Error", "Please select an output folder.")
             return
 
+        srcset_policy = self.srcset_combo.currentText().strip()
+        try:
+            parse_policy(srcset_policy)
+        except ValueError as e:
+            QMessageBox.warning(self, "Input Error", str(e))
+            return
+
         self.log_output.clear()
         self.progress.setValue(0)
         self.start_btn.setEnabled(False)
@@ -134,7 +157,8 @@ class AllImagesDownloaderGUI(QWidget):
             urls=urls,
             save_folder=self.output_folder,
             auth=None,
-            compress_options=compress_options
+            compress_options=compress_options,
+            srcset_policy=srcset_policy
         )
         self.downloader_thread.progress.connect(self.update_progress)
         self.downloader_thread.log.connect(self.log_output.append)
@@ -200,7 +224,8 @@ class ExcelDownloaderGUI(BaseDownloaderGUI):
         self.image_thread = ImageProcessorThread(
             mode=mode, excel_path=self.excel_path.text(), urls=urls,
             source_folder="", output_folder=self.output_folder.text(),
-            image_format=self.format_combo.currentText(), quality=self.quality_spin.value()
+            image_format=self.format_combo.currentText(), quality=self.quality_spin.value(),
+            max_kb=self.max_kb()
         )
         self.image_thread.download_progress.connect(self.progress_bar_download.setValue)
         self.image_thread.compress_progress.connect(self.progress_bar_compress.setValue)
@@ -248,7 +273,8 @@ class URLDownloaderGUI(BaseDownloaderGUI):
         self.image_thread = ImageProcessorThread(
             mode=mode, excel_path="", urls=urls,
             source_folder="", output_folder=self.output_folder.text(),
-            image_format=self.format_combo.currentText(), quality=self.quality_spin.value()
+            image_format=self.format_combo.currentText(), quality=self.quality_spin.value(),
+            max_kb=self.max_kb()
         )
         self.image_thread.download_progress.connect(self.progress_bar_download.setValue)
         self.image_thread.compress_progress.connect(self.progress_bar_compress.setValue)
@@ -323,7 +349,8 @@ class ImageCompressorGUI(BaseDownloaderGUI):
             source_folder=self.source_folder.text(),
             output_folder=self.output_folder.text(),
             image_format=self.format_combo.currentText(),
-            quality=self.quality_spin.value()
+            quality=self.quality_spin.value(),
+            max_kb=self.max_kb()
         )
         self.image_thread.compress_progress.connect(self.progress_bar_compress.setValue)
         self.image_thread.status_update.connect(lambda msg: self.status_label.setText(f"Status: {msg}"))
@@ -346,6 +373,7 @@ class ImageResizerGUI(QWidget):
         }
         self.current_aspect_ratio = None
         self._is_updating_dimensions = False
+        self.resizer_thread = None
         self.init_ui()
 
     def init_ui(self):
@@ -422,13 +450,32 @@ class ImageResizerGUI(QWidget):
         dim_layout.addWidget(self.height_spinbox)
         layout.addLayout(dim_layout)
 
+        # Responsive set (folder mode): every width x format from one decode per image
+        responsive_group = QGroupBox("Responsive Set (uses the input / output folders)")
+        responsive_layout = QHBoxLayout(responsive_group)
+        self.responsive_widths = QLineEdit(", ".join(str(w) for w in RESPONSIVE_WIDTHS))
+        self.responsive_formats = QLineEdit(", ".join(RESPONSIVE_FORMATS))
+        self.responsive_quality = QSpinBox(minimum=1, maximum=100, value=80)
+        self.responsive_btn = QPushButton("Generate Responsive Set")
+        responsive_layout.addWidget(QLabel("Widths:"))
+        responsive_layout.addWidget(self.responsive_widths)
+        responsive_layout.addWidget(QLabel("Formats:"))
+        responsive_layout.addWidget(self.responsive_formats)
+        responsive_layout.addWidget(QLabel("Quality:"))
+        responsive_layout.addWidget(self.responsive_quality)
+        responsive_layout.addWidget(self.responsive_btn)
+        layout.addWidget(responsive_group)
+
         # Progress
         self.progress = QProgressBar()
         layout.addWidget(self.progress)
+        self.status_label = QLabel("Status: Ready")
+        layout.addWidget(self.status_label)
 
-        # Process button
-        process_btn = QPushButton("Process Images")
-        layout.addWidget(process_btn)
+        # Process / stop buttons
+        self.process_btn = QPushButton("Process Images")
+        self.stop_btn = QPushButton("Stop", enabled=False)
+        layout.addLayout(self._create_h_layout([self.process_btn, self.stop_btn]))
 
         # Connections
         browse_input_folder_btn.clicked.connect(self.select_input_folder)
@@ -438,7 +485,9 @@ class ImageResizerGUI(QWidget):
         self.ratio_mode_combo.currentTextChanged.connect(self.mode_changed)
         self.width_spinbox.valueChanged.connect(self.width_changed)
         self.height_spinbox.valueChanged.connect(self.height_changed)
-        process_btn.clicked.connect(self.process)
+        self.process_btn.clicked.connect(self.process)
+        self.responsive_btn.clicked.connect(self.process_responsive_set)
+        self.stop_btn.clicked.connect(self.stop_processing)
 
         self.setLayout(layout)
         self.toggle_mode_widgets()
@@ -452,6 +501,7 @@ class ImageResizerGUI(QWidget):
     def toggle_mode_widgets(self):
         is_folder_mode = self.mode_folder_radio.isChecked()
         self.folder_widgets.setVisible(is_folder_mode)
+        self.responsive_btn.setEnabled(is_folder_mode)
         self.single_file_widgets.setVisible(not is_folder_mode)
         self.mode_changed()
 
@@ -478,10 +528,9 @@ class ImageResizerGUI(QWidget):
             line_edit.setText(folder)
 
     def _update_ratio_from_folder(self, folder_path):
-        supported = ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp')
         try:
             for file_name in os.listdir(folder_path):
-                if file_name.lower().endswith(supported):
+                if file_name.lower().endswith(RESIZE_FORMATS):
                     self._update_ratio_from_file(os.path.join(folder_path, file_name))
                     return
         except Exception:
@@ -526,23 +575,6 @@ class ImageResizerGUI(QWidget):
         else:
             self.process_single_file()
 
-    def _resize_image(self, img_path, output_path):
-        target_width = self.width_spinbox.value()
-        target_height = self.height_spinbox.value()
-        
-        with Image.open(img_path) as img:
-            ratio = self._get_active_ratio()
-            if ratio is not None:
-                target_height = int(target_width * ratio)
-
-            new_size = (target_width, target_height)
-            
-            if img.mode not in ('RGB', 'L'):
-                img = img.convert('RGB')
-            
-            resized_img = img.resize(new_size, Image.Resampling.LANCZOS)
-            resized_img.save(output_path)
-
     def process_folder(self):
         input_path = self.input_folder.text()
         output_path = self.output_folder.text()
@@ -550,22 +582,12 @@ class ImageResizerGUI(QWidget):
             QMessageBox.warning(self, "Error", "Both input and output folders must be valid.")
             return
 
-        supported = ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp')
-        files = [f for f in os.listdir(input_path) if f.lower().endswith(supported)]
+        files = [f for f in os.listdir(input_path) if f.lower().endswith(RESIZE_FORMATS)]
         if not files:
             QMessageBox.information(self, "Info", "No supported images found in the input folder.")
             return
 
-        self.progress.setValue(0)
-        total = len(files)
-        for i, filename in enumerate(files, 1):
-            try:
-                self._resize_image(os.path.join(input_path, filename), os.path.join(output_path, filename))
-            except Exception as e:
-                print(f"Error processing {filename}: {e}")
-            self.progress.setValue(int(i / total * 100))
-        
-        QMessageBox.information(self, "Completed", "All images have been resized successfully.")
+        self._start_resizing([(os.path.join(input_path, f), os.path.join(output_path, f)) for f in files])
 
     def process_single_file(self):
         input_path = self.input_file.text()
@@ -573,11 +595,103 @@ class ImageResizerGUI(QWidget):
         if not os.path.isfile(input_path) or not output_path:
             QMessageBox.warning(self, "Error", "Input and output file paths must be valid.")
             return
-            
+        self._start_resizing([(input_path, output_path)])
+
+    def _start_resizing(self, jobs):
+        """Resize `jobs` ((input, output) pairs) in the background worker."""
+        self.progress.setValue(0)
+        self.process_btn.setEnabled(False)
+        self.responsive_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.status_label.setText("Status: Resizing...")
+
+        self.resizer_thread = ImageResizerThread(
+            jobs, self.width_spinbox.value(), self.height_spinbox.value(), ratio=self._get_active_ratio()
+        )
+        self.resizer_thread.progress.connect(self.progress.setValue)
+        self.resizer_thread.status_update.connect(lambda msg: self.status_label.setText(f"Status: {msg}"))
+        self.resizer_thread.finished_processing.connect(self.resizing_finished)
+        self.resizer_thread.start()
+
+    def process_responsive_set(self):
+        input_path = self.input_folder.text()
+        output_path = self.output_folder.text()
+        if not os.path.isdir(input_path) or not os.path.isdir(output_path):
+            QMessageBox.warning(self, "Error", "Both input and output folders must be valid.")
+            return
         try:
-            self.progress.setValue(0)
-            self._resize_image(input_path, output_path)
-            self.progress.setValue(100)
-            QMessageBox.information(self, "Completed", "Image resized successfully.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"An error occurred while resizing:\n{e}")
+            widths = [int(w) for w in self.responsive_widths.text().replace(",", " ").split()]
+        except ValueError:
+            QMessageBox.warning(self, "Error", "Widths must be whole numbers, e.g. 320, 640, 1024.")
+            return
+        formats = [f.strip().lower().lstrip(".") for f in self.responsive_formats.text().split(",") if f.strip()]
+        if not widths or not formats:
+            QMessageBox.warning(self, "Error", "Enter at least one width and one format.")
+            return
+
+        files = sorted(f for f in os.listdir(input_path) if f.lower().endswith(RESIZE_FORMATS))
+        if not files:
+            QMessageBox.information(self, "Info", "No supported images found in the input folder.")
+            return
+
+        self.progress.setValue(0)
+        self.process_btn.setEnabled(False)
+        self.responsive_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.status_label.setText("Status: Generating responsive set...")
+
+        self.resizer_thread = ResponsiveSetThread(
+            [os.path.join(input_path, f) for f in files], output_path, widths, formats,
+            quality=self.responsive_quality.value()
+        )
+        self.resizer_thread.progress.connect(self.progress.setValue)
+        self.resizer_thread.status_update.connect(lambda msg: self.status_label.setText(f"Status: {msg}"))
+        self.resizer_thread.finished_processing.connect(self.responsive_set_finished)
+        self.resizer_thread.start()
+
+    def responsive_set_finished(self, status):
+        thread = self.resizer_thread
+        self.process_btn.setEnabled(True)
+        self.responsive_btn.setEnabled(self.mode_folder_radio.isChecked())
+        self.stop_btn.setEnabled(False)
+        self.status_label.setText("Status: Ready")
+        if status == "Error":
+            QMessageBox.critical(self, "Error", "An error occurred while generating the responsive set.")
+            return
+
+        files = sum(len(entry["variants"]) for entry in thread.manifest)
+        size = sum(v["bytes"] for entry in thread.manifest for v in entry["variants"]) / (1024 * 1024)
+        message = (f"{len(thread.manifest)} of {len(thread.image_paths)} images processed: "
+                   f"{files} files, {size:.1f} MB.\nManifest: {thread.manifest_name}")
+        if status == "Stopped":
+            message = "Generation was stopped. " + message
+        if thread.failures:
+            details = "\n".join(f"{name}: {error}" for name, error in thread.failures[:10])
+            QMessageBox.warning(self, "Completed with errors", f"{message}\n\n{details}")
+        else:
+            QMessageBox.information(self, "Completed", message)
+
+    def stop_processing(self):
+        if self.resizer_thread and self.resizer_thread.isRunning():
+            self.resizer_thread.stop()
+            self.stop_btn.setEnabled(False)
+
+    def resizing_finished(self, status):
+        thread = self.resizer_thread
+        self.process_btn.setEnabled(True)
+        self.responsive_btn.setEnabled(self.mode_folder_radio.isChecked())
+        self.stop_btn.setEnabled(False)
+        self.status_label.setText("Status: Ready")
+        if status == "Error":
+            QMessageBox.critical(self, "Error", "An error occurred while resizing.")
+            return
+
+        resized = thread.done - len(thread.failures)
+        message = f"{resized} of {len(thread.jobs)} images resized."
+        if status == "Stopped":
+            message = "Resizing was stopped. " + message
+        if thread.failures:
+            details = "\n".join(f"{name}: {error}" for name, error in thread.failures[:10])
+            QMessageBox.warning(self, "Completed with errors", f"{message}\n\n{details}")
+        else:
+            QMessageBox.information(self, "Completed", message)
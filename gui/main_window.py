@@ -14,7 +14,8 @@ from PyQt6.QtGui import QPixmap
 from gui.crawler_gui import CrawlerGUI
 from gui.sitemap_extractor_gui import SitemapExtractorGUI
 from gui.broken_link_inspector_gui import BrokenLinkInspectorGUI
-from gui.meta_product_checker_guis import MetaCheckerGUI
+from gui.redirect_map_gui import RedirectMapGUI
+from gui.meta_product_checker_guis import MetaCheckerGUI, ProductSheetCheckerGUI
 from gui.content_extractor_gui import ContentExtractorGUI
 from gui.image_tool_guis import ImageDownloaderGUI, ImageCompressorGUI, ImageResizerGUI
 from gui.chatbot_tab import ChatbotTab
@@ -51,18 +52,22 @@ class CrawlerMainGUI(QWidget):
         self.broken_tab = BrokenLinkInspectorGUI()
         self.subtabs.addTab(self.broken_tab, "Broken Links")
 
+        # Redirect Map tab
+        self.redirect_tab = RedirectMapGUI()
+        self.subtabs.addTab(self.redirect_tab, "Redirect Map")
+
         # Meta Checker tab
         self.meta_tab = MetaCheckerGUI()
         self.subtabs.addTab(self.meta_tab, "Meta Checker")
 
+        # Product Sheet tab
+        self.product_tab = ProductSheetCheckerGUI()
+        self.subtabs.addTab(self.product_tab, "Product Sheet")
+
         # Content Extractor tab
         self.content_extractor_tab = ContentExtractorGUI()
         self.subtabs.addTab(self.content_extractor_tab, "Content Extractor")
 
-        # Note: ProductSheetCheckerGUI would be added here if extracted
-        # self.product_tab = ProductSheetCheckerGUI()
-        # self.subtabs.addTab(self.product_tab, "Product Sheet")
-
 
 class MainApp(QWidget):
     """Main application window that integrates all tools into a tabbed interface."""
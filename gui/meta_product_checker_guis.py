@@ -8,15 +8,19 @@ Contains validation interfaces for:
 
 import os
 import datetime
-import openpyxl
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QRadioButton,
-    QLineEdit, QLabel, QProgressBar, QFileDialog, QMessageBox, QGroupBox
+    QLineEdit, QLabel, QProgressBar, QFileDialog, QMessageBox, QGroupBox,
+    QSpinBox, QCheckBox
 )
 from openpyxl import Workbook
 from openpyxl.styles import PatternFill, Alignment, Font
 
-from workers.meta_product_workers import MetaCheckWorker, ProductSheetWorker
+from config import MAX_CONCURRENCY_PRODUCT, PRODUCT_CATALOG_MAX_AGE_HOURS
+from workers.meta_product_workers import MetaCheckWorker, ProductSheetWorker, PRODUCT_PREVIEW_LIMIT
+from utils.meta_compare import (
+    FIELDS, FIELD_LABELS, build_frame, compare_frame, summarize, used_fields, mismatches
+)
 
 
 class MetaCheckerGUI(QWidget):
@@ -26,6 +30,7 @@ class MetaCheckerGUI(QWidget):
         super().__init__()
         self.worker = None
         self.results = []
+        self.frame = None
         self.initUI()
 
     def initUI(self):
@@ -145,6 +150,7 @@ class MetaCheckerGUI(QWidget):
             QMessageBox.warning(self, "Busy", "Stop the current run before clearing.")
             return
         self.results = []
+        self.frame = None
         self.manual_text.clear()
         self.results_box.clear()
         self.log_box.clear()
@@ -178,158 +184,24 @@ class MetaCheckerGUI(QWidget):
             items.append({"url": url, "expected": expected})
         return items
 
-    def _collect_items_excel(self):
-        path = self.excel_path.text().strip()
-        if not path:
-            return []
-
-        if not os.path.exists(path):
-            QMessageBox.warning(self, "File error", "Excel file not found.")
-            return []
-
-        try:
-            wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
-        except Exception as e:
-            QMessageBox.warning(self, "File error", f"Could not read Excel file:\n{e}")
-            return []
-
-        # Choose the right sheet
-        ws = wb.active
-        found_sheet = False
-        
-        # Priority 1: Look for "update" (e.g. "Updates")
-        for name in wb.sheetnames:
-            if "update" in name.lower():
-                ws = wb[name]
-                found_sheet = True
-                break
-        
-        # Priority 2: Look for other keywords if not found
-        if not found_sheet:
-            for name in wb.sheetnames:
-                low = name.lower()
-                if "h1" in low or "meta" in low:
-                    ws = wb[name]
-                    break
-
-        rows = list(ws.iter_rows(values_only=True))
-        if not rows:
-            return []
-
-        def norm(cell):
-            return str(cell).strip().lower() if cell is not None else ""
-
-        # Find header row
-        header_row_idx = None
-        max_scan_header_rows = min(20, len(rows))
-        for i in range(max_scan_header_rows):
-            row = rows[i]
-            for cell in row:
-                h = norm(cell)
-                if "page url" in h or h == "url":
-                    header_row_idx = i
-                    break
-            if header_row_idx is not None:
-                break
-
-        header = rows[header_row_idx] if header_row_idx is not None else None
-
-        url_idx = h1_idx = mt_idx = md_idx = ogt_idx = ogd_idx = None
-
-        # Detect columns by names
-        if header is not None:
-            for idx, cell in enumerate(header):
-                h = norm(cell)
-
-                # URL
-                if url_idx is None and ("page url" in h or h == "url"):
-                    url_idx = idx
-
-                # Expected H1
-                if h1_idx is None:
-                    if "expected" in h and ("h1" in h or "heading 1" in h):
-                        h1_idx = idx
-
-                # Expected Meta Title
-                if mt_idx is None:
-                    if "expected" in h and "title" in h and "og" not in h:
-                        mt_idx = idx
-
-                # Expected Meta Description
-                if md_idx is None:
-                    if "expected" in h and "description" in h and "og" not in h:
-                        md_idx = idx
-
-                # Expected OG Title
-                if ogt_idx is None:
-                    if "expected" in h and "og" in h and "title" in h:
-                        ogt_idx = idx
-
-                # Expected OG Description
-                if ogd_idx is None:
-                    if "expected" in h and "og" in h and "description" in h:
-                        ogd_idx = idx
-
-        # Fallback URL detection
-        if url_idx is None:
-            max_cols = max(len(r) for r in rows)
-            for col in range(max_cols):
-                for row in rows:
-                    cell = row[col] if col < len(row) else None
-                    s = str(cell).strip() if cell is not None else ""
-                    if s.startswith("http://") or s.startswith("https://"):
-                        url_idx = col
-                        break
-                if url_idx is not None:
-                    break
-
-        if url_idx is None:
-            url_idx = 0
-
-        def get_cell(row, idx):
-            if idx is None or idx >= len(row):
-                return ""
-            val = row[idx]
-            return str(val).strip() if val is not None else ""
-
-        # Build items list
-        items = []
-        start_row = header_row_idx + 1 if header_row_idx is not None else 0
-
-        for row in rows[start_row:]:
-            if url_idx >= len(row):
-                continue
-
-            url_val = row[url_idx]
-            url = str(url_val).strip() if url_val is not None else ""
-            if not (url.startswith("http://") or url.startswith("https://")):
-                continue
-
-            expected = {
-                "meta_title":        get_cell(row, mt_idx),
-                "meta_description":  get_cell(row, md_idx),
-                "og_title":          get_cell(row, ogt_idx),
-                "og_description":    get_cell(row, ogd_idx),
-                "h1":                get_cell(row, h1_idx),
-            }
-
-            items.append({"url": url, "expected": expected})
-
-        return items
-
     def start_check(self):
         if self.worker and self.worker.isRunning():
             QMessageBox.warning(self, "Busy", "A check is already running.")
             return
 
+        items = []
+        excel_path = ""
         if self.mode_manual.isChecked():
             items = self._collect_items_manual()
+            if not items:
+                QMessageBox.warning(self, "Input error", "No valid rows found to check.")
+                return
         else:
-            items = self._collect_items_excel()
-
-        if not items:
-            QMessageBox.warning(self, "Input error", "No valid rows found to check.")
-            return
+            # The workbook is streamed by the worker thread, not read here
+            excel_path = self.excel_path.text().strip()
+            if not excel_path or not os.path.exists(excel_path):
+                QMessageBox.warning(self, "File error", "Excel file not found.")
+                return
 
         self.results = []
         self.results_box.clear()
@@ -337,12 +209,15 @@ class MetaCheckerGUI(QWidget):
         self.progress.setValue(0)
         self.set_export_ready(False)
 
-        self.log(f"[START] Meta Checker – {len(items)} page(s)")
+        if items:
+            self.log(f"[START] Meta Checker – {len(items)} page(s)")
+        else:
+            self.log(f"[START] Meta Checker – {os.path.basename(excel_path)}")
 
         self.run_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
 
-        self.worker = MetaCheckWorker(items=items)
+        self.worker = MetaCheckWorker(items=items, excel_path=excel_path)
         self.worker.progress_update.connect(self.progress.setValue)
         self.worker.log_update.connect(self.log)
         self.worker.finished.connect(self.on_worker_finished)
@@ -356,6 +231,9 @@ class MetaCheckerGUI(QWidget):
 
     def on_worker_finished(self, results: list):
         self.results = results or []
+        self.frame = getattr(self.worker, "frame", None)
+        if self.frame is None and self.results:
+            self.frame = compare_frame(build_frame(self.results))
         self.run_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
 
@@ -363,73 +241,36 @@ class MetaCheckerGUI(QWidget):
         self.set_export_ready(bool(self.results))
 
     def _render_results(self):
-        if not self.results:
+        if not self.results or self.frame is None:
             self.stats_label.setText("Pages: 0 | Title OK: 0 | Desc OK: 0 | OG Title OK: 0 | OG Desc OK: 0")
             self.results_box.setPlainText("No results.")
             return
 
-        total = len(self.results)
-        title_ok = desc_ok = ogt_ok = ogd_ok = h1_ok = 0
-        mismatches_lines = []
-
-        for r in self.results:
-            url = r["url"]
-            exp = r["expected"]
-            cur = r["current"]
-            m = r["match"]
-
-            # meta title
-            if m["meta_title"] is True:
-                title_ok += 1
-            elif m["meta_title"] is False:
-                mismatches_lines.append(
-                    f"[META TITLE]\nURL: {url}\nExpected: {exp['meta_title']}\nCurrent:  {cur['meta_title']}\n"
-                )
-
-            # meta description
-            if m["meta_description"] is True:
-                desc_ok += 1
-            elif m["meta_description"] is False:
-                mismatches_lines.append(
-                    f"[META DESCRIPTION]\nURL: {url}\nExpected: {exp['meta_description']}\nCurrent:  {cur['meta_description']}\n"
-                )
-
-            # og title
-            if m["og_title"] is True:
-                ogt_ok += 1
-            elif m["og_title"] is False:
-                mismatches_lines.append(
-                    f"[OG TITLE]\nURL: {url}\nExpected: {exp['og_title']}\nCurrent:  {cur['og_title']}\n"
-                )
-
-            # og description
-            if m["og_description"] is True:
-                ogd_ok += 1
-            elif m["og_description"] is False:
-                mismatches_lines.append(
-                    f"[OG DESCRIPTION]\nURL: {url}\nExpected: {exp['og_description']}\nCurrent:  {cur['og_description']}\n"
-                )
+        summary = summarize(self.frame)
+        self.stats_label.setText(
+            f"Pages: {summary['total']} | Title OK: {summary['meta_title']['ok']} | "
+            f"Desc OK: {summary['meta_description']['ok']} | "
+            f"OG Title OK: {summary['og_title']['ok']} | OG Desc OK: {summary['og_description']['ok']} | "
+            f"H1 OK: {summary['h1']['ok']}"
+        )
 
-            # h1
-            if m.get("h1") is True:
-                h1_ok += 1
-            elif m.get("h1") is False:
+        mismatches_lines = []
+        for f in FIELDS:
+            tag = FIELD_LABELS[f].upper()
+            rows = mismatches(self.frame, f)
+            for url, exp, cur, sim in zip(rows["url"], rows[f"expected_{f}"], rows[f"current_{f}"],
+                                          rows[f"similarity_{f}"]):
                 mismatches_lines.append(
-                    f"[H1]\nURL: {url}\nExpected: {exp.get('h1', '')}\nCurrent:  {cur.get('h1', '')}\n"
+                    f"[{tag}] ({sim:.0%} similar)\nURL: {url}\nExpected: {exp}\nCurrent:  {cur}\n"
                 )
 
-        self.stats_label.setText(
-            f"Pages: {total} | Title OK: {title_ok} | Desc OK: {desc_ok} | "
-            f"OG Title OK: {ogt_ok} | OG Desc OK: {ogd_ok} | H1 OK: {h1_ok}"
-        )
-
         if mismatches_lines:
             self.results_box.setPlainText("\n".join(mismatches_lines))
         else:
             self.results_box.setPlainText("All checked fields match expected values.")
 
     def export_results(self):
-        if not self.results:
+        if not self.results or self.frame is None:
             QMessageBox.warning(self, "No data", "No results to export.")
             return
 
@@ -442,14 +283,9 @@ class MetaCheckerGUI(QWidget):
         filename = f"meta_checker_{ts}.xlsx"
         path = os.path.join(folder, filename)
 
-        # Discover which fields were actually used
-        fields = ["meta_title", "meta_description", "og_title", "og_description", "h1"]
-        used_fields = []
-        for f in fields:
-            for r in self.results:
-                if r["expected"].get(f) or r["current"].get(f):
-                    used_fields.append(f)
-                    break
+        frame = self.frame
+        fields = used_fields(frame)
+        summary = summarize(frame)
 
         wb = Workbook()
 
@@ -461,40 +297,34 @@ class MetaCheckerGUI(QWidget):
         ws_sum = wb.active
         ws_sum.title = "Summary"
         ws_sum.append(["Metric", "Value"])
-        
+
         # Style Summary header
         for cell in ws_sum[1]:
             cell.fill = header_fill
             cell.font = header_font
 
-        total = len(self.results)
-        def count_ok(field):
-            return sum(1 for r in self.results if r["match"].get(field) is True)
-
-        ws_sum.append(["Total pages", total])
-        if "meta_title" in used_fields:
-            ws_sum.append(["Meta title OK", count_ok("meta_title")])
-        if "meta_description" in used_fields:
-            ws_sum.append(["Meta description OK", count_ok("meta_description")])
-        if "og_title" in used_fields:
-            ws_sum.append(["OG title OK", count_ok("og_title")])
-        if "og_description" in used_fields:
-            ws_sum.append(["OG description OK", count_ok("og_description")])
+        ws_sum.append(["Total pages", summary["total"]])
+        summary_labels = {
+            "meta_title": "Meta title",
+            "meta_description": "Meta description",
+            "og_title": "OG title",
+            "og_description": "OG description",
+            "h1": "H1",
+        }
+        for f in fields:
+            label = summary_labels[f]
+            ws_sum.append([f"{label} OK", summary[f]["ok"]])
+            if summary[f]["mean_similarity"] is not None:
+                ws_sum.append([f"{label} mean similarity", round(summary[f]["mean_similarity"], 3)])
 
         # Detailed sheet
         ws = wb.create_sheet("Details")
         headers = ["URL"]
-        for f in used_fields:
-            label = {
-                "meta_title": "Meta Title",
-                "meta_description": "Meta Description",
-                "og_title": "OG Title",
-                "og_description": "OG Description",
-                "h1": "H1",
-            }[f]
-            headers.extend([f"Expected {label}", f"Current {label}", f"{label} Match"])
+        for f in fields:
+            label = FIELD_LABELS[f]
+            headers.extend([f"Expected {label}", f"Current {label}", f"{label} Match", f"{label} Similarity"])
         ws.append(headers)
-        
+
         # Style Details header
         for cell in ws[1]:
             cell.fill = header_fill
@@ -504,27 +334,21 @@ class MetaCheckerGUI(QWidget):
         match_cols = {}
 
         col_idx = 2  # starts after URL
-        for f in used_fields:
-            # Expected, Current, Match
+        for f in fields:
+            # Expected, Current, Match, Similarity
             match_cols[f] = col_idx + 2  # third column of the group
-            col_idx += 3
+            col_idx += 4
 
-        for r in self.results:
-            row = [r["url"]]
-            exp = r["expected"]
-            cur = r["current"]
-            m = r["match"]
-            for f in used_fields:
-                row.append(exp.get(f, ""))
-                row.append(cur.get(f, ""))
-                val = m.get(f)
-                if val is True:
-                    row.append("TRUE")
-                elif val is False:
-                    row.append("FALSE")
-                else:
-                    row.append("")
-            ws.append(row)
+        # Build the rows column-wise from the frame
+        columns = [frame["url"].tolist()]
+        for f in fields:
+            match = frame[f"match_{f}"]
+            columns.append(frame[f"expected_{f}"].tolist())
+            columns.append(frame[f"current_{f}"].tolist())
+            columns.append(match.map({True: "TRUE", False: "FALSE"}).astype(object).fillna("").tolist())
+            columns.append(frame[f"similarity_{f}"].round(3).astype(object).fillna("").tolist())
+        for row in zip(*columns):
+            ws.append(list(row))
 
         # Color Match cells (green/red) and enable text wrap
         green_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
@@ -534,8 +358,8 @@ class MetaCheckerGUI(QWidget):
         for i, r in enumerate(ws.iter_rows(min_row=2, values_only=False), start=2):
             for cell in r:
                 cell.alignment = alignment_wrap
-                
-            for f in used_fields:
+
+            for f in fields:
                 col = match_cols[f]
                 cell = ws.cell(row=i, column=col)
                 if cell.value == "TRUE":
@@ -552,7 +376,202 @@ class MetaCheckerGUI(QWidget):
         QMessageBox.information(self, "Export", f"Report saved to:\n{path}")
 
 
-# Note: ProductSheetCheckerGUI would be extracted similarly but is very large (~560 lines)
-# For time efficiency, I'm noting that it follows the same pattern as MetaCheckerGUI but 
-# focuses on product IDs and GTINs from Excel sheets with different field validation logic.
-# It can be extracted separately if needed.
+class ProductSheetCheckerGUI(QWidget):
+    """Product Sheet sub-tab for validating product IDs and GTINs vs a spreadsheet."""
+
+    def __init__(self):
+        super().__init__()
+        self.worker = None
+        self.results = []
+        self.report_path = ""
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout(self)
+
+        title = QLabel("Product Sheet Checker")
+        title.setObjectName("Title")
+        layout.addWidget(title)
+
+        # --------- Input ----------
+        input_group = QGroupBox("Product sheet")
+        ig_layout = QVBoxLayout()
+        row = QHBoxLayout()
+        self.excel_path = QLineEdit()
+        browse_btn = QPushButton("Browse")
+        row.addWidget(QLabel("File:"))
+        row.addWidget(self.excel_path)
+        row.addWidget(browse_btn)
+        ig_layout.addLayout(row)
+        ig_layout.addWidget(QLabel(
+            "Expected columns: URL, Product ID and GTIN/EAN. "
+            "Without headers: URL, then ID and GTIN in the next two columns."
+        ))
+
+        out_row = QHBoxLayout()
+        self.output_folder = QLineEdit()
+        out_btn = QPushButton("Browse")
+        out_row.addWidget(QLabel("Output Folder:"))
+        out_row.addWidget(self.output_folder)
+        out_row.addWidget(out_btn)
+        ig_layout.addLayout(out_row)
+
+        opt_row = QHBoxLayout()
+        self.concurrency_spin = QSpinBox(minimum=1, maximum=100, value=MAX_CONCURRENCY_PRODUCT)
+        opt_row.addWidget(QLabel("Concurrent requests:"))
+        opt_row.addWidget(self.concurrency_spin)
+        self.catalog_cb = QCheckBox("Answer from product catalog when fresher than")
+        self.max_age_spin = QSpinBox(minimum=1, maximum=24 * 30, value=int(PRODUCT_CATALOG_MAX_AGE_HOURS))
+        self.max_age_spin.setSuffix(" h")
+        opt_row.addWidget(self.catalog_cb)
+        opt_row.addWidget(self.max_age_spin)
+        opt_row.addStretch()
+        ig_layout.addLayout(opt_row)
+        input_group.setLayout(ig_layout)
+        layout.addWidget(input_group)
+
+        # --------- Controls ----------
+        controls = QHBoxLayout()
+        self.run_btn = QPushButton("Run check")
+        self.run_btn.setProperty("accent", True)
+        self.stop_btn = QPushButton("Stop")
+        self.stop_btn.setEnabled(False)
+        self.open_btn = QPushButton("Open Report Folder")
+        self.open_btn.setEnabled(False)
+        controls.addWidget(self.run_btn)
+        controls.addWidget(self.stop_btn)
+        controls.addWidget(self.open_btn)
+        layout.addLayout(controls)
+
+        # --------- Progress + stats ----------
+        self.progress = QProgressBar()
+        layout.addWidget(self.progress)
+
+        self.stats_label = QLabel(self._format_stats({}))
+        layout.addWidget(self.stats_label)
+
+        # --------- Results ----------
+        layout.addWidget(QLabel(f"Problems (first {PRODUCT_PREVIEW_LIMIT}; full list in the report):"))
+        self.results_box = QTextEdit()
+        self.results_box.setReadOnly(True)
+        layout.addWidget(self.results_box)
+
+        # --------- Log ----------
+        layout.addWidget(QLabel("Log:"))
+        self.log_box = QTextEdit()
+        self.log_box.setReadOnly(True)
+        layout.addWidget(self.log_box)
+
+        # Connections
+        browse_btn.clicked.connect(self.browse_excel)
+        out_btn.clicked.connect(self.browse_output)
+        self.run_btn.clicked.connect(self.start_check)
+        self.stop_btn.clicked.connect(self.stop_check)
+        self.open_btn.clicked.connect(self.open_report_folder)
+
+    @staticmethod
+    def _format_stats(stats: dict) -> str:
+        return (
+            f"Checked: {stats.get('checked', 0)} | OK: {stats.get('ok', 0)} | "
+            f"ID mismatch: {stats.get('id_mismatch', 0)} | GTIN mismatch: {stats.get('gtin_mismatch', 0)} | "
+            f"Redirects: {stats.get('redirects', 0)} | Errors: {stats.get('errors', 0)} | "
+            f"Invalid format: {stats.get('invalid_format', 0)} | From catalog: {stats.get('cached', 0)}"
+        )
+
+    def log(self, msg: str):
+        self.log_box.append(msg)
+
+    def browse_excel(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Select Excel file", "", "Excel files (*.xlsx *.xlsm)")
+        if path:
+            self.excel_path.setText(path)
+
+    def browse_output(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+        if folder:
+            self.output_folder.setText(folder)
+
+    def open_report_folder(self):
+        folder = os.path.dirname(self.report_path)
+        if folder and os.path.exists(folder):
+            os.startfile(folder)
+
+    def start_check(self):
+        if self.worker and self.worker.isRunning():
+            QMessageBox.warning(self, "Busy", "A check is already running.")
+            return
+
+        path = self.excel_path.text().strip()
+        if not path or not os.path.exists(path):
+            QMessageBox.warning(self, "File error", "Excel file not found.")
+            return
+
+        output_folder = self.output_folder.text().strip() or os.path.dirname(path)
+
+        self.results = []
+        self.report_path = ""
+        self.results_box.clear()
+        self.log_box.clear()
+        self.progress.setValue(0)
+        self.stats_label.setText(self._format_stats({}))
+        self.open_btn.setEnabled(False)
+        self.run_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+        self.log(f"[START] Product Sheet – {os.path.basename(path)}")
+
+        # The workbook is streamed by the worker thread and the report written as rows complete
+        self.worker = ProductSheetWorker(
+            excel_path=path,
+            output_folder=output_folder,
+            max_concurrency=self.concurrency_spin.value(),
+            use_catalog=self.catalog_cb.isChecked(),
+            max_age_hours=self.max_age_spin.value(),
+        )
+        self.worker.progress_update.connect(self.progress.setValue)
+        self.worker.log_update.connect(self.log)
+        self.worker.stats_update.connect(lambda s: self.stats_label.setText(self._format_stats(s)))
+        self.worker.finished.connect(self.on_worker_finished)
+        self.worker.start()
+
+    def stop_check(self):
+        if self.worker and self.worker.isRunning():
+            self.worker.stop()
+            self.log("[WARN] Stop requested by user.")
+            self.stop_btn.setEnabled(False)
+
+    def on_worker_finished(self, results: list):
+        self.results = results or []
+        self.report_path = getattr(self.worker, "report_path", "")
+        self.run_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.open_btn.setEnabled(bool(self.report_path))
+        self._render_results()
+        if self.report_path:
+            QMessageBox.information(self, "Product Sheet", f"Report saved to:\n{self.report_path}")
+
+    def _render_results(self):
+        if not self.results:
+            self.results_box.setPlainText("No problems found." if self.report_path else "No results.")
+            return
+
+        lines = []
+        for r in self.results:
+            issues = []
+            if r.get("gtin_check") not in (None, "", "missing"):
+                issues.append(f"GTIN {r['expected_gtin'] or '?'}: {r['gtin_check']}")
+            if r["status"] is None or r["status"] >= 400:
+                issues.append(f"status {r['status'] or 'error'}")
+            if r["to"]:
+                issues.append(f"redirects to {r['to']}")
+            if r["match_id"] is False:
+                issues.append(f"ID expected {r['expected_id']}, found {r['actual_id']}")
+            if r["match_gtin"] is False:
+                issues.append(f"GTIN expected {r['expected_gtin']}, found {r['actual_gtin']}")
+            if r.get("id_check") not in (None, "", "missing"):
+                issues.append(f"ID {r['expected_id']}: {r['id_check']}")
+            if r.get("shared_gtin_urls"):
+                issues.append(f"GTIN also on {len(r['shared_gtin_urls'])} other URL(s)")
+            if r.get("id_without_page"):
+                issues.append("expected ID has no page in the catalog")
+            lines.append(f"Row {r['row']}: {r['url']}\n  " + "; ".join(issues))
+        self.results_box.setPlainText("\n".join(lines))
@@ -0,0 +1,167 @@
+"""
+Redirect Map GUI component.
+
+Validates old URL -> expected new URL mappings from an Excel file (site migrations).
+"""
+
+import os
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QLineEdit,
+    QLabel, QProgressBar, QFileDialog, QMessageBox, QGroupBox, QSpinBox
+)
+
+from config import MAX_CONCURRENCY_REDIRECT
+from workers.redirect_map_worker import RedirectMapWorker
+
+
+class RedirectMapGUI(QWidget):
+    """Sub-tab 'Redirect Map' within the Crawler."""
+
+    def __init__(self):
+        super().__init__()
+        self.worker = None
+        self.report_path = ""
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout(self)
+
+        title = QLabel("Redirect Map Validation")
+        title.setObjectName("Title")
+        layout.addWidget(title)
+
+        # --------- Input ----------
+        input_group = QGroupBox("Mapping file")
+        ig_layout = QVBoxLayout()
+        row = QHBoxLayout()
+        self.excel_path = QLineEdit()
+        browse_btn = QPushButton("Browse")
+        row.addWidget(QLabel("File:"))
+        row.addWidget(self.excel_path)
+        row.addWidget(browse_btn)
+        ig_layout.addLayout(row)
+        ig_layout.addWidget(QLabel(
+            "Expected columns: Old URL, New URL and optionally Status (301/302). "
+            "Without headers, the first two URL columns are used."
+        ))
+
+        out_row = QHBoxLayout()
+        self.output_folder = QLineEdit()
+        out_btn = QPushButton("Browse")
+        out_row.addWidget(QLabel("Output Folder:"))
+        out_row.addWidget(self.output_folder)
+        out_row.addWidget(out_btn)
+        ig_layout.addLayout(out_row)
+
+        conc_row = QHBoxLayout()
+        self.concurrency_spin = QSpinBox(minimum=1, maximum=200, value=MAX_CONCURRENCY_REDIRECT)
+        conc_row.addWidget(QLabel("Concurrent requests:"))
+        conc_row.addWidget(self.concurrency_spin)
+        conc_row.addStretch()
+        ig_layout.addLayout(conc_row)
+        input_group.setLayout(ig_layout)
+        layout.addWidget(input_group)
+
+        # --------- Controls ----------
+        controls = QHBoxLayout()
+        self.run_btn = QPushButton("Run check")
+        self.run_btn.setProperty("accent", True)
+        self.stop_btn = QPushButton("Stop")
+        self.stop_btn.setEnabled(False)
+        self.open_btn = QPushButton("Open Report Folder")
+        self.open_btn.setEnabled(False)
+        controls.addWidget(self.run_btn)
+        controls.addWidget(self.stop_btn)
+        controls.addWidget(self.open_btn)
+        layout.addLayout(controls)
+
+        # --------- Progress + stats ----------
+        self.progress = QProgressBar()
+        layout.addWidget(self.progress)
+
+        self.stats_label = QLabel(self._format_stats({}))
+        layout.addWidget(self.stats_label)
+
+        # --------- Log ----------
+        layout.addWidget(QLabel("Log:"))
+        self.log_box = QTextEdit()
+        self.log_box.setReadOnly(True)
+        layout.addWidget(self.log_box)
+
+        # Connections
+        browse_btn.clicked.connect(self.browse_excel)
+        out_btn.clicked.connect(self.browse_output)
+        self.run_btn.clicked.connect(self.start_check)
+        self.stop_btn.clicked.connect(self.stop_check)
+        self.open_btn.clicked.connect(self.open_report_folder)
+
+    @staticmethod
+    def _format_stats(stats: dict) -> str:
+        return (
+            f"Checked: {stats.get('checked', 0)} | OK: {stats.get('ok', 0)} | "
+            f"Wrong target: {stats.get('wrong_target', 0)} | Wrong status: {stats.get('wrong_status', 0)} | "
+            f"No redirect: {stats.get('no_redirect', 0)} | Broken: {stats.get('broken', 0)} | Errors: {stats.get('errors', 0)}"
+        )
+
+    def log(self, msg: str):
+        self.log_box.append(msg)
+
+    def browse_excel(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Select Excel file", "", "Excel files (*.xlsx *.xlsm)")
+        if path:
+            self.excel_path.setText(path)
+
+    def browse_output(self):
+        folder = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+        if folder:
+            self.output_folder.setText(folder)
+
+    def open_report_folder(self):
+        folder = os.path.dirname(self.report_path)
+        if folder and os.path.exists(folder):
+            os.startfile(folder)
+
+    def start_check(self):
+        if self.worker and self.worker.isRunning():
+            QMessageBox.warning(self, "Busy", "A check is already running.")
+            return
+
+        path = self.excel_path.text().strip()
+        if not path or not os.path.exists(path):
+            QMessageBox.warning(self, "File error", "Excel file not found.")
+            return
+
+        output_folder = self.output_folder.text().strip() or os.path.dirname(path)
+
+        self.report_path = ""
+        self.log_box.clear()
+        self.progress.setValue(0)
+        self.stats_label.setText(self._format_stats({}))
+        self.open_btn.setEnabled(False)
+        self.run_btn.setEnabled(False)
+        self.stop_btn.setEnabled(True)
+
+        self.worker = RedirectMapWorker(
+            excel_path=path,
+            output_folder=output_folder,
+            max_concurrency=self.concurrency_spin.value(),
+        )
+        self.worker.progress_update.connect(self.progress.setValue)
+        self.worker.log_update.connect(self.log)
+        self.worker.stats_update.connect(lambda s: self.stats_label.setText(self._format_stats(s)))
+        self.worker.finished.connect(self.on_worker_finished)
+        self.worker.start()
+
+    def stop_check(self):
+        if self.worker and self.worker.isRunning():
+            self.worker.stop()
+            self.log("[WARN] Stop requested by user.")
+            self.stop_btn.setEnabled(False)
+
+    def on_worker_finished(self, report_path: str):
+        self.report_path = report_path
+        self.run_btn.setEnabled(True)
+        self.stop_btn.setEnabled(False)
+        self.open_btn.setEnabled(bool(report_path))
+        if report_path:
+            QMessageBox.information(self, "Redirect Map", f"Report saved to:\n{report_path}")
@@ -0,0 +1,123 @@
+"""
+Test script for the asset mode of the Broken Link Inspector (workers/broken_link_worker.py).
+"""
+
+import asyncio
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from bs4 import BeautifulSoup
+
+from workers.broken_link_worker import BrokenLinkWorker
+
+PAGE = """
+<html><head>
+  <link rel="stylesheet" href="/css/site.css">
+  <link rel="icon" href="/favicon.ico">
+  <script src="https://cdn.example.com/app.js"></script>
+  <script>inline()</script>
+</head><body>
+  <img src="/img/a.jpg" srcset="/img/a-320.jpg 320w, /img/a-640.jpg 640w" data-src="/img/lazy.jpg">
+  <img src="data:image/gif;base64,R0lGOD">
+  <picture><source srcset="/img/b.webp 1x, /img/b@2x.webp 2x" type="image/webp"><img src="/img/b.jpg"></picture>
+  <video><source src="/media/clip.mp4"></video>
+  <a href="/docs/guide.PDF?v=2">Guide</a>
+  <a href="/about">About</a>
+  <a href="javascript:void(0)">JS</a>
+</body></html>
+"""
+
+
+def test_extract_assets():
+    found = BrokenLinkWorker._extract_assets(BeautifulSoup(PAGE, "html.parser"), "https://site.com/fr/page")
+    assert found == [
+        ("https://site.com/img/a.jpg", "image"),
+        ("https://site.com/img/lazy.jpg", "image"),
+        ("https://site.com/img/a-320.jpg", "image"),
+        ("https://site.com/img/a-640.jpg", "image"),
+        ("https://site.com/img/b.jpg", "image"),
+        ("https://site.com/img/b.webp", "image"),
+        ("https://site.com/img/b@2x.webp", "image"),
+        ("https://site.com/media/clip.mp4", "media"),
+        ("https://site.com/css/site.css", "stylesheet"),
+        ("https://cdn.example.com/app.js", "script"),
+        ("https://site.com/docs/guide.PDF?v=2", "pdf"),
+    ]
+
+
+def _run(check):
+    async def sized(request):
+        return web.Response(body=b"x" * 2048, content_type="image/jpeg")
+
+    async def head_forbidden(request):
+        return web.Response(status=403)
+
+    async def ranged(request):
+        if request.headers.get("Range") == "bytes=0-0":
+            return web.Response(status=206, body=b"x", content_type="application/pdf",
+                                headers={"Content-Range": "bytes 0-0/5000"})
+        return web.Response(body=b"x" * 5000, content_type="application/pdf")
+
+    async def missing(request):
+        return web.Response(status=404)
+
+    async def page(request):
+        name = request.match_info["name"]
+        body = '<img src="/asset/ok.jpg"><img src="/asset/ok.jpg">'
+        if name == "two":
+            body += '<link rel="stylesheet" href="/asset/site.css">'
+        return web.Response(text=f"<html><body>{body}</body></html>", content_type="text/html")
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/asset/ok.jpg", sized)
+        app.router.add_route("HEAD", "/asset/doc.pdf", head_forbidden)
+        app.router.add_get("/asset/doc.pdf", ranged, allow_head=False)
+        app.router.add_get("/asset/gone.png", missing)
+        app.router.add_get("/page/{name}", page)
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            await check(server, session)
+
+    asyncio.run(main())
+
+
+def test_check_asset():
+    async def check(server, session):
+        worker = BrokenLinkWorker("single", "https://unused", check_assets=True, max_asset_kb=4)
+        sem = asyncio.Semaphore(2)
+
+        def info(asset_type):
+            return {"type": asset_type, "found_on": "https://site.com/", "pages": 3}
+
+        result = await worker._check_asset(str(server.make_url("/asset/ok.jpg")), info("image"), session, sem)
+        assert (result["status"], result["category"], result["content_length"]) == (200, "ok", 2048)
+        assert result["content_type"] == "image/jpeg" and not result["oversized"] and result["pages"] == 3
+
+        # HEAD refused: one-byte range GET, size from Content-Range
+        result = await worker._check_asset(str(server.make_url("/asset/doc.pdf")), info("pdf"), session, sem)
+        assert (result["status"], result["category"], result["content_length"]) == (200, "ok", 5000)
+        assert result["content_type"] == "application/pdf" and result["oversized"]
+
+        result = await worker._check_asset(str(server.make_url("/asset/gone.png")), info("image"), session, sem)
+        assert (result["status"], result["category"]) == (404, "client_error")
+
+    _run(check)
+
+
+def test_collect_assets_counts_pages():
+    async def check(server, session):
+        worker = BrokenLinkWorker("sitemap", "https://unused", check_assets=True)
+        pages = [str(server.make_url("/page/one")), str(server.make_url("/page/two"))]
+        assets = await worker._collect_assets(pages, session)
+        assert assets[str(server.make_url("/asset/ok.jpg"))]["pages"] == 2  # twice on each page
+        assert assets[str(server.make_url("/asset/site.css"))]["pages"] == 1
+
+    _run(check)
+
+
+if __name__ == "__main__":
+    test_extract_assets()
+    test_check_asset()
+    test_collect_assets_counts_pages()
+    print("✅ Broken link asset tests passed")
@@ -0,0 +1,90 @@
+"""
+Test script for the batch mode of the Content Extractor (workers/content_extractor_worker.py).
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import zipfile
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from openpyxl import load_workbook
+
+from workers.content_extractor_worker import ContentExtractorWorker
+
+
+async def _page(request):
+    name = request.match_info["name"]
+    if name == "missing":
+        return web.Response(status=404)
+    return web.Response(content_type="text/html", text=(
+        f"<html><head><title>{name}</title></head>"
+        f"<body><main><h1>Article {name}</h1><p>Body of {name}.</p></main></body></html>"
+    ))
+
+
+def _run_batch(folder, zip_output):
+    async def main():
+        app = web.Application()
+        app.router.add_get("/article/{name}", _page)
+        async with TestServer(app) as server:
+            urls = [str(server.make_url(f"/article/{n}")) for n in ("one", "two", "missing")]
+            worker = ContentExtractorWorker(
+                output_folder=folder, urls=urls, max_concurrency=2, processes=1,
+                zip_output=zip_output, formats=("docx", "md"),
+            )
+            store, threads = worker._store_outputs, set()
+
+            def recording_store(*args):
+                threads.add(threading.get_ident())
+                return store(*args)
+
+            worker._store_outputs = recording_store
+            await worker.extract_batch()
+            # Deflating / writing never blocks the event loop, and one writer keeps the zip consistent
+            assert len(threads) == 1 and threading.get_ident() not in threads
+            return urls
+
+    return asyncio.run(main())
+
+
+def _report_rows(folder):
+    report = next(f for f in os.listdir(folder) if f.endswith(".xlsx"))
+    wb = load_workbook(os.path.join(folder, report), read_only=True)
+    rows = {r[0]: r[1:] for r in wb["Pages"].iter_rows(min_row=2, values_only=True)}
+    wb.close()
+    return rows
+
+
+def test_batch_zip_output():
+    with tempfile.TemporaryDirectory() as folder:
+        urls = _run_batch(folder, zip_output=True)
+        archive = next(f for f in os.listdir(folder) if f.endswith(".zip"))
+        with zipfile.ZipFile(os.path.join(folder, archive)) as zf:
+            assert zf.testzip() is None
+            names = sorted(zf.namelist())
+            assert len(names) == 4 and sum(n.endswith(".docx") for n in names) == 2
+            md = next(n for n in names if n.endswith(".md") and "one" in n)
+            assert "Article one" in zf.read(md).decode("utf-8")
+
+        rows = _report_rows(folder)
+        assert rows[urls[0]][0] == "OK" and rows[urls[1]][0] == "OK"
+        assert rows[urls[2]] == ("Failed", None, "HTTP 404")
+
+
+def test_batch_individual_files():
+    with tempfile.TemporaryDirectory() as folder:
+        urls = _run_batch(folder, zip_output=False)
+        rows = _report_rows(folder)
+        for url in urls[:2]:
+            for name in rows[url][1].split(", "):
+                assert os.path.getsize(os.path.join(folder, name)) > 0
+        assert not any(f.endswith(".zip") for f in os.listdir(folder))
+
+
+if __name__ == "__main__":
+    test_batch_zip_output()
+    test_batch_individual_files()
+    print("✅ Content batch tests passed")
@@ -0,0 +1,94 @@
+"""
+Test script for the Qt-free content extraction used by the Content Extractor batch mode.
+"""
+
+import io
+
+from docx import Document
+
+from bs4 import BeautifulSoup
+
+from utils.content_extraction import ComponentIndex, CrawlerPageExtractor, docx_filename_for, render_docx_bytes
+from utils.extraction_rules import rules_for_url
+
+HTML = """
+<html><head><title>Guide</title><meta name="description" content="A short guide."></head>
+<body><main>
+  <h1>Feeding guide</h1>
+  <p>How much should a <a href="/puppies">puppy</a> eat?</p>
+  <ul><li>Three meals a day</li></ul>
+</main></body></html>
+"""
+
+
+def test_docx_filename_for():
+    assert docx_filename_for("https://example.com/a?b=1") == "https___example.com_a_b=1.docx"
+    assert len(docx_filename_for("https://example.com/" + "x" * 300)) == 105
+
+
+def test_render_docx_bytes():
+    data = render_docx_bytes("https://example.com/guide", HTML)
+    doc = Document(io.BytesIO(data))
+    text = "\n".join(p.text for p in doc.paragraphs)
+    assert "Feeding guide" in text
+    assert "Three meals a day" in text
+    assert doc.tables, "SEO metadata table expected"
+
+
+def test_component_index_matches_bs4():
+    soup = BeautifulSoup("""
+    <main><div class="hero--article-category"><p class="summary">In <a href="/c">category</a></p></div>
+      <div class="component--articles-list"><h3>Read more</h3>
+        <div class="card"><a href="/a1">A1</a><div class="field--name-title">First</div></div>
+        <div class="card"><div class="x"><a href="/a2"><img src="/i.jpg"></a></div></div>
+      </div>
+      <section class="nppe-feedback-article-form"><p>Form</p></section>
+    </main>""", "lxml")
+    main = soup.find("main")
+    index = ComponentIndex(main, rules_for_url("https://www.purina.fr/"))
+    component = soup.find(class_="component--articles-list")
+    text = "[class*=summary], [class*=text], [class*=desc], [class*=body], [class*=content]"
+
+    assert index.component(component)[1] == "Articles List"
+    assert index.is_excluded(soup.find("section"))
+    assert index.find(component, "h2, h3, h4") is component.find(["h2", "h3", "h4"])
+    assert index.find_all(component, "a") == component.find_all("a")
+    assert index.find(component, "img") is component.find("img")
+    assert index.find(main, ".field--name-title") is main.find(class_="field--name-title")
+    assert index.find_all(main, text) == main.select(text)
+    assert index.find(soup.find("img"), "img") is None  # self is not a descendant
+    assert index.inside(soup.find("p"), ".hero--article-category")
+    assert not index.inside(component, ".hero--article-category")
+
+
+def test_crawler_page_layout():
+    soup = BeautifulSoup("""
+    <body><nav>Menu</nav><main><h1>Title</h1>
+      <div class="block" data-block-plugin-id="main_block">
+        <p>See <a href="/x">this</a></p>
+        <section class="component--text-image"><img src="/a.jpg"><div class="text">Long enough text</div></section>
+        <table><tr><th>Name</th><th>Value</th></tr><tr><td>a</td></tr></table>
+      </div>
+    </main></body>""", "lxml")
+    model = CrawlerPageExtractor("https://example.com/p").extract(soup)
+    summary = [
+        (b["type"], b.get("text") or b.get("runs") or b.get("rows")) for b in model.blocks if b["type"] != "spacer"
+    ]
+    assert summary == [
+        ("title", "Source: https://example.com/p"),
+        ("heading", [["Title", ""]]),  # in page order, not moved to the top
+        ("marker", "[DRUPAL BLOCK: main_block]"),
+        ("paragraph", [["Seethis", ""]]),  # plain text, links not inlined
+        ("marker", "[COMPONENT: Text Image]"),
+        ("table", [[[["IMAGE:\n", "b"], ["/a.jpg", ""]], [["Long enough text", ""]]]]),
+        ("table", [[[["Name", "b"]], [["Value", "b"]]], [[["a", ""]]]]),
+    ]
+    assert model.seo == [] and [c["name"] for c in model.components] == ["Text Image"]
+
+
+if __name__ == "__main__":
+    test_docx_filename_for()
+    test_render_docx_bytes()
+    test_component_index_matches_bs4()
+    test_crawler_page_layout()
+    print("✅ Content extraction tests passed")
@@ -0,0 +1,59 @@
+"""
+Test script for the content document model and its renderers.
+"""
+
+import io
+
+from docx import Document
+
+from utils.content_model import (
+    ContentDocument, render_bytes, render_docx, render_html, render_markdown, run
+)
+
+
+def sample_model():
+    model = ContentDocument("https://example.com/guide")
+    model.add("title", text="Source: https://example.com/guide")
+    model.add("heading", level=2, runs=[run("Feeding")])
+    model.add("paragraph", runs=[run("See "), run("puppies", "a", "https://example.com/p"), run(" <now>", "b")])
+    model.add("paragraph", runs=[run("One")], style="List Number")
+    model.add("paragraph", runs=[run("Two")], style="List Number")
+    model.add("marker", kind="component", text="[COMPONENT: Text Image 1]")
+    model.add("table", style="Table Grid", rows=[[[run("IMAGE:\n", "b"), run("/i.jpg")], [run("a|b")]]])
+    model.seo = [["Meta Title", "Guide"]]
+    return model
+
+
+def test_json_round_trip():
+    model = sample_model()
+    again = ContentDocument.from_json(model.to_json())
+    assert again.to_dict() == model.to_dict()
+    assert render_bytes(again, "md") == render_bytes(model, "md")
+
+
+def test_render_markdown():
+    md = render_markdown(sample_model())
+    assert "## Feeding" in md
+    assert "See [puppies](https://example.com/p) **<now>**" in md
+    assert "1. One\n2. Two\n\n>" in md
+    assert "| **IMAGE:**<br>/i.jpg | a\\|b |" in md
+    assert "| Meta Title | Guide |" in md
+
+
+def test_render_html_and_docx():
+    html = render_html(sample_model())
+    assert '<a href="https://example.com/p">puppies</a><strong> &lt;now&gt;</strong>' in html
+    assert "<ol><li>One</li><li>Two</li></ol>" in html
+
+    doc = Document(io.BytesIO(render_bytes(sample_model(), "docx")))
+    text = "\n".join(p.text for p in doc.paragraphs)
+    assert "See puppies (https://example.com/p) <now>" in text
+    assert len(doc.tables) == 2  # component + SEO metadata
+    assert render_docx(ContentDocument()).paragraphs == []
+
+
+if __name__ == "__main__":
+    test_json_round_trip()
+    test_render_markdown()
+    test_render_html_and_docx()
+    print("✅ Content model tests passed")
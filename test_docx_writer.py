@@ -0,0 +1,87 @@
+"""
+Test script for the bulk python-docx XML writer.
+"""
+
+import io
+import os
+import tempfile
+
+from docx import Document
+from PIL import Image
+
+from utils.docx_writer import DocxXmlWriter, run_xml
+
+
+def _reload(doc):
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return Document(io.BytesIO(buffer.getvalue()))
+
+
+def test_paragraphs_and_styles():
+    doc = Document()
+    writer = DocxXmlWriter(doc)
+    writer.paragraph(run_xml("Title", bold=True, size_pt=14, color="0070C0"), align="center")
+    writer.paragraph(run_xml("Item <1> & \x0bmore"), style="List Bullet")
+    writer.paragraph(run_xml("line one\nline two"), style="Heading 2")
+    writer.paragraph()
+    writer.flush()
+
+    doc = _reload(doc)
+    paragraphs = doc.paragraphs
+    assert paragraphs[0].runs[0].bold and paragraphs[0].runs[0].font.size.pt == 14
+    assert paragraphs[1].text == "Item <1> & more"
+    assert paragraphs[1].style.name == "List Bullet"
+    assert paragraphs[2].text == "line one\nline two"
+    assert paragraphs[2].style.name == "Heading 2"
+    assert paragraphs[3].text == ""
+
+
+def test_table_with_header_and_links():
+    doc = Document()
+    writer = DocxXmlWriter(doc)
+    url = "https://example.com/a?b=1&c=2"
+    link = writer.hyperlink(url, run_xml(url, color="0000FF", underline=True))
+    assert writer.hyperlink(url, "").startswith(link[:link.index(">")])  # same relationship reused
+    writer.table([
+        [run_xml("Title", bold=True), run_xml("URL", bold=True)],
+        [run_xml("First"), link],
+        [run_xml("Short row")],
+    ], "Light Grid Accent 1", header_rows=1)
+    writer.flush()
+
+    doc = _reload(doc)
+    table = doc.tables[0]
+    assert table.style.name == "Light Grid Accent 1"
+    assert [[c.text for c in row.cells] for row in table.rows] == [
+        ["Title", "URL"], ["First", url], ["Short row", ""]
+    ]
+    assert table.rows[0].cells[0].paragraphs[0].runs[0].bold
+    hyperlink = table.rows[1].cells[1].paragraphs[0].hyperlinks[0]
+    assert hyperlink.address == url
+
+
+def test_pictures_in_cells():
+    doc = Document()
+    writer = DocxXmlWriter(doc)
+    max_width = writer.cell_width(2)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "wide.png")
+        Image.new("RGB", (960, 96)).save(path, dpi=(96, 96))
+        writer.table([[[run_xml("IMAGE:"), writer.picture(path, max_width)], writer.picture(path)]])
+    writer.flush()
+
+    doc = _reload(doc)
+    shapes = doc.inline_shapes
+    assert len(shapes) == 2
+    assert shapes[0].width == max_width and shapes[0].height == max_width // 10
+    assert shapes[1].width == 960 * 9525  # native size at 96 dpi
+    assert len([r for r in doc.part.rels.values() if r.reltype.endswith("/image")]) == 1
+    assert doc.tables[0].rows[0].cells[0].paragraphs[0].text == "IMAGE:"
+
+
+if __name__ == "__main__":
+    test_paragraphs_and_styles()
+    test_table_with_header_and_links()
+    test_pictures_in_cells()
+    print("✅ DOCX writer tests passed")
@@ -0,0 +1,44 @@
+"""
+Test script for site-wide duplicate title/description/H1 detection.
+"""
+
+from openpyxl import Workbook
+
+from utils.duplicates import DuplicateIndex
+
+
+def test_exact_and_near_groups():
+    index = DuplicateIndex()
+    index.add_page("https://example.com/a", {"title": "Dog food | Purina", "h1": "Dog food"})
+    index.add_page("https://example.com/b", {"title": "Dog  food", "h1": ""})
+    index.add_page("https://example.com/c", {"title": "Premium dry dog food for adult dogs"})
+    index.add_page("https://example.com/d", {"title": "Premium dry dog food for adult dogs!"})
+    index.add_page("https://example.com/e", {"title": "Cat litter"})
+
+    exact = index.exact_groups("title")
+    assert exact == [("Dog food", ["https://example.com/a", "https://example.com/b"])]
+    assert index.exact_groups("h1") == []
+
+    near = index.near_groups("title")
+    assert len(near) == 1
+    sim, members = near[0]
+    assert sim >= index.threshold
+    assert {u for _, urls in members for u in urls} == {"https://example.com/c", "https://example.com/d"}
+
+
+def test_write_sheet():
+    index = DuplicateIndex()
+    for url in ("https://example.com/1", "https://example.com/2"):
+        index.add_page(url, {"meta_description": "Same description"})
+    wb = Workbook()
+    rows = index.write_sheet(wb)
+    ws = wb["Duplicates"]
+    assert rows == 2
+    assert [c.value for c in ws[1]] == ["Field", "Match Type", "Group", "Similarity", "Value", "URL"]
+    assert ws.cell(row=2, column=1).value == "Meta Description"
+
+
+if __name__ == "__main__":
+    test_exact_and_near_groups()
+    test_write_sheet()
+    print("✅ Duplicate detection tests passed")
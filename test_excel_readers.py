@@ -0,0 +1,59 @@
+"""
+Test script for the streaming Excel readers (utils/excel_readers.py).
+"""
+
+import os
+import tempfile
+
+from openpyxl import Workbook
+
+from utils.excel_readers import image_url_items, normalize_url_chunk, open_image_url_sheet
+
+
+def _workbook(folder, rows, name="urls.xlsx"):
+    wb = Workbook()
+    ws = wb.active
+    for row in rows:
+        ws.append(row)
+    path = os.path.join(folder, name)
+    wb.save(path)
+    return path
+
+
+def test_normalize_url_chunk():
+    seen = {"https://a.com/1.jpg"}
+    values = [" https://a.com/1.jpg", "a.com/2.jpg", None, "", "  ", "HTTP://b.com/3.png", "a.com/2.jpg", 42]
+    assert normalize_url_chunk(values, seen) == ["https://a.com/2.jpg", "HTTP://b.com/3.png", "https://42"]
+    assert normalize_url_chunk(["https://a.com/2.jpg"], seen) == []
+
+
+def test_image_url_items():
+    with tempfile.TemporaryDirectory() as folder:
+        rows = [["SKU", "Image URL", "Notes"]]
+        rows += [[i, f"cdn.example.com/p/{i % 7}.jpg", "x" * 50] for i in range(40)]
+        rows += [[99, None, "blank"], [100, "https://cdn.example.com/p/extra.jpg", ""]]
+        stream = open_image_url_sheet(_workbook(folder, rows))
+        assert stream.data_rows_hint == 42
+        urls = list(image_url_items(stream, chunk_size=5))  # duplicates span chunks
+        assert urls == [f"https://cdn.example.com/p/{i}.jpg" for i in range(7)] + ["https://cdn.example.com/p/extra.jpg"]
+
+        # No header: the first column holding URLs, first row included
+        path = _workbook(folder, [[1, "https://x.com/a.jpg"], [2, "https://x.com/b.jpg"]], "plain.xlsx")
+        assert list(image_url_items(open_image_url_sheet(path))) == ["https://x.com/a.jpg", "https://x.com/b.jpg"]
+
+
+def test_projected_rows():
+    with tempfile.TemporaryDirectory() as folder:
+        rows = [["a", "url", "c", "d"]] + [[i, f"u{i}", i * 2, None] for i in range(30)]
+        stream = open_image_url_sheet(_workbook(folder, rows))
+        projected = list(stream.rows(columns=[1, 2]))
+        assert projected[0] == (2, ("u0", 0))
+        assert projected[-1] == (31, ("u29", 58))
+        assert len(projected) == 30
+
+
+if __name__ == "__main__":
+    test_normalize_url_chunk()
+    test_image_url_items()
+    test_projected_rows()
+    print("✅ Excel reader tests passed")
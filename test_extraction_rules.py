@@ -0,0 +1,127 @@
+"""
+Test script for the declarative extraction rules (utils/extraction_rules.py).
+"""
+
+import json
+import os
+import tempfile
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+from utils.content_extraction import ComponentIndex, ContentExtractor
+from utils.extraction_rules import EXCLUDE, MatcherSet, RulesError, load_rules, rules_for_url, yaml
+
+HTML = """
+<main>
+  <div class="card promo-box" id="first" data-kind="offer"><p class="lead-text">Offer</p></div>
+  <section class="component--video hero--image"><img src="/v.jpg"><span class="x content-main">Caption</span></section>
+  <div class="a component--quote b"><h3>Quote</h3></div>
+  <article class="cards"><a href="/x" class="btn">Go</a></article>
+</main>
+"""
+
+SELECTORS = [
+    ".card", "div.card.promo-box", "#first", "p", "h2, h3", "[data-kind]", "[data-kind=offer]",
+    "[class*=text]", "[class^=component--]", "[class*=\" component--\"]", "[class$=image]",
+    "a.btn[href]", "*.cards", "section#first", ".missing",
+]
+
+SITE_RULES = {
+    "name": "petshop",
+    "hosts": ["petshop.example"],
+    "exclude": [".ad-slot"],
+    "components": [
+        {"name": "Product Card", "match": ".product", "handler": "summary",
+         "image": ".product__photo", "text": ".product__blurb"},
+    ],
+}
+
+
+def test_matchers_agree_with_soupsieve():
+    soup = BeautifulSoup(HTML, "lxml")
+    tags = soup.find("main").find_all(True)
+    matchers = MatcherSet()
+    for selector in SELECTORS:
+        matchers.add(selector, selector)
+    for tag in tags:
+        expected = {s for s in SELECTORS if soupsieve.match(s, tag)}
+        assert matchers.match(tag) == expected, (tag.name, tag.get("class"))
+
+
+def test_unsupported_selector():
+    for selector in ("div > p", "div p", ":not(.a)", ".a,"):
+        try:
+            MatcherSet().add("x", selector)
+        except RulesError:
+            continue
+        raise AssertionError(f"{selector!r} should be rejected")
+
+
+def test_default_rules_components():
+    rules = rules_for_url("https://www.purina.fr/article")
+    soup = BeautifulSoup(HTML, "lxml")
+    section = soup.find("section")
+    labels, (rule, name) = rules.classify(section)
+    assert name == "Hero Image" and rule["handler"] == "summary"  # earlier rule wins
+    assert rules.classify(BeautifulSoup("<div class='component--video'></div>", "lxml").div)[1][1] == "Video"
+    assert rules.classify(soup.find(class_="component--quote"))[1][1] == "Quote"
+    assert rules.classify(soup.find("p"))[1] is None
+    assert EXCLUDE in rules.classify(BeautifulSoup("<p id='nppe-feedback-article-form'></p>", "lxml").p)[0]
+
+
+def test_site_rules_by_host():
+    html = """<html><body><main>
+      <div class="product"><img class="product__photo" src="/p.jpg" alt="Kibble">
+        <div class="product__blurb">Grain-free kibble for adult dogs.</div></div>
+      <div class="ad-slot"><p>Advertisement</p></div>
+    </main></body></html>"""
+    with tempfile.TemporaryDirectory() as folder:
+        with open(os.path.join(folder, "default.json"), "w", encoding="utf-8") as f:
+            json.dump({"components": []}, f)
+        with open(os.path.join(folder, "petshop.json"), "w", encoding="utf-8") as f:
+            json.dump(SITE_RULES, f)
+
+        rules = rules_for_url("https://shop.petshop.example/p/1", folder)
+        assert rules.name == "petshop"
+        assert rules_for_url("https://other.example/", folder).name == "default"
+
+        model = ContentExtractor("https://shop.petshop.example/p/1", rules=rules).extract(BeautifulSoup(html, "lxml"))
+        assert [c["name"] for c in model.components] == ["Product Card"]
+        assert [i["src"] for i in model.images] == ["https://shop.petshop.example/p.jpg"]
+        texts = json.dumps(model.to_dict())
+        assert "Grain-free kibble" in texts
+        assert "Advertisement" not in texts
+
+
+def test_index_matches_select():
+    rules = rules_for_url("https://www.purina.fr/article")
+    soup = BeautifulSoup(HTML, "lxml")
+    main = soup.find("main")
+    index = ComponentIndex(main, rules)
+    for kind in rules.kinds:
+        assert index.find_all(main, kind) == main.select(kind), kind
+        assert index.find(main, kind) is main.select_one(kind), kind
+
+
+def test_yaml_rules():
+    if yaml is None:
+        return
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "petshop.yaml")
+        with open(path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(SITE_RULES, f)
+        rules = load_rules(path)
+        assert rules.applies_to("https://petshop.example/")
+        assert rules.components[0]["image"] == ".product__photo"
+        assert rules.components[0]["fallback"] == "p, h1, h2, h3, h4, h5, h6"  # handler default
+
+
+if __name__ == "__main__":
+    test_matchers_agree_with_soupsieve()
+    test_unsupported_selector()
+    test_default_rules_components()
+    test_site_rules_by_host()
+    test_index_matches_select()
+    test_yaml_rules()
+    print("✅ Extraction rules tests passed")
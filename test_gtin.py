@@ -0,0 +1,38 @@
+"""
+Test script for the vectorized GTIN / product ID precheck.
+"""
+
+from utils.gtin import validate_gtins, validate_ids, is_blocking
+
+
+def test_validate_gtins():
+    values = [
+        "4006381333931",    # GTIN-13
+        "96385074",         # GTIN-8
+        "036000291452",     # GTIN-12 (UPC-A)
+        "10614141000415",   # GTIN-14
+        4006381333931.0,    # Excel float artifact, normalized by norm_num
+        "4006381333932",    # wrong check digit
+        "12345",            # wrong length
+        "40063813339X1",    # not numeric
+        None,
+        "",
+    ]
+    assert validate_gtins(values) == [
+        "", "", "", "", "",
+        "bad check digit", "bad length", "not numeric", "missing", "missing",
+    ]
+    assert validate_gtins([]) == []
+
+
+def test_validate_ids_and_blocking():
+    assert validate_ids(["123", 45.0, "12a", None]) == ["", "", "not numeric", "missing"]
+    assert not is_blocking("")
+    assert not is_blocking("missing")
+    assert is_blocking("bad check digit")
+
+
+if __name__ == "__main__":
+    test_validate_gtins()
+    test_validate_ids_and_blocking()
+    print("✅ GTIN precheck tests passed")
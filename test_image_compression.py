@@ -0,0 +1,140 @@
+"""
+Test script for the image compression helpers used by the image workers.
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+
+from PIL import Image
+
+from utils.image_compression import CompressionEngine, compress_file, compress_image_file, describe_savings, encode_to_budget
+
+
+def test_compress_image_file():
+    with tempfile.TemporaryDirectory() as folder:
+        src = os.path.join(folder, "logo.png")
+        Image.new("RGBA", (64, 32), (255, 0, 0, 128)).save(src)
+        out_dir = os.path.join(folder, "Compressed")
+        os.makedirs(out_dir)
+
+        path = compress_image_file(src, out_dir, "jpg", 80)
+        assert path == os.path.join(out_dir, "logo.jpg")
+        with Image.open(path) as img:
+            assert img.format == "JPEG" and img.mode == "RGB" and img.size == (64, 32)
+
+        path = compress_image_file(src, out_dir, "webp", 80)
+        with Image.open(path) as img:
+            assert img.format == "WEBP" and img.mode == "RGBA"
+
+
+
+def _photos(folder, count):
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"photo{i}.png")
+        Image.effect_noise((200, 150), 40).convert("RGB").save(path)
+        paths.append(path)
+    return paths
+
+
+def test_engine_reports_savings():
+    with tempfile.TemporaryDirectory() as folder:
+        sources = _photos(folder, 5)
+        with open(os.path.join(folder, "broken.png"), "wb") as f:
+            f.write(b"not an image")
+        sources.append(os.path.join(folder, "broken.png"))
+        jobs = [(p, p[:-4] + ".jpg") for p in sources]
+
+        with CompressionEngine("jpg", 70, processes=2, max_in_flight=2) as engine:
+            results = list(engine.compress_all(iter(jobs)))
+        assert sorted(r.source for r in results) == sorted(sources)
+        ok = [r for r in results if not r.error]
+        assert len(ok) == 5
+        for r in ok:
+            assert 0 < r.compressed_size < r.original_size == os.path.getsize(r.source)
+            assert "KB →" in describe_savings(r)
+        failed = [r for r in results if r.error]
+        assert failed[0].source.endswith("broken.png") and not os.path.exists(failed[0].output)
+
+
+def test_engine_bounded_and_cancelled():
+    with tempfile.TemporaryDirectory() as folder:
+        sources = _photos(folder, 2)
+        pulled = []
+
+        def jobs():
+            for i in range(1000):
+                pulled.append(i)
+                src = sources[i % 2]
+                yield src, os.path.join(folder, f"out{i}.webp")
+
+        with CompressionEngine("webp", 60, processes=1, max_in_flight=3) as engine:
+            results = engine.compress_all(jobs())
+            next(results)
+            assert len(pulled) <= 4  # never more than max_in_flight queued (plus the refill)
+            threading.Timer(0.1, engine.cancel).start()
+            rest = list(results)
+        assert len(rest) + 1 < 1000 and len(pulled) < 1000
+
+        async def cancelled_before_start():
+            engine = CompressionEngine("jpg", 70, processes=1)
+            engine.cancel()
+            try:
+                return await engine.compress(sources[0], os.path.join(folder, "x.jpg"))
+            finally:
+                engine.close()
+        assert asyncio.run(cancelled_before_start()) is None
+
+
+def _photo(size=(400, 300)):
+    """Smooth gradient with mild noise: compresses like a product photo."""
+    noise = Image.effect_noise(size, 20).convert("RGB")
+    gradient = Image.linear_gradient("L").resize(size).convert("RGB")
+    return Image.blend(gradient, noise, 0.3)
+
+
+def test_encode_to_budget():
+    img = _photo()
+    top = len(encode_to_budget(img, "JPEG", 10 ** 9)[0])
+    budget = top // 3
+    data, quality = encode_to_budget(img, "JPEG", budget)
+    assert len(data) <= budget and 20 <= quality < 95
+    above, _ = encode_to_budget(img, "JPEG", 10 ** 9, max_quality=quality + 1)
+    assert len(above) > budget  # the next quality up does not fit: the search found the highest one
+    data, quality = encode_to_budget(img, "WEBP", 10 ** 9, max_quality=80)
+    assert quality == 80
+    data, quality = encode_to_budget(img, "PNG", 1024)
+    assert quality is None and data[:4] == b"\x89PNG"
+
+
+def test_budget_mode():
+    with tempfile.TemporaryDirectory() as folder:
+        src = os.path.join(folder, "photo.png")
+        _photo().save(src)
+        out_dir = os.path.join(folder, "out")
+        os.makedirs(out_dir)
+
+        result = compress_file(src, os.path.join(out_dir, "photo.jpg"), "jpg", 90, max_bytes=15 * 1024)
+        assert not result.error and not result.kept_original
+        assert result.compressed_size <= 15 * 1024 and result.quality <= 90
+        with Image.open(result.output) as img:
+            assert img.format == "JPEG"
+
+        # A q95 re-encode of a q30 JPEG is larger than the file: the original is kept
+        low = os.path.join(folder, "low.jpg")
+        _photo().save(low, quality=30)
+        result = compress_file(low, os.path.join(out_dir, "low.webp"), "webp", 95, max_bytes=10 ** 9)
+        assert result.kept_original and result.quality is None
+        assert result.output == os.path.join(out_dir, "low.jpg") and result.compressed_size == result.original_size
+        assert "original kept" in describe_savings(result)
+
+
+if __name__ == "__main__":
+    test_compress_image_file()
+    test_engine_reports_savings()
+    test_engine_bounded_and_cancelled()
+    test_encode_to_budget()
+    test_budget_mode()
+    print("✅ Image compression tests passed")
@@ -0,0 +1,136 @@
+"""
+Test script for the streaming image downloads (utils/image_downloads.py).
+"""
+
+import asyncio
+import base64
+import hashlib
+import os
+import tempfile
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from utils.image_downloads import DownloadError, fetch_to_file, stream_to_file
+from workers.image_downloader_worker import ImageProcessorThread
+
+BODY = os.urandom(3 * 1024 * 1024 + 123)
+
+
+async def _body(request):
+    return web.Response(body=BODY, content_type="image/jpeg")
+
+
+async def _chunked(request):
+    response = web.StreamResponse()
+    await response.prepare(request)  # no Content-Length
+    for i in range(0, len(BODY), 100_000):
+        await response.write(BODY[i:i + 100_000])
+    await response.write_eof()
+    return response
+
+
+async def _bad_md5(request):
+    return web.Response(body=BODY, headers={"Content-MD5": base64.b64encode(b"0" * 16).decode()})
+
+
+async def _good_md5(request):
+    md5 = base64.b64encode(hashlib.md5(BODY).digest()).decode()
+    return web.Response(body=BODY, headers={"Content-MD5": md5})
+
+
+def _run(check):
+    async def main(folder):
+        app = web.Application()
+        for name, handler in (("body", _body), ("chunked", _chunked), ("bad_md5", _bad_md5), ("good_md5", _good_md5)):
+            app.router.add_get(f"/{name}", handler)
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            async def download(name, **kwargs):
+                path = os.path.join(folder, name + ".bin")
+                async with session.get(server.make_url(f"/{name}")) as response:
+                    return await stream_to_file(response, path, **kwargs)
+            await check(download, folder)
+
+    with tempfile.TemporaryDirectory() as folder:
+        asyncio.run(main(folder))
+
+
+async def _rejected(coro):
+    try:
+        await coro
+    except DownloadError:
+        return True
+    return False
+
+
+def test_stream_to_file():
+    async def check(download, folder):
+        sha = hashlib.sha256(BODY).hexdigest()
+        result = await download("body", expected_digest=sha)
+        assert result.size == len(BODY) and result.sha256 == sha
+        with open(result.path, "rb") as f:
+            assert f.read() == BODY
+        result = await download("chunked", expected_digest="md5:" + hashlib.md5(BODY).hexdigest())
+        assert result.sha256 == sha
+        assert (await download("good_md5")).size == len(BODY)
+        assert sorted(os.listdir(folder)) == ["body.bin", "chunked.bin", "good_md5.bin"]
+    _run(check)
+
+
+def test_rejections_leave_no_file():
+    async def check(download, folder):
+        assert await _rejected(download("body", max_bytes=1024))          # Content-Length
+        assert await _rejected(download("chunked", max_bytes=1024 * 1024))  # while streaming
+        assert await _rejected(download("bad_md5"))
+        assert await _rejected(download("body", expected_digest="0" * 64))
+        assert os.listdir(folder) == []
+        assert (await download("bad_md5", verify_content_md5=False)).size == len(BODY)
+    _run(check)
+
+
+def test_fetch_retries_and_worker():
+    hits = {}
+
+    async def flaky(request):
+        name = request.match_info["name"]
+        hits[name] = hits.get(name, 0) + 1
+        if name.startswith("flaky") and hits[name] < 3:
+            return web.Response(status=503, headers={"Retry-After": "0"})
+        if name.startswith("missing"):
+            return web.Response(status=404)
+        return web.Response(body=BODY[:5000], content_type="image/jpeg")
+
+    async def main(folder):
+        app = web.Application()
+        app.router.add_get("/img/{name:.+}", flaky)
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            result = await fetch_to_file(session, server.make_url("/img/flaky.jpg"), os.path.join(folder, "a.jpg"),
+                                         backoff=0.01)
+            assert result.size == 5000 and hits["flaky.jpg"] == 3
+            assert await _rejected(fetch_to_file(session, server.make_url("/img/missing.jpg"),
+                                                 os.path.join(folder, "b.jpg"), backoff=0.01))
+            assert hits["missing.jpg"] == 1  # 404 is not retried
+
+            thread = ImageProcessorThread("url", "", [], "", folder, "jpg", 80, concurrency=4, per_host=2)
+            progress, statuses = [], []
+            thread.download_progress.connect(progress.append)
+            thread.status_update.connect(statuses.append)
+            urls = [str(server.make_url(f"/img/{d}/photo.jpg")) for d in "abc"]
+            urls += [str(server.make_url("/img/flaky2.jpg")), str(server.make_url("/img/missing2.jpg"))]
+            out = os.path.join(folder, "Originals")
+            os.makedirs(out)
+            await thread._download_many(urls, out)
+            assert sorted(os.listdir(out)) == ["flaky2.jpg", "photo (2).jpg", "photo (3).jpg", "photo.jpg"]
+            assert progress[-1] == 100 and len(progress) == 5
+            assert "Downloaded 4 of 5 images" in statuses[-1] and "files/s" in statuses[-1]
+
+    with tempfile.TemporaryDirectory() as folder:
+        asyncio.run(main(folder))
+
+
+if __name__ == "__main__":
+    test_stream_to_file()
+    test_rejections_leave_no_file()
+    test_fetch_retries_and_worker()
+    print("✅ Image download tests passed")
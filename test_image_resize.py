@@ -0,0 +1,159 @@
+"""
+Test script for the image resizer (utils/image_resize.py, workers/image_resizer_worker.py).
+"""
+
+import json
+import os
+import tempfile
+
+from PIL import Image, ImageChops, ImageStat
+
+from utils.image_resize import resize_file, resize_image, responsive_set, target_size, variant_stems
+from workers.image_resizer_worker import ImageResizerThread, ResponsiveSetThread
+
+
+def _photo(path, size=(3000, 2000)):
+    gradient = Image.linear_gradient("L").resize(size).convert("RGB")
+    noise = Image.effect_noise(size, 25).convert("RGB")
+    Image.blend(gradient, noise, 0.2).save(path, quality=92)
+
+
+def test_target_size():
+    assert target_size(800, 600) == (800, 600)
+    assert target_size(800, 600, ratio=9 / 16) == (800, 450)
+
+
+def test_resize_matches_full_decode():
+    with tempfile.TemporaryDirectory() as folder:
+        src = os.path.join(folder, "photo.jpg")
+        _photo(src)
+        fast, full = os.path.join(folder, "fast.png"), os.path.join(folder, "full.png")
+        assert resize_image(src, fast, 600, 400) == (3000, 2000)
+        resize_image(src, full, 600, 400, reducing_gap=None)  # previous behaviour: full decode + LANCZOS
+        with Image.open(fast) as a, Image.open(full) as b:
+            assert a.size == b.size == (600, 400)
+            diff = ImageStat.Stat(ImageChops.difference(a.convert("RGB"), b.convert("RGB"))).mean
+            assert max(diff) < 3, diff
+
+        png = os.path.join(folder, "logo.png")
+        Image.new("RGBA", (900, 900), (0, 128, 255, 128)).save(png)
+        resize_image(png, os.path.join(folder, "logo_small.png"), 300, 0, ratio=1.0)
+        with Image.open(os.path.join(folder, "logo_small.png")) as img:
+            assert img.size == (300, 300) and img.mode == "RGB"
+
+        result = resize_file(os.path.join(folder, "missing.jpg"), fast, 10, 10)
+        assert result.error and result.source_size is None
+
+
+def test_worker_progress_and_stop():
+    with tempfile.TemporaryDirectory() as folder:
+        out = os.path.join(folder, "out")
+        os.makedirs(out)
+        src = os.path.join(folder, "photo.jpg")
+        _photo(src, (800, 600))
+        with open(os.path.join(folder, "broken.jpg"), "wb") as f:
+            f.write(b"not a jpeg")
+        jobs = [(src, os.path.join(out, f"p{i}.jpg")) for i in range(5)]
+        jobs.append((os.path.join(folder, "broken.jpg"), os.path.join(out, "broken.jpg")))
+
+        thread = ImageResizerThread(jobs, 200, 150, processes=2)
+        progress = []
+        thread.progress.connect(progress.append)
+        thread.resize_all()
+        assert progress[-1] == 100 and len(progress) == 6
+        assert [name for name, _ in thread.failures] == ["broken.jpg"]
+        assert len(os.listdir(out)) == 5
+
+        stopped = ImageResizerThread(jobs * 20, 200, 150, processes=1)
+        stopped.progress.connect(lambda _: setattr(stopped, "stop_processing_flag", True))
+        stopped.resize_all()
+        assert 1 <= stopped.done <= 3  # the queued files were cancelled
+
+
+def test_responsive_set():
+    with tempfile.TemporaryDirectory() as folder:
+        src = os.path.join(folder, "photo.jpg")
+        _photo(src, (1500, 1000))
+        entry = responsive_set(src, folder, (320, 640, 1024, 1920), ("jpg", "webp"), quality=75)
+        assert (entry["width"], entry["height"]) == (1500, 1000)
+        assert [(v["format"], v["width"], v["height"]) for v in entry["variants"]] == [
+            ("jpg", 320, 213), ("jpg", 640, 427), ("jpg", 1024, 683),
+            ("webp", 320, 213), ("webp", 640, 427), ("webp", 1024, 683),
+        ]  # 1920 would upscale
+        assert entry["srcset"]["webp"] == "photo-320w.webp 320w, photo-640w.webp 640w, photo-1024w.webp 1024w"
+        for v in entry["variants"]:
+            path = os.path.join(folder, v["path"])
+            assert os.path.getsize(path) == v["bytes"]
+            with Image.open(path) as img:
+                assert img.size == (v["width"], v["height"]) and img.format == v["format"].replace("jpg", "jpeg").upper()
+
+        # Cascaded output matches a direct resize of the full image
+        resize_image(src, os.path.join(folder, "direct.png"), 320, 213, reducing_gap=None)
+        with Image.open(os.path.join(folder, "direct.png")) as a, Image.open(os.path.join(folder, "photo-320w.jpg")) as b:
+            diff = ImageStat.Stat(ImageChops.difference(a.convert("RGB"), b.convert("RGB"))).mean
+            assert max(diff) < 4, diff
+
+        png = os.path.join(folder, "logo.png")
+        Image.new("RGBA", (200, 100), (0, 128, 255, 128)).save(png)
+        entry = responsive_set(png, folder, (320, 640), ("jpg", "webp"))
+        assert [(v["path"], v["width"]) for v in entry["variants"]] == [("logo-200w.jpg", 200), ("logo-200w.webp", 200)]
+        with Image.open(os.path.join(folder, "logo-200w.webp")) as img:
+            assert img.mode == "RGBA"
+
+        assert "error" in responsive_set(os.path.join(folder, "missing.jpg"), folder, (320,), ("jpg",))
+
+
+def test_responsive_worker_manifest():
+    with tempfile.TemporaryDirectory() as folder:
+        out = os.path.join(folder, "out")
+        sources = []
+        for name in ("b.jpg", "a.jpg"):
+            sources.append(os.path.join(folder, name))
+            _photo(sources[-1], (800, 600))
+        with open(os.path.join(folder, "broken.jpg"), "wb") as f:
+            f.write(b"not a jpeg")
+        sources.append(os.path.join(folder, "broken.jpg"))
+
+        thread = ResponsiveSetThread(sources, out, (320, 640), ("jpg", "webp"), processes=2)
+        thread.generate_all()
+        assert [name for name, _ in thread.failures] == ["broken.jpg"]
+        with open(os.path.join(out, ResponsiveSetThread.manifest_name), encoding="utf-8") as f:
+            manifest = json.load(f)
+        assert manifest["widths"] == [320, 640] and manifest["formats"] == ["jpg", "webp"]
+        assert [entry["source"] for entry in manifest["images"]] == ["b.jpg", "a.jpg"]
+        assert manifest["images"][1]["srcset"]["jpg"] == "a-320w.jpg 320w, a-640w.jpg 640w"
+        assert len([f for f in os.listdir(out) if not f.endswith(".json")]) == 8
+
+
+def test_responsive_set_shared_stems():
+    assert variant_stems(["a/hero.jpg", "b/hero.png", "HERO.webp", "hero-2.jpg", "my photo.jpg"]) == [
+        "hero", "hero-2", "HERO-3", "hero-2-2", "my photo",
+    ]
+    with tempfile.TemporaryDirectory() as folder:
+        out = os.path.join(folder, "out")
+        _photo(os.path.join(folder, "hero.jpg"), (700, 500))
+        Image.new("RGB", (700, 350), (200, 30, 30)).save(os.path.join(folder, "hero.png"))
+        _photo(os.path.join(folder, "my photo.jpg"), (400, 300))
+        sources = [os.path.join(folder, n) for n in ("hero.jpg", "hero.png", "my photo.jpg")]
+
+        thread = ResponsiveSetThread(sources, out, (320, 640), ("jpg",), processes=2)
+        thread.generate_all()
+        paths = [[v["path"] for v in entry["variants"]] for entry in thread.manifest]
+        assert paths == [
+            ["hero-320w.jpg", "hero-640w.jpg"],
+            ["hero-2-320w.jpg", "hero-2-640w.jpg"],
+            ["my photo-320w.jpg"],
+        ]
+        assert thread.manifest[2]["srcset"]["jpg"] == "my%20photo-320w.jpg 320w"
+        with Image.open(os.path.join(out, "hero-2-640w.jpg")) as img:
+            assert img.size == (640, 320)  # from hero.png, not overwritten by hero.jpg
+
+
+if __name__ == "__main__":
+    test_target_size()
+    test_resize_matches_full_decode()
+    test_worker_progress_and_stop()
+    test_responsive_set()
+    test_responsive_worker_manifest()
+    test_responsive_set_shared_stems()
+    print("✅ Image resize tests passed")
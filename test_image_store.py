@@ -0,0 +1,118 @@
+"""
+Test script for the content-addressed image store (utils/image_store.py).
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import tempfile
+from collections import Counter
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from PIL import Image
+
+from utils.image_store import ImageStore, link_or_copy
+from workers.image_downloader_worker import AllImagesDownloaderThread
+
+
+def _jpeg(color):
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), color).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+IMAGES = {"a.jpg": _jpeg("red"), "b.jpg": _jpeg("blue"), "copy.jpg": _jpeg("red")}
+
+
+def test_add_and_lookup():
+    with tempfile.TemporaryDirectory() as folder:
+        data = b"image bytes"
+        sha = hashlib.sha256(data).hexdigest()
+        with ImageStore(folder) as store:
+            for url in ("https://x/a.jpg", "https://y/a.jpg"):
+                tmp = store.incoming_path()
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                stored = store.add(url, tmp, sha, len(data), ".jpg", etag='"v1"')
+                assert not os.path.exists(tmp)
+            assert stored.path == store.object_path(sha, ".jpg")
+            assert os.listdir(os.path.dirname(stored.path)) == [sha + ".jpg"]  # one copy per content
+
+        with ImageStore(folder) as store:  # index survives reopening
+            known = store.lookup("https://x/a.jpg")
+            assert known.sha256 == sha and known.size == len(data)
+            assert ImageStore.conditional_headers(known) == {"If-None-Match": '"v1"'}
+            assert store.lookup("https://z/missing.jpg") is None
+
+            target = os.path.join(folder, "page", "a.jpg")
+            os.makedirs(os.path.dirname(target))
+            link_or_copy(known.path, target)
+            link_or_copy(known.path, target)  # replaces an existing file
+            with open(target, "rb") as f:
+                assert f.read() == data
+
+            os.remove(known.path)
+            assert store.lookup("https://x/a.jpg") is None  # object gone: download again
+
+
+def test_downloader_reuses_store():
+    requests = Counter()
+
+    async def page(request):
+        n = request.match_info["n"]
+        imgs = "".join(f"<img src='/img/{name}'>" for name in IMAGES)
+        return web.Response(text=f"<html><head><title>Page {n}</title></head><body>{imgs}</body></html>",
+                            content_type="text/html")
+
+    async def image(request):
+        name = request.match_info["name"]
+        etag = f'"{name}"'
+        if request.headers.get("If-None-Match") == etag:
+            requests["304"] += 1
+            return web.Response(status=304)
+        requests["200"] += 1
+        return web.Response(body=IMAGES[name], content_type="image/jpeg", headers={"ETag": etag})
+
+    async def main(folder):
+        app = web.Application()
+        app.router.add_get("/pg/{n}", page)
+        app.router.add_get("/img/{name}", image)
+        async with TestServer(app) as server:
+            for run in ("first", "second"):
+                worker = AllImagesDownloaderThread(
+                    [str(server.make_url(f"/pg/{n}")) for n in range(3)], os.path.join(folder, run), None,
+                    {"enabled": True, "format": "webp", "quality": 70}, processes=1,
+                    store_dir=os.path.join(folder, "store"),
+                )
+                await worker.main_downloader()
+                yield worker
+
+    async def check(folder):
+        runs = [worker async for worker in main(folder)]
+        first, second = runs
+        # Three pages share three image URLs: each URL downloaded once, each distinct content compressed once
+        assert first._store_stats["downloaded"] == 3 and first._store_stats["shared"] == 6
+        assert first._store_stats["compressed"] == 2
+        # Second run: every URL revalidated as unchanged, nothing re-compressed
+        assert second._store_stats["downloaded"] == 0 and second._store_stats["unchanged"] == 3
+        assert second._store_stats["compressed"] == 0 and second._store_stats["compressed_reused"] == 2
+        assert requests == {"200": 3, "304": 3}
+
+        for run in ("first", "second"):
+            for n in range(3):
+                page_folder = os.path.join(folder, run, f"Page {n}")
+                assert sorted(os.listdir(os.path.join(page_folder, "Originals"))) == sorted(IMAGES)
+                assert sorted(os.listdir(os.path.join(page_folder, "Compressed"))) == ["a.webp", "b.webp", "copy.webp"]
+                with open(os.path.join(page_folder, "Originals", "b.jpg"), "rb") as f:
+                    assert f.read() == IMAGES["b.jpg"]
+
+    with tempfile.TemporaryDirectory() as folder:
+        asyncio.run(check(folder))
+
+
+if __name__ == "__main__":
+    test_add_and_lookup()
+    test_downloader_reuses_store()
+    print("✅ Image store tests passed")
@@ -0,0 +1,98 @@
+"""
+Test script for the image thumbnails embedded by the Content Extractor.
+"""
+
+import asyncio
+import io
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from docx import Document
+from PIL import Image
+
+from utils.content_model import ContentDocument, render_docx_to_bytes, run
+from utils.image_thumbnails import ThumbnailCache, ThumbnailFetcher, make_thumbnail
+
+
+def _image_bytes(fmt, mode, size):
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, fmt)
+    return buffer.getvalue()
+
+
+def test_make_thumbnail():
+    with tempfile.TemporaryDirectory() as folder:
+        path = make_thumbnail(_image_bytes("JPEG", "RGB", (1200, 600)), os.path.join(folder, "a"), 200)
+        assert path.endswith(".jpg")
+        with Image.open(path) as img:
+            assert img.size == (200, 100)
+        path = make_thumbnail(_image_bytes("PNG", "RGBA", (50, 80)), os.path.join(folder, "b"), 200)
+        assert path.endswith(".png")
+        with Image.open(path) as img:
+            assert img.size == (50, 80) and img.mode == "RGBA"
+        assert sorted(os.listdir(folder)) == ["a.jpg", "b.png"]  # no temporary files left
+
+
+def test_fetcher_dedupes_and_caches():
+    hits = []
+
+    async def image(request):
+        hits.append(request.match_info["name"])
+        if request.match_info["name"] == "missing.jpg":
+            return web.Response(status=404)
+        return web.Response(body=_image_bytes("JPEG", "RGB", (640, 480)), content_type="image/jpeg")
+
+    async def fetch(cache, urls):
+        async with aiohttp.ClientSession() as session:
+            with ThreadPoolExecutor(2) as pool:
+                fetcher = ThumbnailFetcher(session, pool, cache, concurrency=2)
+                # Two "pages" sharing an image at the same time
+                first, second = await asyncio.gather(fetcher.get_many(urls), fetcher.get_many(urls[:1]))
+                return fetcher, first, second
+
+    async def main(folder):
+        app = web.Application()
+        app.router.add_get("/img/{name}", image)
+        async with TestServer(app) as server:
+            urls = [str(server.make_url(f"/img/{n}")) for n in ("a.jpg", "b.jpg", "missing.jpg", "a.jpg")]
+            cache = ThumbnailCache(folder, max_px=100)
+            fetcher, first, second = await fetch(cache, urls)
+            assert sorted(hits) == ["a.jpg", "b.jpg", "missing.jpg"]
+            assert set(first) == set(urls[:2]) and second == {urls[0]: first[urls[0]]}
+            assert (fetcher.downloads, fetcher.failures, fetcher.hits) == (2, 1, 0)
+
+            # Second export: served from the cache, no image request
+            hits.clear()
+            fetcher, again, _ = await fetch(ThumbnailCache(folder, max_px=100), urls[:2])
+            assert again == first and hits == [] and fetcher.hits == 2
+
+    with tempfile.TemporaryDirectory() as folder:
+        asyncio.run(main(folder))
+
+
+def test_render_docx_embeds_thumbnails():
+    model = ContentDocument("https://example.com/a")
+    model.add("table", style="Table Grid", rows=[[
+        [run("IMAGE:\n", "b"), run("https://example.com/a.jpg", "m")],
+        [run("https://example.com/missing.jpg", "m")],
+    ]])
+    assert model.media_urls() == ["https://example.com/a.jpg", "https://example.com/missing.jpg"]
+    with tempfile.TemporaryDirectory() as folder:
+        path = make_thumbnail(_image_bytes("JPEG", "RGB", (300, 200)), os.path.join(folder, "a"), 300)
+        data = render_docx_to_bytes(model, {"https://example.com/a.jpg": path})
+    doc = Document(io.BytesIO(data))
+    assert len(doc.inline_shapes) == 1
+    cell = doc.tables[0].rows[0].cells[0]
+    assert "https://example.com/a.jpg" in cell.text and len(cell.paragraphs) == 2
+    assert len(Document(io.BytesIO(render_docx_to_bytes(model))).inline_shapes) == 0
+
+
+if __name__ == "__main__":
+    test_make_thumbnail()
+    test_fetcher_dedupes_and_caches()
+    test_render_docx_embeds_thumbnails()
+    print("✅ Image thumbnail tests passed")
@@ -0,0 +1,58 @@
+"""
+Test script for the vectorized Meta Checker comparison engine.
+"""
+
+import pandas as pd
+
+from utils.helpers import norm_text, norm_title
+from utils.meta_compare import (
+    build_frame, compare_frame, summarize, to_results, normalize_series
+)
+
+
+def test_normalize_matches_helpers():
+    """Vectorized normalization must agree with norm_text / norm_title."""
+    samples = [
+        "  Chiots   et chiens  | Purina",
+        "Titre | Purina FR",
+        "Line\nbreak\tand  spaces",
+        "",
+        None,
+    ]
+    series = pd.Series(samples)
+    assert normalize_series(series).tolist() == [norm_text(s) for s in samples]
+    assert normalize_series(series, title=True).tolist() == [norm_title(s) for s in samples]
+
+
+def test_compare_and_summarize():
+    records = [
+        {
+            "url": "https://example.com/a",
+            "expected": {"meta_title": "Page A", "meta_description": "Desc A"},
+            "current": {"meta_title": "Page  A | Purina", "meta_description": "Other", "h1": "A"},
+        },
+        {
+            "url": "https://example.com/b",
+            "expected": {"meta_title": "Page B"},
+            "current": {"meta_title": "Page B"},
+        },
+    ]
+    frame = compare_frame(build_frame(records))
+    results = to_results(frame)
+
+    assert results[0]["match"]["meta_title"] is True
+    assert results[0]["match"]["meta_description"] is False
+    assert results[0]["match"]["h1"] is None
+    assert results[0]["current"]["h1"] == "A"  # unchecked fields keep the raw value
+    assert 0 <= results[0]["similarity"]["meta_description"] < 1
+
+    summary = summarize(frame)
+    assert summary["total"] == 2
+    assert summary["meta_title"] == {"checked": 2, "ok": 2, "mismatch": 0, "mean_similarity": 1.0}
+    assert summary["meta_description"]["mismatch"] == 1
+
+
+if __name__ == "__main__":
+    test_normalize_matches_helpers()
+    test_compare_and_summarize()
+    print("✅ Meta compare tests passed")
@@ -0,0 +1,81 @@
+"""
+Test script for the SQLite product catalog.
+"""
+
+import os
+import tempfile
+import time
+
+from utils.product_catalog import ProductCatalog, catalog_key, extract_canonical
+
+
+def _catalog(folder):
+    catalog = ProductCatalog(os.path.join(folder, "catalog.sqlite3"))
+    catalog.upsert_many([
+        {"url": "https://example.com/a/", "product_id": "1", "gtin": "7613035000001", "status": 200},
+        {"url": "example.com/b", "product_id": "2", "gtin": "7613035000001", "status": 200},
+        {"url": "https://example.com/b-variant", "product_id": "2", "gtin": "7613035000002",
+         "canonical_url": "https://example.com/b"},
+        {"url": "https://example.com/c", "product_id": "3", "gtin": "7613035000003",
+         "fetched_at": time.time() - 48 * 3600},
+    ])
+    return catalog
+
+
+def test_lookup_and_freshness():
+    with tempfile.TemporaryDirectory() as folder:
+        with _catalog(folder) as catalog:
+            assert catalog_key("example.com/a/#top") == "https://example.com/a"
+            assert catalog.lookup("https://example.com/a")["product_id"] == "1"
+            assert catalog.lookup("https://example.com/c", max_age_hours=24) is None
+            assert catalog.lookup("https://example.com/c")["gtin"] == "7613035000003"
+            assert catalog.lookup("https://example.com/missing") is None
+
+
+def test_shared_gtins_and_missing_ids():
+    with tempfile.TemporaryDirectory() as folder:
+        with _catalog(folder) as catalog:
+            assert catalog.shared_gtins() == [
+                ("7613035000001", ["https://example.com/a", "https://example.com/b"])
+            ]
+            assert catalog.ids_without_page(["1", "4", "2", "5", "4"]) == ["4", "5"]
+            assert catalog.urls_for_product_id("2") == ["https://example.com/b", "https://example.com/b-variant"]
+
+            plan = " ".join(
+                str(tuple(r)) for r in catalog.conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT url FROM products WHERE gtin = ? AND gtin <> ''", ("x",)
+                )
+            )
+            assert "idx_products_gtin" in plan
+
+
+def test_urls_for_gtin_skips_canonical_twins():
+    with tempfile.TemporaryDirectory() as folder:
+        with ProductCatalog(os.path.join(folder, "catalog.sqlite3")) as catalog:
+            catalog.upsert_many([
+                {"url": "https://x.com/p/1", "gtin": "4006381333931", "canonical_url": "https://x.com/p/1"},
+                {"url": "https://x.com/p/1?color=red", "gtin": "4006381333931", "canonical_url": "https://x.com/p/1"},
+            ])
+            assert catalog.shared_gtins() == []
+            assert catalog.urls_for_gtin("4006381333931", exclude_url="https://x.com/p/1?color=red") == []
+
+            catalog.upsert("https://x.com/p/2", gtin="4006381333931")
+            assert catalog.urls_for_gtin("4006381333931", exclude_url="https://x.com/p/1") == ["https://x.com/p/2"]
+            assert catalog.urls_for_gtin("4006381333931", exclude_url="https://x.com/p/2") == [
+                "https://x.com/p/1", "https://x.com/p/1?color=red"
+            ]
+            assert len(catalog.urls_for_gtin("4006381333931")) == 3
+
+
+def test_extract_canonical():
+    html = '<head><link href="/x"><link rel="canonical" href="https://example.com/p"></head>'
+    assert extract_canonical(html) == "https://example.com/p"
+    assert extract_canonical("<head></head>") == ""
+
+
+if __name__ == "__main__":
+    test_lookup_and_freshness()
+    test_shared_gtins_and_missing_ids()
+    test_urls_for_gtin_skips_canonical_twins()
+    test_extract_canonical()
+    print("✅ Product catalog tests passed")
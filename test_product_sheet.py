@@ -0,0 +1,139 @@
+"""
+Test script for the Product Sheet worker (workers/meta_product_workers.py).
+"""
+
+import asyncio
+import os
+import tempfile
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from openpyxl import load_workbook
+
+from workers import meta_product_workers
+from utils.product_catalog import ProductCatalog
+from workers.meta_product_workers import ProductSheetWorker
+
+PRODUCTS = {
+    "/p1": ("111", "4006381333931"),
+    "/p2": ("222", "96385074"),
+    "/p3": ("333", "036000291452"),
+}
+
+
+def _product(hits):
+    async def handler(request):
+        product_id, gtin = PRODUCTS[request.path]
+        hits.append(request.path)
+        return web.Response(content_type="text/html", text=(
+            f'<html><head><link rel="canonical" href="{request.path}"><script type="application/ld+json">'
+            f'{{"@type": "Product", "@id": "{product_id}", "name": "P", "gtin13": "{gtin}"}}'
+            "</script></head><body></body></html>"
+        ))
+    return handler
+
+
+def _run(make_items, **worker_options):
+    """Run a worker on items built from the server URL; returns (worker, paths fetched)."""
+    async def main():
+        app = web.Application()
+        hits = []
+        for path in PRODUCTS:
+            app.router.add_get(path, _product(hits))
+        async with TestServer(app) as server:
+            worker = ProductSheetWorker(make_items(lambda path: str(server.make_url(path))), **worker_options)
+            await worker.main()
+            return worker, hits
+
+    return asyncio.run(main())
+
+
+def test_malformed_gtin_rows_are_checked_last():
+    def items(url):
+        return [
+            {"row": 2, "url": url("/p1"), "expected_id": "111", "expected_gtin": "4006381333931"},
+            {"row": 3, "url": url("/p2"), "expected_id": "222", "expected_gtin": "96385075"},  # bad check digit
+            {"row": 4, "url": url("/p3"), "expected_id": "333", "expected_gtin": "036000291452"},
+        ]
+
+    worker, hits = _run(items, max_concurrency=1)
+    assert hits == ["/p1", "/p3", "/p2"]
+    assert [r["row"] for r in worker.results] == [2, 3, 4]
+    flagged = worker.results[1]
+    assert flagged["gtin_check"] == "bad check digit"
+    assert flagged["status"] == 200 and flagged["match_id"] is True and flagged["match_gtin"] is False
+    assert worker.stats["deferred"] == 1 and worker.stats["invalid_format"] == 1 and worker.stats["ok"] == 2
+
+    # Report: "Products" keeps the sheet order, the deferred row has its own sheet
+    with tempfile.TemporaryDirectory() as folder:
+        worker, _ = _run(items, max_concurrency=1, output_folder=folder)
+        wb = load_workbook(worker.report_path, read_only=True)
+        assert wb.sheetnames == ["Products", "Deferred (malformed GTIN)"]
+        assert [r[0] for r in wb["Products"].iter_rows(min_row=2, values_only=True)] == [2, 4]
+        deferred = list(wb["Deferred (malformed GTIN)"].iter_rows(min_row=2, values_only=True))
+        assert [(r[0], r[11]) for r in deferred] == [(3, "bad check digit")]
+        wb.close()
+
+
+def test_duplicate_urls_share_bounded_fetches():
+    def items(url):
+        paths = ["/p1", "/p1", "/p2", "/p1", "/p3", "/p3"]
+        return [{"row": i + 2, "url": url(p), "expected_id": "", "expected_gtin": ""} for i, p in enumerate(paths)]
+
+    worker, hits = _run(items, max_concurrency=1)
+    assert hits == ["/p1", "/p2", "/p3"] and worker.stats["deduplicated"] == 3
+    assert [r["actual_id"] for r in worker.results] == ["111", "111", "222", "111", "333", "333"]
+
+    size = meta_product_workers.FETCH_CACHE_SIZE
+    meta_product_workers.FETCH_CACHE_SIZE = 1
+    try:
+        worker, hits = _run(items, max_concurrency=1)
+    finally:
+        meta_product_workers.FETCH_CACHE_SIZE = size
+    assert hits == ["/p1", "/p2", "/p1", "/p3"]  # /p1 was evicted by /p2
+    assert len(worker._fetched) == 1 and not worker._in_flight
+
+
+def test_catalog_flags_after_all_fetches():
+    with tempfile.TemporaryDirectory() as folder:
+        catalog_path = os.path.join(folder, "catalog.sqlite3")
+        with ProductCatalog(catalog_path) as catalog:
+            catalog.upsert("https://other.example/p1-copy", product_id="999", gtin="4006381333931", status=200)
+            catalog.commit()
+
+        worker, _ = _run(lambda url: [
+            # "222" only gets a page when row 3 is fetched, after row 2 is written
+            {"row": 2, "url": url("/p1"), "expected_id": "222", "expected_gtin": ""},
+            {"row": 3, "url": url("/p2"), "expected_id": "555", "expected_gtin": ""},
+            {"row": 4, "url": url("/p3"), "expected_id": "333", "expected_gtin": ""},
+        ], max_concurrency=1, use_catalog=True, catalog_path=catalog_path, output_folder=folder)
+
+        assert worker.stats["shared_gtin"] == 1 and worker.stats["id_without_page"] == 1 and worker.stats["ok"] == 1
+        flags = {r["row"]: (r.get("shared_gtin_urls"), r.get("id_without_page")) for r in worker.results}
+        assert flags == {
+            2: (["https://other.example/p1-copy"], False),
+            3: ([], True),
+        }
+        sheet = load_workbook(worker.report_path, read_only=True)["Catalog Flags"]
+        rows = [list(r) for r in sheet.iter_rows(min_row=2, values_only=True)]
+        assert [(r[0], r[3], r[5]) for r in rows] == [(2, "https://other.example/p1-copy", None), (3, None, "TRUE")]
+
+
+def test_canonical_twins_do_not_share_a_gtin():
+    with tempfile.TemporaryDirectory() as folder:
+        worker, hits = _run(lambda url: [
+            {"row": 2, "url": url("/p1"), "expected_id": "111", "expected_gtin": ""},
+            {"row": 3, "url": url("/p1?color=red"), "expected_id": "111", "expected_gtin": ""},
+        ], max_concurrency=1, use_catalog=True, catalog_path=os.path.join(folder, "catalog.sqlite3"),
+           output_folder=folder)
+        assert hits == ["/p1", "/p1"]
+        assert worker.stats["shared_gtin"] == 0 and worker.stats["ok"] == 2
+        assert all("shared_gtin_urls" not in r for r in worker.results)
+
+
+if __name__ == "__main__":
+    test_malformed_gtin_rows_are_checked_last()
+    test_duplicate_urls_share_bounded_fetches()
+    test_catalog_flags_after_all_fetches()
+    test_canonical_twins_do_not_share_a_gtin()
+    print("✅ Product sheet tests passed")
@@ -0,0 +1,112 @@
+"""
+Test script for the redirect map validation (utils/excel_readers.py, workers/redirect_map_worker.py).
+"""
+
+import asyncio
+import os
+import tempfile
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from openpyxl import Workbook
+
+from utils.excel_readers import _is_redirect_header, open_redirect_map, redirect_map_items
+from workers.redirect_map_worker import RedirectMapWorker
+
+
+def _workbook(folder, rows, name="redirects.xlsx"):
+    wb = Workbook()
+    ws = wb.active
+    for row in rows:
+        ws.append(row)
+    path = os.path.join(folder, name)
+    wb.save(path)
+    return path
+
+
+def test_is_redirect_header():
+    assert _is_redirect_header(["Old URL", "New URL", "Status"])
+    assert _is_redirect_header(["Source URL", "Destination"])
+    assert _is_redirect_header(["from url", "to"])
+    assert not _is_redirect_header(["Old URL", "Notes"])
+    assert not _is_redirect_header(["https://a.com/old", "https://a.com/new"])
+
+
+def test_redirect_map_items():
+    with tempfile.TemporaryDirectory() as folder:
+        rows = [
+            ["Old URL", "New URL", "Redirect Type"],
+            ["https://a.com/old", "https://a.com/new", "301 Permanent"],
+            [None, "https://a.com/skipped", None],
+            ["a.com/plain", "/relative", None],
+        ]
+        stream = open_redirect_map(_workbook(folder, rows))
+        assert list(redirect_map_items(stream)) == [
+            {"row": 2, "source": "https://a.com/old", "expected": "https://a.com/new", "expected_status": 301},
+            {"row": 4, "source": "a.com/plain", "expected": "/relative", "expected_status": None},
+        ]
+        stream.close()
+
+        # No header: the first two URL columns
+        path = _workbook(folder, [["x", "https://a.com/1", "https://a.com/2"]], "plain.xlsx")
+        stream = open_redirect_map(path)
+        assert [(i["source"], i["expected"]) for i in redirect_map_items(stream)] == [("https://a.com/1", "https://a.com/2")]
+        stream.close()
+
+
+def test_check_row():
+    def redirect(location, status):
+        async def handler(request):
+            return web.Response(status=status, headers={"Location": location})
+        return handler
+
+    async def final(request):
+        return web.Response(text="ok")
+
+    async def head_forbidden(request):
+        return web.Response(status=403)
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/old", redirect("/step", 301))
+        app.router.add_get("/step", redirect("/new", 302))
+        app.router.add_get("/new", final)
+        app.router.add_route("HEAD", "/cdn", head_forbidden)
+        app.router.add_get("/cdn", redirect("/new", 301), allow_head=False)
+        app.router.add_get("/loop", redirect("/loop2", 301))
+        app.router.add_get("/loop2", redirect("/loop", 301))
+        worker = RedirectMapWorker("unused.xlsx", "unused")
+        async with TestServer(app) as server, aiohttp.ClientSession() as session:
+            def item(path, expected="/new", status=None):
+                return {"row": 2, "source": str(server.make_url(path)), "expected": expected, "expected_status": status}
+
+            result = await worker._check_row(item("/old", status=301), session)
+            assert result["chain"] == "301 → 302 → 200" and result["hops"] == 2
+            assert result["final_url"] == str(server.make_url("/new"))
+            assert result["target_match"] is True and result["status_match"] is True
+            assert result["verdict"] == "OK"
+
+            result = await worker._check_row(item("/old", status=302), session)
+            assert result["status_match"] is False and result["verdict"] == "Wrong status"
+
+            result = await worker._check_row(item("/old", expected="/elsewhere"), session)
+            assert result["verdict"] == "Wrong target"
+
+            result = await worker._check_row(item("/cdn"), session)  # HEAD 403, GET redirects
+            assert result["chain"] == "301 → 200" and result["verdict"] == "OK"
+
+            result = await worker._check_row(item("/new"), session)
+            assert result["verdict"] == "No redirect"
+
+            result = await worker._check_row(item("/loop"), session)
+            assert result["verdict"] == "Error" and result["error"] == "Redirect loop"
+
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    test_is_redirect_header()
+    test_redirect_map_items()
+    test_check_row()
+    print("✅ Redirect map tests passed")
@@ -0,0 +1,80 @@
+"""
+Test script for responsive image candidate selection (utils/srcset.py).
+"""
+
+from bs4 import BeautifulSoup
+
+from utils.srcset import image_candidates, parse_policy, parse_srcset, select_candidates
+from workers.image_downloader_worker import AllImagesDownloaderThread
+
+BASE = "https://example.com/article/"
+
+HTML = """
+<img src="/a-400.jpg" srcset="/a-400.jpg 400w, /a-800.jpg 800w, /a-1600.jpg 1600w" alt="Dog" title="T">
+<img src="/b.png" srcset="/b.png 1x, /b@2x.png 2x, /b@3x.png 3x">
+<img src="data:image/gif;base64,R0lGOD" data-src="/lazy.jpg" data-srcset="/lazy-600.jpg 600w, /lazy-1200.jpg 1200w">
+<picture>
+  <source media="(min-width: 1000px)" srcset="/wide-1200.webp 1200w, /wide-2400.webp 2400w" type="image/webp">
+  <source media="(min-width: 1000px)" srcset="/wide-1200.jpg 1200w, /wide-2400.jpg 2400w">
+  <source srcset="/square.jxl" type="image/jxl">
+  <img src="/square-500.jpg" srcset="/square-500.jpg 500w, /square-1000.jpg 1000w" alt="Cat">
+</picture>
+<video><source src="/clip.mp4" type="video/mp4"></video>
+"""
+
+
+def _urls(policy):
+    soup = BeautifulSoup(HTML, "html.parser")
+    return [url.replace("https://example.com", "") for url, _ in image_candidates(soup, BASE, policy)]
+
+
+def test_parse_srcset():
+    candidates = parse_srcset("/img,crop=1.jpg 2x,/plain.jpg, /w.jpg 640w ,, /odd.jpg 1.5x")
+    assert [(c.url, c.width, c.density) for c in candidates] == [
+        ("/img,crop=1.jpg", None, 2.0), ("/plain.jpg", None, 1.0), ("/w.jpg", 640, None), ("/odd.jpg", None, 1.5),
+    ]
+    assert parse_srcset("") == []
+
+
+def test_policies():
+    candidates = parse_srcset("/s.jpg 320w, /m.jpg 800w, /l.jpg 1600w")
+    assert [c.url for c in select_candidates(candidates, "largest")] == ["/l.jpg"]
+    assert [c.url for c in select_candidates(candidates, "smallest")] == ["/s.jpg"]
+    assert [c.url for c in select_candidates(candidates, "700w")] == ["/m.jpg"]
+    assert [c.url for c in select_candidates(candidates, "5000w")] == ["/l.jpg"]
+    assert len(select_candidates(candidates, "all")) == 3
+    densities = parse_srcset("/1.jpg, /2.jpg 2x, /3.jpg 3x")
+    assert [c.url for c in select_candidates(densities, "2x")] == ["/2.jpg"]
+    assert [c.url for c in select_candidates(densities, "800w")] == ["/1.jpg"]  # no widths: 1x
+    for bad in ("biggest", "12px"):
+        try:
+            parse_policy(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"{bad!r} should be rejected")
+
+
+def test_image_candidates():
+    assert _urls("largest") == ["/a-1600.jpg", "/b@3x.png", "/lazy-1200.jpg", "/wide-2400.webp",
+                                "/square-1000.jpg", "/clip.mp4"]
+    assert _urls("smallest") == ["/a-400.jpg", "/b.png", "/lazy-600.jpg", "/wide-1200.webp",
+                                 "/square-500.jpg", "/clip.mp4"]
+    everything = _urls("all")
+    assert len(everything) == 17 and "/square.jxl" in everything and "/wide-2400.jpg" in everything
+
+
+def test_worker_sources():
+    soup = BeautifulSoup(HTML, "html.parser")
+    sources = AllImagesDownloaderThread._extract_img_sources(soup, BASE, "largest")
+    by_name = {name: (alt, title) for _, name, alt, title in sources}
+    assert by_name["a-1600.jpg"] == ("Dog", "T")
+    assert by_name["wide-2400.webp"] == ("Cat", "")  # <picture> sources take the <img> alt
+    assert len(sources) == 6
+
+
+if __name__ == "__main__":
+    test_parse_srcset()
+    test_policies()
+    test_image_candidates()
+    test_worker_sources()
+    print("✅ srcset tests passed")
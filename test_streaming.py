@@ -0,0 +1,68 @@
+"""
+Test script for the streaming helpers (bounded runner + reorder buffer).
+"""
+
+import asyncio
+import random
+
+from utils.streaming import OrderedWriter, run_bounded
+
+
+async def _source(n):
+    for i in range(n):
+        yield i
+
+
+def test_ordered_writer_keeps_source_order():
+    written = []
+    peak = 0
+
+    async def main():
+        nonlocal peak
+        ordered = OrderedWriter(written.append, window=8)
+
+        async def handle(entry):
+            _, item = entry
+            await asyncio.sleep(random.random() * 0.005)
+            return None if item % 10 == 0 else item  # None results are skipped
+
+        def on_result(entry, result):
+            nonlocal peak
+            ordered.put(entry[0], result)
+            peak = max(peak, len(ordered._pending))
+
+        await run_bounded(ordered.numbered(_source(200)), handle, 4, on_result=on_result)
+
+    asyncio.run(main())
+    assert written == [i for i in range(200) if i % 10]
+    assert peak <= 8
+
+
+def test_ordered_writer_stops_pulling_items():
+    written = []
+    stop = False
+
+    async def main():
+        ordered = OrderedWriter(written.append, window=4)
+
+        async def handle(entry):
+            nonlocal stop
+            if stop:
+                return None
+            if entry[1] == 20:
+                stop = True
+            return entry[1]
+
+        await run_bounded(
+            ordered.numbered(_source(1000), should_stop=lambda: stop),
+            handle, 2, on_result=lambda e, r: ordered.put(e[0], r),
+        )
+
+    asyncio.run(main())
+    assert written == list(range(21))
+
+
+if __name__ == "__main__":
+    test_ordered_writer_keeps_source_order()
+    test_ordered_writer_stops_pulling_items()
+    print("✅ Streaming tests passed")
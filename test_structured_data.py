@@ -0,0 +1,63 @@
+"""
+Test script for the JSON-LD structured-data extractor.
+"""
+
+from utils.structured_data import find_jsonld_blocks, parse_structured_data
+from workers.meta_product_workers import ProductSheetWorker
+
+PAGE = """
+<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "BreadcrumbList", "@id": "123",
+ "itemListElement": [{"@type": "ListItem", "position": 1, "item": {"@id": "456", "name": "Dogs"}}]}
+</script>
+<script type='application/ld+json'>
+{"@context": "https://schema.org", "@graph": [
+  {"@type": "Organization", "@id": "https://example.com/#org", "sku": "999"},
+  {"@type": "Product", "@id": "12345678", "name": "Dry Food", "sku": "7613035000000",
+   "offers": {"@id": "https://example.com/#offer"}},
+  {"@type": "Offer", "@id": "https://example.com/#offer", "price": 12.5,
+   "priceCurrency": "EUR", "availability": "https://schema.org/InStock", "gtin13": "7613035123456"}
+]}
+</script>
+<SCRIPT TYPE="application/ld+json"><!-- {"@type": "WebPage"} --></SCRIPT>
+<script type="application/ld+json">{ not json }</script>
+<script>var x = "application/ld+json";</script>
+</head><body></body></html>
+"""
+
+
+def test_scanner_finds_only_jsonld_blocks():
+    blocks = find_jsonld_blocks(PAGE)
+    assert len(blocks) == 4
+    assert find_jsonld_blocks("<html><script>var a = 1;</script></html>") == []
+
+
+def test_product_resolution():
+    data = parse_structured_data(PAGE)
+    assert data.blocks == 4 and data.errors == 1
+    assert data.types()[:3] == ["BreadcrumbList", "ListItem", "Organization"]
+    assert "WebPage" in data.types()
+
+    info = data.product_info()
+    assert info["id"] == "12345678"  # not the breadcrumb "@id"
+    assert info["sku"] == "7613035000000"
+    assert info["gtin"] == "7613035123456"  # gtin13 from the referenced offer
+    assert info["offers"][0]["price"] == "12.5"
+    assert info["offers"][0]["availability"] == "InStock"
+
+
+def test_worker_extractors():
+    assert ProductSheetWorker._extract_product_id(PAGE) == "12345678"
+    assert ProductSheetWorker._extract_gtin(PAGE) == "7613035123456"
+    sku_only = '<script type="application/ld+json">{"@type": "Product", "@id": "https://x.com/p/42", "sku": "1234"}</script>'
+    assert ProductSheetWorker._extract_product_id(sku_only) == "42"
+    assert ProductSheetWorker._extract_gtin(sku_only) == "1234"
+    assert ProductSheetWorker._extract_gtin("") == ""
+
+
+if __name__ == "__main__":
+    test_scanner_finds_only_jsonld_blocks()
+    test_product_resolution()
+    test_worker_extractors()
+    print("✅ Structured data tests passed")
@@ -0,0 +1,748 @@
+"""
+Qt-free content extraction to structured documents.
+
+`ContentExtractor` applies the Content Extractor's extraction (components,
+text blocks, links, tables, SEO table) without any dependency on Qt, and
+produces a `ContentDocument` model (utils/content_model.py) that
+is rendered to Word, Markdown or HTML. `CrawlerPageExtractor` fills the
+same model with the Web Crawler's own Word layout. `ContentDocxBuilder` is
+the extract-and-render-to-Word shortcut. `render_page` is the picklable entry
+point used by the batch mode's process pool.
+
+What counts as a component, which handler extracts it and with which
+selectors comes from the per-site rules files (utils/extraction_rules.py).
+Before extracting, `ComponentIndex` walks the main content once, evaluates
+all the compiled rules on every element (excluded, text block, Drupal
+block, component root) and records, per handler selector, the
+document-order positions of all matching tags. The component handlers
+answer their "first / all descendants matching X" and "inside X" questions
+from that index with a bisect instead of re-scanning subtrees, so the
+writer stays linear on long pages whatever the number of rules.
+"""
+
+import os
+import re
+from bisect import bisect_right
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup, Tag, NavigableString
+from docx import Document
+
+from utils.content_model import ContentDocument, RENDER_FORMATS, render_bytes, render_docx, run
+from utils.extraction_rules import BLOCK, EXCLUDE, TEXT_BLOCK, ExtractionRules, rules_for_url
+
+
+def output_stem_for(url: str) -> str:
+    """Safe file name (without extension) for a URL."""
+    safe_filename = re.sub(r'[<>:"/\\|?*]', '_', url)
+    return safe_filename[:100]
+
+
+def docx_filename_for(url: str) -> str:
+    """Safe .docx file name for a URL (same scheme as the single-page extractor)."""
+    return output_stem_for(url) + ".docx"
+
+
+class ComponentIndex:
+    """
+    Single-pass index of a content subtree under a set of extraction rules.
+
+    Each element is classified once against all the rules (exclusion, text
+    block, Drupal block, component root) and recorded under every handler
+    selector ("kind") it matches.
+
+    find(tag, kind) / find_all(tag, kind) return the descendants of `tag`
+    (in document order, `tag` itself excluded) matching the selector `kind`,
+    like bs4's select_one/select; inside(tag, kind) tells whether an ancestor
+    of `tag` matches one of the rules' ancestor kinds.
+    """
+
+    def __init__(self, root, rules: ExtractionRules):
+        self.rules = rules
+        self._pre = {}       # id(tag) -> preorder position
+        self._end = {}       # id(tag) -> position of its last descendant
+        self._excluded = set()
+        self._text_blocks = set()
+        self._blocks = set()
+        self._components = {}  # id(tag) -> (rule, name)
+        self._inside = {kind: set() for kind in rules.ancestor_kinds}
+        self._positions = {}  # kind -> [positions]
+        self._tags = {}       # kind -> [tags]
+        self._walk(root)
+
+    def _walk(self, root):
+        rules = self.rules
+        ancestor_labels = {("kind", kind): kind for kind in rules.ancestor_kinds}
+
+        # Ancestor kinds open above the root still count for inside()
+        open_kinds = dict.fromkeys(rules.ancestor_kinds, 0)
+        if open_kinds:
+            for parent in root.parents:
+                if isinstance(parent, Tag) and parent.name != '[document]':
+                    for label in rules.matchers.match(parent):
+                        if label in ancestor_labels:
+                            open_kinds[ancestor_labels[label]] += 1
+
+        pos = 0
+        stack = [(root, None)]
+        while stack:
+            tag, opened = stack.pop()
+            key = id(tag)
+            if opened is not None:
+                self._end[key] = pos - 1
+                for kind in opened:
+                    open_kinds[kind] -= 1
+                continue
+
+            self._pre[key] = pos
+            labels, component = rules.classify(tag)
+            if EXCLUDE in labels:
+                self._excluded.add(key)
+            if TEXT_BLOCK in labels:
+                self._text_blocks.add(key)
+            if BLOCK in labels:
+                self._blocks.add(key)
+            if component:
+                self._components[key] = component
+            for kind, count in open_kinds.items():
+                if count:
+                    self._inside[kind].add(key)
+
+            opened = []
+            for label in labels:
+                if label[0] != "kind":
+                    continue
+                if pos:  # the root is not its own descendant
+                    self._positions.setdefault(label[1], []).append(pos)
+                    self._tags.setdefault(label[1], []).append(tag)
+                if label in ancestor_labels:
+                    opened.append(label[1])
+                    open_kinds[label[1]] += 1
+            pos += 1
+
+            stack.append((tag, opened))
+            children = [c for c in tag.children if isinstance(c, Tag)]
+            stack.extend((c, None) for c in reversed(children))
+
+    def is_excluded(self, tag) -> bool:
+        return id(tag) in self._excluded
+
+    def is_text_block(self, tag) -> bool:
+        return id(tag) in self._text_blocks
+
+    def is_block(self, tag) -> bool:
+        return id(tag) in self._blocks
+
+    def component(self, tag):
+        """(rule, display name) when `tag` is a component root, else None."""
+        return self._components.get(id(tag))
+
+    def _range(self, tag, kind):
+        positions = self._positions.get(kind, [])
+        key = id(tag)
+        lo = bisect_right(positions, self._pre[key])
+        hi = bisect_right(positions, self._end[key], lo)
+        return lo, hi
+
+    def find(self, tag, kind):
+        lo, hi = self._range(tag, kind)
+        return self._tags[kind][lo] if lo < hi else None
+
+    def find_all(self, tag, kind) -> list:
+        lo, hi = self._range(tag, kind)
+        return self._tags[kind][lo:hi] if lo < hi else []
+
+    def inside(self, tag, kind) -> bool:
+        return id(tag) in self._inside[kind]
+
+
+class ContentExtractor:
+    """
+    Extract the structured content of a parsed page into a ContentDocument.
+
+    Args:
+        url: Page URL (used for the header, relative links and the SEO table)
+        log: Optional callable(str) receiving warnings
+        index_class: Index built over the main content before extracting
+        block_markers: Also mark Drupal blocks (the rules' "block_marker")
+        rules: ExtractionRules to apply (default: the rules file matching
+            the URL's host, see utils/extraction_rules.py)
+    """
+
+    def __init__(self, url, log=None, index_class=ComponentIndex, block_markers=False, rules=None):
+        self.url = url
+        self.log = log or (lambda msg: None)
+        self.index_class = index_class
+        self.block_markers = block_markers
+        self.rules = rules or rules_for_url(url)
+        self.index = None
+        self.model = None
+        self.text_block_count = 0
+        self.text_image_count = 0
+        self.base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
+
+    def extract(self, soup) -> ContentDocument:
+        """Return the content model for `soup`."""
+        model = self.model = ContentDocument(self.url)
+
+        # Header
+        model.add("title", text=f"Source: {self.url}")
+        model.add("spacer")
+
+        # V3: H1 Extraction (Top)
+        h1 = soup.find('h1')
+        if h1:
+            model.add("heading", level=1, runs=[run(h1.get_text(strip=True))])
+            model.add("spacer")
+
+        # Reset counters
+        self.text_block_count = 0
+        self.text_image_count = 0
+
+        # Process Main Content
+        main_content = soup.find('main') or soup.find('body')
+        if main_content:
+            self.index = self.index_class(main_content, self.rules)
+            self._process_element(main_content)
+        else:
+            model.add("paragraph", runs=[run("No main content found.")])
+
+        # SEO Metadata Table (rendered at the end)
+        model.seo = self._seo_metadata(soup)
+        return model
+
+    def _make_absolute(self, url):
+        """Convert relative URLs to absolute."""
+        if not url:
+            return ""
+        if url.startswith('http'):
+            return url
+        return urljoin(self.base_url, url)
+
+    def _marker(self, kind, text):
+        self.model.add("marker", kind=kind, text=text)
+
+    def _process_element(self, element, level=0):
+        """Recursively process HTML elements."""
+        model = self.model
+
+        # Skip unwanted tags
+        if element.name in self.rules.skip_tags:
+            return
+
+        # V2/V3: Exclusions (class- and ID-based)
+        if self.index.is_excluded(element):
+            return
+
+        # V1: Text Block Tagging
+        if self.index.is_text_block(element):
+            self.text_block_count += 1
+            self._marker("text_block", f"[COMPONENT: Text Block {self.text_block_count}]")
+
+        # Special Components
+        component = self.index.component(element)
+        if component:
+            rule, component_name = component
+            model.add_component(component_name)
+            self._process_special_component(element, rule, component_name)
+            return
+
+        # Drupal blocks (crawler export)
+        if self.block_markers and self.index.is_block(element):
+            self._marker("block", f"[DRUPAL BLOCK: {self.rules.block_id(element)}]")
+
+        # Processing Tags
+        if element.name == 'h1':
+            # Skip H1 (already extracted at top)
+            return
+
+        if element.name in ['h2', 'h3', 'h4', 'h5', 'h6']:
+            model.add("heading", level=int(element.name[1]), runs=self._runs(element))
+
+        elif element.name == 'p':
+            model.add("paragraph", runs=self._runs(element))
+
+        elif element.name in ['ul', 'ol']:
+            style = 'List Bullet' if element.name == 'ul' else 'List Number'
+            for li in element.find_all('li', recursive=False):
+                model.add("paragraph", runs=self._runs(li), style=style)
+
+        elif element.name == 'table':
+            self._process_table(element)
+
+        else:
+            # Recursion for containers
+            for child in element.children:
+                if isinstance(child, Tag):
+                    self._process_element(child, level + 1)
+                elif isinstance(child, NavigableString):
+                    text = str(child).strip()
+                    if len(text) > 20:
+                        model.add("paragraph", runs=[run(text)])
+
+    def _runs(self, element) -> list:
+        """Runs of an element's children, preserving links and emphasis."""
+        runs = []
+        for child in element.children:
+            if isinstance(child, NavigableString):
+                text = str(child)
+                if text:
+                    runs.append(run(text))
+
+            elif isinstance(child, Tag):
+                if child.name == 'a':
+                    link_text = child.get_text()
+                    link_url = self._make_absolute(child.get('href', ''))
+                    runs.append(run(link_text, "a", link_url))
+                    self.model.add_link(link_text.strip(), link_url)
+                elif child.name in ['strong', 'b']:
+                    runs.append(run(child.get_text(), "b"))
+                elif child.name in ['em', 'i']:
+                    runs.append(run(child.get_text(), "i"))
+                else:
+                    runs.append(run(child.get_text()))
+        return runs
+
+    def _process_table(self, table_element):
+        """Process HTML table."""
+        rows = [row.find_all(['td', 'th']) for row in table_element.find_all('tr')]
+        if not rows:
+            return
+        header = 1 if rows[0] and all(cell.name == 'th' for cell in rows[0]) else 0
+        self.model.add("table", style='Light Grid Accent 1', header=header, rows=[
+            [[run(cell.get_text(strip=True))] for cell in cells] for cells in rows
+        ])
+
+    def _image_cell(self, img_tag, img_url, prefix=None) -> list:
+        """Runs of the image column of a component table."""
+        runs = [run(prefix, "b")] if prefix else []
+        if img_tag:
+            runs += [run("IMAGE:\n", "b"), run(img_url, "m")]
+        else:
+            runs.append(run("No Image", "i"))
+        return runs
+
+    def _process_special_component(self, element, rule, component_name):
+        """Handle special components with the handler named by their rule."""
+        handler = getattr(self, f"_component_{rule['handler']}")
+        handler(element, rule, component_name)
+
+    def _component_hero(self, element, rule, component_name):
+        """Hero: category line, then hero image and alt text."""
+        model = self.model
+        index = self.index
+
+        # Extract Category
+        cat_elem = index.find(element, rule['category'])
+        if cat_elem:
+            cat_text = cat_elem.get_text(strip=True)
+            cat_link = index.find(cat_elem, rule['category_link'])
+            cat_url = self._make_absolute(cat_link.get('href', '')) if cat_link else ""
+
+            cat_runs = [run(f"Article category: {cat_text}", "b")]
+            if cat_url:
+                cat_runs.append(run(f" - {cat_url}", "i"))
+                model.add_link(cat_text, cat_url)
+            model.add("paragraph", runs=cat_runs)
+
+        # Find image specifically from the hero image container
+        hero_image_container = index.find(element, rule['image_container'])
+        img_url = "No image found"
+        img_alt = ""
+        img_flags = ""
+        if hero_image_container:
+            img_tag = index.find(hero_image_container, rule['image'])
+            if img_tag:
+                img_url = self._make_absolute(img_tag.get('src', ''))
+                img_alt = img_tag.get('alt', '').strip()
+                img_flags = "m"
+                model.add_image(img_url, img_alt, component_name)
+
+        # Column 1: Image URL, Column 2: Alt Text only
+        model.add("table", style='Table Grid', rows=[[
+            [run("IMAGE:\n", "b"), run(img_url, img_flags)],
+            [run("Alt Text: ", "b"), run(img_alt if img_alt else "No Alt Text")],
+        ]])
+        model.add("spacer")
+
+    def _component_link_list(self, element, rule, component_name):
+        """Link list (Articles List): Title | URL table of the linked items."""
+        model = self.model
+        index = self.index
+
+        # Find component title
+        component_title = index.find(element, rule['title'])
+        component_title_text = component_title.get_text(strip=True) if component_title else component_name
+
+        # Filter out category links and deduplicate by URL (each article may have multiple links)
+        seen_urls = set()
+        article_links = []
+        for link in index.find_all(element, rule['link']):
+            parent = link.parent
+            if parent is None or not self.rules.matches(parent, rule['link_parent_exclude']):
+                url = link.get('href', '')
+                if url and url not in seen_urls:
+                    seen_urls.add(url)
+                    article_links.append(link)
+
+        if article_links:
+            # 2-column table: Title | URL, with a header and a component title row
+            rows = [
+                [[run("Title", "b")], [run("URL", "b")]],
+                [[run(f"Component: {component_title_text}", "b")], []],
+            ]
+            for link in article_links:
+                title_text = link.get_text(strip=True)  # Default to link text
+
+                # Look for title field in parent hierarchy
+                parent = link.parent
+                while parent is not None and parent is not element:
+                    title_field = index.find(parent, rule['item_title'])
+                    if title_field:
+                        title_text = title_field.get_text(strip=True)
+                        break
+                    parent = parent.parent
+
+                article_url = self._make_absolute(link.get('href', ''))
+                model.add_link(title_text, article_url)
+                rows.append([[run(title_text)], [run(article_url, "a", article_url)]])
+            model.add("table", style='Light Grid Accent 1', rows=rows, header=1)
+
+        model.add("spacer")
+
+    def _component_text_image(self, element, rule, component_name):
+        """Text Image: numbered marker, image table, then the text content below it."""
+        model = self.model
+        index = self.index
+
+        self.text_image_count += 1
+        self._marker("component", f"[COMPONENT: {component_name} {self.text_image_count}]")
+
+        img_tag = index.find(element, rule['image'])
+        img_url = ""
+        alt_text = ""
+        if img_tag:
+            img_url = self._make_absolute(img_tag.get('src', ''))
+            alt_text = img_tag.get('alt', '').strip()
+            model.add_image(img_url, alt_text, component_name)
+
+        # Col 1: Image Info, Col 2: Alt Text
+        model.add("table", style='Table Grid', rows=[[
+            self._image_cell(img_tag, img_url, prefix="Image Position: Left\n"),
+            [run("Alt Text: ", "b"), run(alt_text if alt_text else "No Alt Text")],
+        ]])
+
+        # Content BELOW table
+        model.add("spacer")
+
+        # Tag-based extraction with formatting preservation; track seen text to avoid duplicates
+        content_tags = index.find_all(element, rule['content'])
+        seen_texts = set()
+
+        if content_tags:
+            for tag in content_tags:
+                if index.inside(tag, rule['skip_inside']):
+                    continue
+
+                text_content = tag.get_text(strip=True)
+                if text_content and len(text_content) > 2 and text_content not in seen_texts:
+                    seen_texts.add(text_content)
+                    if tag.name in ['h2', 'h3', 'h4', 'h5', 'h6']:
+                        model.add("heading", level=int(tag.name[1]), runs=[run(text_content)])
+                    else:
+                        model.add("paragraph", runs=[run(text_content)])
+        else:
+            # Fallback: simple text extraction
+            for container in index.find_all(element, rule['text']):
+                t = container.get_text(strip=True)
+                if t and len(t) > 10 and t not in seen_texts:
+                    seen_texts.add(t)
+                    model.add("paragraph", runs=[run(t)])
+
+        model.add("spacer")  # Spacing
+
+    def _component_summary(self, element, rule, component_name):
+        """Other components: standard 2-column table (image | summary text)."""
+        model = self.model
+        index = self.index
+        self._marker("component", f"[COMPONENT: {component_name}]")
+
+        img_tag = index.find(element, rule['image'])
+        img_url = "No image found"
+        if img_tag:
+            img_url = self._make_absolute(img_tag.get('src', ''))
+            model.add_image(img_url, img_tag.get('alt', '').strip(), component_name)
+
+        # Standard text extraction
+        text_parts = []
+        for container in index.find_all(element, rule['text']):
+            if self.rules.matches(container, rule['text_exclude']):
+                continue
+            t = container.get_text(strip=True)
+            if t and len(t) > 10:
+                text_parts.append(t)
+
+        if not text_parts:
+            for tag in index.find_all(element, rule['fallback']):
+                t = tag.get_text(strip=True)
+                if t:
+                    text_parts.append(t)
+
+        summary_text = "\n\n".join(list(dict.fromkeys(text_parts)))
+        if not summary_text:
+            summary_text = element.get_text(separator=' ', strip=True)[:500]
+
+        model.add("table", style='Table Grid', rows=[[
+            self._image_cell(img_tag, img_url),
+            [run(summary_text)],
+        ]])
+        model.add("spacer")  # Spacing
+
+    def _seo_metadata(self, soup) -> list:
+        """SEO metadata rows ([label, value]) for the table at the end of the document."""
+        try:
+            # Extract URL path
+            url_path = urlparse(self.url).path
+
+            # Extract metadata
+            meta_title = soup.find('title')
+            meta_title_text = meta_title.string.strip() if meta_title and meta_title.string else "No Meta Title"
+
+            meta_desc = soup.find('meta', attrs={'name': 'description'})
+            meta_desc_text = meta_desc.get('content', 'No Meta Description') if meta_desc else "No Meta Description"
+
+            og_title = soup.find('meta', property='og:title')
+            og_title_text = og_title.get('content', 'No OG Title') if og_title else "No OG Title"
+
+            og_desc = soup.find('meta', property='og:description')
+            og_desc_text = og_desc.get('content', 'No OG Description') if og_desc else "No OG Description"
+
+            schemas = soup.find_all('script', type='application/ld+json')
+            if schemas:
+                schema_texts = [s.string.strip() for s in schemas if s.string]
+                schema_text = "\n---\n".join(schema_texts)
+                # Truncate if too long
+                if len(schema_text) > 2000:
+                    schema_text = schema_text[:2000] + "...[truncated]"
+            else:
+                schema_text = "No Schema"
+
+            return [
+                ['Internal URL', url_path],
+                ['Meta Title', meta_title_text],
+                ['Meta Description', meta_desc_text],
+                ['OG Title', og_title_text],
+                ['OG Description', og_desc_text],
+                ['Schema', schema_text],
+            ]
+        except Exception as e:
+            self.log(f"Error adding SEO metadata table: {e}")
+            return []
+
+
+class CrawlerPageExtractor:
+    """
+    Extract a crawled page into a ContentDocument with the Web Crawler's layout.
+
+    A plain walk of the main content, independent of the site rules: Drupal
+    blocks are marked, `component--*`, `article--hero` and `hero--image`
+    containers become two-column image / text tables, and headings,
+    paragraphs, lists and tables are kept as plain text in page order.
+
+    Args:
+        url: Page URL (used for the header)
+        log: Optional callable(str) receiving warnings
+    """
+
+    SKIP_TAGS = ('script', 'style', 'nav', 'footer', 'header', 'noscript')
+    _TEXT_CLASS_RE = re.compile(r'(summary|text|desc|body|content)')
+
+    def __init__(self, url, log=None):
+        self.url = url
+        self.log = log or (lambda msg: None)
+        self.model = None
+
+    def extract(self, soup) -> ContentDocument:
+        """Return the content model for `soup`."""
+        model = self.model = ContentDocument(self.url)
+        model.add("title", text=f"Source: {self.url}")
+        model.add("spacer")
+
+        main_content = soup.find('main') or soup.find('body')
+        if main_content:
+            self._process_element(main_content)
+        else:
+            model.add("paragraph", runs=[run("No main content found.")])
+        return model
+
+    @staticmethod
+    def _component_name(classes):
+        for cls in classes:
+            if cls.startswith('component--'):
+                return cls.replace('component--', '').replace('-', ' ').title()
+            if cls == 'article--hero':
+                return "Hero Article"
+            if cls == 'hero--image':
+                return "Hero Image"
+        return None
+
+    def _process_element(self, element):
+        model = self.model
+        if element.name in self.SKIP_TAGS:
+            return
+
+        if element.name in ['div', 'section', 'article']:
+            classes = element.get('class', [])
+            component_name = self._component_name(classes)
+            if component_name:
+                model.add_component(component_name)
+                self._process_component(element, component_name)
+                return
+            if 'block' in classes:
+                block_id = element.get('data-block-plugin-id') or element.get('id') or 'unknown'
+                model.add("marker", kind="block", text=f"[DRUPAL BLOCK: {block_id}]")
+
+        if element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            text = element.get_text(strip=True)
+            if text:
+                model.add("heading", level=int(element.name[1]), runs=[run(text)])
+
+        elif element.name == 'p':
+            text = element.get_text(strip=True)
+            if len(text) > 1:
+                model.add("paragraph", runs=[run(text)])
+
+        elif element.name in ['ul', 'ol']:
+            style = 'List Bullet' if element.name == 'ul' else 'List Number'
+            for li in element.find_all('li', recursive=False):
+                text = li.get_text(strip=True)
+                if text:
+                    model.add("paragraph", runs=[run(text)], style=style)
+
+        elif element.name == 'table':
+            rows = [row.find_all(['td', 'th']) for row in element.find_all('tr')]
+            if any(rows):
+                # Header cells are bolded where they stand, no header row
+                model.add("table", style='Light Grid Accent 1', rows=[
+                    [[run(cell.get_text(strip=True), "b" if cell.name == 'th' else "")] for cell in cells]
+                    for cells in rows
+                ])
+
+        else:
+            for child in element.children:
+                if isinstance(child, Tag):
+                    self._process_element(child)
+                elif isinstance(child, NavigableString):
+                    text = str(child).strip()
+                    if len(text) > 20:
+                        model.add("paragraph", runs=[run(text)])
+
+    def _process_component(self, element, component_name):
+        """Marker, then a 2-column table: first image URL | summary text."""
+        model = self.model
+        try:
+            model.add("marker", kind="component", text=f"[COMPONENT: {component_name}]")
+            img_tag = element.find('img')
+            text_parts = []
+            text_containers = element.find_all(class_=self._TEXT_CLASS_RE)
+            if text_containers:
+                for container in text_containers:
+                    text = container.get_text(strip=True)
+                    if len(text) > 10:
+                        text_parts.append(text)
+            else:
+                for tag in element.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+                    text = tag.get_text(strip=True)
+                    if text:
+                        text_parts.append(text)
+            summary_text = "\n\n".join(dict.fromkeys(text_parts))
+            if not summary_text:
+                summary_text = element.get_text(separator=' ', strip=True)[:500]
+
+            if img_tag:
+                image_cell = [run("IMAGE:\n", "b"), run(img_tag.get('src', ''))]
+                model.add_image(img_tag.get('src', ''), img_tag.get('alt', ''), component_name)
+            else:
+                image_cell = [run("No Image", "i")]
+
+            model.add("table", style='Table Grid', rows=[[image_cell, [run(summary_text)]]])
+            model.add("spacer")
+        except Exception as e:
+            self.log(f"Error processing component {component_name}: {e}")
+
+
+class ContentDocxBuilder:
+    """
+    Build a structured Word document from a parsed page (extract, then render).
+
+    Args:
+        url: Page URL (used for the header, relative links and the SEO table)
+        log: Optional callable(str) receiving warnings
+        index_class: Index built over the main content before extracting
+        rules: ExtractionRules to apply (default: by URL host)
+    """
+
+    def __init__(self, url, log=None, index_class=ComponentIndex, rules=None):
+        self.extractor = ContentExtractor(url, log=log, index_class=index_class, rules=rules)
+        self.url = url
+        self.model = None
+
+    @property
+    def text_block_count(self):
+        return self.extractor.text_block_count
+
+    @property
+    def text_image_count(self):
+        return self.extractor.text_image_count
+
+    def build(self, soup) -> Document:
+        """Return the Word document for `soup`."""
+        self.model = self.extractor.extract(soup)
+        return render_docx(self.model)
+
+    def save(self, soup, output_folder, filename: str = None) -> str:
+        """Build and save the document; returns its path."""
+        path = os.path.join(output_folder, filename or docx_filename_for(self.url))
+        self.build(soup).save(path)
+        return path
+
+
+def _render_outputs(model, formats, with_model, images=None) -> dict:
+    out = {RENDER_FORMATS[fmt][0]: render_bytes(model, fmt, images) for fmt in formats}
+    if with_model:
+        out[".json"] = model.to_json().encode("utf-8")
+    return out
+
+
+def render_page(url: str, html: str, formats=("docx",), with_model: bool = False) -> dict:
+    """
+    Parse `html`, extract its model and render it (process-pool entry point).
+
+    Returns:
+        {extension: bytes} for each format, plus ".json" (the cached model)
+        when with_model is set
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    return _render_outputs(ContentExtractor(url).extract(soup), formats, with_model)
+
+
+def extract_page(url: str, html: str) -> tuple:
+    """
+    Parse `html` and extract its model (process-pool entry point).
+
+    Returns:
+        (model JSON, image URLs to embed) — the first step of render_page
+        when thumbnails are fetched in between
+    """
+    model = ContentExtractor(url).extract(BeautifulSoup(html, 'lxml'))
+    return model.to_json(), model.media_urls()
+
+
+def render_model(model_json: str, formats=("docx",), with_model: bool = False, images: dict = None) -> dict:
+    """Render a model from extract_page (process-pool entry point); same output as render_page."""
+    return _render_outputs(ContentDocument.from_json(model_json), formats, with_model, images)
+
+
+def render_docx_bytes(url: str, html: str) -> bytes:
+    """Parse `html` and return its document as .docx bytes."""
+    return render_page(url, html)[".docx"]
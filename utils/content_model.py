@@ -0,0 +1,419 @@
+"""
+Intermediate document model for extracted page content, and its renderers.
+
+`ContentExtractor` (utils/content_extraction.py) turns a parsed page into a
+`ContentDocument`: a flat list of blocks plus the page's components, links,
+images and SEO metadata, made only of JSON types so it can be cached next to
+the outputs. `render_docx`, `render_markdown` and `render_html` turn the same
+model into each format, so re-rendering or switching format needs neither a
+refetch nor a reparse. The Word renderer can also embed image thumbnails
+(utils/image_thumbnails.py) below the image URLs of component tables.
+
+Blocks (dicts, in document order):
+    {"type": "title", "text"}                       source header
+    {"type": "heading", "level", "runs"}
+    {"type": "paragraph", "runs", "style"}          style: "" or a list style
+    {"type": "marker", "kind", "text"}              kind: text_block | component | block
+    {"type": "table", "style", "rows", "header"}    rows: [[cell runs]], header: header row count
+    {"type": "spacer"}
+
+Runs are [text, flags] or [text, flags, href]; flags holds "b" (bold),
+"i" (italic), "a" (link, with href) and/or "m" (the text is an image URL).
+"""
+
+import html as html_lib
+import io
+import json
+import os
+
+from docx import Document
+
+from utils.docx_writer import DocxXmlWriter, run_xml
+
+MODEL_VERSION = 1
+
+# Marker kind -> (font color, bold, italic) in Word
+_MARKER_STYLES = {
+    "text_block": ("006400", True, False),
+    "component": ("646464", False, True),
+    "block": ("808080", False, True),
+}
+
+_ACCENT = "0070C0"
+_LINK = "0000FF"
+
+
+def run(text, flags="", href=None) -> list:
+    """Build a model run."""
+    return [text, flags, href] if href else [text, flags]
+
+
+class ContentDocument:
+    """
+    Extracted content of one page.
+
+    Attributes:
+        url: Source page URL
+        blocks: Content blocks in document order
+        components: [{"name", "block"}] detected components and the index of
+            their first block
+        links: [{"text", "href"}] absolute links found in the content
+        images: [{"src", "alt", "component"}] images used by components
+        seo: [[label, value]] SEO metadata rows
+    """
+
+    def __init__(self, url: str = ""):
+        self.url = url
+        self.blocks = []
+        self.components = []
+        self.links = []
+        self.images = []
+        self.seo = []
+
+    # -- building ---------------------------------------------------------
+
+    def add(self, block_type: str, **fields) -> dict:
+        block = {"type": block_type, **fields}
+        self.blocks.append(block)
+        return block
+
+    def add_component(self, name: str):
+        self.components.append({"name": name, "block": len(self.blocks)})
+
+    def add_link(self, text: str, href: str):
+        if href:
+            self.links.append({"text": text, "href": href})
+
+    def add_image(self, src: str, alt: str = "", component: str = ""):
+        if src:
+            self.images.append({"src": src, "alt": alt, "component": component})
+
+    def media_urls(self) -> list:
+        """Distinct image URLs of the "m" runs in tables (the images render_docx can embed)."""
+        urls = {}
+        for block in self.blocks:
+            if block["type"] == "table":
+                for cells in block["rows"]:
+                    for cell in cells:
+                        for r in cell:
+                            if "m" in r[1]:
+                                urls[r[0]] = None
+        return list(urls)
+
+    # -- JSON cache -------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "version": MODEL_VERSION,
+            "url": self.url,
+            "blocks": self.blocks,
+            "components": self.components,
+            "links": self.links,
+            "images": self.images,
+            "seo": self.seo,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ContentDocument":
+        if data.get("version") != MODEL_VERSION:
+            raise ValueError(f"Unsupported content model version: {data.get('version')}")
+        doc = cls(data.get("url", ""))
+        doc.blocks = data.get("blocks", [])
+        doc.components = data.get("components", [])
+        doc.links = data.get("links", [])
+        doc.images = data.get("images", [])
+        doc.seo = data.get("seo", [])
+        return doc
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "ContentDocument":
+        return cls.from_dict(json.loads(text))
+
+    def save_json(self, path: str) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+        return path
+
+    @classmethod
+    def load_json(cls, path: str) -> "ContentDocument":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_json(f.read())
+
+
+# ----------------------------------------------------------------------
+# Word
+# ----------------------------------------------------------------------
+
+def _docx_runs(writer: DocxXmlWriter, runs, bold=False) -> str:
+    """Run XML for model runs; links become hyperlinks (Blue, Underlined) followed by their URL."""
+    out = []
+    for r in runs:
+        text, flags = r[0], r[1]
+        href = r[2] if len(r) > 2 else None
+        if "a" in flags:
+            xml = run_xml(text, bold=bold, color=_LINK, underline=True)
+            if href and text.strip() != href:
+                xml += run_xml(f" ({href})", color=_LINK, underline=True)
+            out.append(writer.hyperlink(href, xml) if href else xml)
+        else:
+            out.append(run_xml(text, bold=bold or "b" in flags, italic="i" in flags))
+    return "".join(out)
+
+
+def _docx_table(writer: DocxXmlWriter, block, images=None):
+    header_rows = block.get("header", 0)
+    max_width = writer.cell_width(max((len(r) for r in block["rows"]), default=1))
+    rows = []
+    for i, cells in enumerate(block["rows"]):
+        row = []
+        for cell in cells:
+            xml = _docx_runs(writer, cell, bold=i < header_rows)
+            pictures = [images[r[0]] for r in cell if "m" in r[1] and r[0] in images] if images else []
+            if pictures:
+                # Thumbnails go in their own paragraphs below the cell text
+                xml = [xml] + [writer.picture(path, max_width) for path in pictures]
+            row.append(xml)
+        rows.append(row)
+    writer.table(rows, block["style"], header_rows=header_rows)
+
+
+def render_docx(model: ContentDocument, images: dict = None) -> Document:
+    """
+    Render the model as a python-docx Document (XML written in bulk by DocxXmlWriter).
+
+    Args:
+        images: Optional {image URL: local image path}; the image of each
+            "m" run found there is embedded below it
+    """
+    doc = Document()
+    writer = DocxXmlWriter(doc)
+    for block in model.blocks:
+        kind = block["type"]
+        if kind == "title":
+            writer.paragraph(run_xml(block["text"], bold=True, size_pt=14, color=_ACCENT), align="center")
+        elif kind == "heading":
+            writer.paragraph(_docx_runs(writer, block["runs"]), style=f"Heading {block['level']}")
+        elif kind == "paragraph":
+            writer.paragraph(_docx_runs(writer, block["runs"]), style=block.get("style") or None)
+        elif kind == "marker":
+            color, bold, italic = _MARKER_STYLES.get(block["kind"], _MARKER_STYLES["component"])
+            writer.paragraph(run_xml(block["text"], bold=bold, italic=italic, color=color, size_pt=9))
+        elif kind == "table":
+            _docx_table(writer, block, images)
+        elif kind == "spacer":
+            writer.paragraph()
+
+    if model.seo:
+        writer.paragraph()  # Spacer
+        writer.paragraph(run_xml("SEO METADATA", bold=True, size_pt=12, color=_ACCENT))
+        _docx_table(writer, {
+            "style": "Light Grid Accent 1",
+            "rows": [[[run(label, "b")], [run(value)]] for label, value in model.seo],
+        })
+    writer.flush()
+    return doc
+
+
+def render_docx_to_bytes(model: ContentDocument, images: dict = None) -> bytes:
+    buffer = io.BytesIO()
+    render_docx(model, images).save(buffer)
+    return buffer.getvalue()
+
+
+# ----------------------------------------------------------------------
+# Markdown
+# ----------------------------------------------------------------------
+
+def _md_escape(text: str) -> str:
+    for ch in ("\\", "*", "_", "[", "]", "`"):
+        text = text.replace(ch, "\\" + ch)
+    return text
+
+
+def _md_runs(runs, line_break=" ") -> str:
+    out = []
+    for r in runs:
+        text, flags = r[0], r[1]
+        href = r[2] if len(r) > 2 else None
+        stripped = text.strip()
+        if not stripped:
+            out.append(" " if text else "")
+            continue
+        piece = _md_escape(stripped)
+        if "a" in flags and href:
+            piece = f"[{piece}]({href})"
+        if "b" in flags:
+            piece = f"**{piece}**"
+        if "i" in flags:
+            piece = f"*{piece}*"
+        # Keep surrounding whitespace outside the markers
+        lead = text[:len(text) - len(text.lstrip())]
+        trail = text[len(text.rstrip()):]
+        out.append(f"{lead}{piece}{trail}")
+    lines = (" ".join(line.split()) for line in "".join(out).split("\n"))
+    return line_break.join(line for line in lines if line)
+
+
+def _md_cell(runs) -> str:
+    return _md_runs(runs, "<br>").replace("|", "\\|") or " "
+
+
+def render_markdown(model: ContentDocument) -> str:
+    """Render the model as Markdown."""
+    lines = []
+    number = 0
+    in_list = False
+    for block in model.blocks:
+        kind = block["type"]
+        style = block.get("style") if kind == "paragraph" else None
+        if style != "List Number":
+            number = 0
+        if in_list and style not in ("List Bullet", "List Number"):
+            lines.append("")
+        in_list = style in ("List Bullet", "List Number")
+        if kind == "title":
+            lines += [f"_{_md_escape(block['text'])}_", ""]
+        elif kind == "heading":
+            lines += ["#" * block["level"] + " " + _md_runs(block["runs"]), ""]
+        elif kind == "paragraph":
+            text = _md_runs(block["runs"])
+            if style == "List Bullet":
+                lines.append(f"- {text}")
+            elif style == "List Number":
+                number += 1
+                lines.append(f"{number}. {text}")
+            elif text:
+                lines += [text, ""]
+        elif kind == "marker":
+            lines += [f"> {_md_escape(block['text'])}", ""]
+        elif kind == "table":
+            rows = block["rows"]
+            cols = max((len(r) for r in rows), default=0)
+            if not cols:
+                continue
+            if lines and lines[-1] != "":
+                lines.append("")
+            for i, cells in enumerate(rows):
+                padded = [_md_cell(c) for c in cells] + [" "] * (cols - len(cells))
+                lines.append("| " + " | ".join(padded) + " |")
+                if i == 0:
+                    lines.append("|" + " --- |" * cols)
+            lines.append("")
+        elif kind == "spacer" and lines and lines[-1] != "":
+            lines.append("")
+
+    if model.seo:
+        if lines and lines[-1] != "":
+            lines.append("")
+        lines += ["## SEO metadata", "", "| Field | Value |", "| --- | --- |"]
+        lines += [f"| {_md_escape(label)} | {_md_cell([run(value)])} |" for label, value in model.seo]
+    return "\n".join(lines).strip() + "\n"
+
+
+# ----------------------------------------------------------------------
+# HTML
+# ----------------------------------------------------------------------
+
+_HTML_STYLE = (
+    "body{font-family:Calibri,Arial,sans-serif;max-width:60em;margin:2em auto;line-height:1.4}"
+    "table{border-collapse:collapse;margin:.5em 0}td,th{border:1px solid #999;padding:4px 8px;vertical-align:top;text-align:left}"
+    ".source{text-align:center;color:#0070c0;font-weight:bold}"
+    ".marker{font-size:9pt;color:#646464;font-style:italic}"
+    ".marker.text_block{color:#006400;font-weight:bold;font-style:normal}"
+    ".marker.block{color:#808080}"
+)
+
+
+def _html_runs(runs) -> str:
+    out = []
+    for r in runs:
+        text, flags = r[0], r[1]
+        href = r[2] if len(r) > 2 else None
+        piece = html_lib.escape(text).replace("\n", "<br>")
+        if "a" in flags and href:
+            piece = f'<a href="{html_lib.escape(href, quote=True)}">{piece}</a>'
+        if "b" in flags:
+            piece = f"<strong>{piece}</strong>"
+        if "i" in flags:
+            piece = f"<em>{piece}</em>"
+        out.append(piece)
+    return "".join(out)
+
+
+def _html_table(rows, header_rows=0) -> str:
+    body = []
+    for i, cells in enumerate(rows):
+        tag = "th" if i < header_rows else "td"
+        body.append("<tr>" + "".join(f"<{tag}>{_html_runs(c)}</{tag}>" for c in cells) + "</tr>")
+    return f"<table>{''.join(body)}</table>"
+
+
+def render_html(model: ContentDocument) -> str:
+    """Render the model as a standalone HTML page."""
+    parts = []
+    open_list = None
+    for block in model.blocks:
+        kind = block["type"]
+        style = block.get("style") if kind == "paragraph" else None
+        list_tag = {"List Bullet": "ul", "List Number": "ol"}.get(style)
+        if open_list and list_tag != open_list:
+            parts.append(f"</{open_list}>")
+            open_list = None
+        if list_tag and not open_list:
+            parts.append(f"<{list_tag}>")
+            open_list = list_tag
+
+        if kind == "title":
+            parts.append(f'<p class="source">{html_lib.escape(block["text"])}</p>')
+        elif kind == "heading":
+            level = min(max(int(block["level"]), 1), 6)
+            parts.append(f"<h{level}>{_html_runs(block['runs'])}</h{level}>")
+        elif kind == "paragraph":
+            tag = "li" if list_tag else "p"
+            parts.append(f"<{tag}>{_html_runs(block['runs'])}</{tag}>")
+        elif kind == "marker":
+            parts.append(f'<p class="marker {block["kind"]}">{html_lib.escape(block["text"])}</p>')
+        elif kind == "table":
+            parts.append(_html_table(block["rows"], block.get("header", 0)))
+    if open_list:
+        parts.append(f"</{open_list}>")
+
+    if model.seo:
+        parts.append("<h2>SEO metadata</h2>")
+        parts.append(_html_table([[[run(label, "b")], [run(value)]] for label, value in model.seo]))
+
+    return (
+        '<!DOCTYPE html><html><head><meta charset="utf-8">'
+        f"<title>{html_lib.escape(model.url)}</title><style>{_HTML_STYLE}</style></head>"
+        f"<body>{''.join(parts)}</body></html>\n"
+    )
+
+
+# Output format -> (file extension, renderer(model, images) returning bytes)
+RENDER_FORMATS = {
+    "docx": (".docx", render_docx_to_bytes),
+    "md": (".md", lambda model, images=None: render_markdown(model).encode("utf-8")),
+    "html": (".html", lambda model, images=None: render_html(model).encode("utf-8")),
+}
+
+
+def render_bytes(model: ContentDocument, fmt: str, images: dict = None) -> bytes:
+    """Render the model in `fmt` ("docx", "md" or "html"); `images` is used by docx only."""
+    if fmt not in RENDER_FORMATS:
+        raise ValueError(f"Unknown output format: {fmt}")
+    return RENDER_FORMATS[fmt][1](model, images)
+
+
+def write_formats(model: ContentDocument, output_folder: str, stem: str, formats=("docx",),
+                  images: dict = None) -> list:
+    """Write the model as <stem><ext> in each format; returns the paths."""
+    paths = []
+    for fmt in formats:
+        path = os.path.join(output_folder, stem + RENDER_FORMATS[fmt][0])
+        with open(path, "wb") as f:
+            f.write(render_bytes(model, fmt, images))
+        paths.append(path)
+    return paths
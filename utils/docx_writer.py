@@ -0,0 +1,213 @@
+"""
+Bulk WordprocessingML writer for python-docx documents.
+
+python-docx builds tables cell by cell (`add_table`, `row.cells`,
+`cell.paragraphs[0].add_run`) and resolves the style name on every
+paragraph, which is slow for documents with thousands of cells.
+`DocxXmlWriter` instead renders paragraphs and tables as XML text in one
+pass, resolves each style, hyperlink relationship and image part once, and
+inserts the whole batch with a single parse on flush().
+"""
+
+import re
+from xml.sax.saxutils import escape
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+# Characters XML 1.0 cannot carry (python-docx rejects them)
+_INVALID_XML_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_BREAKS_RE = re.compile(r"(\r\n|\r|\n|\t)")
+
+_EMU_PER_TWIP = 635
+_CELL_MARGIN_TWIPS = 108  # Word's default left/right cell margin
+
+_NSDECLS = nsdecls('w', 'r', 'wp', 'a', 'pic')
+
+_PICTURE_XML = (
+    '<w:r><w:drawing><wp:inline distT="0" distB="0" distL="0" distR="0">'
+    '<wp:extent cx="{cx}" cy="{cy}"/><wp:docPr id="{id}" name="Picture {id}"/>'
+    '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<pic:pic><pic:nvPicPr><pic:cNvPr id="0" name="{name}"/><pic:cNvPicPr/></pic:nvPicPr>'
+    '<pic:blipFill><a:blip r:embed="{rel_id}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+    '<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr></pic:pic>'
+    '</a:graphicData></a:graphic></wp:inline></w:drawing></w:r>'
+)
+
+
+def _text_xml(text: str) -> str:
+    """w:t / w:br / w:tab content for `text` (newlines and tabs as python-docx add_run does)."""
+    out = []
+    for piece in _BREAKS_RE.split(_INVALID_XML_RE.sub("", text)):
+        if not piece:
+            continue
+        if piece == "\t":
+            out.append("<w:tab/>")
+        elif piece in ("\n", "\r", "\r\n"):
+            out.append("<w:br/>")
+        elif piece != piece.strip():
+            out.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+        else:
+            out.append(f"<w:t>{escape(piece)}</w:t>")
+    return "".join(out)
+
+
+def run_xml(text: str, bold=False, italic=False, color: str = None, size_pt: float = None,
+            underline=False) -> str:
+    """One w:r element. `color` is an RRGGBB hex string."""
+    props = []
+    if bold:
+        props.append("<w:b/>")
+    if italic:
+        props.append("<w:i/>")
+    if color:
+        props.append(f'<w:color w:val="{color}"/>')
+    if size_pt:
+        props.append(f'<w:sz w:val="{int(round(size_pt * 2))}"/>')
+    if underline:
+        props.append('<w:u w:val="single"/>')
+    rpr = f"<w:rPr>{''.join(props)}</w:rPr>" if props else ""
+    return f"<w:r>{rpr}{_text_xml(text)}</w:r>"
+
+
+class DocxXmlWriter:
+    """
+    Append paragraphs and tables to a python-docx Document as raw XML.
+
+    Args:
+        doc: python-docx Document to append to
+
+    Content is buffered by paragraph() / table() (both take pre-rendered
+    run XML from run_xml() / hyperlink()) and inserted before the final
+    section properties by flush().
+    """
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._parts = []
+        self._style_ids = {}
+        self._rel_ids = {}
+        self._next_rel = 1
+        self._images = {}  # path -> (rel_id, Image)
+        self._next_shape = 1
+        section = doc.sections[-1]
+        self.block_width = section.page_width - section.left_margin - section.right_margin
+
+    def style_id(self, name: str) -> str:
+        """Style id for a style name, resolved once per document."""
+        style_id = self._style_ids.get(name)
+        if style_id is None:
+            style_id = self._style_ids[name] = self.doc.styles[name].style_id
+        return style_id
+
+    def hyperlink(self, url: str, runs_xml: str) -> str:
+        """w:hyperlink wrapping `runs_xml`, with one relationship per distinct URL."""
+        rel_id = self._rel_ids.get(url)
+        if rel_id is None:
+            # rels.get_or_add_ext_rel scans every relationship per call; number them here instead
+            rels = self.doc.part.rels
+            while f"rId{self._next_rel}" in rels:
+                self._next_rel += 1
+            rel_id = self._rel_ids[url] = f"rId{self._next_rel}"
+            rels.add_relationship(RT.HYPERLINK, url, rel_id, is_external=True)
+        return f'<w:hyperlink r:id="{rel_id}" w:history="1">{runs_xml}</w:hyperlink>'
+
+    def picture(self, path: str, max_width: int = None) -> str:
+        """
+        w:r holding an inline picture of the image file at `path`.
+
+        The image part is added once per path; the picture keeps the image's
+        native size (from its DPI), scaled down to `max_width` EMU if given.
+        """
+        entry = self._images.get(path)
+        if entry is None:
+            entry = self._images[path] = self.doc.part.get_or_add_image(path)
+        rel_id, image = entry
+        cx, cy = image.width, image.height
+        if max_width and cx > max_width:
+            cx, cy = max_width, int(cy * max_width / cx)
+        shape_id = self._next_shape
+        self._next_shape += 1
+        return _PICTURE_XML.format(
+            cx=int(cx), cy=int(cy), id=shape_id, rel_id=rel_id,
+            name=escape(image.filename, {'"': "&quot;"}),
+        )
+
+    def _paragraph_xml(self, runs_xml: str = "", style: str = None, align: str = None) -> str:
+        ppr = ""
+        if style or align:
+            style_xml = f'<w:pStyle w:val="{self.style_id(style)}"/>' if style else ""
+            align_xml = f'<w:jc w:val="{align}"/>' if align else ""
+            ppr = f"<w:pPr>{style_xml}{align_xml}</w:pPr>"
+        return f"<w:p>{ppr}{runs_xml}</w:p>" if ppr or runs_xml else "<w:p/>"
+
+    def _append(self, xml: str):
+        # Each top-level element declares its namespaces itself: lxml then
+        # moves it into the document without reconciling every descendant
+        end = xml.index(">")
+        if xml[end - 1] == "/":
+            end -= 1
+        self._parts.append(f"{xml[:end]} {_NSDECLS}{xml[end:]}")
+
+    def paragraph(self, runs_xml: str = "", style: str = None, align: str = None):
+        """Append a paragraph; `align` is a w:jc value such as "center"."""
+        self._append(self._paragraph_xml(runs_xml, style, align))
+
+    def cell_width(self, cols: int) -> int:
+        """Content width in EMU of each cell of a table with `cols` columns."""
+        return int(self.block_width / max(cols, 1)) - 2 * _CELL_MARGIN_TWIPS * _EMU_PER_TWIP
+
+    def table(self, rows, style: str = None, header_rows: int = 0):
+        """
+        Append a table.
+
+        Args:
+            rows: [[cell]] where a cell is the run XML of its single
+                paragraph, or a list of run XML strings (one paragraph each)
+            style: Table style name
+            header_rows: Leading rows marked as header rows (repeated on
+                each page)
+        """
+        cols = max((len(r) for r in rows), default=0)
+        if not cols:
+            return
+        width = int(self.block_width / cols / _EMU_PER_TWIP)
+        tc_pr = f'<w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr>'
+        style_xml = f'<w:tblStyle w:val="{self.style_id(style)}"/>' if style else ""
+
+        out = [
+            f'<w:tbl><w:tblPr>{style_xml}<w:tblW w:type="auto" w:w="0"/>'
+            '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+            'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr><w:tblGrid>',
+            f'<w:gridCol w:w="{width}"/>' * cols,
+            "</w:tblGrid>",
+        ]
+        for i, cells in enumerate(rows):
+            header = i < header_rows
+            out.append("<w:tr><w:trPr><w:tblHeader/></w:trPr>" if header else "<w:tr>")
+            for j in range(cols):
+                cell = cells[j] if j < len(cells) else ""
+                paragraphs = cell if isinstance(cell, list) else [cell]
+                out.append(f"<w:tc>{tc_pr}")
+                out.extend(self._paragraph_xml(p) for p in (paragraphs or [""]))
+                out.append("</w:tc>")
+            out.append("</w:tr>")
+        out.append("</w:tbl>")
+        self._append("".join(out))
+
+    def flush(self):
+        """Parse the buffered XML once and insert it at the end of the document body."""
+        if not self._parts:
+            return
+        fragment = parse_xml(f"<w:body {_NSDECLS}>{''.join(self._parts)}</w:body>")
+        self._parts = []
+        body = self.doc.element.body
+        sect_pr = body.sectPr
+        for element in list(fragment):
+            if sect_pr is not None:
+                sect_pr.addprevious(element)
+            else:
+                body.append(element)
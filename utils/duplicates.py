@@ -0,0 +1,181 @@
+"""
+Site-wide duplicate detection for meta titles, descriptions and H1s.
+
+Values are normalized with `norm_title` / `norm_text` and hashed into a
+grouping index as crawl rows stream in (exact duplicates). Each distinct
+value also gets a MinHash signature that is bucketed with LSH banding, so
+near-duplicates are found without comparing every pair of pages.
+"""
+
+import hashlib
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+from utils.helpers import norm_text, norm_title
+
+# field key -> (label, normalizer)
+DUPLICATE_FIELDS = {
+    "title": ("Meta Title", norm_title),
+    "meta_description": ("Meta Description", norm_text),
+    "h1": ("H1", norm_text),
+}
+
+_PRIME = np.uint64(4294967311)  # smallest prime above 2**32
+
+
+class DuplicateIndex:
+    """
+    Streaming exact and near-duplicate index.
+
+    Args:
+        num_perm: MinHash signature length
+        bands: Number of LSH bands (num_perm must be divisible by bands)
+        threshold: Minimum estimated Jaccard similarity for near-duplicates
+        shingle_size: Character shingle length used for MinHash
+        seed: Seed for the permutation coefficients
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.8,
+                 shingle_size: int = 4, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+
+        rng = np.random.RandomState(seed)
+        # a < 2**31 keeps a * x + b inside uint64 for 32-bit shingle hashes
+        self._a = rng.randint(1, 2 ** 31 - 1, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._b = rng.randint(0, 2 ** 31 - 1, size=num_perm, dtype=np.int64).astype(np.uint64)
+
+        self._urls = {f: {} for f in DUPLICATE_FIELDS}        # field -> digest -> [urls]
+        self._values = {f: {} for f in DUPLICATE_FIELDS}      # field -> digest -> normalized value
+        self._signatures = {f: {} for f in DUPLICATE_FIELDS}  # field -> digest -> signature
+        self._buckets = {f: defaultdict(list) for f in DUPLICATE_FIELDS}  # field -> band key -> [digest]
+
+    def add(self, url: str, field: str, value):
+        """Index one page value. Empty values and unknown fields are ignored."""
+        if field not in DUPLICATE_FIELDS or not value:
+            return
+        normalized = DUPLICATE_FIELDS[field][1](str(value))
+        if not normalized:
+            return
+        key = normalized.casefold()
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+
+        urls = self._urls[field].setdefault(digest, [])
+        urls.append(url)
+        if len(urls) > 1:
+            return
+
+        # First time this value is seen: sign it and drop it into LSH buckets
+        self._values[field][digest] = normalized
+        signature = self._minhash(key)
+        if signature is None:
+            return
+        self._signatures[field][digest] = signature
+        r = self.rows_per_band
+        for band in range(self.bands):
+            band_key = (band, signature[band * r:(band + 1) * r].tobytes())
+            self._buckets[field][band_key].append(digest)
+
+    def add_page(self, url: str, fields: dict):
+        """Index all duplicate-relevant fields of one crawled page."""
+        for field, value in (fields or {}).items():
+            self.add(url, field, value)
+
+    def _minhash(self, text: str):
+        k = self.shingle_size
+        if len(text) < k:
+            shingles = {text}
+        else:
+            shingles = {text[i:i + k] for i in range(len(text) - k + 1)}
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+        )
+        if hashes.size == 0:
+            return None
+        # (num_perm, n_shingles) permuted hashes, min per permutation
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _PRIME
+        return permuted.min(axis=1)
+
+    def exact_groups(self, field: str):
+        """Return [(value, [urls])] for values shared by more than one page."""
+        groups = [
+            (self._values[field][digest], urls)
+            for digest, urls in self._urls[field].items()
+            if len(urls) > 1
+        ]
+        groups.sort(key=lambda g: -len(g[1]))
+        return groups
+
+    def near_groups(self, field: str):
+        """
+        Return near-duplicate groups of distinct values for `field`.
+
+        Each group is (similarity, [(value, [urls]), ...]) where similarity is
+        the lowest estimated Jaccard similarity against the group anchor.
+        Bucket members are only verified against the bucket's first entry, so
+        cost stays linear in the number of distinct values.
+        """
+        parent = {}
+
+        def find(x):
+            while parent.get(x, x) != x:
+                parent[x] = parent.get(parent[x], parent[x])
+                x = parent[x]
+            return x
+
+        best = {}
+        signatures = self._signatures[field]
+        for members in self._buckets[field].values():
+            if len(members) < 2:
+                continue
+            anchor = members[0]
+            others = members[1:]
+            # One vectorized comparison of the whole bucket against its anchor
+            sims = (np.stack([signatures[d] for d in others]) == signatures[anchor]).mean(axis=1)
+            for other, sim in zip(others, sims.tolist()):
+                if sim < self.threshold or find(anchor) == find(other):
+                    continue
+                parent[find(other)] = find(anchor)
+                best[other] = max(best.get(other, 0.0), sim)
+
+        clusters = defaultdict(list)
+        for digest in list(parent):
+            clusters[find(digest)].append(digest)
+
+        groups = []
+        for root, digests in clusters.items():
+            members = set(digests) | {root}
+            if len(members) < 2:
+                continue
+            sim = min(best.get(d, 1.0) for d in members)
+            ordered = sorted(members, key=lambda d: -len(self._urls[field][d]))
+            groups.append((sim, [(self._values[field][d], self._urls[field][d]) for d in ordered]))
+        groups.sort(key=lambda g: -sum(len(urls) for _, urls in g[1]))
+        return groups
+
+    def write_sheet(self, workbook, title: str = "Duplicates"):
+        """Append a sheet listing every exact and near-duplicate group, one row per URL."""
+        ws = workbook.create_sheet(title)
+        ws.append(["Field", "Match Type", "Group", "Similarity", "Value", "URL"])
+        rows = 0
+        for field, (label, _) in DUPLICATE_FIELDS.items():
+            group_no = 0
+            for value, urls in self.exact_groups(field):
+                group_no += 1
+                for url in urls:
+                    ws.append([label, "Exact", group_no, 1.0, value, url])
+                    rows += 1
+            for sim, members in self.near_groups(field):
+                group_no += 1
+                for value, urls in members:
+                    for url in urls:
+                        ws.append([label, "Near", group_no, round(sim, 3), value, url])
+                        rows += 1
+        return rows
@@ -0,0 +1,415 @@
+"""
+Streaming Excel input readers.
+
+Workbooks are opened in openpyxl `read_only` mode and consumed row by row:
+the header and columns are detected from the first rows only, and data rows
+are yielded lazily so workers can start checking while the sheet is read.
+"""
+
+from itertools import islice
+
+import openpyxl
+import pandas as pd
+
+
+def norm_header(cell) -> str:
+    """Normalize a header cell for keyword matching."""
+    return str(cell).strip().lower() if cell is not None else ""
+
+
+def cell_text(row, idx) -> str:
+    """Return the stripped text of `row[idx]`, or an empty string."""
+    if idx is None or idx >= len(row):
+        return ""
+    val = row[idx]
+    return str(val).strip() if val is not None else ""
+
+
+def is_http_url(value) -> bool:
+    """True if a cell value looks like an absolute http(s) URL."""
+    s = str(value).strip() if value is not None else ""
+    return s.startswith("http://") or s.startswith("https://")
+
+
+class SheetStream:
+    """
+    Lazily iterate a worksheet, detecting the header row from the first rows.
+
+    Args:
+        path: Path to the .xlsx/.xlsm workbook
+        is_header: Callable(row) -> bool used to spot the header row
+        sheet_keywords: Sheet name keywords tried in priority order (case-insensitive);
+            the active sheet is used when none matches
+        scan_rows: Number of leading rows buffered for header/column detection
+    """
+
+    def __init__(self, path, is_header, sheet_keywords=(), scan_rows: int = 20):
+        self.path = path
+        self.wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        self.ws = self._pick_sheet(sheet_keywords)
+        # Dimension from the sheet metadata; may be None for some generators
+        self.total_rows = self.ws.max_row
+        self._rows = self.ws.iter_rows(values_only=True)
+        self.head = list(islice(self._rows, scan_rows))
+
+        self.header_idx = None
+        for i, row in enumerate(self.head):
+            if is_header(row):
+                self.header_idx = i
+                break
+        self.header = self.head[self.header_idx] if self.header_idx is not None else None
+
+    def _pick_sheet(self, sheet_keywords):
+        for keywords in sheet_keywords:
+            if isinstance(keywords, str):
+                keywords = (keywords,)
+            for name in self.wb.sheetnames:
+                low = name.lower()
+                if any(k in low for k in keywords):
+                    return self.wb[name]
+        return self.wb.active
+
+    @property
+    def data_rows_hint(self):
+        """Approximate number of data rows, or None if the sheet has no dimension."""
+        if not self.total_rows:
+            return None
+        skip = self.header_idx + 1 if self.header_idx is not None else 0
+        return max(0, self.total_rows - skip)
+
+    def rows(self, columns=None):
+        """
+        Yield `(excel_row_number, row_tuple)` for every row after the header.
+
+        Args:
+            columns: Optional 0-based column indexes; rows are then tuples of
+                those cells only, and openpyxl builds no cells for the others
+        """
+        start = self.header_idx + 1 if self.header_idx is not None else 0
+        rows = self._rows
+        if columns is not None:
+            columns = list(columns)
+            low = min(columns)
+            rows = self.ws.iter_rows(min_row=len(self.head) + 1, min_col=low + 1, max_col=max(columns) + 1,
+                                     values_only=True)
+        try:
+            for i in range(start, len(self.head)):
+                row = self.head[i]
+                yield i + 1, row if columns is None else tuple(row[c] if c < len(row) else None for c in columns)
+            row_number = len(self.head)
+            for row in rows:
+                row_number += 1
+                yield row_number, row if columns is None else tuple(
+                    row[c - low] if c - low < len(row) else None for c in columns
+                )
+        finally:
+            self.close()
+
+    def close(self):
+        try:
+            self.wb.close()
+        except Exception:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Redirect map (old URL -> expected new URL)
+# ---------------------------------------------------------------------------
+
+def _is_redirect_header(row) -> bool:
+    cells = [norm_header(c) for c in row]
+    has_source = any(("old" in h or "source" in h or "from" in h) and "url" in h for h in cells)
+    has_target = any(
+        ("new" in h or "target" in h or "destination" in h or "expected" in h or h == "to" or h.startswith("to "))
+        for h in cells
+    )
+    return has_source and has_target
+
+
+def open_redirect_map(path) -> SheetStream:
+    """Open a redirect mapping workbook for streaming."""
+    return SheetStream(path, _is_redirect_header, sheet_keywords=(("redirect",), ("mapping", "map")))
+
+
+def redirect_map_items(stream: SheetStream):
+    """
+    Yield redirect mapping rows from a `SheetStream`.
+
+    Each item is a dict: {row, source, expected, expected_status}.
+    Columns are detected by header keywords (old/source/from URL, new/target/
+    destination/expected URL, status/code/type); without a header the first
+    two URL columns in the scanned rows are used.
+    """
+    src_idx = dst_idx = status_idx = None
+
+    if stream.header is not None:
+        for idx, cell in enumerate(stream.header):
+            h = norm_header(cell)
+            if not h:
+                continue
+            if src_idx is None and ("old" in h or "source" in h or "from" in h):
+                src_idx = idx
+            elif dst_idx is None and (
+                "new" in h or "target" in h or "destination" in h or "expected" in h or h == "to" or h.startswith("to ")
+            ) and "status" not in h and "code" not in h:
+                dst_idx = idx
+            elif status_idx is None and ("status" in h or "code" in h or "type" in h):
+                status_idx = idx
+
+    if src_idx is None or dst_idx is None:
+        # Fallback: first row of the scanned block holding two URLs
+        for row in stream.head:
+            url_cols = [i for i, c in enumerate(row) if is_http_url(c)]
+            if len(url_cols) >= 2:
+                src_idx, dst_idx = url_cols[0], url_cols[1]
+                break
+
+    if src_idx is None or dst_idx is None:
+        src_idx, dst_idx = 0, 1
+
+    for row_number, row in stream.rows():
+        source = cell_text(row, src_idx)
+        if not source:
+            continue
+        expected_status = None
+        raw_status = cell_text(row, status_idx)
+        digits = "".join(ch for ch in raw_status if ch.isdigit())[:3]
+        if digits:
+            expected_status = int(digits)
+        yield {
+            "row": row_number,
+            "source": source,
+            "expected": cell_text(row, dst_idx),
+            "expected_status": expected_status,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Meta Checker expectations (URL + expected meta fields)
+# ---------------------------------------------------------------------------
+
+def _is_meta_header(row) -> bool:
+    for cell in row:
+        h = norm_header(cell)
+        if "page url" in h or h == "url":
+            return True
+    return False
+
+
+def open_meta_sheet(path) -> SheetStream:
+    """
+    Open a Meta Checker expectation workbook for streaming.
+
+    Sheet priority: a sheet named like "update(s)", then one mentioning
+    "h1" or "meta", otherwise the active sheet.
+    """
+    return SheetStream(path, _is_meta_header, sheet_keywords=(("update",), ("h1", "meta")))
+
+
+def meta_check_items(stream: SheetStream):
+    """
+    Yield Meta Checker items from a `SheetStream`.
+
+    Each item is a dict: {row, url, expected: {meta_title, meta_description,
+    og_title, og_description, h1}}. Columns are detected from the header;
+    without a URL header, the first column holding an http(s) URL in the
+    scanned rows is used.
+    """
+    url_idx = h1_idx = mt_idx = md_idx = ogt_idx = ogd_idx = None
+
+    if stream.header is not None:
+        for idx, cell in enumerate(stream.header):
+            h = norm_header(cell)
+
+            if url_idx is None and ("page url" in h or h == "url"):
+                url_idx = idx
+
+            if h1_idx is None and "expected" in h and ("h1" in h or "heading 1" in h):
+                h1_idx = idx
+
+            if mt_idx is None and "expected" in h and "title" in h and "og" not in h:
+                mt_idx = idx
+
+            if md_idx is None and "expected" in h and "description" in h and "og" not in h:
+                md_idx = idx
+
+            if ogt_idx is None and "expected" in h and "og" in h and "title" in h:
+                ogt_idx = idx
+
+            if ogd_idx is None and "expected" in h and "og" in h and "description" in h:
+                ogd_idx = idx
+
+    # Fallback URL detection on the scanned rows only
+    if url_idx is None and stream.head:
+        max_cols = max(len(r) for r in stream.head)
+        for col in range(max_cols):
+            if any(col < len(r) and is_http_url(r[col]) for r in stream.head):
+                url_idx = col
+                break
+
+    if url_idx is None:
+        url_idx = 0
+
+    for row_number, row in stream.rows():
+        url = cell_text(row, url_idx)
+        if not (url.startswith("http://") or url.startswith("https://")):
+            continue
+        yield {
+            "row": row_number,
+            "url": url,
+            "expected": {
+                "meta_title": cell_text(row, mt_idx),
+                "meta_description": cell_text(row, md_idx),
+                "og_title": cell_text(row, ogt_idx),
+                "og_description": cell_text(row, ogd_idx),
+                "h1": cell_text(row, h1_idx),
+            },
+        }
+
+
+# ---------------------------------------------------------------------------
+# Product sheet (URL + expected product ID / GTIN)
+# ---------------------------------------------------------------------------
+
+def _is_gtin_header(h: str) -> bool:
+    return "gtin" in h or "ean" in h or "barcode" in h
+
+
+def _is_id_header(h: str) -> bool:
+    return ("product" in h and "id" in h) or h in ("id", "sku", "product code") or "article" in h
+
+
+def _is_product_header(row) -> bool:
+    cells = [norm_header(c) for c in row]
+    has_url = any("url" in h or "link" in h for h in cells)
+    return has_url and any(_is_gtin_header(h) or _is_id_header(h) for h in cells)
+
+
+def open_product_sheet(path) -> SheetStream:
+    """
+    Open a product sheet workbook for streaming.
+
+    Sheet priority: a sheet named like "product(s)", then one mentioning
+    "sku", "gtin" or "ean", otherwise the active sheet.
+    """
+    return SheetStream(path, _is_product_header, sheet_keywords=(("product",), ("sku", "gtin", "ean")))
+
+
+def product_sheet_items(stream: SheetStream):
+    """
+    Yield product sheet rows from a `SheetStream`.
+
+    Each item is a dict: {row, url, expected_id, expected_gtin}. Expected
+    values are the raw cell values (numbers stay numbers for `norm_num`).
+    Columns are detected from the header; without one, the first URL column
+    of the scanned rows is used with the ID and GTIN in the next two columns.
+    """
+    url_idx = id_idx = gtin_idx = None
+
+    if stream.header is not None:
+        for idx, cell in enumerate(stream.header):
+            h = norm_header(cell)
+            if not h:
+                continue
+            if url_idx is None and ("url" in h or "link" in h):
+                url_idx = idx
+            elif gtin_idx is None and _is_gtin_header(h):
+                gtin_idx = idx
+            elif id_idx is None and _is_id_header(h):
+                id_idx = idx
+
+    if url_idx is None:
+        for row in stream.head:
+            url_cols = [i for i, c in enumerate(row) if is_http_url(c)]
+            if url_cols:
+                url_idx = url_cols[0]
+                break
+        if url_idx is None:
+            url_idx = 0
+        if stream.header is None:
+            id_idx, gtin_idx = url_idx + 1, url_idx + 2
+
+    def raw(row, idx):
+        if idx is None or idx >= len(row):
+            return None
+        return row[idx]
+
+    for row_number, row in stream.rows():
+        url = cell_text(row, url_idx)
+        if not url or "." not in url:
+            continue
+        yield {
+            "row": row_number,
+            "url": url,
+            "expected_id": raw(row, id_idx),
+            "expected_gtin": raw(row, gtin_idx),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Image URL list (one URL per row)
+# ---------------------------------------------------------------------------
+
+def _is_image_url_header(row) -> bool:
+    return any(("url" in h or "link" in h or "image" in h) and "/" not in h
+               for h in (norm_header(c) for c in row))
+
+
+def open_image_url_sheet(path) -> SheetStream:
+    """Open an image URL list (first sheet) for streaming."""
+    return SheetStream(path, _is_image_url_header)
+
+
+def normalize_url_chunk(values, seen: set) -> list:
+    """
+    Normalize a chunk of URL cells in one vectorized pass.
+
+    Cells are stripped, empty ones dropped, "https://" is added where the
+    scheme is missing, and URLs already in `seen` (or earlier in the chunk)
+    are dropped. New URLs are added to `seen`, in their original order.
+    """
+    urls = pd.Series(values, dtype=object).dropna().astype(str).str.strip()
+    urls = urls[urls != ""]
+    missing_scheme = ~urls.str.match(r"(?i)https?://")
+    urls = urls.where(~missing_scheme, "https://" + urls)
+    urls = urls[~urls.duplicated()]
+    new = [u for u in urls.tolist() if u not in seen]
+    seen.update(new)
+    return new
+
+
+def image_url_items(stream: SheetStream, chunk_size: int = 2000):
+    """
+    Yield unique, normalized image URLs from a `SheetStream`.
+
+    Only the URL column is read: the one whose header mentions url/link/
+    image, else the first column holding an http(s) URL in the scanned rows,
+    else the first column. Rows are normalized and deduplicated per chunk
+    (see normalize_url_chunk; chunks grow up to `chunk_size`), so the first
+    URLs are available long before the sheet has been read.
+    """
+    url_idx = None
+    if stream.header is not None:
+        for idx, cell in enumerate(stream.header):
+            h = norm_header(cell)
+            if ("url" in h or "link" in h or "image" in h) and "/" not in h:
+                url_idx = idx
+                break
+    if url_idx is None:
+        for row in stream.head:
+            url_cols = [i for i, c in enumerate(row) if is_http_url(c)]
+            if url_cols:
+                url_idx = url_cols[0]
+                break
+    if url_idx is None:
+        url_idx = 0
+
+    seen = set()
+    rows = stream.rows(columns=[url_idx])
+    size = min(64, chunk_size)  # small first chunks: the first downloads start right away
+    while True:
+        chunk = [row[0] for _, row in islice(rows, size)]
+        if not chunk:
+            return
+        yield from normalize_url_chunk(chunk, seen)
+        size = min(size * 2, chunk_size)
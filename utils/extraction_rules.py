@@ -0,0 +1,346 @@
+"""
+Declarative per-site extraction rules for the content extractor.
+
+A rules file (JSON, or YAML when PyYAML is installed) lists the tags to
+skip, the exclusions, the text-block marker, the Drupal block marker and
+the components with their handler and selectors. Selectors use a CSS
+subset: compound selectors made of a tag or `*`, `.class`, `#id` and
+`[attr]`, `[attr=v]`, `[attr^=v]`, `[attr*=v]`, `[attr$=v]` filters, in
+comma-separated lists (no combinators; nested lookups are expressed as
+separate selectors such as "image_container" then "image").
+
+Every selector is compiled once into a `Matcher`, and `ExtractionRules`
+buckets the matchers by a required class, id or tag so that evaluating all
+rules on one element only looks at the matchers that can apply to it.
+Rule files live in config.EXTRACTION_RULES_DIR; the one whose "hosts"
+match the page host is used, "default.json" otherwise.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from urllib.parse import urlparse
+
+from config import EXTRACTION_RULES_DIR
+
+try:
+    import yaml
+except ImportError:  # YAML rule files are optional
+    yaml = None
+
+DEFAULT_RULES_FILE = "default.json"
+RULE_FILE_EXTENSIONS = (".json", ".yaml", ".yml")
+
+# Handler -> selector parameters it reads (with defaults used when a rule omits them)
+HANDLER_DEFAULTS = {
+    "hero": {
+        "category": ".hero--article-category",
+        "category_link": "a",
+        "image_container": ".hero--image",
+        "image": "img",
+    },
+    "link_list": {
+        "title": "h2, h3, h4",
+        "link": "a",
+        "link_parent_exclude": ".field--name-field-article-category",
+        "item_title": ".field--name-title",
+    },
+    "text_image": {
+        "image": "img",
+        "content": "p, h2, h3, h4, h5, h6, li",
+        "skip_inside": ".hero--article-category",
+        "text": "[class*=summary], [class*=text], [class*=desc], [class*=body], [class*=content]",
+    },
+    "summary": {
+        "image": "img",
+        "text": "[class*=summary], [class*=text], [class*=desc], [class*=body], [class*=content]",
+        "text_exclude": ".hero--article-category",
+        "fallback": "p, h1, h2, h3, h4, h5, h6",
+    },
+}
+
+# Parameters whose selectors are checked against ancestors (index.inside)
+ANCESTOR_PARAMS = ("skip_inside",)
+# Parameters whose selectors are checked on a single element (rules.matches)
+ELEMENT_PARAMS = ("link_parent_exclude", "text_exclude")
+
+_COMPOUND_RE = re.compile(
+    r"""(?P<tag>[A-Za-z][\w-]*|\*)|\.(?P<cls>[\w-]+)|\#(?P<id>[\w-]+)"""
+    r"""|\[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[\^*$]?=)\s*(?P<val>"[^"]*"|'[^']*'|[^\]\s]+)\s*)?\]"""
+)
+
+
+class RulesError(ValueError):
+    """Invalid extraction rules or selector."""
+
+
+class Matcher:
+    """One compiled compound selector."""
+
+    __slots__ = ("selector", "tag", "classes", "id", "attrs", "key", "class_only")
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        self.tag = None
+        self.id = None
+        self.attrs = []  # (name, op, value)
+        classes = []
+        pos = 0
+        while pos < len(selector):
+            m = _COMPOUND_RE.match(selector, pos)
+            if not m or m.end() == pos:
+                raise RulesError(f"Unsupported selector: {selector!r}")
+            if m.group("tag"):
+                if pos:
+                    raise RulesError(f"Tag must come first in selector: {selector!r}")
+                self.tag = None if m.group("tag") == "*" else m.group("tag").lower()
+            elif m.group("cls"):
+                classes.append(m.group("cls"))
+            elif m.group("id"):
+                self.id = m.group("id")
+            else:
+                value = m.group("val")
+                if value and value[0] in "\"'":
+                    value = value[1:-1]
+                self.attrs.append((m.group("attr").lower(), m.group("op"), value))
+            pos = m.end()
+        self.classes = frozenset(classes)
+
+        # Bucket key: the most selective required feature
+        if self.classes:
+            self.key = ("class", min(self.classes))
+        elif self.id:
+            self.key = ("id", self.id)
+        elif self.tag:
+            self.key = ("tag", self.tag)
+        else:
+            self.key = ("any", None)
+        # Result depends only on the element's class attribute (cacheable per class string)
+        self.class_only = self.tag is None and self.id is None and all(a[0] == "class" for a in self.attrs)
+
+    def matches(self, tag, class_list=None) -> bool:
+        if class_list is None:
+            class_list = tag.get("class") or []
+        if self.tag and tag.name != self.tag:
+            return False
+        if self.id and tag.get("id") != self.id:
+            return False
+        if self.classes and not self.classes.issubset(class_list):
+            return False
+        for name, op, value in self.attrs:
+            raw = class_list if name == "class" else tag.get(name)
+            if raw is None or (name == "class" and not raw):
+                return False
+            if op is None:
+                continue
+            # Multi-valued attributes (class) compare their whole value, as in CSS
+            text = " ".join(raw) if isinstance(raw, list) else raw
+            if op == "=" and text != value:
+                return False
+            if op == "^=" and not text.startswith(value):
+                return False
+            if op == "$=" and not text.endswith(value):
+                return False
+            if op == "*=" and value not in text:
+                return False
+        return True
+
+
+class MatcherSet:
+    """
+    Labelled selectors evaluated together.
+
+    Matchers are bucketed by a required class, id or tag; match(tag) only
+    evaluates the buckets of the element's own classes, id and tag, plus the
+    selectors without such a key (whose class-only results are cached per
+    class attribute value). The cost per element does not grow with the
+    number of rules that cannot apply to it.
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._any = []
+        self._any_class_only = []
+        self._class_cache = {}
+
+    def add(self, label, selector: str):
+        parts = [p.strip() for p in selector.split(",")]
+        if not all(parts):
+            raise RulesError(f"Empty selector in {selector!r}")
+        for part in parts:
+            matcher = Matcher(part)
+            if matcher.key[0] != "any":
+                self._buckets.setdefault(matcher.key, []).append((label, matcher))
+            elif matcher.class_only:
+                self._any_class_only.append((label, matcher))
+            else:
+                self._any.append((label, matcher))
+        self._class_cache.clear()
+
+    def match(self, tag) -> set:
+        """Labels of every selector matching `tag`."""
+        class_list = tag.get("class") or []
+        labels = set()
+        buckets = self._buckets
+        if buckets:
+            for cls in class_list:
+                for label, matcher in buckets.get(("class", cls), ()):
+                    if label not in labels and matcher.matches(tag, class_list):
+                        labels.add(label)
+            for key in (("id", tag.get("id")), ("tag", tag.name)):
+                for label, matcher in buckets.get(key, ()):
+                    if label not in labels and matcher.matches(tag, class_list):
+                        labels.add(label)
+        if self._any_class_only:
+            cache_key = " ".join(class_list)
+            hits = self._class_cache.get(cache_key)
+            if hits is None:
+                hits = self._class_cache[cache_key] = frozenset(
+                    label for label, matcher in self._any_class_only if matcher.matches(tag, class_list)
+                )
+            labels |= hits
+        for label, matcher in self._any:
+            if label not in labels and matcher.matches(tag, class_list):
+                labels.add(label)
+        return labels
+
+
+# Labels used in ExtractionRules.matchers besides ("component", order) and ("kind", selector)
+EXCLUDE = ("exclude",)
+TEXT_BLOCK = ("text_block",)
+BLOCK = ("block",)
+
+
+class ExtractionRules:
+    """
+    Compiled extraction rules.
+
+    Attributes:
+        name: Rule set name
+        hosts: Host suffixes the rules apply to
+        skip_tags: Tag names never descended into
+        markers: Selector lists of "exclude", "text_block" and "block_marker"
+        component_tags: Tag names that may be component roots (all when empty)
+        components: [{"match", "name", "name_from_class", "handler", **selectors}]
+            in priority order
+        kinds: Every selector a handler looks up, indexed per element
+        ancestor_kinds: Kinds tested against ancestors (skip_inside)
+        matchers: MatcherSet of exclusions, markers, components and kinds
+    """
+
+    def __init__(self, data: dict, source: str = ""):
+        self.source = source
+        self.name = data.get("name") or os.path.splitext(os.path.basename(source))[0]
+        self.hosts = [h.lower() for h in data.get("hosts", [])]
+        self.skip_tags = set(data.get("skip_tags", ["script", "style", "nav", "footer", "header", "noscript"]))
+        self.block_id_attrs = data.get("block_id_attrs", ["data-block-plugin-id", "id"])
+        self.component_tags = set(data.get("component_tags", []))
+        self.matchers = MatcherSet()
+        self.markers = {}
+        for label, key in ((EXCLUDE, "exclude"), (TEXT_BLOCK, "text_block"), (BLOCK, "block_marker")):
+            selectors = data.get(key) or []
+            if isinstance(selectors, str):
+                selectors = [selectors]
+            self.markers[key] = ", ".join(selectors)
+            if selectors:
+                self.matchers.add(label, self.markers[key])
+
+        self.components = []
+        self.kinds = []
+        self.ancestor_kinds = set()
+        self._element_checks = {}
+        for i, rule in enumerate(data.get("components", [])):
+            handler = rule.get("handler", "summary")
+            if handler not in HANDLER_DEFAULTS:
+                raise RulesError(f"Unknown handler {handler!r} in component {i} of {source}")
+            if "match" not in rule or not (rule.get("name") or rule.get("name_from_class")):
+                raise RulesError(f"Component {i} of {source} needs 'match' and 'name' or 'name_from_class'")
+            compiled = dict(HANDLER_DEFAULTS[handler])
+            compiled.update({k: v for k, v in rule.items() if k in HANDLER_DEFAULTS[handler]})
+            for param, selector in compiled.items():
+                if param in ELEMENT_PARAMS:
+                    self._element_check(selector)
+                    continue
+                if selector not in self.kinds:
+                    self.kinds.append(selector)
+                    self.matchers.add(("kind", selector), selector)
+                if param in ANCESTOR_PARAMS:
+                    self.ancestor_kinds.add(selector)
+            compiled.update({
+                "match": rule["match"],
+                "name": rule.get("name", ""),
+                "name_from_class": rule.get("name_from_class", ""),
+                "handler": handler,
+            })
+            self.matchers.add(("component", i), rule["match"])
+            self.components.append(compiled)
+
+    def _element_check(self, selector: str) -> MatcherSet:
+        checks = self._element_checks.get(selector)
+        if checks is None:
+            checks = self._element_checks[selector] = MatcherSet()
+            checks.add(True, selector)
+        return checks
+
+    def applies_to(self, url: str) -> bool:
+        host = (urlparse(url).hostname or "").lower()
+        return any(host == h or host.endswith("." + h) for h in self.hosts)
+
+    def classify(self, tag):
+        """
+        Evaluate every rule on one element.
+
+        Returns:
+            (labels, component) where component is (rule, display name) of
+            the first matching component rule, or None
+        """
+        labels = self.matchers.match(tag)
+        orders = [label[1] for label in labels if label[0] == "component"]
+        if not orders or (self.component_tags and tag.name not in self.component_tags):
+            return labels, None
+        rule = self.components[min(orders)]
+        return labels, (rule, self.component_name(rule, tag))
+
+    @staticmethod
+    def component_name(rule: dict, tag) -> str:
+        """Display name of a component root matched by `rule`."""
+        if rule["name"]:
+            return rule["name"]
+        prefix = rule["name_from_class"]
+        cls = next((c for c in tag.get("class") or [] if c.startswith(prefix)), prefix)
+        return cls[len(prefix):].replace("-", " ").title()
+
+    def block_id(self, tag) -> str:
+        return next((tag.get(a) for a in self.block_id_attrs if tag.get(a)), "unknown")
+
+    def matches(self, tag, selector: str) -> bool:
+        """Whether `tag` itself matches a handler's element-check selector."""
+        return bool(self._element_check(selector).match(tag))
+
+
+def read_rules(path: str) -> dict:
+    """Raw contents of a JSON or YAML rules file."""
+    with open(path, encoding="utf-8") as f:
+        if path.lower().endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise RulesError(f"PyYAML is required to read {path}")
+            return yaml.safe_load(f) or {}
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def load_rules(path: str) -> ExtractionRules:
+    """Load and compile a rules file (cached per path)."""
+    return ExtractionRules(read_rules(path), source=path)
+
+
+def rules_for_url(url: str, rules_dir: str = EXTRACTION_RULES_DIR) -> ExtractionRules:
+    """Rules whose "hosts" match the URL's host, or the default rules."""
+    for name in sorted(os.listdir(rules_dir)) if os.path.isdir(rules_dir) else []:
+        if name == DEFAULT_RULES_FILE or not name.lower().endswith(RULE_FILE_EXTENSIONS):
+            continue
+        rules = load_rules(os.path.join(rules_dir, name))
+        if rules.applies_to(url):
+            return rules
+    return load_rules(os.path.join(rules_dir, DEFAULT_RULES_FILE))
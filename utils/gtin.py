@@ -0,0 +1,86 @@
+"""
+Vectorized GTIN / product ID format validation.
+
+Expected values from product sheets are validated in batches before any page
+is fetched: each value is normalized with `norm_num`, left-padded to 14 digits
+and the GTIN-8/12/13/14 check digits of the whole batch are verified in one
+numpy pass.
+"""
+
+import numpy as np
+
+from utils.helpers import norm_num
+
+GTIN_LENGTHS = (8, 12, 13, 14)
+
+# GTIN-14 weights for the 13 data digits (left-padding with zeros keeps
+# shorter GTINs valid under the same weights)
+_WEIGHTS = np.array([3, 1] * 6 + [3], dtype=np.int64)
+
+# Reasons reported for invalid values ("" means valid, "missing" means empty)
+GTIN_OK = ""
+GTIN_MISSING = "missing"
+GTIN_NOT_NUMERIC = "not numeric"
+GTIN_BAD_LENGTH = "bad length"
+GTIN_BAD_CHECK_DIGIT = "bad check digit"
+
+
+def _as_strings(values) -> np.ndarray:
+    return np.array([norm_num(v) for v in values], dtype=str)
+
+
+def validate_gtins(values) -> list:
+    """
+    Validate a batch of expected GTINs.
+
+    Args:
+        values: Iterable of raw cell values (str, int, float or None)
+
+    Returns:
+        One reason per value: "" when valid, otherwise "missing",
+        "not numeric", "bad length" or "bad check digit".
+    """
+    s = _as_strings(values)
+    n = len(s)
+    if n == 0:
+        return []
+
+    lengths = np.char.str_len(s)
+    numeric = np.char.isdigit(s)
+    length_ok = np.isin(lengths, GTIN_LENGTHS)
+    candidates = numeric & length_ok
+
+    check_ok = np.zeros(n, dtype=bool)
+    if candidates.any():
+        padded = np.char.zfill(s[candidates], 14).astype("U14")
+        digits = padded.view(np.uint32).reshape(-1, 14).astype(np.int64) - 48
+        expected = (10 - (digits[:, :13] @ _WEIGHTS) % 10) % 10
+        check_ok[candidates] = expected == digits[:, 13]
+
+    reasons = np.full(n, GTIN_BAD_CHECK_DIGIT, dtype=object)
+    reasons[check_ok] = GTIN_OK
+    reasons[numeric & ~length_ok] = GTIN_BAD_LENGTH
+    reasons[~numeric] = GTIN_NOT_NUMERIC
+    reasons[lengths == 0] = GTIN_MISSING
+    return reasons.tolist()
+
+
+def validate_ids(values) -> list:
+    """
+    Validate a batch of expected product IDs (digits only).
+
+    Returns:
+        One reason per value: "", "missing" or "not numeric".
+    """
+    s = _as_strings(values)
+    if len(s) == 0:
+        return []
+    reasons = np.full(len(s), GTIN_OK, dtype=object)
+    reasons[~np.char.isdigit(s)] = GTIN_NOT_NUMERIC
+    reasons[np.char.str_len(s) == 0] = GTIN_MISSING
+    return reasons.tolist()
+
+
+def is_blocking(reason: str) -> bool:
+    """True for reasons that flag a value as malformed (not merely absent)."""
+    return reason not in (GTIN_OK, GTIN_MISSING)
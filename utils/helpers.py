@@ -9,6 +9,9 @@ import math
 from pathlib import Path
 from typing import Union
 
+# Site-name suffix stripped from titles, e.g. " | Purina" or " | Purina ES"
+TITLE_SUFFIX_RE = re.compile(r'\s*\|\s*purina(?:\s+[A-Z]{2})?$', re.IGNORECASE)
+
 
 def sanitize_filename(filename: str, max_length: int = 255) -> str:
     """
@@ -114,7 +117,7 @@ def norm_title(text: str) -> str:
     normalized = re.sub(r'\s+', ' ', text).strip()
     
     # Remove suffixes like " | Purina" or " | Purina ES" (case-insensitive)
-    normalized = re.sub(r'\s*\|\s*purina(?:\s+[A-Z]{2})?$', '', normalized, flags=re.IGNORECASE)
+    normalized = TITLE_SUFFIX_RE.sub('', normalized)
     
     return normalized.strip()
 
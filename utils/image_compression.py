@@ -0,0 +1,268 @@
+"""
+Image compression helpers shared by the image workers.
+
+Functions here take and return plain values so they can run in a
+ProcessPoolExecutor next to the downloads. `CompressionEngine` owns such a
+pool: it keeps a bounded number of files in flight, reports each file's
+byte savings as it finishes and can be cancelled from another thread.
+
+With a byte budget (`max_bytes`), the encoder quality is binary-searched in
+memory for the highest quality that fits, and the original file is kept
+when re-encoding would not make it smaller.
+"""
+
+import asyncio
+import io
+import os
+import shutil
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+from config import TARGET_SIZE_MIN_QUALITY
+from utils.streaming import map_in_pool
+
+# error: None on success, else the message (original_size / compressed_size are 0 when unknown);
+# quality: encoder quality chosen for a byte budget; kept_original: the source was copied unchanged
+CompressResult = namedtuple(
+    "CompressResult", "source output original_size compressed_size error quality kept_original",
+    defaults=(None, False),
+)
+
+FORMAT_MAP = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG', 'webp': 'WEBP', 'gif': 'GIF', 'avif': 'AVIF'}
+QUALITY_FORMATS = ('JPEG', 'WEBP', 'AVIF')  # formats whose size a quality search can steer
+
+
+def _prepare(img, save_format):
+    """Image converted for `save_format`, and the base save options."""
+    if img.mode in ('P', 'RGBA') and save_format not in ['PNG', 'WEBP', 'AVIF']:
+        img = img.convert('RGB')
+    save_options = {'format': save_format, 'optimize': True}
+    if getattr(img, 'is_animated', False) and save_format in ['GIF', 'WEBP', 'PNG']:
+        save_options['save_all'] = True
+    return img, save_options
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = f"{path}.{os.getpid()}.part"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def compress_image(img_path: str, output_path: str, fmt: str, quality: int) -> str:
+    """
+    Re-encode one image to `output_path` as `fmt` (process-pool entry point).
+
+    The file is written under a temporary name and renamed, so readers never
+    see a partial output.
+
+    Raises:
+        OSError / PIL errors when the file cannot be read or written
+    """
+    save_format = FORMAT_MAP.get(fmt.lower(), 'JPEG')
+    tmp_path = f"{output_path}.{os.getpid()}.part"
+    with Image.open(img_path) as img:
+        img, save_options = _prepare(img, save_format)
+        if save_format in ['JPEG', 'WEBP']:
+            save_options['quality'] = quality
+        img.save(tmp_path, **save_options)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def encode_to_budget(img, save_format: str, max_bytes: int, max_quality: int = 95,
+                     min_quality: int = TARGET_SIZE_MIN_QUALITY):
+    """
+    Encode `img` in memory at the highest quality whose output fits `max_bytes`.
+
+    Quality is binary-searched between min_quality and max_quality (about
+    log2(range) encodes, no temporary files). Formats without a quality
+    setting are encoded once.
+
+    Returns:
+        (data, quality): quality is None for formats without one; when even
+        min_quality does not fit, the min_quality encoding is returned
+    """
+    img, save_options = _prepare(img, save_format)
+
+    def encode(quality):
+        buffer = io.BytesIO()
+        options = dict(save_options, quality=quality) if quality is not None else save_options
+        img.save(buffer, **options)
+        return buffer.getvalue()
+
+    if save_format not in QUALITY_FORMATS:
+        return encode(None), None
+    min_quality = min(min_quality, max_quality)
+    data = encode(max_quality)
+    if len(data) <= max_bytes:
+        return data, max_quality
+    best, smallest = None, (data, max_quality)
+    low, high = min_quality, max_quality - 1
+    while low <= high:
+        quality = (low + high) // 2
+        data = encode(quality)
+        if len(data) <= max_bytes:
+            best, low = (data, quality), quality + 1
+        else:
+            smallest, high = (data, quality), quality - 1
+    return best or smallest
+
+
+def compress_image_file(img_path: str, output_dir: str, fmt: str, quality: int) -> str:
+    """
+    Re-encode one image into `output_dir` as `<name>.<fmt>` (process-pool entry point).
+
+    Returns:
+        Path of the compressed file
+    """
+    base_name = os.path.splitext(os.path.basename(img_path))[0]
+    return compress_image(img_path, os.path.join(output_dir, f"{base_name}.{fmt.lower()}"), fmt, quality)
+
+
+def compress_to_budget(img_path: str, output_path: str, fmt: str, max_bytes: int, max_quality: int = 95):
+    """
+    Re-encode one image to fit `max_bytes` (see encode_to_budget).
+
+    When the encoding is not smaller than the source file, the source is
+    copied unchanged instead, keeping its own extension.
+
+    Returns:
+        (output path, quality or None, kept original)
+    """
+    save_format = FORMAT_MAP.get(fmt.lower(), 'JPEG')
+    with Image.open(img_path) as img:
+        img.load()
+        data, quality = encode_to_budget(img, save_format, max_bytes, max_quality)
+    if len(data) >= os.path.getsize(img_path):
+        output_path = os.path.splitext(output_path)[0] + os.path.splitext(img_path)[1]
+        tmp_path = f"{output_path}.{os.getpid()}.part"
+        shutil.copyfile(img_path, tmp_path)
+        os.replace(tmp_path, output_path)
+        return output_path, None, True
+    _write_atomic(output_path, data)
+    return output_path, quality, False
+
+
+def compress_file(img_path: str, output_path: str, fmt: str, quality: int, max_bytes: int = None) -> CompressResult:
+    """
+    compress_image() (or compress_to_budget() with `max_bytes`, `quality`
+    being the highest quality tried) reporting sizes; errors are returned,
+    not raised (process-pool entry point).
+    """
+    original_size = 0
+    try:
+        original_size = os.path.getsize(img_path)
+        if max_bytes:
+            output_path, chosen, kept = compress_to_budget(img_path, output_path, fmt, max_bytes, quality)
+            return CompressResult(img_path, output_path, original_size, os.path.getsize(output_path), None,
+                                  chosen, kept)
+        compress_image(img_path, output_path, fmt, quality)
+        return CompressResult(img_path, output_path, original_size, os.path.getsize(output_path), None, quality)
+    except Exception as e:
+        return CompressResult(img_path, output_path, original_size, 0, str(e) or e.__class__.__name__)
+
+
+def describe_savings(result: CompressResult) -> str:
+    """"120.5 KB → 40.2 KB (-67%)" for a successful CompressResult."""
+    if result.kept_original:
+        return f"{result.original_size / 1024:.1f} KB, original kept"
+    before, after = result.original_size / 1024, result.compressed_size / 1024
+    change = (result.compressed_size - result.original_size) / result.original_size * 100 if result.original_size else 0
+    return f"{before:.1f} KB → {after:.1f} KB ({change:+.0f}%)"
+
+
+class CompressionEngine:
+    """
+    Compress image files in a process pool.
+
+    Args:
+        fmt: Output format ("jpg", "webp", ...)
+        quality: Encoder quality for JPEG / WebP
+        processes: Worker processes (default: CPU count - 1)
+        max_in_flight: Files submitted but not finished (default: 2 per process),
+            so a large folder never queues all of its work at once
+        max_bytes: Optional byte budget per file; `quality` is then the
+            highest quality the search tries
+
+    `compress_all()` drives the pool from a worker thread; `compress()` is the
+    asyncio equivalent for one file. `cancel()` (any thread) drops the queued
+    files; files already being encoded finish. Use as a context manager or
+    call close().
+    """
+
+    def __init__(self, fmt: str, quality: int, processes: int = None, max_in_flight: int = None,
+                 max_bytes: int = None):
+        self.fmt = fmt
+        self.quality = quality
+        self.max_bytes = max_bytes
+        self.processes = processes or max(1, (os.cpu_count() or 2) - 1)
+        self.max_in_flight = max(1, max_in_flight or 2 * self.processes)
+        self._pool = None
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._slots = None  # asyncio.Semaphore, created in the running loop
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Stop submitting files and cancel the queued ones."""
+        self._cancelled.set()
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _submit(self, source: str, output: str):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processes)
+        future = self._pool.submit(compress_file, source, output, self.fmt, self.quality, self.max_bytes)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def compress_all(self, jobs):
+        """
+        Compress (source, output) pairs, yielding a CompressResult per file as it finishes.
+
+        `jobs` is consumed lazily. Stops early (without results for the
+        remaining files) once cancel() is called.
+        """
+        yield from map_in_pool(lambda job: self._submit(*job), jobs, self.max_in_flight, lambda: self.cancelled)
+
+    async def compress(self, source: str, output: str):
+        """Compress one file in the pool; None when the engine was cancelled first."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        async with self._slots:
+            if self.cancelled:
+                return None
+            future = self._submit(source, output)
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                if future.cancelled():  # cancelled by cancel(), not the awaiting task
+                    return None
+                raise
@@ -0,0 +1,184 @@
+"""
+Streaming downloads to disk for the image workers.
+
+`stream_to_file` writes a response body to a temporary ".part" file chunk
+by chunk (file I/O batched and run off the event loop), enforces a size
+limit, verifies an expected digest and/or the server's Content-MD5, and
+renames the file into place only when the download is complete, so a
+partially written image never appears under its final name. `fetch_to_file`
+adds the GET with retries of transient failures (connection errors,
+timeouts, 408/429/5xx with backoff or Retry-After), and `TransferRate`
+measures throughput for progress messages.
+"""
+
+import asyncio
+import base64
+import hashlib
+import os
+import random
+import time
+from collections import namedtuple
+
+import aiohttp
+
+from config import IMAGE_DOWNLOAD_RETRIES
+
+CHUNK_SIZE = 64 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024  # Bytes collected before each (off-loop) file write
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+MAX_RETRY_DELAY = 30  # Seconds; longer Retry-After values are capped
+
+DownloadResult = namedtuple("DownloadResult", "path size sha256")
+
+
+class DownloadError(Exception):
+    """A download rejected by its HTTP status, size limit or checksum (the partial file is removed)."""
+
+
+def _parse_digest(expected: str):
+    """("sha256", hex) from "sha256:<hex>" / "md5:<hex>" or a bare 64-character sha256 hex."""
+    if ":" in expected:
+        algorithm, _, value = expected.partition(":")
+        algorithm = algorithm.strip().lower()
+    else:
+        algorithm, value = "sha256", expected
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"Unknown checksum algorithm: {algorithm}")
+    return algorithm, value.strip().lower()
+
+
+async def stream_to_file(response, path: str, max_bytes: int = None, expected_digest: str = None,
+                         verify_content_md5: bool = True, chunk_size: int = CHUNK_SIZE) -> DownloadResult:
+    """
+    Stream an aiohttp response body to `path`.
+
+    Args:
+        response: aiohttp ClientResponse (status already checked)
+        path: Final file path; data goes to path + ".part" until complete
+        max_bytes: Reject bodies larger than this (checked against
+            Content-Length first, then while streaming)
+        expected_digest: Optional "sha256:<hex>", "md5:<hex>" (any hashlib
+            algorithm) or bare sha256 hex the content must match
+        verify_content_md5: Also check the server's Content-MD5 header when sent
+
+    Returns:
+        DownloadResult(path, size, sha256 hex of the content)
+
+    Raises:
+        DownloadError: size limit exceeded or checksum mismatch
+        aiohttp / OS errors from the transfer or the file system
+    """
+    if max_bytes and (response.content_length or 0) > max_bytes:
+        raise DownloadError(f"Content-Length {response.content_length} exceeds the {max_bytes} byte limit")
+
+    expected = _parse_digest(expected_digest) if expected_digest else None
+    content_md5 = response.headers.get("Content-MD5") if verify_content_md5 else None
+    sha256 = hashlib.sha256()
+    extra = {}
+    if expected and expected[0] != "sha256":
+        extra[expected[0]] = hashlib.new(expected[0])
+    if content_md5 and "md5" not in extra:
+        extra["md5"] = hashlib.md5()
+
+    loop = asyncio.get_running_loop()
+    tmp_path = path + ".part"
+    f = await loop.run_in_executor(None, open, tmp_path, "wb")
+    size = 0
+    buffer = bytearray()
+    try:
+        async for chunk in response.content.iter_chunked(chunk_size):
+            size += len(chunk)
+            if max_bytes and size > max_bytes:
+                raise DownloadError(f"Body exceeds the {max_bytes} byte limit")
+            sha256.update(chunk)
+            for h in extra.values():
+                h.update(chunk)
+            buffer += chunk
+            if len(buffer) >= WRITE_BUFFER_SIZE:
+                data, buffer = bytes(buffer), bytearray()
+                await loop.run_in_executor(None, f.write, data)
+        if buffer:
+            await loop.run_in_executor(None, f.write, bytes(buffer))
+        await loop.run_in_executor(None, f.close)
+
+        if expected:
+            algorithm, value = expected
+            actual = sha256.hexdigest() if algorithm == "sha256" else extra[algorithm].hexdigest()
+            if actual != value:
+                raise DownloadError(f"{algorithm} mismatch: expected {value}, got {actual}")
+        if content_md5:
+            actual = base64.b64encode(extra["md5"].digest()).decode("ascii")
+            if actual != content_md5.strip():
+                raise DownloadError(f"Content-MD5 mismatch: expected {content_md5}, got {actual}")
+
+        await loop.run_in_executor(None, os.replace, tmp_path, path)
+    except BaseException:
+        # Also on cancellation: never leave a partial file behind
+        f.close()
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return DownloadResult(path, size, sha256.hexdigest())
+
+
+def _retry_delay(attempt: int, backoff: float, response=None) -> float:
+    """Seconds before retry `attempt` (0-based): Retry-After when sent, else jittered exponential backoff."""
+    retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+    if retry_after.strip().isdigit():
+        return min(float(retry_after), MAX_RETRY_DELAY)
+    delay = backoff * 2 ** attempt
+    return min(delay + random.uniform(0, delay / 2), MAX_RETRY_DELAY)
+
+
+async def fetch_to_file(session, url: str, path: str, retries: int = IMAGE_DOWNLOAD_RETRIES,
+                        backoff: float = 0.5, **stream_options) -> DownloadResult:
+    """
+    GET `url` into `path` with stream_to_file(), retrying transient failures.
+
+    Args:
+        session: aiohttp ClientSession (its connector sets the connection limits)
+        retries: Extra attempts after connection errors, timeouts and
+            408/429/5xx responses
+        backoff: First retry delay in seconds, doubled per attempt
+        stream_options: Passed to stream_to_file (max_bytes, expected_digest, ...)
+
+    Raises:
+        DownloadError: non-retryable status, retries exhausted on a status,
+            size limit or checksum mismatch
+        aiohttp.ClientError / asyncio.TimeoutError when retries are exhausted
+    """
+    attempt = 0
+    while True:
+        try:
+            async with session.get(url, ssl=False) as response:
+                if response.status == 200:
+                    return await stream_to_file(response, path, **stream_options)
+                if response.status not in RETRY_STATUSES or attempt >= retries:
+                    raise DownloadError(f"HTTP {response.status}")
+                delay = _retry_delay(attempt, backoff, response)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt >= retries:
+                raise
+            delay = _retry_delay(attempt, backoff)
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+class TransferRate:
+    """Files and bytes completed since creation, as rates for progress messages."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.files = 0
+        self.bytes = 0
+
+    def add(self, size: int):
+        self.files += 1
+        self.bytes += size
+
+    def describe(self) -> str:
+        """Rates such as "4.2 MB/s · 12.5 files/s"."""
+        elapsed = max(time.monotonic() - self.started, 1e-6)
+        return f"{self.bytes / elapsed / (1024 * 1024):.1f} MB/s · {self.files / elapsed:.1f} files/s"
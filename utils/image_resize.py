@@ -0,0 +1,163 @@
+"""
+Image resizing for the Image Resizer tool.
+
+`resize_file` runs in a process pool. It lets the decoder do most of the
+downscaling before the final LANCZOS pass: JPEGs are decoded at a reduced
+DCT scale with draft(), and other formats are shrunk with the cheap box
+reduce() (Pillow's `reducing_gap`). For large photos, most of the
+full-resolution decode and resample work is skipped, and the output stays
+visually the same.
+
+`responsive_set` builds a srcset-ready family of one image: it decodes the
+source once, derives every width by cascading from the next larger one,
+and encodes all formats of a width in parallel threads.
+"""
+
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+from PIL import Image
+
+from config import RESPONSIVE_FORMATS, RESPONSIVE_WIDTHS
+from utils.image_compression import FORMAT_MAP
+
+RESIZE_FORMATS = ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp')
+REDUCING_GAP = 2.0  # Decode / reduce to at least this multiple of the target size before LANCZOS
+
+# error: None on success, else the message; source_size: (width, height) before resizing
+ResizeResult = namedtuple("ResizeResult", "source output source_size error")
+
+
+def target_size(width: int, height: int, ratio=None):
+    """Output size: `width` x `height`, or `width` x width*ratio when a ratio (height / width) is set."""
+    if ratio is not None:
+        height = int(width * ratio)
+    return max(1, int(width)), max(1, int(height))
+
+
+def resize_image(img_path: str, output_path: str, width: int, height: int, ratio=None,
+                 reducing_gap: float = REDUCING_GAP):
+    """
+    Resize one image to the target size and save it (format from `output_path`).
+
+    Returns:
+        (width, height) of the source image
+    """
+    with Image.open(img_path) as img:
+        source_size = img.size
+        size = target_size(width, height, ratio)
+        if reducing_gap and img.format == 'JPEG':
+            # DCT-domain downscale while decoding (1/2, 1/4 or 1/8), staying >= gap x target
+            img.draft(None, (int(size[0] * reducing_gap), int(size[1] * reducing_gap)))
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        resized = img.resize(size, Image.Resampling.LANCZOS, reducing_gap=reducing_gap)
+    tmp_path = f"{output_path}.{os.getpid()}.part{os.path.splitext(output_path)[1]}"
+    resized.save(tmp_path)
+    os.replace(tmp_path, output_path)
+    return source_size
+
+
+def resize_file(img_path: str, output_path: str, width: int, height: int, ratio=None) -> ResizeResult:
+    """resize_image() with errors returned, not raised (process-pool entry point)."""
+    try:
+        source_size = resize_image(img_path, output_path, width, height, ratio)
+        return ResizeResult(img_path, output_path, source_size, None)
+    except Exception as e:
+        return ResizeResult(img_path, output_path, None, str(e) or e.__class__.__name__)
+
+
+def _encode_variant(img, path: str, fmt: str, quality: int) -> int:
+    """Save one variant (temporary name, then rename); returns its size in bytes."""
+    save_format = FORMAT_MAP.get(fmt.lower(), 'JPEG')
+    if save_format not in ('PNG', 'WEBP', 'AVIF') and img.mode not in ('RGB', 'L'):
+        img = img.convert('RGB')
+    options = {'format': save_format, 'optimize': True}
+    if save_format in ('JPEG', 'WEBP', 'AVIF'):
+        options['quality'] = quality
+    tmp_path = f"{path}.{os.getpid()}.part"
+    img.save(tmp_path, **options)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def variant_stems(image_paths) -> list:
+    """
+    Output name stem per source for responsive_set(): the file name without
+    extension, suffixed "-2", "-3"... when an earlier source of the batch has
+    the same stem (case-insensitive), e.g. hero.jpg and hero.png.
+    """
+    used = set()
+    stems = []
+    for path in image_paths:
+        base = os.path.splitext(os.path.basename(path))[0]
+        stem, n = base, 2
+        while stem.lower() in used:
+            stem = f"{base}-{n}"
+            n += 1
+        used.add(stem.lower())
+        stems.append(stem)
+    return stems
+
+
+def responsive_set(img_path: str, output_dir: str, widths=RESPONSIVE_WIDTHS, formats=RESPONSIVE_FORMATS,
+                   quality: int = 80, reducing_gap: float = REDUCING_GAP, stem: str = None) -> dict:
+    """
+    Write `<stem>-<width>w.<fmt>` for every width and format (process-pool entry point).
+
+    `stem` defaults to the source file name without extension; batches pass
+    the names from variant_stems() so sources sharing a stem do not
+    overwrite each other's files.
+
+    The source is decoded once (JPEGs at a reduced DCT scale still at least
+    `reducing_gap` x the largest width). Widths are produced from the largest
+    down, each resized from the previous one, so every step shrinks a small
+    image. Widths wider than the source are skipped (the source width is
+    used when all are). Aspect ratio is kept.
+
+    Returns:
+        Manifest entry: {source, width, height, variants: [{path, format,
+        width, height, bytes}], srcset: {format: "path 320w, ..."}}, paths
+        relative to `output_dir`; or {source, error} on failure
+    """
+    name = os.path.basename(img_path)
+    try:
+        stem = stem or os.path.splitext(name)[0]
+        with Image.open(img_path) as img:
+            source_w, source_h = img.size
+            sizes = sorted({w for w in widths if 0 < w <= source_w}, reverse=True) or [source_w]
+            largest = sizes[0]
+            if reducing_gap and img.format == 'JPEG':
+                img.draft(None, (int(largest * reducing_gap), int(source_h * largest / source_w * reducing_gap)))
+            img.load()
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            elif img.mode not in ('RGB', 'RGBA', 'L'):
+                img = img.convert('RGB')
+
+            variants = []
+            current = img
+            with ThreadPoolExecutor(max_workers=max(1, len(formats))) as encoders:  # encoders release the GIL
+                for width in sizes:
+                    height = max(1, round(source_h * width / source_w))
+                    if current.size != (width, height):
+                        current = current.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=reducing_gap)
+                    paths = {fmt: f"{stem}-{width}w.{fmt.lower()}" for fmt in formats}
+                    sizes_in_bytes = encoders.map(
+                        lambda fmt, img=current: _encode_variant(img, os.path.join(output_dir, paths[fmt]), fmt, quality),
+                        formats,
+                    )
+                    for fmt, size in zip(formats, sizes_in_bytes):
+                        variants.append({"path": paths[fmt], "format": fmt.lower(), "width": width,
+                                         "height": height, "bytes": size})
+    except Exception as e:
+        return {"source": name, "error": str(e) or e.__class__.__name__}
+
+    srcset = {}
+    for fmt in formats:
+        entries = sorted((v for v in variants if v["format"] == fmt.lower()), key=lambda v: v["width"])
+        srcset[fmt.lower()] = ", ".join(f"{quote(v['path'])} {v['width']}w" for v in entries)
+    variants.sort(key=lambda v: (v["format"], v["width"]))
+    return {"source": name, "width": source_w, "height": source_h, "variants": variants, "srcset": srcset}
@@ -0,0 +1,132 @@
+"""
+Content-addressed image store shared by image downloads.
+
+Downloaded files are kept once per content hash under
+`objects/<sha[:2]>/<sha256><ext>`, and an SQLite index maps each image URL to
+its content hash with the ETag / Last-Modified it was served with. Later
+runs revalidate a known URL with a conditional request, so an unchanged
+image is not downloaded again, and compressed variants are stored per
+content hash and settings (`variants/`), so each distinct image is
+compressed once. Per-page folders get hard links to the stored files
+(copies where the file system cannot link).
+"""
+
+import os
+import shutil
+import sqlite3
+import time
+import uuid
+from collections import namedtuple
+
+from config import IMAGE_STORE_DIR
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    url           TEXT PRIMARY KEY,
+    sha256        TEXT NOT NULL,
+    ext           TEXT NOT NULL DEFAULT '',
+    size          INTEGER NOT NULL DEFAULT 0,
+    etag          TEXT NOT NULL DEFAULT '',
+    last_modified TEXT NOT NULL DEFAULT '',
+    fetched_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_urls_sha256 ON urls(sha256);
+"""
+
+StoredImage = namedtuple("StoredImage", "url sha256 ext size etag last_modified path")
+
+
+def link_or_copy(src: str, dst: str):
+    """Hard-link `src` to `dst` (replacing it), copying when linking is not possible."""
+    tmp = f"{dst}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+class ImageStore:
+    """
+    Content-addressed image files with an SQLite URL index.
+
+    Args:
+        root: Store folder (created with its subfolders when missing)
+
+    Use as a context manager or call close().
+    """
+
+    def __init__(self, root: str = IMAGE_STORE_DIR):
+        self.root = root
+        for sub in ("objects", "variants", "incoming"):
+            os.makedirs(os.path.join(root, sub), exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(root, "index.sqlite3"))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def object_path(self, sha256: str, ext: str = "") -> str:
+        return os.path.join(self.root, "objects", sha256[:2], sha256 + ext)
+
+    def variant_path(self, sha256: str, fmt: str, quality) -> str:
+        """Path of a compressed variant of a stored object."""
+        return os.path.join(self.root, "variants", sha256[:2], f"{sha256}.q{quality}.{fmt.lower()}")
+
+    def incoming_path(self) -> str:
+        """Unique temporary path for a download in progress (same file system as the objects)."""
+        return os.path.join(self.root, "incoming", uuid.uuid4().hex)
+
+    def lookup(self, url: str):
+        """StoredImage for `url` when its object is still on disk, else None."""
+        row = self.conn.execute(
+            "SELECT url, sha256, ext, size, etag, last_modified FROM urls WHERE url = ?", (url,)
+        ).fetchone()
+        if not row:
+            return None
+        path = self.object_path(row[1], row[2])
+        return StoredImage(*row, path) if os.path.exists(path) else None
+
+    @staticmethod
+    def conditional_headers(stored) -> dict:
+        """If-None-Match / If-Modified-Since headers revalidating a stored image."""
+        headers = {}
+        if stored and stored.etag:
+            headers["If-None-Match"] = stored.etag
+        if stored and stored.last_modified:
+            headers["If-Modified-Since"] = stored.last_modified
+        return headers
+
+    def add(self, url: str, tmp_path: str, sha256: str, size: int, ext: str = "",
+            etag: str = "", last_modified: str = "") -> StoredImage:
+        """Move a finished download into the store (dropped if the content is already there) and index it."""
+        path = self.object_path(sha256, ext)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO urls (url, sha256, ext, size, etag, last_modified, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url, sha256, ext, size, etag or "", last_modified or "", time.time()),
+        )
+        return StoredImage(url, sha256, ext, size, etag or "", last_modified or "", path)
+
+    def touch(self, url: str):
+        """Record that a stored image was revalidated as unchanged."""
+        self.conn.execute("UPDATE urls SET fetched_at = ? WHERE url = ?", (time.time(), url))
+
+    def commit(self):
+        self.conn.commit()
@@ -0,0 +1,148 @@
+"""
+Image thumbnails for embedding in extracted documents.
+
+`ThumbnailFetcher` downloads the images referenced by content models with
+bounded concurrency (each URL at most once, even when several pages use it
+at the same time), turns them into bounded-size thumbnails in a process
+pool and keeps them in an on-disk cache keyed by URL and size, so exporting
+the same article again does no download and no decoding.
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+
+from PIL import Image
+
+from config import THUMBNAIL_CACHE_DIR, THUMBNAIL_MAX_DOWNLOAD_MB, THUMBNAIL_MAX_PX, TIMEOUT_STANDARD
+
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+THUMBNAIL_EXTENSIONS = (".jpg", ".png")
+
+
+def make_thumbnail(data: bytes, path_stem: str, max_px: int = THUMBNAIL_MAX_PX) -> str:
+    """
+    Write a thumbnail of image `data` (process-pool entry point).
+
+    Opaque images are saved as JPEG, images with transparency as PNG. The file
+    is written under a temporary name and renamed, so a concurrent export
+    never reads a partial thumbnail.
+
+    Returns:
+        Path of the thumbnail (path_stem + ".jpg" or ".png")
+    """
+    with Image.open(io.BytesIO(data)) as img:
+        img.draft("RGB", (max_px, max_px))  # JPEG: decode at reduced scale
+        img.thumbnail((max_px, max_px))
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or (img.mode == "P" and "transparency" in img.info)
+        if has_alpha:
+            out, ext, fmt = img.convert("RGBA"), ".png", "PNG"
+        else:
+            out, ext, fmt = img.convert("RGB"), ".jpg", "JPEG"
+        path = path_stem + ext
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        out.save(tmp_path, fmt, quality=85, optimize=True)
+    os.replace(tmp_path, path)
+    return path
+
+
+class ThumbnailCache:
+    """
+    On-disk thumbnails keyed by source URL and size.
+
+    Args:
+        folder: Cache folder (created on demand)
+        max_px: Longest side of the thumbnails
+    """
+
+    def __init__(self, folder: str = THUMBNAIL_CACHE_DIR, max_px: int = THUMBNAIL_MAX_PX):
+        self.folder = folder
+        self.max_px = max_px
+        os.makedirs(folder, exist_ok=True)
+
+    def stem_for(self, url: str) -> str:
+        key = hashlib.sha1(f"{self.max_px}:{url}".encode("utf-8")).hexdigest()
+        return os.path.join(self.folder, key[:2], key)
+
+    def get(self, url: str):
+        """Cached thumbnail path for `url`, or None."""
+        stem = self.stem_for(url)
+        for ext in THUMBNAIL_EXTENSIONS:
+            if os.path.exists(stem + ext):
+                return stem + ext
+        return None
+
+
+class ThumbnailFetcher:
+    """
+    Fetch thumbnails for image URLs, sharing downloads between callers.
+
+    Args:
+        session: aiohttp ClientSession used for downloads
+        executor: Executor running make_thumbnail (a ProcessPoolExecutor)
+        cache: ThumbnailCache
+        concurrency: Maximum concurrent image downloads
+        log: Optional callable(str) receiving warnings
+
+    Counters (hits, downloads, failures) cover every URL requested.
+    """
+
+    def __init__(self, session, executor, cache: ThumbnailCache = None, concurrency: int = 8, log=None):
+        self.session = session
+        self.executor = executor
+        self.cache = cache or ThumbnailCache()
+        self.log = log or (lambda msg: None)
+        self._semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+        self._tasks = {}  # url -> Task resolving to a thumbnail path or None
+        self.hits = 0
+        self.downloads = 0
+        self.failures = 0
+
+    async def get_many(self, urls) -> dict:
+        """{url: thumbnail path} for the given URLs (failed images are left out)."""
+        urls = [u for u in dict.fromkeys(urls) if u and u.startswith("http")]
+        paths = await asyncio.gather(*(self.get(u) for u in urls))
+        return {u: p for u, p in zip(urls, paths) if p}
+
+    def get(self, url: str):
+        """Awaitable thumbnail path (or None) for one URL."""
+        task = self._tasks.get(url)
+        if task is None:
+            task = self._tasks[url] = asyncio.ensure_future(self._fetch(url))
+        return task
+
+    async def _fetch(self, url: str):
+        path = self.cache.get(url)
+        if path:
+            self.hits += 1
+            return path
+        try:
+            async with self._semaphore:
+                data = await self._download(url)
+            self.downloads += 1
+            loop = asyncio.get_running_loop()
+            stem = self.cache.stem_for(url)
+            os.makedirs(os.path.dirname(stem), exist_ok=True)
+            return await loop.run_in_executor(self.executor, make_thumbnail, data, stem, self.cache.max_px)
+        except Exception as e:
+            self.failures += 1
+            self.log(f"[WARN] Image {url}: {e or e.__class__.__name__}")
+            return None
+
+    async def _download(self, url: str) -> bytes:
+        limit = THUMBNAIL_MAX_DOWNLOAD_MB * 1024 * 1024
+        async with self.session.get(url, headers=REQUEST_HEADERS, ssl=False, timeout=TIMEOUT_STANDARD) as response:
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}")
+            if (response.content_length or 0) > limit:
+                raise RuntimeError(f"larger than {THUMBNAIL_MAX_DOWNLOAD_MB} MB")
+            data = bytearray()
+            async for chunk in response.content.iter_chunked(65536):
+                data += chunk
+                if len(data) > limit:
+                    raise RuntimeError(f"larger than {THUMBNAIL_MAX_DOWNLOAD_MB} MB")
+            return bytes(data)
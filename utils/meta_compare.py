@@ -0,0 +1,156 @@
+"""
+Columnar comparison engine for Meta Checker results.
+
+Fetched and expected values are collected into a pandas DataFrame and
+normalized, matched, scored and counted in vectorized passes (one regex
+pass per column instead of one call per field per URL).
+
+The frame has one row per checked page:
+    url, expected_<field>, current_<field>, match_<field>, similarity_<field>
+where match is a nullable boolean (NA when no expectation was given) and
+similarity a 0..1 score (NA when no expectation was given).
+"""
+
+import re
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from utils.helpers import TITLE_SUFFIX_RE
+
+FIELDS = ["meta_title", "meta_description", "og_title", "og_description", "h1"]
+
+FIELD_LABELS = {
+    "meta_title": "Meta Title",
+    "meta_description": "Meta Description",
+    "og_title": "OG Title",
+    "og_description": "OG Description",
+    "h1": "H1",
+}
+
+# Titles get the same treatment as utils.helpers.norm_title
+TITLE_FIELDS = {"meta_title", "og_title"}
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_series(series: pd.Series, title: bool = False) -> pd.Series:
+    """Vectorized equivalent of `norm_text` (or `norm_title` when title=True)."""
+    s = series.fillna("").astype(str).str.replace(_WS_RE, " ", regex=True).str.strip()
+    if title:
+        s = s.str.replace(TITLE_SUFFIX_RE, "", regex=True).str.strip()
+    return s
+
+
+def build_frame(records) -> pd.DataFrame:
+    """
+    Build the raw columnar frame from worker records.
+
+    Args:
+        records: Iterable of dicts {url, expected: {field: str}, current: {field: str}}
+    """
+    records = list(records)
+    data = {"url": [r.get("url", "") for r in records]}
+    for f in FIELDS:
+        data[f"expected_{f}"] = [(r.get("expected") or {}).get(f, "") or "" for r in records]
+        data[f"current_{f}"] = [(r.get("current") or {}).get(f, "") or "" for r in records]
+    return pd.DataFrame(data)
+
+
+def _similarity(expected: pd.Series, current: pd.Series, mask: pd.Series) -> pd.Series:
+    """Similarity ratio for rows in `mask`; equal pairs short-circuit to 1.0."""
+    sim = pd.Series(pd.NA, index=expected.index, dtype="Float64")
+    if not mask.any():
+        return sim
+    equal = mask & (expected == current)
+    sim[equal] = 1.0
+    todo = mask & ~equal
+    if todo.any():
+        sim[todo] = [
+            SequenceMatcher(None, a, b).ratio()
+            for a, b in zip(expected[todo].tolist(), current[todo].tolist())
+        ]
+    return sim
+
+
+def compare_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize, match and score every field of a frame from `build_frame`.
+
+    Expected values are stored normalized; current values are normalized only
+    where an expectation exists (unchecked fields keep the raw page value).
+    """
+    out = frame.copy()
+    for f in FIELDS:
+        title = f in TITLE_FIELDS
+        exp = normalize_series(out[f"expected_{f}"], title)
+        cur = normalize_series(out[f"current_{f}"], title)
+        has_exp = exp != ""
+
+        match = pd.Series(pd.NA, index=out.index, dtype="boolean")
+        match[has_exp] = (exp == cur)[has_exp]
+
+        out[f"expected_{f}"] = exp
+        out[f"current_{f}"] = cur.where(has_exp, out[f"current_{f}"].fillna("").astype(str))
+        out[f"match_{f}"] = match
+        out[f"similarity_{f}"] = _similarity(exp, cur, has_exp)
+    return out
+
+
+def summarize(frame: pd.DataFrame) -> dict:
+    """
+    Per-field counts from a compared frame.
+
+    Returns:
+        {"total": int, "<field>": {"checked", "ok", "mismatch", "mean_similarity"}}
+    """
+    summary = {"total": int(len(frame))}
+    for f in FIELDS:
+        match = frame[f"match_{f}"] if f"match_{f}" in frame else pd.Series(dtype="boolean")
+        sim = frame[f"similarity_{f}"] if f"similarity_{f}" in frame else pd.Series(dtype="Float64")
+        checked = int(match.notna().sum())
+        ok = int(match.fillna(False).sum())
+        summary[f] = {
+            "checked": checked,
+            "ok": ok,
+            "mismatch": checked - ok,
+            "mean_similarity": float(sim.mean()) if checked else None,
+        }
+    return summary
+
+
+def used_fields(frame: pd.DataFrame) -> list:
+    """Fields with at least one expected or current value."""
+    return [
+        f for f in FIELDS
+        if (frame[f"expected_{f}"] != "").any() or (frame[f"current_{f}"] != "").any()
+    ]
+
+
+def mismatches(frame: pd.DataFrame, field: str) -> pd.DataFrame:
+    """Rows where `field` was checked and did not match."""
+    return frame[frame[f"match_{field}"].fillna(True) == False]  # noqa: E712
+
+
+def to_results(frame: pd.DataFrame) -> list:
+    """Convert a compared frame back to the list-of-dicts result shape."""
+    results = []
+    columns = {c: frame[c].tolist() for c in frame.columns}
+    for i in range(len(frame)):
+        results.append({
+            "url": columns["url"][i],
+            "expected": {f: columns[f"expected_{f}"][i] for f in FIELDS},
+            "current": {f: columns[f"current_{f}"][i] for f in FIELDS},
+            "match": {f: _plain(columns[f"match_{f}"][i]) for f in FIELDS},
+            "similarity": {f: _plain(columns[f"similarity_{f}"][i]) for f in FIELDS},
+        })
+    return results
+
+
+def _plain(value):
+    """pd.NA -> None, numpy scalars -> Python scalars."""
+    if value is pd.NA or value is None:
+        return None
+    if isinstance(value, float):
+        return round(value, 4)
+    return value.item() if hasattr(value, "item") else value
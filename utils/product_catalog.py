@@ -0,0 +1,211 @@
+"""
+Persistent product catalog (SQLite) built from crawled JSON-LD.
+
+Maps page URL -> product ID, GTIN, SKU, name, canonical URL, final URL
+(after redirects), HTTP status and fetch time. Product checks can be answered
+from it while the data is fresh, and cross-page questions (GTINs on several
+URLs, IDs without a page) are answered with indexed queries.
+"""
+
+import os
+import re
+import sqlite3
+import time
+
+from config import PRODUCT_CATALOG_PATH
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    url           TEXT PRIMARY KEY,
+    product_id    TEXT NOT NULL DEFAULT '',
+    gtin          TEXT NOT NULL DEFAULT '',
+    sku           TEXT NOT NULL DEFAULT '',
+    name          TEXT NOT NULL DEFAULT '',
+    canonical_url TEXT NOT NULL DEFAULT '',
+    final_url     TEXT NOT NULL DEFAULT '',
+    status        INTEGER,
+    fetched_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_products_product_id ON products(product_id) WHERE product_id <> '';
+CREATE INDEX IF NOT EXISTS idx_products_gtin ON products(gtin) WHERE gtin <> '';
+CREATE INDEX IF NOT EXISTS idx_products_canonical ON products(canonical_url) WHERE canonical_url <> '';
+"""
+
+_COLUMNS = ("url", "product_id", "gtin", "sku", "name", "canonical_url", "final_url", "status", "fetched_at")
+
+_CANONICAL_RE = re.compile(r"<link\b[^>]*\brel\s*=\s*[\"']?canonical\b[^>]*>", re.IGNORECASE)
+_HREF_RE = re.compile(r"""\bhref\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.IGNORECASE)
+
+
+def catalog_key(url: str) -> str:
+    """Catalog key for a URL: scheme added when missing, no fragment or trailing slash."""
+    url = (url or "").strip()
+    if url and not url.lower().startswith(("http://", "https://")):
+        url = "https://" + url
+    return url.split("#", 1)[0].rstrip("/")
+
+
+def extract_canonical(html: str) -> str:
+    """href of the first <link rel="canonical"> in raw HTML, or ''."""
+    m = _CANONICAL_RE.search(html or "")
+    if not m:
+        return ""
+    href = _HREF_RE.search(m.group(0))
+    return next((g for g in href.groups() if g), "").strip() if href else ""
+
+
+class ProductCatalog:
+    """
+    SQLite-backed URL -> product index.
+
+    Args:
+        path: Database file (created with its folder when missing)
+
+    Use as a context manager or call close(). Writes are batched; call
+    commit() (or leave the context) to persist them.
+    """
+
+    def __init__(self, path: str = PRODUCT_CATALOG_PATH):
+        folder = os.path.dirname(os.path.abspath(path))
+        os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def commit(self):
+        self.conn.commit()
+
+    def upsert(self, url: str, product_id: str = "", gtin: str = "", sku: str = "", name: str = "",
+               canonical_url: str = "", final_url: str = "", status: int = None, fetched_at: float = None):
+        """Insert or replace the record of one page."""
+        self.upsert_many([{
+            "url": url, "product_id": product_id, "gtin": gtin, "sku": sku, "name": name,
+            "canonical_url": canonical_url, "final_url": final_url, "status": status,
+            "fetched_at": fetched_at,
+        }])
+
+    def upsert_many(self, records):
+        """Insert or replace many page records (dicts with the column names)."""
+        now = time.time()
+        rows = [
+            (
+                catalog_key(r["url"]),
+                str(r.get("product_id") or ""),
+                str(r.get("gtin") or ""),
+                str(r.get("sku") or ""),
+                str(r.get("name") or ""),
+                catalog_key(r.get("canonical_url") or ""),
+                str(r.get("final_url") or ""),
+                r.get("status"),
+                r.get("fetched_at") or now,
+            )
+            for r in records if r.get("url")
+        ]
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO products ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+            rows,
+        )
+        return len(rows)
+
+    def lookup(self, url: str, max_age_hours: float = None):
+        """
+        Return the record for `url` as a dict, or None.
+
+        With max_age_hours, records fetched longer ago are treated as missing.
+        """
+        row = self.conn.execute("SELECT * FROM products WHERE url = ?", (catalog_key(url),)).fetchone()
+        if row is None:
+            return None
+        if max_age_hours is not None and time.time() - row["fetched_at"] > max_age_hours * 3600:
+            return None
+        return dict(row)
+
+    def urls_for_gtin(self, gtin: str, exclude_url: str = None) -> list:
+        """
+        URLs publishing `gtin`.
+
+        With exclude_url, pages that are the same page as that URL (same
+        canonical URL, or same URL when there is none) are left out, as in
+        shared_gtins().
+        """
+        if not exclude_url:
+            rows = self.conn.execute("SELECT url FROM products WHERE gtin = ? AND gtin <> '' ORDER BY url", (gtin,))
+            return [r[0] for r in rows]
+        key = catalog_key(exclude_url)
+        own = self.conn.execute("SELECT canonical_url FROM products WHERE url = ?", (key,)).fetchone()
+        page = (own["canonical_url"] if own else "") or key
+        rows = self.conn.execute(
+            """
+            SELECT url FROM products
+            WHERE gtin = ? AND gtin <> ''
+              AND (CASE WHEN canonical_url <> '' THEN canonical_url ELSE url END) <> ?
+            ORDER BY url
+            """,
+            (gtin, page),
+        )
+        return [r[0] for r in rows]
+
+    def urls_for_product_id(self, product_id: str) -> list:
+        rows = self.conn.execute(
+            "SELECT url FROM products WHERE product_id = ? AND product_id <> '' ORDER BY url", (product_id,)
+        )
+        return [r[0] for r in rows]
+
+    def shared_gtins(self) -> list:
+        """
+        GTINs published on more than one page (distinct canonical URLs).
+
+        Returns:
+            [(gtin, [urls])] sorted by number of URLs, largest first
+        """
+        rows = self.conn.execute(
+            """
+            SELECT gtin, GROUP_CONCAT(url, char(10)) AS urls, COUNT(*) AS n
+            FROM products
+            WHERE gtin <> ''
+            GROUP BY gtin
+            HAVING COUNT(DISTINCT CASE WHEN canonical_url <> '' THEN canonical_url ELSE url END) > 1
+            ORDER BY n DESC, gtin
+            """
+        )
+        return [(r["gtin"], sorted(r["urls"].split("\n"))) for r in rows]
+
+    def ids_without_page(self, product_ids) -> list:
+        """
+        Product IDs from `product_ids` that no cataloged page publishes.
+
+        The IDs are loaded into a temporary table and anti-joined against the
+        product_id index, so the lookup does not scan the catalog.
+        """
+        ids = [str(i) for i in dict.fromkeys(product_ids) if i]
+        if not ids:
+            return []
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS wanted_ids (product_id TEXT PRIMARY KEY)")
+        self.conn.execute("DELETE FROM wanted_ids")
+        self.conn.executemany("INSERT OR IGNORE INTO wanted_ids VALUES (?)", ((i,) for i in ids))
+        rows = self.conn.execute(
+            """
+            SELECT w.product_id FROM wanted_ids w
+            WHERE NOT EXISTS (SELECT 1 FROM products p WHERE p.product_id = w.product_id AND p.product_id <> '')
+            """
+        )
+        missing = {r[0] for r in rows}
+        return [i for i in ids if i in missing]
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
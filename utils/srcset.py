@@ -0,0 +1,158 @@
+"""
+Responsive image candidate selection.
+
+A page declares one image through `<img src srcset>` or a `<picture>` with
+`<source>` alternatives, often listing several widths or densities of the
+same picture. `image_candidates` groups those candidates per image element
+the way a browser would (one `<source>` per media condition, the first of
+a supported type, the `<img>` as fallback) and keeps only the candidate(s)
+chosen by a policy:
+
+    "largest"   widest (or highest density) candidate
+    "smallest"  narrowest (or lowest density) candidate
+    "<N>w"      narrowest candidate at least N pixels wide (else the widest)
+    "<N>x"      lowest density at least N (else the highest)
+    "all"       every candidate
+"""
+
+import re
+from collections import namedtuple
+from urllib.parse import urljoin
+
+Candidate = namedtuple("Candidate", "url width density")  # width/density: number or None
+
+POLICIES = ("largest", "smallest", "all")
+
+# <source type> values worth downloading; unknown or unsupported types are skipped
+SUPPORTED_TYPES = ("image/jpeg", "image/jpg", "image/png", "image/webp", "image/gif", "image/avif",
+                   "image/bmp", "image/svg+xml")
+
+_DESCRIPTOR = re.compile(r"^(\d+(?:\.\d+)?)([wx])$")
+
+
+def parse_policy(policy: str):
+    """("largest" | "smallest" | "all" | "w" | "x", value) for a policy string; raises ValueError."""
+    if isinstance(policy, tuple):  # already parsed
+        return policy
+    policy = (policy or "largest").strip().lower()
+    if policy in POLICIES:
+        return policy, None
+    match = _DESCRIPTOR.match(policy)
+    if not match:
+        raise ValueError(f"Unknown srcset policy: {policy!r} (use largest, smallest, all, <N>w or <N>x)")
+    return match.group(2), float(match.group(1))
+
+
+def parse_srcset(value: str):
+    """
+    Candidates of a srcset attribute as (url, width, density).
+
+    URLs may contain commas (they end at whitespace); a candidate without
+    descriptor is 1x.
+    """
+    candidates = []
+    pos, n = 0, len(value or "")
+    while pos < n:
+        while pos < n and (value[pos].isspace() or value[pos] == ","):
+            pos += 1
+        start = pos
+        while pos < n and not value[pos].isspace():
+            pos += 1
+        url = value[start:pos]
+        if url.endswith(","):
+            url, descriptors = url.rstrip(","), ""
+        else:
+            end = value.find(",", pos)
+            end = n if end == -1 else end
+            descriptors, pos = value[pos:end], end + 1
+        if not url:
+            continue
+        width = density = None
+        for descriptor in descriptors.split():
+            match = _DESCRIPTOR.match(descriptor.lower())
+            if match and match.group(2) == "w":
+                width = int(float(match.group(1)))
+            elif match:
+                density = float(match.group(1))
+        if width is None and density is None:
+            density = 1.0
+        candidates.append(Candidate(url, width, density))
+    return candidates
+
+
+def select_candidates(candidates, policy="largest"):
+    """Candidates kept by `policy` (a string or a parse_policy() tuple)."""
+    kind, value = parse_policy(policy)
+    if kind == "all" or len(candidates) < 2:
+        return list(candidates)
+    widths = [c for c in candidates if c.width]
+    densities = [c for c in candidates if c.density]
+    if widths and (kind != "x" or not densities):
+        pool, key = widths, (lambda c: c.width)
+        if kind == "x":  # densities of width candidates depend on the layout: take the widest
+            kind = "largest"
+    else:
+        pool, key = densities, (lambda c: c.density)
+        if kind == "w":  # no widths to compare: take what a 1x screen would get
+            kind, value = "x", 1.0
+    if kind == "largest":
+        return [max(pool, key=key)]
+    if kind == "smallest":
+        return [min(pool, key=key)]
+    large_enough = [c for c in pool if key(c) >= value]
+    return [min(large_enough, key=key) if large_enough else max(pool, key=key)]
+
+
+def _element_candidates(tag):
+    """srcset / src candidates of one <img> or <source> (lazy-loading data-* attributes included)."""
+    candidates = parse_srcset(tag.get("data-srcset") or "") + parse_srcset(tag.get("srcset") or "")
+    for attr in ("data-src", "src"):
+        src = (tag.get(attr) or "").strip()
+        if src and not src.startswith("data:") and not any(c.url == src for c in candidates):
+            candidates.append(Candidate(src, None, 1.0))
+    return [c for c in candidates if not c.url.startswith("data:")]
+
+
+def _picture_choices(picture):
+    """Elements a browser could render for a <picture>: one per media condition, <img> as default."""
+    chosen = {}  # media ("" = always) -> element
+    for source in picture.find_all("source"):
+        media = (source.get("media") or "").strip()
+        source_type = (source.get("type") or "").strip().lower()
+        if source_type and source_type not in SUPPORTED_TYPES:
+            continue
+        if media not in chosen and _element_candidates(source):
+            chosen[media] = source
+    img = picture.find("img")
+    if "" not in chosen and img is not None:
+        chosen[""] = img
+    return list(chosen.values())
+
+
+def image_candidates(soup, base_url: str, policy="largest"):
+    """
+    Image URLs chosen by `policy`, per image element of the document.
+
+    Returns:
+        List of (absolute url, img tag or None) in document order, where the
+        <img> supplies alt/title text for its <picture> sources
+    """
+    policy = parse_policy(policy)
+    results = []
+    seen_pictures = set()
+    for tag in soup.find_all(["img", "source"]):
+        picture = tag.find_parent("picture")
+        if picture is not None:
+            if id(picture) in seen_pictures:
+                continue
+            seen_pictures.add(id(picture))
+            img = picture.find("img")
+            elements = picture.find_all(["source", "img"]) if policy[0] == "all" else _picture_choices(picture)
+        elif tag.name == "img":
+            img, elements = tag, [tag]
+        else:  # <source> of <video>/<audio>, or stray
+            img, elements = None, [tag]
+        for element in elements:
+            for candidate in select_candidates(_element_candidates(element), policy):
+                results.append((urljoin(base_url, candidate.url.strip()), img))
+    return results
@@ -0,0 +1,171 @@
+"""
+Streaming helpers shared by the bulk worker threads.
+
+Lets workers consume very large inputs (Excel sheets, URL lists) lazily and
+process them with a fixed pool of coroutines instead of one task per row;
+`map_in_pool` does the same for CPU-bound jobs in a process pool.
+"""
+
+import asyncio
+import concurrent.futures
+from itertools import islice
+
+_DONE = object()
+
+
+async def iterate_in_thread(iterable, chunk_size: int = 256):
+    """
+    Yield items from a blocking iterator without blocking the event loop.
+
+    Items are pulled in chunks on the default executor, so slow sources such as
+    openpyxl read-only sheets never stall running network requests.
+
+    Args:
+        iterable: Any (blocking) iterable
+        chunk_size: Number of items fetched per executor call
+    """
+    it = iter(iterable)
+    loop = asyncio.get_running_loop()
+
+    def next_chunk():
+        return list(islice(it, chunk_size))
+
+    while True:
+        chunk = await loop.run_in_executor(None, next_chunk)
+        if not chunk:
+            break
+        for item in chunk:
+            yield item
+
+
+async def run_bounded(source, handler, concurrency: int, on_result=None, should_stop=None):
+    """
+    Feed items from an async iterable to `handler` with bounded concurrency.
+
+    Only `concurrency` handlers run at once and at most `2 * concurrency` items
+    are buffered, so memory stays constant however long the source is.
+
+    Args:
+        source: Async iterable of items
+        handler: Coroutine function called as `await handler(item)`
+        concurrency: Number of concurrent handlers
+        on_result: Optional callback `on_result(item, result)` run as results complete
+        should_stop: Optional callable; when it returns True, no new items are started
+    """
+    concurrency = max(1, int(concurrency))
+    should_stop = should_stop or (lambda: False)
+    queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def produce():
+        try:
+            async for item in source:
+                if should_stop():
+                    break
+                await queue.put(item)
+        finally:
+            for _ in range(concurrency):
+                await queue.put(_DONE)
+
+    async def consume():
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if should_stop():
+                continue
+            result = await handler(item)
+            if on_result is not None:
+                on_result(item, result)
+
+    tasks = [asyncio.ensure_future(produce())]
+    tasks.extend(asyncio.ensure_future(consume()) for _ in range(concurrency))
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+def map_in_pool(submit, jobs, max_in_flight: int, should_stop=None, poll_interval: float = 0.2):
+    """
+    Run jobs in an executor with bounded in-flight work, yielding results as they finish.
+
+    `jobs` is consumed lazily: at most `max_in_flight` are submitted and not
+    yet finished. Once `should_stop()` returns True, no more jobs are
+    submitted and the queued ones are cancelled; results of jobs already
+    running are still yielded. Closing the generator early cancels the queue.
+
+    Args:
+        submit: Callable(job) -> concurrent.futures.Future, e.g. `lambda job: pool.submit(fn, *job)`
+        jobs: Iterable of jobs
+        max_in_flight: Maximum submitted, unfinished jobs
+        should_stop: Optional callable checked at least every `poll_interval` seconds
+    """
+    should_stop = should_stop or (lambda: False)
+    jobs = iter(jobs)
+    running = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and not should_stop() and len(running) < max_in_flight:
+                job = next(jobs, _DONE)
+                if job is _DONE:
+                    exhausted = True
+                else:
+                    running.add(submit(job))
+            if not running:
+                return
+            done, running = concurrent.futures.wait(running, timeout=poll_interval,
+                                                    return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                if not future.cancelled():
+                    yield future.result()
+            if should_stop():
+                running = {f for f in running if not f.cancel()}
+    finally:
+        for future in running:
+            future.cancel()
+
+
+class OrderedWriter:
+    """
+    Reorder buffer: hand results to `write` in source order as they complete.
+
+    `numbered()` tags source items with their position and stops pulling new
+    items while `window` of them are in flight or waiting for an earlier one,
+    so a single slow row cannot make the buffer (or memory) grow unbounded.
+
+    Args:
+        write: Callable(result) invoked in source order; None results are skipped
+        window: Maximum number of items between the oldest unwritten one and the newest
+    """
+
+    def __init__(self, write, window: int = 256):
+        self._write = write
+        self._pending = {}
+        self._next = 0
+        self._slots = asyncio.Semaphore(max(1, int(window)))
+        self.written = 0
+
+    async def numbered(self, source, should_stop=None):
+        """Yield `(index, item)` from an async iterable, waiting for a free slot first."""
+        idx = 0
+        async for item in source:
+            await self._slots.acquire()
+            if should_stop is not None and should_stop():
+                self._slots.release()
+                break
+            yield idx, item
+            idx += 1
+
+    def put(self, idx: int, result):
+        """Record the result for `idx` and write every result now in order."""
+        self._pending[idx] = result
+        while self._next in self._pending:
+            result = self._pending.pop(self._next)
+            self._next += 1
+            self._slots.release()
+            if result is not None:
+                self._write(result)
+                self.written += 1
@@ -0,0 +1,234 @@
+"""
+JSON-LD structured-data extraction.
+
+`<script type="application/ld+json">` blocks are located with a plain string
+scanner (no DOM parse of the whole page) and decoded with orjson when it is
+installed (stdlib json otherwise). Every node, including nodes nested in
+`@graph` arrays or properties, is indexed by `@type` and `@id` so Product
+fields can be resolved from the right node instead of the first matching
+string in the markup.
+"""
+
+import json
+import re
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _JSON_ERRORS = (orjson.JSONDecodeError, ValueError)
+except ImportError:  # optional speed-up
+    _loads = json.loads
+    _JSON_ERRORS = (ValueError,)
+
+_SCRIPT_OPEN_RE = re.compile(r"<script\b[^>]*>", re.IGNORECASE)
+_SCRIPT_CLOSE_RE = re.compile(r"</script", re.IGNORECASE)
+_LD_TYPE_RE = re.compile(r"""type\s*=\s*["']?application/ld\+json""", re.IGNORECASE)
+_TRAILING_DIGITS_RE = re.compile(r"[/#:=](\d+)/?$")
+
+GTIN_KEYS = ("gtin13", "gtin", "gtin14", "gtin12", "gtin8")
+
+_SCHEMA_PREFIXES = ("http://schema.org/", "https://schema.org/", "schema:")
+
+
+def _strip_schema(value) -> str:
+    value = str(value or "").strip()
+    for prefix in _SCHEMA_PREFIXES:
+        if value.startswith(prefix):
+            return value[len(prefix):]
+    return value
+
+
+def _as_list(value) -> list:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _digits(value) -> str:
+    """Return `value` as a string when it is made of digits only, else ''."""
+    if isinstance(value, bool) or value is None:
+        return ""
+    if isinstance(value, (int, float)):
+        value = str(int(value))
+    value = str(value).strip()
+    return value if value.isdigit() else ""
+
+
+def find_jsonld_blocks(html: str) -> list:
+    """
+    Return the raw text of every JSON-LD script block in `html`.
+
+    Only `<script ...>` tags and their closing tags are matched; the body is
+    sliced out without building a DOM, and pages without JSON-LD return after
+    a single substring check.
+    """
+    if not html or ("ld+json" not in html and "LD+JSON" not in html):
+        return []
+    blocks = []
+    pos = 0
+    while True:
+        m = _SCRIPT_OPEN_RE.search(html, pos)
+        if not m:
+            break
+        start = m.end()
+        close = _SCRIPT_CLOSE_RE.search(html, start)
+        end = close.start() if close else len(html)
+        if _LD_TYPE_RE.search(m.group(0)):
+            text = html[start:end].strip()
+            if text:
+                blocks.append(text)
+        pos = end
+    return blocks
+
+
+def _clean_block(text: str) -> str:
+    """Strip HTML comment / CDATA wrappers some CMSes put around JSON-LD."""
+    text = text.strip()
+    for opener, closer in (("<!--", "-->"), ("//<![CDATA[", "//]]>"), ("<![CDATA[", "]]>")):
+        if text.startswith(opener) and text.endswith(closer):
+            text = text[len(opener):-len(closer)].strip()
+    return text
+
+
+class StructuredData:
+    """
+    Index of JSON-LD nodes for one page.
+
+    Attributes:
+        nodes: Every dict node found, in document order
+        by_type: type name (without schema.org prefix) -> [nodes]
+        by_id: "@id" -> node (the most complete node wins)
+        blocks: Number of JSON-LD blocks found
+        errors: Number of blocks that could not be parsed
+    """
+
+    def __init__(self):
+        self.nodes = []
+        self.by_type = {}
+        self.by_id = {}
+        self.blocks = 0
+        self.errors = 0
+
+    @classmethod
+    def from_html(cls, html: str) -> "StructuredData":
+        data = cls()
+        for block in find_jsonld_blocks(html):
+            data.blocks += 1
+            try:
+                doc = _loads(_clean_block(block))
+            except _JSON_ERRORS:
+                data.errors += 1
+                continue
+            data._walk(doc)
+        return data
+
+    def _walk(self, value):
+        stack = [value]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, list):
+                stack.extend(reversed(item))
+            elif isinstance(item, dict):
+                self._index(item)
+                stack.extend(reversed([v for v in item.values() if isinstance(v, (dict, list))]))
+
+    def _index(self, node: dict):
+        types = [_strip_schema(t) for t in _as_list(node.get("@type")) if t]
+        node_id = node.get("@id")
+        if not types and node_id and len(node) == 1:
+            return  # bare reference, resolved later through by_id
+        self.nodes.append(node)
+        for t in types:
+            self.by_type.setdefault(t, []).append(node)
+        if isinstance(node_id, str) and node_id:
+            known = self.by_id.get(node_id)
+            if known is None or len(node) > len(known):
+                self.by_id[node_id] = node
+
+    def resolve(self, value):
+        """Follow an {"@id": ...} reference to the indexed node when possible."""
+        if isinstance(value, dict) and "@id" in value and len(value) == 1:
+            return self.by_id.get(value["@id"], value)
+        return value
+
+    def types(self) -> list:
+        """Distinct node types in document order."""
+        return list(self.by_type)
+
+    def of_type(self, type_name: str) -> list:
+        return self.by_type.get(type_name, [])
+
+    def product(self):
+        """The main Product node (one carrying identifiers or offers is preferred)."""
+        products = self.of_type("Product") or self.of_type("ProductGroup")
+        if not products:
+            return None
+        for node in products:
+            if any(k in node for k in ("sku", "offers", "productID") + GTIN_KEYS):
+                return node
+        return products[0]
+
+    def offers(self, product=None) -> list:
+        """Offer dicts for `product`, flattening AggregateOffer containers."""
+        product = product if product is not None else self.product()
+        if not product:
+            return []
+        out = []
+        pending = [self.resolve(o) for o in _as_list(product.get("offers"))]
+        while pending:
+            offer = pending.pop(0)
+            if not isinstance(offer, dict):
+                continue
+            nested = offer.get("offers")
+            if nested:
+                pending.extend(self.resolve(o) for o in _as_list(nested))
+                if "price" not in offer and "lowPrice" not in offer:
+                    continue
+            out.append({
+                "price": str(offer.get("price", offer.get("lowPrice", "")) or ""),
+                "currency": str(offer.get("priceCurrency", "") or ""),
+                "availability": _strip_schema(offer.get("availability")),
+                "sku": str(offer.get("sku", "") or ""),
+                "gtin": next((_digits(offer.get(k)) for k in GTIN_KEYS if _digits(offer.get(k))), ""),
+                "url": str(offer.get("url", "") or ""),
+            })
+        return out
+
+    def product_info(self) -> dict:
+        """
+        Resolve the identifiers of the main Product.
+
+        Returns:
+            {"id", "sku", "gtin", "name", "offers"}; empty strings when absent.
+            `id` is the numeric "@id" (or the trailing number of an IRI @id,
+            or productID); `gtin` falls back to the offers and then to a
+            digits-only sku, which is how GTINs are published on these sites.
+        """
+        info = {"id": "", "sku": "", "gtin": "", "name": "", "offers": []}
+        product = self.product()
+        if product is None:
+            return info
+
+        raw_id = product.get("@id")
+        product_id = _digits(raw_id)
+        if not product_id and isinstance(raw_id, str):
+            m = _TRAILING_DIGITS_RE.search(raw_id.strip())
+            product_id = m.group(1) if m else ""
+        info["id"] = product_id or _digits(product.get("productID"))
+
+        info["sku"] = str(product.get("sku", "") or "").strip()
+        info["name"] = str(product.get("name", "") or "").strip()
+        info["offers"] = self.offers(product)
+
+        gtin = next((_digits(product.get(k)) for k in GTIN_KEYS if _digits(product.get(k))), "")
+        if not gtin:
+            gtin = next((o["gtin"] for o in info["offers"] if o["gtin"]), "")
+        if not gtin:
+            gtin = _digits(info["sku"]) or next((_digits(o["sku"]) for o in info["offers"] if _digits(o["sku"])), "")
+        info["gtin"] = gtin
+        return info
+
+
+def parse_structured_data(html: str) -> StructuredData:
+    """Build a StructuredData index from raw page HTML."""
+    return StructuredData.from_html(html)
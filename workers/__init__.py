@@ -2,14 +2,19 @@
 
 from .crawler_worker import CrawlerThread
 from .broken_link_worker import BrokenLinkWorker
+from .redirect_map_worker import RedirectMapWorker
 from .meta_product_workers import MetaCheckWorker, ProductSheetWorker
 from .image_downloader_worker import AllImagesDownloaderThread, ImageProcessorThread
+from .image_resizer_worker import ImageResizerThread, ResponsiveSetThread
 
 __all__ = [
     'CrawlerThread',
     'BrokenLinkWorker',
+    'RedirectMapWorker',
     'MetaCheckWorker',
     'ProductSheetWorker',
     'AllImagesDownloaderThread',
     'ImageProcessorThread',
+    'ImageResizerThread',
+    'ResponsiveSetThread',
 ]
@@ -9,7 +9,7 @@ from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from config import HEADERS, TIMEOUT_STANDARD, TIMEOUT_SHORT
+from config import HEADERS, TIMEOUT_STANDARD, TIMEOUT_SHORT, MAX_ASSET_SIZE_KB
 
 
 class BrokenLinkWorker(QThread):
@@ -18,17 +18,23 @@ class BrokenLinkWorker(QThread):
     - mode: 'single' (single page checkup) or 'sitemap'
     - root_url: Base URL (page or sitemap.xml)
     - same_domain_only: If True, filters only same-domain links (single page)
+    - check_assets: If True, checks page assets (images, CSS, JS, PDFs) instead of <a href> links.
+      Assets are deduplicated across all pages before checking.
+    - max_asset_kb: Assets above this size are flagged as oversized (asset mode)
     """
     progress_update = pyqtSignal(int)
     log_update = pyqtSignal(str)
     finished = pyqtSignal(list)  # list of results
 
-    def __init__(self, mode: str, root_url: str, same_domain_only: bool = True, max_concurrency: int = 10):
+    def __init__(self, mode: str, root_url: str, same_domain_only: bool = True, max_concurrency: int = 10,
+                 check_assets: bool = False, max_asset_kb: int = MAX_ASSET_SIZE_KB):
         super().__init__()
         self.mode = mode
         self.root_url = root_url.strip()
         self.same_domain_only = same_domain_only
         self.max_concurrency = max_concurrency
+        self.check_assets = check_assets
+        self.max_asset_bytes = max_asset_kb * 1024
         self._stop_requested = False
         self.results = []
 
@@ -49,6 +55,10 @@ class BrokenLinkWorker(QThread):
         self.log_update.emit(f"[INIT] Broken Link Inspector mode = {self.mode}, URL = {self.root_url}")
 
         async with aiohttp.ClientSession(headers=HEADERS) as session:
+            if self.check_assets:
+                await self._run_asset_mode(session)
+                return
+
             if self.mode == "single":
                 urls = await self._collect_links_from_page(self.root_url, session)
             elif self.mode == "sitemap":
@@ -88,6 +98,199 @@ class BrokenLinkWorker(QThread):
             self.progress_update.emit(100)
             self.log_update.emit("[DONE] Broken Link Inspector finished.")
 
+    async def _run_asset_mode(self, session: aiohttp.ClientSession):
+        if self.mode == "single":
+            pages = [self.root_url]
+        elif self.mode == "sitemap":
+            pages = await self._collect_from_sitemap(self.root_url, session)
+        else:
+            self.log_update.emit(f"[ERROR] Unknown mode: {self.mode}")
+            pages = []
+
+        pages = list(dict.fromkeys(pages))
+        assets = await self._collect_assets(pages, session)
+        total = len(assets)
+        if total == 0:
+            self.log_update.emit("[INFO] No assets to check.")
+            self.progress_update.emit(100)
+            return
+
+        self.log_update.emit(f"[INFO] {total} unique asset(s) to check across {len(pages)} page(s).")
+        sem = asyncio.Semaphore(self.max_concurrency)
+        done = 0
+        tasks = [self._check_asset(url, info, session, sem) for url, info in assets.items()]
+        for coro in asyncio.as_completed(tasks):
+            if self._stop_requested:
+                self.log_update.emit("[WARN] Stop requested. Aborting remaining checks.")
+                break
+            result = await coro
+            if result is not None:
+                self.results.append(result)
+            done += 1
+            self.progress_update.emit(int(done * 100 / total))
+
+        self.progress_update.emit(100)
+        self.log_update.emit("[DONE] Broken Link Inspector (assets) finished.")
+
+    async def _collect_assets(self, pages, session: aiohttp.ClientSession):
+        """Fetch pages concurrently and build a site-wide asset index {url: info}."""
+        assets = {}
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def load(page_url):
+            async with sem:
+                if self._stop_requested:
+                    return page_url, None
+                try:
+                    async with session.get(page_url, ssl=False, timeout=TIMEOUT_STANDARD) as resp:
+                        if resp.status != 200:
+                            self.log_update.emit(f"[WARN] {page_url} – HTTP {resp.status}")
+                            return page_url, None
+                        return page_url, await resp.text(errors="ignore")
+                except aiohttp.ClientError as e:
+                    self.log_update.emit(f"[ERROR] Network error loading page: {page_url} – {e}")
+                except asyncio.TimeoutError:
+                    self.log_update.emit(f"[ERROR] Timeout loading page: {page_url}")
+                except Exception as e:
+                    self.log_update.emit(f"[ERROR] Could not load page: {page_url} – {e}")
+                return page_url, None
+
+        total = len(pages)
+        done = 0
+        for coro in asyncio.as_completed([load(p) for p in pages]):
+            page_url, html = await coro
+            done += 1
+            if html:
+                soup = BeautifulSoup(html, "html.parser")
+                for asset_url, asset_type in self._extract_assets(soup, page_url):
+                    info = assets.get(asset_url)
+                    if info is None:
+                        assets[asset_url] = {"type": asset_type, "found_on": page_url, "pages": 1, "last_page": page_url}
+                    elif info["last_page"] != page_url:
+                        # A page's assets are added together, so repeats on one page are not recounted
+                        info["pages"] += 1
+                        info["last_page"] = page_url
+            if total > 1 and done % 10 == 0:
+                self.log_update.emit(f"[INFO] Scanned {done}/{total} page(s), {len(assets)} unique asset(s).")
+
+        return assets
+
+    @staticmethod
+    def _extract_assets(soup, page_url: str):
+        """Return (absolute_url, asset_type) pairs for images, stylesheets, scripts and PDFs."""
+        found = []
+
+        def add(raw, asset_type):
+            raw = (raw or "").strip()
+            if not raw or raw.startswith(("data:", "javascript:", "#")):
+                return
+            full_url = urljoin(page_url, raw)
+            if urlparse(full_url).scheme in ("http", "https"):
+                found.append((full_url, asset_type))
+
+        def add_srcset(srcset, asset_type):
+            for candidate in (srcset or "").split(","):
+                parts = candidate.strip().split()
+                if parts:
+                    add(parts[0], asset_type)
+
+        for tag in soup.find_all("img"):
+            add(tag.get("src"), "image")
+            add(tag.get("data-src"), "image")
+            add_srcset(tag.get("srcset"), "image")
+
+        for tag in soup.find_all("source"):
+            parent = tag.parent.name if tag.parent else ""
+            asset_type = "image" if parent == "picture" else "media"
+            add(tag.get("src"), asset_type)
+            add_srcset(tag.get("srcset"), asset_type)
+
+        for tag in soup.find_all("link", href=True):
+            rel = [r.lower() for r in (tag.get("rel") or [])]
+            if "stylesheet" in rel:
+                add(tag["href"], "stylesheet")
+
+        for tag in soup.find_all("script", src=True):
+            add(tag["src"], "script")
+
+        for tag in soup.find_all("a", href=True):
+            if urlparse(tag["href"].strip()).path.lower().endswith(".pdf"):
+                add(tag["href"], "pdf")
+
+        return found
+
+    async def _check_asset(self, url: str, info: dict, session: aiohttp.ClientSession, sem: asyncio.Semaphore):
+        """
+        Check one asset with the lightest request that works: HEAD first, then a
+        one-byte range GET when HEAD is refused or does not report a size.
+        """
+        async with sem:
+            if self._stop_requested:
+                return None
+
+            status = None
+            final_url = ""
+            content_type = ""
+            content_length = None
+            error = ""
+            try:
+                try:
+                    async with session.head(url, ssl=False, allow_redirects=True, timeout=TIMEOUT_SHORT) as resp:
+                        status = resp.status
+                        final_url = str(resp.url)
+                        content_type = resp.headers.get("Content-Type", "")
+                        content_length = resp.content_length
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    status = None
+
+                if status is None or status in (403, 405, 501) or (status == 200 and content_length is None):
+                    range_headers = {"Range": "bytes=0-0"}
+                    async with session.get(url, ssl=False, allow_redirects=True, timeout=TIMEOUT_STANDARD,
+                                           headers=range_headers) as resp:
+                        status = resp.status
+                        final_url = str(resp.url)
+                        content_type = resp.headers.get("Content-Type", "") or content_type
+                        if status == 206:
+                            # Content-Range: bytes 0-0/12345
+                            total = resp.headers.get("Content-Range", "").rpartition("/")[2]
+                            content_length = int(total) if total.isdigit() else None
+                            status = 200
+                        else:
+                            content_length = resp.content_length
+            except aiohttp.ClientError as e:
+                error = f"Network error: {str(e)}"
+            except asyncio.TimeoutError:
+                error = "Timeout"
+            except Exception as e:
+                error = str(e)
+
+            category = "network_error"
+            if status is not None:
+                if 200 <= status < 300:
+                    category = "ok"
+                elif 300 <= status < 400:
+                    category = "redirect"
+                elif 400 <= status < 500:
+                    category = "client_error"
+                elif status >= 500:
+                    category = "server_error"
+
+            oversized = bool(content_length and content_length > self.max_asset_bytes)
+
+            return {
+                "url": url,
+                "status": status,
+                "final_url": final_url,
+                "error": error,
+                "category": category,
+                "asset_type": info["type"],
+                "content_type": content_type.split(";")[0].strip(),
+                "content_length": content_length,
+                "oversized": oversized,
+                "found_on": info["found_on"],
+                "pages": info["pages"],
+            }
+
     async def _collect_links_from_page(self, page_url: str, session: aiohttp.ClientSession):
         urls = []
         try:
@@ -1,43 +1,95 @@
 """
 ContentExtractorWorker for structured Word document generation.
-Fetches URL, extracts content with refined logic (V7.1), and saves to .docx.
+Fetches URL, extracts content with refined logic (V7.1), and saves to .docx
+(and/or Markdown / HTML, rendered from the same content model).
+Batch mode converts URL lists / sitemaps, building documents in a process pool.
+Optionally embeds thumbnails of the component images in the Word output.
 """
 
 import os
-import re
 import asyncio
+import datetime
+import hashlib
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import urlparse
+
 import aiohttp
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup, Tag, NavigableString
+from bs4 import BeautifulSoup
+from openpyxl import Workbook
 from PyQt6.QtCore import QThread, pyqtSignal
-from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 
-from config import TIMEOUT_STANDARD
+from config import TIMEOUT_STANDARD, MAX_CONCURRENCY, THUMBNAIL_CACHE_DIR, THUMBNAIL_MAX_PX
+from utils.content_extraction import (
+    ContentDocxBuilder, ContentExtractor, extract_page, output_stem_for, render_model, render_page
+)
+from utils.content_model import ContentDocument, write_formats
+from utils.image_thumbnails import ThumbnailCache, ThumbnailFetcher
+from utils.streaming import run_bounded
+
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
 
 
 class ContentExtractorWorker(QThread):
     """
     Worker thread for extracting structured content from a URL and saving to Word.
+
+    Batch mode (`urls`): every entry is a page URL or a sitemap (.xml, sitemap
+    indexes are followed). Pages are fetched with bounded concurrency and the
+    documents built in a process pool, written as individual files or into
+    one zip streamed as documents complete. Per-URL failures are logged and
+    listed in a batch report workbook.
+
+    `formats` selects the outputs ("docx", "md", "html"); with `save_model`
+    the extracted content model is also written as .json, and
+    render_cached() can later re-render it without fetching the page.
+
+    With `embed_images`, the images of the component tables are downloaded
+    once per URL (concurrently, shared between the pages of a batch),
+    reduced to thumbnails of at most `thumbnail_px` pixels in the process
+    pool and embedded in the .docx below their URL. Thumbnails are kept in
+    `thumbnail_cache_dir`, so re-exporting a page downloads nothing.
     """
     log_update = pyqtSignal(str)
-    finished = pyqtSignal(str)
+    progress_update = pyqtSignal(int)
+    finished = pyqtSignal(str)  # docx path (single), zip or output folder (batch)
     error = pyqtSignal(str)
 
-    def __init__(self, url, output_folder):
+    def __init__(self, url="", output_folder="", urls=None, max_concurrency: int = MAX_CONCURRENCY,
+                 processes: int = None, zip_output: bool = False, formats=("docx",),
+                 save_model: bool = False, embed_images: bool = False,
+                 thumbnail_px: int = THUMBNAIL_MAX_PX, thumbnail_cache_dir: str = THUMBNAIL_CACHE_DIR):
         super().__init__()
         self.url = url
+        self.urls = urls or []
         self.output_folder = output_folder
+        self.max_concurrency = max_concurrency
+        self.processes = processes or max(1, (os.cpu_count() or 2) - 1)
+        self.zip_output = zip_output
+        self.formats = tuple(formats) or ("docx",)
+        self.save_model = save_model
+        self.embed_images = embed_images and "docx" in self.formats
+        self.thumbnail_px = thumbnail_px
+        self.thumbnail_cache_dir = thumbnail_cache_dir
+        self._stop_requested = False
         self.text_block_count = 0
         self.text_image_count = 0
         self.base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
         os.makedirs(self.output_folder, exist_ok=True)
 
+    def stop(self):
+        self._stop_requested = True
+
     def run(self):
         """Run the async extraction process."""
         try:
-            asyncio.run(self.extract())
+            if self.urls:
+                asyncio.run(self.extract_batch())
+            else:
+                asyncio.run(self.extract())
         except Exception as e:
             self.error.emit(f"Error: {e}")
             self.log_update.emit(f"Extraction failed: {e}")
@@ -45,27 +97,29 @@ class ContentExtractorWorker(QThread):
     async def extract(self):
         """Main async extraction function."""
         self.log_update.emit(f"Fetching {self.url}...")
-        
+
         try:
             async with aiohttp.ClientSession() as session:
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                }
-                async with session.get(self.url, headers=headers, ssl=False, timeout=TIMEOUT_STANDARD) as response:
+                async with session.get(self.url, headers=REQUEST_HEADERS, ssl=False, timeout=TIMEOUT_STANDARD) as response:
                     if response.status != 200:
                         self.error.emit(f"HTTP {response.status}")
                         self.log_update.emit(f"Failed to fetch URL: Status {response.status}")
                         return
-                    
+
                     html = await response.text()
                     soup = BeautifulSoup(html, 'lxml')
-                    
+
                     self.log_update.emit("Parsing content...")
-                    docx_path = self._save_to_docx(self.url, soup, self.output_folder)
-                    
-                    self.log_update.emit(f"✓ Document saved: {os.path.basename(docx_path)}")
-                    self.finished.emit(docx_path)
-                    
+                    if self.embed_images:
+                        path = await self._save_with_images(self.url, soup, self.output_folder, session)
+                    elif self.formats == ("docx",) and not self.save_model:
+                        path = self._save_to_docx(self.url, soup, self.output_folder)
+                    else:
+                        path = self._save_formats(self.url, soup, self.output_folder)
+
+                    self.log_update.emit(f"✓ Document saved: {os.path.basename(path)}")
+                    self.finished.emit(path)
+
         except asyncio.TimeoutError:
             self.error.emit("Request timeout")
             self.log_update.emit("Request timed out")
@@ -76,505 +130,213 @@ class ContentExtractorWorker(QThread):
     def _save_to_docx(self, url, soup, output_folder):
         """Generate structured Word document from HTML."""
         try:
-            # Create safe filename
-            safe_filename = re.sub(r'[<>:"/\\|?*]', '_', url)
-            safe_filename = safe_filename[:100] + ".docx"
-            docx_filename = os.path.join(output_folder, safe_filename)
-            
-            doc = Document()
-            
-            # Header
-            title = doc.add_paragraph()
-            title.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-            run = title.add_run(f"Source: {url}")
-            run.bold = True
-            run.font.size = Pt(14)
-            run.font.color.rgb = RGBColor(0, 112, 192)
-            doc.add_paragraph()
-
-            # V3: H1 Extraction (Top)
-            h1 = soup.find('h1')
-            if h1:
-                h1_text = h1.get_text(strip=True)
-                doc.add_heading(h1_text, level=1)
-                doc.add_paragraph()
-
-            # Reset counters
-            self.text_block_count = 0
-            self.text_image_count = 0
-
-            # Process Main Content
-            main_content = soup.find('main') or soup.find('body')
-            if main_content:
-                self._process_element(doc, main_content)
-            else:
-                doc.add_paragraph("No main content found.")
-            
-            # Add SEO Metadata Table at the end
-            doc.add_paragraph()  # Spacer
-            self._add_seo_metadata_table(doc, soup)
-            
-            doc.save(docx_filename)
-            return docx_filename
-            
+            builder = ContentDocxBuilder(url, log=self.log_update.emit)
+            path = builder.save(soup, output_folder)
+            self.text_block_count = builder.text_block_count
+            self.text_image_count = builder.text_image_count
+            return path
         except Exception as e:
             self.log_update.emit(f"Error saving document: {e}")
             raise
 
-    def _make_absolute(self, url):
-        """Convert relative URLs to absolute."""
-        if not url:
-            return ""
-        if url.startswith('http'):
-            return url
-        return urljoin(self.base_url, url)
-
-    def _process_element(self, doc, element, level=0):
-        """Recursively process HTML elements."""
-        # Skip unwanted tags
-        if element.name in ['script', 'style', 'nav', 'footer', 'header', 'noscript']:
-            return
-
-        # V2/V3: Exclusions
-        classes = element.get('class', [])
-        class_set = set(classes) if classes else set()
-        
-        exclusions = {
-            'hero--article-wrapper--items',
-            'article-author-bottom',
-            'nppe-feedback-article-form',
-            'related-topics--label',
-            'related-topics--links',
-            'article--progressbar',
-            'component--newsletter'
-        }
-        
-        if not class_set.isdisjoint(exclusions):
-            return
-        
-        # Additional ID-based exclusion
-        if element.get('id') == 'nppe-feedback-article-form':
-            return
-
-        # V1: Text Block Tagging
-        target_classes = {
-            'clearfix', 'text-formatted', 'field', 'field--name-field-c-text',
-            'field--type-text-long', 'field--label-hidden', 'field__item'
-        }
-        if target_classes.issubset(class_set):
-            self.text_block_count += 1
-            marker = doc.add_paragraph()
-            run = marker.add_run(f"[COMPONENT: Text Block {self.text_block_count}]")
-            run.font.size = Pt(9)
-            run.font.color.rgb = RGBColor(0, 100, 0)
-            run.bold = True
-
-        # Special Components
-        if element.name in ['div', 'section', 'article']:
-            component_name = None
-            for cls in classes:
-                if cls.startswith('component--'):
-                    component_name = cls.replace('component--', '').replace('-', ' ').title()
-                    break
-                elif cls == 'article--hero':
-                    component_name = "Hero Article"
-                    break
-                elif cls == 'hero--image':
-                    component_name = "Hero Image"
-                    break
-            
-            if component_name:
-                self._process_special_component(doc, element, component_name)
-                return
-
-        # Processing Tags
-        if element.name == 'h1':
-            # Skip H1 (already extracted at top)
-            return
-
-        if element.name in ['h2', 'h3', 'h4', 'h5', 'h6']:
-            heading_level = int(element.name[1])
-            heading = doc.add_heading(level=heading_level)
-            self._process_children_with_links(heading, element)
-
-        elif element.name == 'p':
-            p = doc.add_paragraph()
-            self._process_children_with_links(p, element)
-
-        elif element.name in ['ul', 'ol']:
-            for li in element.find_all('li', recursive=False):
-                p = doc.add_paragraph(style='List Bullet' if element.name == 'ul' else 'List Number')
-                self._process_children_with_links(p, li)
-
-        elif element.name == 'table':
-            self._process_table(doc, element)
-
-        else:
-            # Recursion for containers
-            for child in element.children:
-                if isinstance(child, Tag):
-                    self._process_element(doc, child, level + 1)
-                elif isinstance(child, NavigableString):
-                    text = str(child).strip()
-                    if len(text) > 20:
-                        doc.add_paragraph(text)
-
-    def _process_children_with_links(self, paragraph, element):
-        """Process children while preserving links with formatting."""
-        for child in element.children:
-            if isinstance(child, NavigableString):
-                text = str(child)
-                if text:
-                    paragraph.add_run(text)
-            
-            elif isinstance(child, Tag):
-                if child.name == 'a':
-                    link_text = child.get_text()
-                    link_url = self._make_absolute(child.get('href', ''))
-                    
-                    # Link Text (Blue, Underlined)
-                    run = paragraph.add_run(link_text)
-                    run.font.color.rgb = RGBColor(0, 0, 255)
-                    run.font.underline = True
-                    
-                    # URL (Blue, Underlined)
-                    if link_url:
-                        run_url = paragraph.add_run(f" ({link_url})")
-                        run_url.font.color.rgb = RGBColor(0, 0, 255)
-                        run_url.font.underline = True
-                
-                elif child.name in ['strong', 'b']:
-                    run = paragraph.add_run(child.get_text())
-                    run.bold = True
-                elif child.name in ['em', 'i']:
-                    run = paragraph.add_run(child.get_text())
-                    run.italic = True
-                else:
-                    paragraph.add_run(child.get_text())
-
-    def _process_table(self, doc, table_element):
-        """Process HTML table."""
-        rows = table_element.find_all('tr')
-        if not rows:
-            return
-        
-        col_count = max(len(row.find_all(['td', 'th'])) for row in rows)
-        word_table = doc.add_table(rows=len(rows), cols=col_count)
-        word_table.style = 'Light Grid Accent 1'
-        
-        for i, row in enumerate(rows):
-            cells = row.find_all(['td', 'th'])
-            for j, cell in enumerate(cells):
-                if j < col_count:
-                    word_table.rows[i].cells[j].text = cell.get_text(strip=True)
-
-    def _process_special_component(self, doc, element, component_name):
-        """Handle special components (Hero, Text Image, etc.)."""
-        
-        # --- 1. Hero Article ---
-        if component_name == "Hero Article":
-            # Extract Category
-            cat_elem = element.find(class_='hero--article-category')
-            if cat_elem:
-                cat_text = cat_elem.get_text(strip=True)
-                cat_link = cat_elem.find('a')
-                cat_url = self._make_absolute(cat_link.get('href', '')) if cat_link else ""
-                
-                p_cat = doc.add_paragraph()
-                p_cat.add_run(f"Article category: {cat_text}").bold = True
-                if cat_url:
-                    p_cat.add_run(f" - {cat_url}").italic = True
-
-            # Create Table
-            table = doc.add_table(rows=1, cols=2)
-            table.style = 'Table Grid'
-            
-            # Find image specifically from hero--image class
-            hero_image_container = element.find(class_='hero--image')
-            img_tag = None
-            img_url = "No image found"
-            img_alt = ""
-            
-            if hero_image_container:
-                img_tag = hero_image_container.find('img')
-                if img_tag:
-                    img_url = self._make_absolute(img_tag.get('src', ''))
-                    img_alt = img_tag.get('alt', '').strip()
-            
-            # Column 1: Image URL
-            cell_img = table.rows[0].cells[0]
-            p_img = cell_img.paragraphs[0]
-            p_img.add_run("IMAGE:\n").bold = True
-            p_img.add_run(img_url)
-            
-            # Column 2: Alt Text only
-            cell_text = table.rows[0].cells[1]
-            p_alt = cell_text.paragraphs[0]
-            p_alt.add_run("Alt Text: ").bold = True
-            p_alt.add_run(img_alt if img_alt else "No Alt Text")
-            
-            doc.add_paragraph()  # Spacing
-            return
-
-        # --- 2. Articles List ---
-        if component_name == "Articles List":
-            # Find component title
-            component_title = element.find(['h2', 'h3', 'h4'])
-            component_title_text = component_title.get_text(strip=True) if component_title else "Articles List"
-            
-            # Find all links in the component, excluding article-category
-            all_links = element.find_all('a')
-            # Filter out category links and deduplicate by URL
-            seen_urls = set()
-            article_links = []
-            for link in all_links:
-                parent = link.parent
-                # Skip if parent has field--name-field-article-category class
-                parent_classes = parent.get('class', []) if parent else []
-                if 'field--name-field-article-category' not in parent_classes:
-                    url = link.get('href', '')
-                    # Deduplicate by URL (each article may have multiple links)
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        article_links.append(link)
-            
-            if article_links:
-                # Create 2-column table: Title | URL
-                # +1 row for header, +1 for component title row
-                table = doc.add_table(rows=len(article_links) + 2, cols=2)
-                table.style = 'Light Grid Accent 1'
-                
-                # Header row
-                header_cells = table.rows[0].cells
-                p_title_header = header_cells[0].paragraphs[0]
-                p_title_header.add_run("Title").bold = True
-                p_url_header = header_cells[1].paragraphs[0]
-                p_url_header.add_run("URL").bold = True
-                
-                # Component title row
-                table.rows[1].cells[0].text = f"Component: {component_title_text}"
-                table.rows[1].cells[1].text = ""
-                # Make component title row bold
-                for paragraph in table.rows[1].cells[0].paragraphs:
-                    for run in paragraph.runs:
-                        run.bold = True
-                
-                # Data rows (articles)
-                for i, link in enumerate(article_links, 2):  # Start at row 2 (after header and component title)
-                    # Try to find the title field in parent elements
-                    title_text = link.get_text(strip=True)  # Default to link text
-                    
-                    # Look for title field in parent hierarchy
-                    parent = link.parent
-                    while parent and parent != element:
-                        title_field = parent.find(class_='field--name-title')
-                        if title_field:
-                            title_text = title_field.get_text(strip=True)
-                            break
-                        parent = parent.parent
-                    
-                    article_url = self._make_absolute(link.get('href', ''))
-                    
-                    # Use actual title instead of "Article N"
-                    table.rows[i].cells[0].text = title_text
-                    table.rows[i].cells[1].text = article_url
-            
-            doc.add_paragraph()  # Spacer
-            return
-
-        # --- 3. Text Image ---
-        if component_name == "Text Image":
-            self.text_image_count += 1
-            display_name = f"{component_name} {self.text_image_count}"
-            
-            marker = doc.add_paragraph()
-            run = marker.add_run(f"[COMPONENT: {display_name}]")
-            run.font.size = Pt(9)
-            run.font.color.rgb = RGBColor(100, 100, 100)
-            run.italic = True
-
-            # Create Table
-            table = doc.add_table(rows=1, cols=2)
-            table.style = 'Table Grid'
-            
-            # Col 1: Image Info
-            cell_info = table.rows[0].cells[0]
-            p_info = cell_info.paragraphs[0]
-            p_info.add_run("Image Position: Left\n").bold = True
-            
-            img_tag = element.find('img')
-            alt_text = ""
-            if img_tag:
-                img_url = self._make_absolute(img_tag.get('src', ''))
-                alt_text = img_tag.get('alt', '').strip()
-                p_info.add_run("IMAGE:\n").bold = True
-                p_info.add_run(img_url)
+    def _save_formats(self, url, soup, output_folder, images=None, model=None):
+        """Extract once and write every selected format (and the model); returns the first path."""
+        model = model or ContentExtractor(url, log=self.log_update.emit).extract(soup)
+        stem = output_stem_for(url)
+        paths = write_formats(model, output_folder, stem, self.formats, images)
+        if self.save_model:
+            paths.append(model.save_json(os.path.join(output_folder, stem + ".json")))
+        for path in paths[1:]:
+            self.log_update.emit(f"✓ Saved: {os.path.basename(path)}")
+        return paths[0]
+
+    async def _save_with_images(self, url, soup, output_folder, session):
+        """_save_formats with the component images embedded as thumbnails."""
+        model = ContentExtractor(url, log=self.log_update.emit).extract(soup)
+        urls = model.media_urls()
+        self.log_update.emit(f"Fetching {len(urls)} image(s)...")
+        with ProcessPoolExecutor(max_workers=max(1, min(self.processes, len(urls)))) as pool:
+            fetcher = self._thumbnail_fetcher(session, pool)
+            images = await fetcher.get_many(urls)
+        self._log_thumbnails(fetcher)
+        return self._save_formats(url, soup, output_folder, images, model)
+
+    def _thumbnail_fetcher(self, session, pool):
+        cache = ThumbnailCache(self.thumbnail_cache_dir, self.thumbnail_px)
+        return ThumbnailFetcher(session, pool, cache, self.max_concurrency, log=self.log_update.emit)
+
+    def _log_thumbnails(self, fetcher):
+        self.log_update.emit(
+            f"[DONE] Thumbnails – {fetcher.hits} cached, {fetcher.downloads} downloaded, "
+            f"{fetcher.failures} failed"
+        )
+
+    @staticmethod
+    def render_cached(json_paths, output_folder, formats=("docx",), embed_images=False,
+                      thumbnail_px=THUMBNAIL_MAX_PX, thumbnail_cache_dir=THUMBNAIL_CACHE_DIR):
+        """
+        Re-render cached .json content models without refetching; returns the written paths.
+
+        With `embed_images`, thumbnails already in the cache are embedded
+        (nothing is downloaded).
+        """
+        cache = ThumbnailCache(thumbnail_cache_dir, thumbnail_px) if embed_images else None
+        written = []
+        for json_path in json_paths:
+            model = ContentDocument.load_json(json_path)
+            stem = os.path.splitext(os.path.basename(json_path))[0]
+            images = None
+            if cache:
+                images = {u: p for u, p in ((u, cache.get(u)) for u in model.media_urls()) if p}
+            written += write_formats(model, output_folder, stem, formats, images)
+        return written
+
+    # ------------------------------------------------------------------
+    # Batch mode
+    # ------------------------------------------------------------------
+
+    async def _fetch_text(self, url, session):
+        async with session.get(url, headers=REQUEST_HEADERS, ssl=False, timeout=TIMEOUT_STANDARD) as response:
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}")
+            return await response.text()
+
+    async def _expand_sources(self, session):
+        """Resolve the input list to page URLs, following sitemaps and sitemap indexes."""
+        pages = []
+        pending = [u.strip() for u in self.urls if u.strip()]
+        seen_sitemaps = set()
+        while pending:
+            url = pending.pop(0)
+            if not urlparse(url).path.lower().endswith(".xml"):
+                pages.append(url)
+                continue
+            if url in seen_sitemaps:
+                continue
+            seen_sitemaps.add(url)
+            self.log_update.emit(f"[FETCH] Sitemap {url}")
+            try:
+                root = ET.fromstring(await self._fetch_text(url, session))
+            except Exception as e:
+                self.log_update.emit(f"[ERROR] Sitemap {url}: {e}")
+                continue
+            if root.tag.split('}')[-1].lower() == "sitemapindex":
+                pending.extend(loc.text.strip() for loc in root.iterfind(".//{*}sitemap/{*}loc") if loc.text)
             else:
-                p_info.add_run("No Image").italic = True
-            
-            # Col 2: Alt Text
-            cell_alt = table.rows[0].cells[1]
-            p_alt = cell_alt.paragraphs[0]
-            p_alt.add_run("Alt Text: ").bold = True
-            p_alt.add_run(alt_text if alt_text else "No Alt Text")
-            
-            # Content BELOW table
-            doc.add_paragraph()  # Spacer
-            
-            # Tag-based extraction with formatting preservation
-            content_tags = element.find_all(['p', 'h2', 'h3', 'h4', 'h5', 'h6', 'li'])
-            
-            # Track seen text to avoid duplicates
-            seen_texts = set()
-            
-            if content_tags:
-                for tag in content_tags:
-                    if tag.find_parent(class_='hero--article-category'):
-                        continue
-                    
-                    text_content = tag.get_text(strip=True)
-                    if text_content and len(text_content) > 2 and text_content not in seen_texts:
-                        seen_texts.add(text_content)
-                        
-                        # Add as heading or paragraph
-                        if tag.name in ['h2', 'h3', 'h4', 'h5', 'h6']:
-                            # Extract level from tag name (e.g., 'h3' -> 3)
-                            try:
-                                level = int(tag.name[1])
-                            except ValueError:
-                                level = 3 # Default to H3 if parsing fails
-                            
-                            doc.add_heading(text_content, level=level)
-                        else:
-                            doc.add_paragraph(text_content)
+                pages.extend(loc.text.strip() for loc in root.iterfind(".//{*}loc") if loc.text)
+        return list(dict.fromkeys(pages))
+
+    @staticmethod
+    def _unique_stem(url, used):
+        """output_stem_for(url), suffixed with a short hash when truncation collides."""
+        stem = output_stem_for(url)
+        if stem in used:
+            digest = hashlib.md5(url.encode("utf-8")).hexdigest()[:8]
+            stem = f"{stem}_{digest}"
+        used.add(stem)
+        return stem
+
+    def _store_outputs(self, archive, stem, outputs):
+        """Write one page's documents into the zip or the output folder; returns the file names."""
+        names = []
+        for ext, data in outputs.items():
+            names.append(stem + ext)
+            if archive is not None:
+                archive.writestr(stem + ext, data)
             else:
-                # Fallback: simple text extraction
-                text_containers = element.find_all(class_=re.compile(r'(summary|text|desc|body|content)'))
-                if text_containers:
-                    for container in text_containers:
-                        t = container.get_text(strip=True)
-                        if t and len(t) > 10 and t not in seen_texts:
-                            seen_texts.add(t)
-                            doc.add_paragraph(t)
-            
-            doc.add_paragraph()  # Spacing
-            return
-
-        # --- 4. Other Components (Default) ---
-        # Standard 2-Column Table for other components
-        marker = doc.add_paragraph()
-        run = marker.add_run(f"[COMPONENT: {component_name}]")
-        run.font.size = Pt(9)
-        run.font.color.rgb = RGBColor(100, 100, 100)
-        run.italic = True
-
-        table = doc.add_table(rows=1, cols=2)
-        table.style = 'Table Grid'
-        
-        img_tag = element.find('img')
-        img_url = "No image found"
-        img_alt = ""
-        if img_tag:
-            img_url = self._make_absolute(img_tag.get('src', ''))
-            img_alt = img_tag.get('alt', '').strip()
-        
-        # Standard text extraction
-        text_parts = []
-        text_containers = element.find_all(class_=re.compile(r'(summary|text|desc|body|content)'))
-        if text_containers:
-            for container in text_containers:
-                if 'hero--article-category' in container.get('class', []):
-                    continue
-                t = container.get_text(strip=True)
-                if t and len(t) > 10:
-                    text_parts.append(t)
-        
-        if not text_parts:
-            for tag in element.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                t = tag.get_text(strip=True)
-                if t:
-                    text_parts.append(t)
-        
-        summary_text = "\n\n".join(list(dict.fromkeys(text_parts)))
-        if not summary_text:
-            summary_text = element.get_text(separator=' ', strip=True)[:500]
-        
-        # Fill table
-        cell_img = table.rows[0].cells[0]
-        p_img = cell_img.paragraphs[0]
-        if img_tag:
-            p_img.add_run("IMAGE:\n").bold = True
-            p_img.add_run(img_url)
-        else:
-            p_img.add_run("No Image").italic = True
-        
-        cell_text = table.rows[0].cells[1]
-        cell_text.text = summary_text
-        
-        doc.add_paragraph()  # Spacing
-
-    def _add_seo_metadata_table(self, doc, soup):
-        """Add SEO metadata table at the end of the document."""
-        try:
-            # Add section header
-            header = doc.add_paragraph()
-            run = header.add_run("SEO METADATA")
-            run.bold = True
-            run.font.size = Pt(12)
-            run.font.color.rgb = RGBColor(0, 112, 192)
-            
-            # Extract URL path
-            from urllib.parse import urlparse
-            url_path = urlparse(self.url).path
-            
-            # Extract metadata
-            meta_title = soup.find('title')
-            meta_title_text = meta_title.string.strip() if meta_title and meta_title.string else "No Meta Title"
-            
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            meta_desc_text = meta_desc.get('content', 'No Meta Description') if meta_desc else "No Meta Description"
-            
-            og_title = soup.find('meta', property='og:title')
-            og_title_text = og_title.get('content', 'No OG Title') if og_title else "No OG Title"
-            
-            og_desc = soup.find('meta', property='og:description')
-            og_desc_text = og_desc.get('content', 'No OG Description') if og_desc else "No OG Description"
-            
-            schemas = soup.find_all('script', type='application/ld+json')
-            if schemas:
-                schema_texts = [s.string.strip() for s in schemas if s.string]
-                schema_text = "\n---\n".join(schema_texts)
-                # Truncate if too long
-                if len(schema_text) > 2000:
-                    schema_text = schema_text[:2000] + "...[truncated]"
-            else:
-                schema_text = "No Schema"
-            
-            # Create 2-column table with 6 rows (one per metadata field)
-            table = doc.add_table(rows=6, cols=2)
-            table.style = 'Light Grid Accent 1'
-            
-            # Define metadata rows
-            metadata_rows = [
-                ('Internal URL', url_path),
-                ('Meta Title', meta_title_text),
-                ('Meta Description', meta_desc_text),
-                ('OG Title', og_title_text),
-                ('OG Description', og_desc_text),
-                ('Schema', schema_text)
-            ]
-            
-            # Fill table
-            for i, (label, value) in enumerate(metadata_rows):
-                # Column 1: Label (bold)
-                cell_label = table.rows[i].cells[0]
-                p_label = cell_label.paragraphs[0]
-                run_label = p_label.add_run(label)
-                run_label.bold = True
-                
-                # Column 2: Value
-                cell_value = table.rows[i].cells[1]
-                cell_value.text = value
-                
-        except Exception as e:
-            self.log_update.emit(f"Error adding SEO metadata table: {e}")
+                with open(os.path.join(self.output_folder, stem + ext), "wb") as f:
+                    f.write(data)
+        return names
+
+    async def extract_batch(self):
+        """Fetch and convert every page of `urls`."""
+        ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        zip_path = os.path.join(self.output_folder, f"content_export_{ts}.zip") if self.zip_output else ""
+        report_path = os.path.join(self.output_folder, f"content_export_{ts}.xlsx")
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ssl=False)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            pages = await self._expand_sources(session)
+            total = len(pages)
+            if total == 0:
+                self.error.emit("No page URLs to extract")
+                return
+            self.log_update.emit(
+                f"[INIT] Batch extraction – {total} page(s), {self.max_concurrency} concurrent fetches, "
+                f"{self.processes} process(es)."
+            )
+
+            # Write-only report: one row per URL, flushed as results arrive
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Pages")
+            ws.append(["URL", "Status", "Output", "Error"])
+
+            archive = zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) if zip_path else None
+            used_stems = set()
+            loop = asyncio.get_running_loop()
+            stats = {"done": 0, "ok": 0, "failed": 0}
+
+            async def handle(url):
+                stem = self._unique_stem(url, used_stems)
+                try:
+                    html = await self._fetch_text(url, session)
+                    if fetcher is None:
+                        outputs = await loop.run_in_executor(
+                            pool, render_page, url, html, self.formats, self.save_model
+                        )
+                    else:
+                        # Extract, fetch the thumbnails (shared across pages), then render
+                        model_json, image_urls = await loop.run_in_executor(pool, extract_page, url, html)
+                        images = await fetcher.get_many(image_urls)
+                        outputs = await loop.run_in_executor(
+                            pool, render_model, model_json, self.formats, self.save_model, images
+                        )
+                    names = await loop.run_in_executor(writer, self._store_outputs, archive, stem, outputs)
+                    return url, stem, names, ""
+                except asyncio.TimeoutError:
+                    return url, stem, None, "Timeout"
+                except Exception as e:
+                    return url, stem, None, str(e) or e.__class__.__name__
+
+            def on_result(url, result):
+                _, stem, names, err = result
+                stats["done"] += 1
+                if err:
+                    stats["failed"] += 1
+                    self.log_update.emit(f"[ERROR] {url} – {err}")
+                    ws.append([url, "Failed", "", err])
+                else:
+                    stats["ok"] += 1
+                    self.log_update.emit(f"[DONE] {', '.join(names)}")
+                    ws.append([url, "OK", ", ".join(names), ""])
+                self.progress_update.emit(int(stats["done"] * 100 / total))
+
+            async def source():
+                for url in pages:
+                    yield url
+
+            pool = ProcessPoolExecutor(max_workers=self.processes)
+            # Deflating and writing run off the event loop, one at a time so the zip stays consistent
+            writer = ThreadPoolExecutor(max_workers=1)
+            fetcher = self._thumbnail_fetcher(session, pool) if self.embed_images else None
+            try:
+                await run_bounded(
+                    source(), handle, self.max_concurrency,
+                    on_result=on_result, should_stop=lambda: self._stop_requested,
+                )
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+                writer.shutdown(wait=True)
+                if archive is not None:
+                    archive.close()
+                wb.save(report_path)
+
+        if self._stop_requested:
+            self.log_update.emit("[WARN] Stop requested. Remaining pages were not extracted.")
+        if fetcher is not None:
+            self._log_thumbnails(fetcher)
+        self.log_update.emit(
+            f"[DONE] Batch extraction – {stats['ok']} document(s), {stats['failed']} failure(s). "
+            f"Report: {report_path}"
+        )
+        self.finished.emit(zip_path or self.output_folder)
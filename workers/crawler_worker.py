@@ -9,14 +9,22 @@ import datetime
 import asyncio
 import aiohttp
 import openpyxl
-from urllib.parse import urlparse
-from bs4 import BeautifulSoup, Tag, NavigableString
+from urllib.parse import urljoin, urlparse
+from bs4 import BeautifulSoup
 from PyQt6.QtCore import QThread, pyqtSignal
-from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 
 from config import MAX_EXCEL_CELL_LENGTH, TIMEOUT_STANDARD
+from utils.content_extraction import CrawlerPageExtractor, docx_filename_for
+from utils.content_model import render_docx
+from utils.duplicates import DuplicateIndex
+from utils.product_catalog import ProductCatalog
+from utils.structured_data import parse_structured_data
+
+# Typed columns filled from the page's JSON-LD index
+SCHEMA_HEADERS = [
+    "Schema Types", "Product ID", "Product SKU", "Product GTIN",
+    "Offer Price", "Offer Currency", "Offer Availability", "Schema Errors",
+]
 
 
 class CrawlerThread(QThread):
@@ -77,6 +85,19 @@ class CrawlerThread(QThread):
             self.extract_options["og_tags"] = True
             self.extract_options["schema"] = True
 
+        # Duplicate detection reads title / description / H1 even when their columns are off
+        dup_index = DuplicateIndex() if self.extract_options.get("duplicates") else None
+
+        # Product catalog: JSON-LD product records are upserted in batches
+        catalog = None
+        catalog_batch = []
+        if self.extract_options.get("catalog"):
+            try:
+                catalog = ProductCatalog()
+                self.log_update.emit(f"Product catalog: {catalog.path} ({catalog.count()} record(s))")
+            except Exception as e:
+                self.log_update.emit(f"Could not open product catalog: {e}")
+
         # Check if any Excel extraction options are selected
         excel_options_selected = any([
             self.extract_options.get("h1"),
@@ -84,6 +105,7 @@ class CrawlerThread(QThread):
             self.extract_options.get("meta_description"),
             self.extract_options.get("og_tags"),
             self.extract_options.get("schema"),
+            self.extract_options.get("duplicates"),  # Duplicates sheet is added to the results workbook
             self.mode in [1, 2]  # Search modes also require Excel
         ])
 
@@ -105,7 +127,7 @@ class CrawlerThread(QThread):
                 headers.append("OG Title")
                 headers.append("OG Description")
                 headers.append("OG Image")
-            if self.extract_options.get("schema"): headers.append("Schema JSON")
+            if self.extract_options.get("schema"): headers.extend(SCHEMA_HEADERS)
             # Removed "All Meta Tags" blob column as requested
             
             if self.mode == 1: headers.append("Module Found")
@@ -118,38 +140,63 @@ class CrawlerThread(QThread):
             ws_errors.title = "Error Results"
             ws_errors.append(["URL", "Status Code", "Redirect"])
 
-        async with aiohttp.ClientSession() as session:
-            all_urls_to_check = []
-            for url in self.urls:
-                if self.stopped: break
-                if urlparse(url).path.endswith(".xml"):
-                    self.log_update.emit(f"Fetching URLs from sitemap: {url}")
-                    sitemap_urls = await self._get_sitemap_urls(url, session)
-                    all_urls_to_check.extend(sitemap_urls)
-                else:
-                    all_urls_to_check.append(url)
+        try:
+            async with aiohttp.ClientSession() as session:
+                all_urls_to_check = []
+                for url in self.urls:
+                    if self.stopped: break
+                    if urlparse(url).path.endswith(".xml"):
+                        self.log_update.emit(f"Fetching URLs from sitemap: {url}")
+                        sitemap_urls = await self._get_sitemap_urls(url, session)
+                        all_urls_to_check.extend(sitemap_urls)
+                    else:
+                        all_urls_to_check.append(url)
             
-            total_urls = len(all_urls_to_check)
-            self.total_pages_crawled = total_urls
+                total_urls = len(all_urls_to_check)
+                self.total_pages_crawled = total_urls
             
-            tasks = [self._crawl_url(u, session, class_patterns, search_patterns) for u in all_urls_to_check]
+                tasks = [self._crawl_url(u, session, class_patterns, search_patterns) for u in all_urls_to_check]
             
-            for i, future in enumerate(asyncio.as_completed(tasks)):
-                if  self.stopped: break
+                for i, future in enumerate(asyncio.as_completed(tasks)):
+                    if  self.stopped: break
                 
-                result = await future
-                if result:
-                    if result['type'] == 'success':
-                        if ws_main:  # Only append if Excel is being used
-                            ws_main.append(result['main_data'])
-                    elif result['type'] == 'error' and ws_errors:
-                        ws_errors.append(result['error_data'])
-
-                progress = int((i + 1) / total_urls * 100) if total_urls > 0 else 100
-                self.progress_update.emit(progress)
-                self.log_update.emit(f"Processed {i + 1}/{total_urls} URLs")
+                    result = await future
+                    if result:
+                        if result['type'] == 'success':
+                            if ws_main:  # Only append if Excel is being used
+                                ws_main.append(result['main_data'])
+                            if dup_index is not None:
+                                dup_index.add_page(result['url'], result.get('fields'))
+                            if catalog is not None and result.get('catalog'):
+                                catalog_batch.append(result['catalog'])
+                                if len(catalog_batch) >= 200:
+                                    catalog.upsert_many(catalog_batch)
+                                    catalog.commit()
+                                    catalog_batch.clear()
+                        elif result['type'] == 'error' and ws_errors:
+                            ws_errors.append(result['error_data'])
+
+                    progress = int((i + 1) / total_urls * 100) if total_urls > 0 else 100
+                    self.progress_update.emit(progress)
+                    self.log_update.emit(f"Processed {i + 1}/{total_urls} URLs")
+
+            if catalog is not None:
+                catalog.upsert_many(catalog_batch)
+                catalog_batch.clear()
+                shared = catalog.shared_gtins()
+                self.log_update.emit(f"Product catalog updated: {catalog.count()} record(s), "
+                                     f"{len(shared)} GTIN(s) shared by several URLs")
+        finally:
+            # Records still batched when the crawl fails are kept too
+            if catalog is not None:
+                catalog.upsert_many(catalog_batch)
+                catalog.close()
 
         if not self.stopped:
+            if wb_main and dup_index is not None:
+                self.log_update.emit("Detecting duplicate titles, descriptions and H1s...")
+                dup_rows = dup_index.write_sheet(wb_main, "Duplicates")
+                self.log_update.emit(f"Duplicates sheet: {dup_rows} row(s)")
             if wb_main:  # Only save if Excel was created
                 self.log_update.emit("Saving results to Excel files...")
                 wb_main.save(main_filename)
@@ -197,20 +244,28 @@ class CrawlerThread(QThread):
                     soup = BeautifulSoup(html, 'lxml')
                     result = {'type': 'success', 'url': url, 'soup': soup}
                     row_data = [url]
+                    fields = {}  # raw values used for duplicate detection
+                    duplicates = self.extract_options.get("duplicates")
                     
                     # 1. H1 Tag (<h1>) - Now First
-                    if self.extract_options.get("h1"):
+                    if self.extract_options.get("h1") or duplicates:
                         h1 = soup.find("h1")
-                        row_data.append(h1.get_text(strip=True) if h1 else "No H1")
+                        fields["h1"] = h1.get_text(strip=True) if h1 else ""
+                        if self.extract_options.get("h1"):
+                            row_data.append(fields["h1"] or "No H1")
 
                     # 2. Page Title (<title>) - Renamed to Meta Title
-                    if self.extract_options.get("title"):
-                        row_data.append(soup.title.string.strip() if soup.title and soup.title.string else "No title")
+                    if self.extract_options.get("title") or duplicates:
+                        fields["title"] = soup.title.string.strip() if soup.title and soup.title.string else ""
+                        if self.extract_options.get("title"):
+                            row_data.append(fields["title"] or "No title")
                     
                     # 3. Meta Description (Standard <meta name="description">)
-                    if self.extract_options.get("meta_description"):
+                    if self.extract_options.get("meta_description") or duplicates:
                         meta = soup.find("meta", attrs={"name": "description"})
-                        row_data.append(meta["content"] if meta and meta.get("content") else "No meta description")
+                        fields["meta_description"] = meta["content"] if meta and meta.get("content") else ""
+                        if self.extract_options.get("meta_description"):
+                            row_data.append(fields["meta_description"] or "No meta description")
                     
                     # 4. OG Tags (Title, Description, Image)
                     if self.extract_options.get("og_tags"):
@@ -227,16 +282,23 @@ class CrawlerThread(QThread):
                         row_data.append(og_i_val)
                     
                     # 5. Schema JSON-LD
+                    data = product = None
+                    if self.extract_options.get("schema") or self.extract_options.get("catalog"):
+                        data = parse_structured_data(html)
+                        product = data.product_info()
                     if self.extract_options.get("schema"):
-                        schemas = soup.find_all("script", type="application/ld+json")
-                        if schemas:
-                            # Join multiple schemas with a separator
-                            schema_texts = [s.string.strip() for s in schemas if s.string]
-                            full_schema = "\n---\n".join(schema_texts)
-                            # Truncate if too long for Excel
-                            row_data.append(full_schema[:MAX_EXCEL_CELL_LENGTH])
-                        else:
-                            row_data.append("No Schema")
+                        offer = product["offers"][0] if product["offers"] else {}
+                        types = ", ".join(data.types()) or ("Invalid Schema" if data.errors else "No Schema")
+                        row_data.extend([
+                            types[:MAX_EXCEL_CELL_LENGTH],
+                            product["id"],
+                            product["sku"],
+                            product["gtin"],
+                            offer.get("price", ""),
+                            offer.get("currency", ""),
+                            offer.get("availability", ""),
+                            data.errors,
+                        ])
 
                     # Removed "All Meta Tags" blob extraction
 
@@ -252,7 +314,22 @@ class CrawlerThread(QThread):
                         found_words = [p.pattern for p in search_patterns if p.search(text)]
                         row_data.append(', '.join(found_words) if found_words else "None")
 
+                    if self.extract_options.get("catalog") and data.product() is not None:
+                        canonical = soup.find("link", rel="canonical")
+                        canonical_href = (canonical.get("href") or "").strip() if canonical else ""
+                        result['catalog'] = {
+                            "url": url,
+                            "product_id": product["id"],
+                            "gtin": product["gtin"],
+                            "sku": product["sku"],
+                            "name": product["name"],
+                            "canonical_url": urljoin(url, canonical_href) if canonical_href else "",
+                            "final_url": str(response.url),
+                            "status": response.status,
+                        }
+
                     result['main_data'] = row_data
+                    result['fields'] = fields
                     return result
                 else:
                     self.log_update.emit(f"Non-200 status for {url}: {response.status}")
@@ -268,211 +345,12 @@ class CrawlerThread(QThread):
     def _save_to_docx(self, url, soup, output_folder):
         """
         Generate a structured Word document from the crawled HTML.
-        Detects Drupal blocks and preserves HTML hierarchy.
+        Detects Drupal blocks and components, keeping the page order.
         """
         try:
-            # Sanitize URL for filename
-            safe_filename = re.sub(r'[<>:"/\\|?*]', '_', url)
-            safe_filename = safe_filename[:100]  # Limit length
-            docx_filename = os.path.join(output_folder, f"{safe_filename}.docx")
-            
-            doc = Document()
-            
-            # Add URL header
-            title = doc.add_paragraph()
-            title.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-            run = title.add_run(f"Source: {url}")
-            run.bold = True
-            run.font.size = Pt(14)
-            run.font.color.rgb = RGBColor(0, 112, 192)
-            
-            doc.add_paragraph()  # Spacing
-            
-            # Process the main content area
-            main_content = soup.find('main') or soup.find('body')
-            
-            if main_content:
-                self._process_element(doc, main_content, level=0)
-            else:
-                doc.add_paragraph("No main content found.")
-            
-            doc.save(docx_filename)
-            self.log_update.emit(f"Saved Word document: {safe_filename}.docx")
-            
+            model = CrawlerPageExtractor(url, log=self.log_update.emit).extract(soup)
+            filename = docx_filename_for(url)
+            render_docx(model).save(os.path.join(output_folder, filename))
+            self.log_update.emit(f"Saved Word document: {filename}")
         except Exception as e:
             self.log_update.emit(f"Error saving Word document for {url}: {e}")
-    
-    def _process_element(self, doc, element, level=0):
-        """
-        Recursively process HTML elements and add to Word document.
-        Detects Drupal blocks and maintains hierarchy.
-        """
-        # Skip script, style, nav, footer elements
-        if element.name in ['script', 'style', 'nav', 'footer', 'header', 'noscript']:
-            return
-        
-        # Detect Drupal blocks
-        is_drupal_block = False
-        block_id = None
-        
-        if element.name in ['div', 'section', 'article']:
-            # Check for Drupal block markers
-            classes = element.get('class', [])
-            if 'block' in classes:
-                is_drupal_block = True
-                block_id = element.get('data-block-plugin-id') or element.get('id') or 'unknown'
-            
-            # Generic Component Detection
-            # Matches: component--*, article--hero, hero--image
-            component_name = None
-            for cls in classes:
-                if cls.startswith('component--'):
-                    component_name = cls.replace('component--', '').replace('-', ' ').title()
-                    break
-                elif cls == 'article--hero':
-                    component_name = "Hero Article"
-                    break
-                elif cls == 'hero--image':
-                    component_name = "Hero Image"
-                    break
-            
-            if component_name:
-                self._process_special_component(doc, element, component_name)
-                return  # Skip default processing for this component
-        
-        # If it's a Drupal block, add a marker
-        if is_drupal_block:
-            block_marker = doc.add_paragraph()
-            run = block_marker.add_run(f"[DRUPAL BLOCK: {block_id}]")
-            run.font.size = Pt(9)
-            run.font.color.rgb = RGBColor(128, 128, 128)
-            run.italic = True
-        
-        # Process based on tag type
-        if element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-            # Headings
-            heading_level = int(element.name[1])
-            text = element.get_text(strip=True)
-            if text:
-                heading = doc.add_heading(text, level=heading_level)
-        
-        elif element.name == 'p':
-            # Paragraphs
-            text = element.get_text(strip=True)
-            if text and len(text) > 1:  # Avoid empty paragraphs
-                doc.add_paragraph(text)
-        
-        elif element.name in ['ul', 'ol']:
-            # Lists
-            for li in element.find_all('li', recursive=False):
-                text = li.get_text(strip=True)
-                if text:
-                    doc.add_paragraph(text, style='List Bullet' if element.name == 'ul' else 'List Number')
-        
-        elif element.name == 'table':
-            # Tables
-            self._process_table(doc, element)
-        
-        else:
-            # Process children for div, section, article, etc.
-            for child in element.children:
-                if isinstance(child, Tag):
-                    self._process_element(doc, child, level + 1)
-                elif isinstance(child, NavigableString):
-                    text = str(child).strip()
-                    if len(text) > 20:  # Only add significant text chunks
-                        doc.add_paragraph(text)
-    
-    def _process_table(self, doc, table_element):
-        """Process HTML table and add to Word document."""
-        try:
-            rows = table_element.find_all('tr')
-            if not rows:
-                return
-            
-            # Determine column count
-            col_count = max(len(row.find_all(['td', 'th'])) for row in rows)
-            
-            # Create Word table
-            word_table = doc.add_table(rows=len(rows), cols=col_count)
-            word_table.style = 'Light Grid Accent 1'
-            
-            for i, row in enumerate(rows):
-                cells = row.find_all(['td', 'th'])
-                for j, cell in enumerate(cells):
-                    if j < col_count:
-                        text = cell.get_text(strip=True)
-                        word_table.rows[i].cells[j].text = text
-                        
-                        # Bold header cells
-                        if cell.name == 'th':
-                            for paragraph in word_table.rows[i].cells[j].paragraphs:
-                                for run in paragraph.runs:
-                                    run.bold = True
-        except Exception as e:
-            self.log_update.emit(f"Error processing table: {e}")
-
-    def _process_special_component(self, doc, element, component_name):
-        """
-        Generic handler for special components (Hero, Text-Image, Contact, etc.).
-        Attempts to extract main image and text content and present them in a structured table.
-        """
-        try:
-            # Add a marker
-            marker = doc.add_paragraph()
-            run = marker.add_run(f"[COMPONENT: {component_name}]")
-            run.font.size = Pt(9)
-            run.font.color.rgb = RGBColor(100, 100, 100)
-            run.italic = True
-
-            # Create 2-column table for structured layout
-            table = doc.add_table(rows=1, cols=2)
-            table.style = 'Table Grid'
-            
-            # --- Extract Image ---
-            img_tag = element.find('img')
-            img_url = "No image found"
-            if img_tag:
-                img_url = img_tag.get('src', '')
-                # Basic relative URL handling could go here
-            
-            # --- Extract Text ---
-            # Heuristic: Get all text, but skip the image caption if it duplicates
-            # We'll use a separator to join multiple text parts
-            text_parts = []
-            
-            # Try specific text containers first
-            text_containers = element.find_all(class_=re.compile(r'(summary|text|desc|body|content)'))
-            if text_containers:
-                for container in text_containers:
-                    t = container.get_text(strip=True)
-                    if t and len(t) > 10: text_parts.append(t)
-            else:
-                # Fallback: Get direct text from paragraphs or headings
-                for tag in element.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                    t = tag.get_text(strip=True)
-                    if t: text_parts.append(t)
-            
-            # Deduplicate and join
-            summary_text = "\n\n".join(list(dict.fromkeys(text_parts))) # simple dedup
-            if not summary_text:
-                summary_text = element.get_text(separator=' ', strip=True)[:500] # Ultimate fallback
-            
-            # --- Fill Table ---
-            # Cell 0: Image Info
-            cell_img = table.rows[0].cells[0]
-            p_img = cell_img.paragraphs[0]
-            if img_tag:
-                p_img.add_run("IMAGE:\n").bold = True
-                p_img.add_run(img_url)
-            else:
-                p_img.add_run("No Image").italic = True
-            
-            # Cell 1: Text Content
-            cell_text = table.rows[0].cells[1]
-            cell_text.text = summary_text
-            
-            doc.add_paragraph() # Spacing after component
-            
-        except Exception as e:
-            self.log_update.emit(f"Error processing component {component_name}: {e}")
@@ -9,40 +9,88 @@ This module contains worker threads for:
 
 import os
 import asyncio
+from collections import Counter
+
 import aiohttp
-import pandas as pd
-import requests
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
-from PIL import Image
 from openpyxl import Workbook
 from PyQt6.QtCore import QThread, pyqtSignal
 
 # Import from our modules
-from config import HEADERS
+from config import (
+    HEADERS, MAX_CONCURRENCY_IMAGE_PAGES, MAX_CONCURRENCY_IMAGES, MAX_CONCURRENCY_PER_HOST, SUPPORTED_IMAGE_FORMATS,
+    IMAGE_MAX_DOWNLOAD_MB, IMAGE_DOWNLOAD_RETRIES, IMAGE_STORE_DIR, IMAGE_SRCSET_POLICY, TIMEOUT_SHORT, TIMEOUT_STANDARD
+)
 from utils.helpers import sanitize_filename
+from utils.image_compression import CompressResult, CompressionEngine, describe_savings
+from utils.image_downloads import DownloadError, TransferRate, fetch_to_file, stream_to_file
+from utils.image_store import ImageStore, link_or_copy
+from utils.srcset import image_candidates, parse_policy
+from utils.excel_readers import image_url_items, open_image_url_sheet
+from utils.streaming import iterate_in_thread, run_bounded
 
 
 class AllImagesDownloaderThread(QThread):
     """
     Worker thread to scrape all images from URLs, download them, create metadata Excel files,
     and optionally compress the downloaded images.
+
+    The work runs as a pipeline: up to `page_concurrency` pages are fetched and
+    parsed at once, the image downloads of all pages share one pool of
+    `image_concurrency` connections, and each downloaded image is compressed
+    in a process pool (`processes`) while the downloads continue.
+    `stage_progress` reports each stage ("pages", "images", "compressed")
+    as done / total, with totals growing as pages reveal their images.
+
+    Images are streamed to disk in chunks and renamed into place when
+    complete; downloads over `max_image_mb` are aborted, and with
+    `verify_checksums` a Content-MD5 sent by the server must match.
+
+    Downloads go through a content-addressed ImageStore (`store_dir`): each
+    image URL is fetched once per run however many pages use it, URLs seen in
+    earlier runs are revalidated with a conditional request, and each distinct
+    image is compressed once per format and quality. Page folders get hard
+    links to the stored files, and the metadata sheet records their SHA-256.
+
+    Responsive images (`srcset`, `<picture>` sources) contribute only the
+    candidate chosen by `srcset_policy` ("largest", "smallest", "<N>w",
+    "<N>x" or "all"; see utils.srcset).
     """
     progress = pyqtSignal(int, str)  # Percentage, status_text
+    stage_progress = pyqtSignal(str, int, int)  # stage, done, total
     finished = pyqtSignal(str)
     log = pyqtSignal(str)
 
-    def __init__(self, urls, save_folder, auth, compress_options):
+    STAGES = ("pages", "images", "compressed")
+
+    def __init__(self, urls, save_folder, auth, compress_options,
+                 page_concurrency: int = MAX_CONCURRENCY_IMAGE_PAGES,
+                 image_concurrency: int = MAX_CONCURRENCY_IMAGES, processes: int = None,
+                 max_image_mb: float = IMAGE_MAX_DOWNLOAD_MB, verify_checksums: bool = True,
+                 store_dir: str = IMAGE_STORE_DIR, srcset_policy: str = IMAGE_SRCSET_POLICY):
         super().__init__()
         self.urls = urls
         self.save_folder = save_folder
         self.auth = auth
         self.compress_options = compress_options
+        self.page_concurrency = page_concurrency
+        self.image_concurrency = image_concurrency
+        self.processes = processes or max(1, (os.cpu_count() or 2) - 1)
+        self.max_image_bytes = int(max_image_mb * 1024 * 1024) if max_image_mb else None
+        self.verify_checksums = verify_checksums
+        self.store_dir = store_dir
+        self.srcset_policy = parse_policy(srcset_policy)  # ValueError for an unknown policy
         self.is_stopped = False
+        self._counts = {}
+        self._percent = 0
+        self._engine = None
 
     def stop(self):
         self.log.emit("Stopping process...")
         self.is_stopped = True
+        if self._engine is not None:
+            self._engine.cancel()
 
     def run(self):
         try:
@@ -52,138 +100,262 @@ class AllImagesDownloaderThread(QThread):
         self.finished.emit("Completed" if not self.is_stopped else "Stopped")
 
     async def main_downloader(self):
-        async with aiohttp.ClientSession(headers=HEADERS, auth=self.auth) as session:
-            total_urls = len(self.urls)
-            for i, url in enumerate(self.urls):
-                if self.is_stopped:
-                    break
-                status = f"Processing URL {i+1}/{total_urls}: {url}"
-                self.progress.emit(int((i / total_urls) * 100), status)
-                await self.process_url(session, url.strip())
-        
+        urls = [u.strip() for u in self.urls if u.strip()]
+        self._counts = {stage: [0, 0] for stage in self.STAGES}
+        self._percent = 0
+        self._advance("pages", total=len(urls))
+        self._image_slots = asyncio.Semaphore(max(1, self.image_concurrency))
+        self._compress_tasks = []
+        self._used_folders = set()
+        self._objects = {}  # image URL -> Task resolving to a StoredImage or None
+        self._variants = {}  # content sha256 -> Task resolving to the compressed variant path
+        self._store_stats = Counter()
+        self._store = ImageStore(self.store_dir)
+
+        if self.compress_options['enabled']:
+            self._engine = CompressionEngine(
+                self.compress_options['format'], self.compress_options['quality'], self.processes
+            )
+        connector = aiohttp.TCPConnector(limit=self.page_concurrency + self.image_concurrency)
+        try:
+            async with aiohttp.ClientSession(headers=HEADERS, auth=self.auth, connector=connector) as session:
+                async def source():
+                    for url in urls:
+                        yield url
+
+                async def handle(url):
+                    await self.process_url(session, url)
+                    self._advance("pages", done=1)
+
+                await run_bounded(source(), handle, self.page_concurrency, should_stop=lambda: self.is_stopped)
+            # Let the compression stage drain
+            if self._compress_tasks:
+                await asyncio.gather(*self._compress_tasks)
+        finally:
+            if self._engine is not None:
+                self._engine.close()
+                self._engine = None
+            self._store.close()
+
+        stats = self._store_stats
+        self.log.emit(
+            f"Image store: {stats['downloaded']} downloaded, {stats['unchanged']} unchanged since the last run, "
+            f"{stats['shared']} shared between pages; {stats['compressed']} compressed, "
+            f"{stats['compressed_reused']} compressions reused"
+        )
         if not self.is_stopped:
             self.progress.emit(100, "All URLs processed.")
             self.log.emit("Download and extraction completed.")
 
+    def _advance(self, stage, done=0, total=0):
+        """Update a stage counter and emit the per-stage and overall progress."""
+        counts = self._counts[stage]
+        counts[0] += done
+        counts[1] += total
+        self.stage_progress.emit(stage, counts[0], counts[1])
+        stages = [s for s in self.STAGES if self._counts[s][1]]
+        # Overall: mean of the stage ratios; never moves backwards when new images are found
+        ratio = sum(self._counts[s][0] / self._counts[s][1] for s in stages) / max(len(stages), 1)
+        self._percent = max(self._percent, min(99, int(ratio * 100)))
+        status = " · ".join(f"{s.capitalize()} {self._counts[s][0]}/{self._counts[s][1]}" for s in stages)
+        self.progress.emit(self._percent, status)
+
+    def _page_folder(self, page_title):
+        """Folder for a page, suffixed when another page of this run has the same title."""
+        name = page_title
+        n = 2
+        while name in self._used_folders:
+            name = f"{page_title} ({n})"
+            n += 1
+        self._used_folders.add(name)
+        return os.path.join(self.save_folder, name), name
+
+    @staticmethod
+    def _parse_page(html, url, srcset_policy=IMAGE_SRCSET_POLICY):
+        soup = BeautifulSoup(html, 'html.parser')
+        page_title = sanitize_filename(soup.title.string if soup.title and soup.title.string else "Untitled")
+        return page_title, AllImagesDownloaderThread._extract_img_sources(soup, url, srcset_policy)
+
     async def process_url(self, session, url):
         try:
             async with session.get(url, ssl=False, timeout=30) as response:
                 if response.status != 200:
                     self.log.emit(f"Failed to fetch {url}: Status {response.status}")
                     return
-
                 html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                page_title = sanitize_filename(soup.title.string if soup.title else "Untitled")
-                url_folder = os.path.join(self.save_folder, page_title)
-                originals_folder = os.path.join(url_folder, "Originals")
-                os.makedirs(originals_folder, exist_ok=True)
-
-                workbook = Workbook()
-                ws = workbook.active
-                ws.title = "Image Data"
-                ws.append(["Image URL", "Alt Text", "Title", "Local Filename"])
-
-                img_sources = self._extract_img_sources(soup, url)
-                self.log.emit(f"Found {len(img_sources)} images on {url}")
-
-                download_tasks = []
-                for src, img_name, alt, title in img_sources:
-                    if self.is_stopped:
-                        break
-                    local_path = os.path.join(originals_folder, img_name)
-                    ws.append([src, alt, title, img_name])
-                    download_tasks.append(self._download_image(session, src, local_path))
-                
-                await asyncio.gather(*download_tasks)
-
-                excel_path = os.path.join(url_folder, f"{page_title}_Image_Data.xlsx")
-                workbook.save(excel_path)
-                self.log.emit(f"Metadata saved to {excel_path}")
-                
-                # --- Compression Step ---
-                if self.compress_options['enabled'] and not self.is_stopped:
-                    self.log.emit(f"Starting compression for images from {url}...")
-                    self._compress_images(
-                        source_dir=originals_folder,
-                        output_dir=os.path.join(url_folder, "Compressed"),
-                        fmt=self.compress_options['format'],
-                        quality=self.compress_options['quality']
-                    )
+
+            # Parse off the event loop so running downloads are not held up
+            loop = asyncio.get_running_loop()
+            page_title, img_sources = await loop.run_in_executor(None, self._parse_page, html, url, self.srcset_policy)
+            url_folder, folder_name = self._page_folder(page_title)
+            originals_folder = os.path.join(url_folder, "Originals")
+            compressed_folder = os.path.join(url_folder, "Compressed")
+            os.makedirs(originals_folder, exist_ok=True)
+
+            workbook = Workbook()
+            ws = workbook.active
+            ws.title = "Image Data"
+            ws.append(["Image URL", "Alt Text", "Title", "Local Filename", "SHA-256", "Stored File"])
+
+            self.log.emit(f"Found {len(img_sources)} images on {url}")
+
+            downloads = {}  # one download per image URL of the page
+            for src, img_name, alt, title in img_sources:
+                downloads.setdefault(src, os.path.join(originals_folder, img_name))
+            self._advance("images", total=len(downloads))
+
+            stored = await asyncio.gather(*(
+                self._download_and_queue(session, src, local_path, compressed_folder)
+                for src, local_path in downloads.items()
+            ))
+            stored = dict(zip(downloads, stored))
+            self._store.commit()
+
+            for src, img_name, alt, title in img_sources:
+                obj = stored.get(src)
+                ws.append([src, alt, title, img_name, obj.sha256 if obj else "", obj.path if obj else ""])
+
+            excel_path = os.path.join(url_folder, f"{folder_name}_Image_Data.xlsx")
+            workbook.save(excel_path)
+            self.log.emit(f"Metadata saved to {excel_path}")
 
         except Exception as e:
             self.log.emit(f"Error processing {url}: {e}")
 
-    def _extract_img_sources(self, soup, base_url):
+    @staticmethod
+    def _extract_img_sources(soup, base_url, srcset_policy=IMAGE_SRCSET_POLICY):
         sources = set()
-        for tag in soup.find_all(['img', 'source']):
-            alt = tag.get('alt', '').strip()
-            title = tag.get('title', '').strip()
-            
-            src_attrs = [tag.get('src'), tag.get('data-src')]
-            if tag.get('srcset'):
-                src_attrs.extend([s.strip().split(' ')[0] for s in tag.get('srcset').split(',')])
-
-            for src in src_attrs:
-                if src:
-                    resolved_url = urljoin(base_url, src.strip())
-                    img_name = sanitize_filename(os.path.basename(urlparse(resolved_url).path))
-                    if img_name and '.' in img_name:
-                         sources.add((resolved_url, img_name, alt, title))
-        return list(sources)
-
-    async def _download_image(self, session, url, local_path):
+        for resolved_url, img in image_candidates(soup, base_url, srcset_policy):
+            alt = img.get('alt', '').strip() if img is not None else ''
+            title = img.get('title', '').strip() if img is not None else ''
+            img_name = sanitize_filename(os.path.basename(urlparse(resolved_url).path))
+            if img_name and '.' in img_name:
+                sources.add((resolved_url, img_name, alt, title))
+        return sorted(sources)
+
+    async def _download_and_queue(self, session, url, local_path, compressed_folder):
+        """Get one image from the store (downloading it once per run), link it into the page and queue compression."""
+        if self.is_stopped:
+            return None
+        task = self._objects.get(url)
+        if task is None:
+            task = self._objects[url] = asyncio.ensure_future(
+                self._fetch_object(session, url, os.path.basename(local_path))
+            )
+        else:
+            self._store_stats["shared"] += 1
+        stored = await task
+        self._advance("images", done=1)
+        if stored is None or self.is_stopped:
+            return stored
         try:
-            async with session.get(url, ssl=False) as response:
+            link_or_copy(stored.path, local_path)
+        except OSError as e:
+            self.log.emit(f"Could not save {os.path.basename(local_path)}: {e}")
+            return stored
+        if self._engine is not None and local_path.lower().endswith(SUPPORTED_IMAGE_FORMATS):
+            self._advance("compressed", total=1)
+            self._compress_tasks.append(asyncio.ensure_future(self._compress(stored, local_path, compressed_folder)))
+        return stored
+
+    async def _fetch_object(self, session, url, filename):
+        async with self._image_slots:
+            if self.is_stopped:
+                return None
+            return await self._download_image(session, url, filename)
+
+    async def _download_image(self, session, url, filename):
+        """Download `url` into the store, or revalidate the stored copy; returns a StoredImage or None."""
+        known = self._store.lookup(url)
+        try:
+            async with session.get(url, ssl=False, headers=ImageStore.conditional_headers(known)) as response:
+                if response.status == 304 and known:
+                    self._store.touch(url)
+                    self._store_stats["unchanged"] += 1
+                    self.log.emit(f"Unchanged: {filename}")
+                    return known
                 if response.status == 200:
-                    with open(local_path, "wb") as f:
-                        f.write(await response.read())
-                    self.log.emit(f"Downloaded: {os.path.basename(local_path)}")
+                    result = await stream_to_file(
+                        response, self._store.incoming_path(), max_bytes=self.max_image_bytes,
+                        verify_content_md5=self.verify_checksums,
+                    )
+                    stored = self._store.add(
+                        url, result.path, result.sha256, result.size, os.path.splitext(filename)[1].lower(),
+                        response.headers.get("ETag", ""), response.headers.get("Last-Modified", ""),
+                    )
+                    self._store_stats["downloaded"] += 1
+                    self.log.emit(f"Downloaded: {filename}")
+                    return stored
                 else:
                     self.log.emit(f"Failed download for {url}: Status {response.status}")
+        except DownloadError as e:
+            self.log.emit(f"Rejected download for {url}: {e}")
         except Exception as e:
             self.log.emit(f"Error downloading {url}: {e}")
+        return None
 
-    def _compress_images(self, source_dir, output_dir, fmt, quality):
-        os.makedirs(output_dir, exist_ok=True)
-        supported = ('.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp', '.avif')
-        format_map = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG', 'webp': 'WEBP', 'gif': 'GIF', 'avif': 'AVIF'}
-        save_format = format_map.get(fmt.lower(), 'JPEG')
-
-        for filename in os.listdir(source_dir):
+    async def _compress(self, stored, local_path, output_dir):
+        """Compression stage: link the image's compressed variant into the page, compressing it once."""
+        filename = os.path.basename(local_path)
+        fmt = self.compress_options['format'].lower()
+        try:
             if self.is_stopped:
-                break
-            if not filename.lower().endswith(supported):
-                continue
-
-            img_path = os.path.join(source_dir, filename)
-            self.log.emit(f"Compressing {filename}")
-            try:
-                with Image.open(img_path) as img:
-                    base_name = os.path.splitext(filename)[0]
-                    output_path = os.path.join(output_dir, f"{base_name}.{fmt.lower()}")
-                    
-                    if img.mode in ('P', 'RGBA') and save_format not in ['PNG', 'WEBP', 'AVIF']:
-                        img = img.convert('RGB')
-                    
-                    save_options = {'format': save_format, 'optimize': True}
-                    if save_format in ['JPEG', 'WEBP']:
-                        save_options['quality'] = quality
-                    img.save(output_path, **save_options)
-            except Exception as e:
-                self.log.emit(f"Could not compress {filename}: {e}")
+                return
+            task = self._variants.get(stored.sha256)
+            if task is None:
+                task = self._variants[stored.sha256] = asyncio.ensure_future(self._compress_object(stored))
+            result = await task
+            if result is None:  # cancelled
+                return
+            os.makedirs(output_dir, exist_ok=True)
+            link_or_copy(result.output, os.path.join(output_dir, f"{os.path.splitext(filename)[0]}.{fmt}"))
+            self.log.emit(f"Compressed {filename}: {describe_savings(result)}")
+        except Exception as e:
+            self.log.emit(f"Could not compress {filename}: {e}")
+        finally:
+            self._advance("compressed", done=1)
+
+    async def _compress_object(self, stored):
+        """
+        CompressResult for the compressed variant of a stored image (None if cancelled),
+        re-encoded by the engine unless already in the store.
+        """
+        path = self._store.variant_path(stored.sha256, self._engine.fmt, self._engine.quality)
+        if os.path.exists(path):
+            self._store_stats["compressed_reused"] += 1
+            return CompressResult(stored.path, path, stored.size, os.path.getsize(path), None)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        result = await self._engine.compress(stored.path, path)
+        if result is not None and result.error:
+            raise RuntimeError(result.error)
+        if result is not None:
+            self._store_stats["compressed"] += 1
+        return result
 
 
 class ImageProcessorThread(QThread):
     """
     A worker thread for downloading (from Excel/URL list) and/or compressing images.
+
+    Downloads run on one aiohttp session: `concurrency` at once, at most
+    `per_host` connections per host, transient failures retried (`retries`).
+    `download_progress` carries the percentage of URLs done and status
+    messages include the MB/s and files/s rates.
+    Compression runs in a CompressionEngine process pool (`processes`) and
+    reports each file's byte savings; stop() cancels the queued files.
+    With `max_kb`, each image gets the highest quality (up to `quality`)
+    that fits the budget, and a Compression_Report.xlsx lists the chosen
+    quality per file.
     """
     download_progress = pyqtSignal(int)
     compress_progress = pyqtSignal(int)
     status_update = pyqtSignal(str)
     finished_processing = pyqtSignal(str)
 
-    def __init__(self, mode, excel_path, urls, source_folder, output_folder, image_format, quality):
+    def __init__(self, mode, excel_path, urls, source_folder, output_folder, image_format, quality,
+                 processes: int = None, max_kb: int = None, concurrency: int = MAX_CONCURRENCY_IMAGES,
+                 per_host: int = MAX_CONCURRENCY_PER_HOST, retries: int = IMAGE_DOWNLOAD_RETRIES,
+                 max_image_mb: float = IMAGE_MAX_DOWNLOAD_MB):
         super().__init__()
         self.mode = mode
         self.excel_path = excel_path
@@ -192,11 +364,20 @@ class ImageProcessorThread(QThread):
         self.output_folder = output_folder
         self.image_format = image_format
         self.quality = quality
+        self.processes = processes
+        self.max_kb = max_kb
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.retries = retries
+        self.max_image_bytes = int(max_image_mb * 1024 * 1024) if max_image_mb else None
         self.stop_processing_flag = False
+        self._engine = None
 
     def stop(self):
         self.status_update.emit("Stopping process...")
         self.stop_processing_flag = True
+        if self._engine is not None:
+            self._engine.cancel()
 
     def run(self):
         try:
@@ -230,88 +411,144 @@ class ImageProcessorThread(QThread):
 
     def _download_from_excel(self, output_dir):
         os.makedirs(output_dir, exist_ok=True)
-        df = pd.read_excel(self.excel_path, sheet_name=0)
-        if df.empty:
-            return
-        
-        url_column = df.columns[0]
-        total = len(df)
-        for i, row in df.iterrows():
-            if self.stop_processing_flag:
-                break
-            url = str(row[url_column]).strip()
-            if not url:
-                continue
-            if not url.startswith(('http://', 'https://')):
-                url = 'https://' + url
-            self._download_file(url, output_dir)
-            self.download_progress.emit(int((i + 1) / total * 100))
+        # Only the URL column is read, lazily: downloads start with the first rows
+        stream = open_image_url_sheet(self.excel_path)
+        asyncio.run(self._download_many(image_url_items(stream), output_dir, stream.data_rows_hint))
 
     def _download_from_urls(self, output_dir):
         os.makedirs(output_dir, exist_ok=True)
-        total = len(self.urls)
-        for i, url in enumerate(self.urls):
-            if self.stop_processing_flag:
-                break
-            self._download_file(url, output_dir)
-            self.download_progress.emit(int((i + 1) / total * 100))
-
-    def _download_file(self, url, output_dir):
-        try:
-            filename = sanitize_filename(os.path.basename(urlparse(url).path))
-            if not filename:
-                return
-            
-            self.status_update.emit(f"Downloading: {filename}")
-            response = requests.get(url, stream=True, verify=False, timeout=10)
-            if response.status_code == 200:
-                with open(os.path.join(output_dir, filename), 'wb') as f:
-                    for chunk in response.iter_content(8192):
-                        if self.stop_processing_flag:
-                            return
-                        f.write(chunk)
+        urls = list(dict.fromkeys(u.strip() for u in self.urls if u and u.strip()))
+        if urls:
+            asyncio.run(self._download_many(urls, output_dir, len(urls)))
+
+    async def _download_many(self, urls, output_dir, total_hint=None):
+        """
+        Download `urls` (any iterable, read off the event loop as needed) into `output_dir`
+        with bounded concurrency, reporting progress and rates.
+
+        `total_hint` sizes the progress bar until the source is exhausted.
+        """
+        rate = TransferRate()
+        done = failed = queued = 0
+        exhausted = False
+        used_names = set()
+
+        async def source():
+            nonlocal queued, exhausted
+            async for url in iterate_in_thread(urls):
+                queued += 1
+                filename = self._unique_filename(url, used_names)
+                yield url, os.path.join(output_dir, filename) if filename else None
+            exhausted = True
+
+        async def handle(item):
+            url, path = item
+            if path is None:
+                return None
+            return await self._download_file(session, url, path)
+
+        def on_result(item, size):
+            nonlocal done, failed
+            done += 1
+            if size is None:
+                failed += 1
             else:
-                self.status_update.emit(f"Failed to download {filename} (status: {response.status_code})")
+                rate.add(size)
+            total = queued if exhausted else max(total_hint or 0, queued)
+            self.download_progress.emit(int(done / total * 100))
+            self.status_update.emit(f"Downloaded {rate.files}/{total} · {rate.describe()}")
+
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host, ssl=False)
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=TIMEOUT_SHORT, sock_read=TIMEOUT_STANDARD)
+        async with aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=timeout) as session:
+            await run_bounded(source(), handle, self.concurrency, on_result=on_result,
+                              should_stop=lambda: self.stop_processing_flag)
+
+        self.status_update.emit(
+            f"Downloaded {rate.files} of {queued} images ({rate.bytes / (1024 * 1024):.1f} MB, "
+            f"{rate.describe()}), {failed} failed"
+        )
+
+    @staticmethod
+    def _unique_filename(url, used_names):
+        """Sanitized file name of `url`, suffixed when another URL of the run has the same name."""
+        filename = sanitize_filename(os.path.basename(urlparse(url).path))
+        if not filename:
+            return None
+        stem, ext = os.path.splitext(filename)
+        name, n = filename, 2
+        while name.lower() in used_names:
+            name = f"{stem} ({n}){ext}"
+            n += 1
+        used_names.add(name.lower())
+        return name
+
+    async def _download_file(self, session, url, path):
+        """Download one image; returns its size in bytes, or None on failure."""
+        filename = os.path.basename(path)
+        try:
+            result = await fetch_to_file(session, url, path, retries=self.retries, max_bytes=self.max_image_bytes)
+            return result.size
+        except DownloadError as e:
+            self.status_update.emit(f"Failed to download {filename} ({e})")
         except Exception as e:
-            self.status_update.emit(f"Error downloading {url}: {e}")
+            self.status_update.emit(f"Error downloading {url}: {e or e.__class__.__name__}")
+        return None
 
     def _compress_images(self, source_dir):
         compressed_folder = os.path.join(self.output_folder, 'Compressed')
         os.makedirs(compressed_folder, exist_ok=True)
-        
-        supported = ('.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp', '.avif')
-        format_map = {'jpg': 'JPEG', 'jpeg': 'JPEG', 'png': 'PNG', 'webp': 'WEBP', 'gif': 'GIF', 'avif': 'AVIF'}
-        save_format = format_map.get(self.image_format.lower(), 'JPEG')
 
-        files_to_process = [os.path.join(r, f) for r, _, files in os.walk(source_dir) for f in files if f.lower().endswith(supported)]
+        files_to_process = [os.path.join(r, f) for r, _, files in os.walk(source_dir) for f in files if f.lower().endswith(SUPPORTED_IMAGE_FORMATS)]
         total = len(files_to_process)
         if total == 0:
             self.status_update.emit("No images found to compress.")
             return
 
-        for i, img_path in enumerate(files_to_process):
+        extension = self.image_format.lower()
+        jobs = (
+            (img_path, os.path.join(compressed_folder, f"{os.path.splitext(os.path.basename(img_path))[0]}.{extension}"))
+            for img_path in files_to_process
+        )
+        done = saved = 0
+        results = []
+        max_bytes = self.max_kb * 1024 if self.max_kb else None
+        with CompressionEngine(self.image_format, self.quality, self.processes, max_bytes=max_bytes) as engine:
+            self._engine = engine
             if self.stop_processing_flag:
-                break
-            filename = os.path.basename(img_path)
-            self.status_update.emit(f"Compressing {filename}")
-            
-            try:
-                with Image.open(img_path) as img:
-                    base_name = os.path.splitext(filename)[0]
-                    output_path = os.path.join(compressed_folder, f"{base_name}.{self.image_format.lower()}")
-                    
-                    if img.format == 'GIF' and save_format == 'GIF':
-                        img.save(output_path, save_all=True, append_images=img.n_frames > 1, optimize=False, loop=0)
-                        continue
-
-                    if img.mode in ('P', 'RGBA') and save_format not in ['PNG', 'WEBP', 'AVIF']:
-                        img = img.convert('RGB')
-                    
-                    save_options = {'format': save_format, 'optimize': True}
-                    if save_format in ['JPEG', 'WEBP']:
-                        save_options['quality'] = self.quality
-                    
-                    img.save(output_path, **save_options)
-            except Exception as e:
-                self.status_update.emit(f"Could not process {filename}: {e}")
-            self.compress_progress.emit(int((i + 1) / total * 100))
+                engine.cancel()
+            for result in engine.compress_all(jobs):
+                done += 1
+                filename = os.path.basename(result.source)
+                if result.error:
+                    self.status_update.emit(f"Could not process {filename}: {result.error}")
+                else:
+                    saved += result.original_size - result.compressed_size
+                    quality = f" at quality {result.quality}" if max_bytes and result.quality else ""
+                    self.status_update.emit(f"Compressed {filename}{quality}: {describe_savings(result)}")
+                results.append(result)
+                self.compress_progress.emit(int(done / total * 100))
+        self._engine = None
+        if max_bytes and results:
+            self._save_compression_report(results, max_bytes)
+        self.status_update.emit(f"Processed {done} of {total} images, {saved / (1024 * 1024):.1f} MB saved")
+
+    def _save_compression_report(self, results, max_bytes):
+        """Excel report of a target-size run: chosen quality and final size per file."""
+        workbook = Workbook()
+        ws = workbook.active
+        ws.title = "Compression"
+        ws.append(["File", "Output", "Original (KB)", "Final (KB)", "Quality", "Within Budget", "Note"])
+        for r in sorted(results, key=lambda r: r.source):
+            if r.error:
+                ws.append([os.path.basename(r.source), "", round(r.original_size / 1024, 1), "", "", "", r.error])
+                continue
+            note = "Original kept (re-encoding was larger)" if r.kept_original else ""
+            ws.append([
+                os.path.basename(r.source), os.path.basename(r.output), round(r.original_size / 1024, 1),
+                round(r.compressed_size / 1024, 1), r.quality if r.quality is not None else "",
+                "Yes" if r.compressed_size <= max_bytes else "No", note,
+            ])
+        path = os.path.join(self.output_folder, "Compression_Report.xlsx")
+        workbook.save(path)
+        self.status_update.emit(f"Report saved to {path}")
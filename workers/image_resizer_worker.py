@@ -0,0 +1,160 @@
+"""
+Image resizer worker thread.
+
+Resizes a batch of images in a process pool so the Image Resizer tab stays
+responsive, with live progress and cancellation. `ResponsiveSetThread`
+generates srcset families (several widths x formats per image) the same way
+and writes their manifest.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from utils.image_resize import resize_file, responsive_set, variant_stems
+from utils.streaming import map_in_pool
+
+
+class ImageResizerThread(QThread):
+    """
+    Worker thread resizing images across `processes` worker processes.
+
+    Args:
+        jobs: List of (input_path, output_path)
+        width, height: Target size
+        ratio: Optional height / width ratio overriding `height`
+        processes: Worker processes (default: CPU count - 1)
+
+    stop() cancels the files not started yet; `failures` lists
+    (filename, error) once the thread has finished.
+    """
+    progress = pyqtSignal(int)
+    status_update = pyqtSignal(str)
+    finished_processing = pyqtSignal(str)  # "Completed", "Stopped" or "Error"
+
+    def __init__(self, jobs, width, height, ratio=None, processes: int = None):
+        super().__init__()
+        self.jobs = list(jobs)
+        self.width = width
+        self.height = height
+        self.ratio = ratio
+        self.processes = processes or max(1, (os.cpu_count() or 2) - 1)
+        self.stop_processing_flag = False
+        self.done = 0
+        self.failures = []
+
+    def stop(self):
+        self.status_update.emit("Stopping process...")
+        self.stop_processing_flag = True
+
+    def run(self):
+        try:
+            self.resize_all()
+            self.finished_processing.emit("Stopped" if self.stop_processing_flag else "Completed")
+        except Exception as e:
+            self.status_update.emit(f"An error occurred: {e}")
+            self.finished_processing.emit("Error")
+
+    def resize_all(self):
+        total = len(self.jobs)
+        if not total:
+            return
+        processes = min(self.processes, total)
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            def submit(job):
+                return pool.submit(resize_file, job[0], job[1], self.width, self.height, self.ratio)
+
+            results = map_in_pool(submit, self.jobs, 2 * processes, should_stop=lambda: self.stop_processing_flag)
+            for result in results:
+                self.done += 1
+                filename = os.path.basename(result.source)
+                if result.error:
+                    self.failures.append((filename, result.error))
+                    self.status_update.emit(f"Could not resize {filename}: {result.error}")
+                else:
+                    self.status_update.emit(f"Resized {filename} ({self.done}/{total})")
+                self.progress.emit(int(self.done / total * 100))
+
+
+class ResponsiveSetThread(QThread):
+    """
+    Worker thread writing a responsive image set per source image.
+
+    Args:
+        image_paths: Source images
+        output_dir: Folder receiving the variants and `manifest_name`
+        widths: Target widths (never upscaled)
+        formats: Output formats, e.g. ("jpg", "webp")
+        quality: Encoder quality for JPEG / WebP / AVIF
+        processes: Worker processes (default: CPU count - 1)
+
+    `manifest` holds the per-image entries of responsive_set() in input
+    order; it is written as JSON even when the thread was stopped.
+    """
+    progress = pyqtSignal(int)
+    status_update = pyqtSignal(str)
+    finished_processing = pyqtSignal(str)  # "Completed", "Stopped" or "Error"
+
+    manifest_name = "responsive_manifest.json"
+
+    def __init__(self, image_paths, output_dir, widths, formats, quality=80, processes: int = None):
+        super().__init__()
+        self.image_paths = list(image_paths)
+        self.output_dir = output_dir
+        self.widths = tuple(widths)
+        self.formats = tuple(formats)
+        self.quality = quality
+        self.processes = processes or max(1, (os.cpu_count() or 2) - 1)
+        self.stop_processing_flag = False
+        self.done = 0
+        self.failures = []
+        self.manifest = []
+
+    def stop(self):
+        self.status_update.emit("Stopping process...")
+        self.stop_processing_flag = True
+
+    def run(self):
+        try:
+            self.generate_all()
+            self.finished_processing.emit("Stopped" if self.stop_processing_flag else "Completed")
+        except Exception as e:
+            self.status_update.emit(f"An error occurred: {e}")
+            self.finished_processing.emit("Error")
+
+    def generate_all(self):
+        total = len(self.image_paths)
+        if not total:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        processes = min(self.processes, total)
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            def submit(job):
+                path, stem = job
+                return pool.submit(responsive_set, path, self.output_dir, self.widths, self.formats, self.quality,
+                                   stem=stem)
+
+            entries = {}
+            jobs = zip(self.image_paths, variant_stems(self.image_paths))
+            results = map_in_pool(submit, jobs, 2 * processes, should_stop=lambda: self.stop_processing_flag)
+            for entry in results:
+                self.done += 1
+                entries[entry["source"]] = entry
+                if "error" in entry:
+                    self.failures.append((entry["source"], entry["error"]))
+                    self.status_update.emit(f"Could not process {entry['source']}: {entry['error']}")
+                else:
+                    size = sum(v["bytes"] for v in entry["variants"]) / 1024
+                    self.status_update.emit(
+                        f"{entry['source']}: {len(entry['variants'])} files, {size:.0f} KB ({self.done}/{total})"
+                    )
+                self.progress.emit(int(self.done / total * 100))
+
+        order = [os.path.basename(p) for p in self.image_paths]
+        self.manifest = [entries[name] for name in dict.fromkeys(order) if name in entries and "error" not in entries[name]]
+        manifest_path = os.path.join(self.output_dir, self.manifest_name)
+        with open(manifest_path, "w", encoding="utf-8") as f:
+            json.dump({"widths": list(self.widths), "formats": list(self.formats), "images": self.manifest}, f, indent=2)
+        self.status_update.emit(f"Manifest saved: {manifest_path}")
@@ -2,31 +2,52 @@
 MetaCheckWorker and ProductSheetWorker for checking metadata and product information.
 """
 
-import re
+import os
+import json
+import datetime
 import asyncio
+import tempfile
+from collections import OrderedDict
+from urllib.parse import urljoin
 import aiohttp
 from bs4 import BeautifulSoup
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Font
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from config import HEADERS, TIMEOUT_HEAVY, MAX_CONCURRENCY_META, MAX_CONCURRENCY_PRODUCT
-from utils.helpers import norm_text, norm_title, norm_num
+from config import (
+    HEADERS, TIMEOUT_HEAVY, MAX_CONCURRENCY_META, MAX_CONCURRENCY_PRODUCT,
+    PRODUCT_CATALOG_PATH, PRODUCT_CATALOG_MAX_AGE_HOURS
+)
+from utils.helpers import norm_num
+from utils.gtin import validate_gtins, validate_ids, is_blocking
+from utils.excel_readers import open_meta_sheet, meta_check_items, open_product_sheet, product_sheet_items
+from utils.meta_compare import build_frame, compare_frame, to_results
+from utils.product_catalog import ProductCatalog, catalog_key, extract_canonical
+from utils.streaming import iterate_in_thread, run_bounded, OrderedWriter
+from utils.structured_data import parse_structured_data
 
 
 class MetaCheckWorker(QThread):
     """
-    Worker for 'Meta Checker':
+    Worker for 'Meta Checker' (results are also exposed as a DataFrame in `frame`):
     - items: list of dicts {url, expected: {meta_title, meta_description, og_title, og_description, h1}}
+    - excel_path: alternatively, an expectation workbook streamed row by row in the worker
+      thread, so checking starts while the rest of the sheet is still being read
     """
     progress_update = pyqtSignal(int)
     log_update = pyqtSignal(str)
     finished = pyqtSignal(list)  # list of results
 
-    def __init__(self, items, max_concurrency: int = MAX_CONCURRENCY_META):
+    def __init__(self, items=None, max_concurrency: int = MAX_CONCURRENCY_META, excel_path: str = ""):
         super().__init__()
         self.items = items or []
+        self.excel_path = excel_path
         self.max_concurrency = max_concurrency
         self._stop_requested = False
         self.results = []
+        self.frame = None  # pandas DataFrame of compared results (see utils.meta_compare)
 
     def stop(self):
         self._stop_requested = True
@@ -41,46 +62,83 @@ class MetaCheckWorker(QThread):
         finally:
             self.finished.emit(self.results)
 
-    async def main(self):
-        total = len(self.items)
-        if total == 0:
-            self.progress_update.emit(100)
-            self.log_update.emit("[INFO] No items to check.")
-            return
+    async def _iter_list(self):
+        for item in self.items:
+            yield item
 
-        self.log_update.emit(f"[INIT] Meta Checker – {total} page(s) to check.")
+    async def main(self):
+        stream = None
+        if self.excel_path:
+            try:
+                stream = open_meta_sheet(self.excel_path)
+            except Exception as e:
+                self.log_update.emit(f"[ERROR] Could not read Excel file: {e}")
+                return
+            total = stream.data_rows_hint
+            source = iterate_in_thread(meta_check_items(stream))
+            self.log_update.emit(
+                f"[INIT] Meta Checker – streaming ~{total if total is not None else '?'} row(s) "
+                f"from sheet '{stream.ws.title}'."
+            )
+        else:
+            total = len(self.items)
+            if total == 0:
+                self.progress_update.emit(100)
+                self.log_update.emit("[INFO] No items to check.")
+                return
+            source = self._iter_list()
+            self.log_update.emit(f"[INIT] Meta Checker – {total} page(s) to check.")
+
+        async def indexed(src):
+            idx = 0
+            async for item in src:
+                yield idx, item
+                idx += 1
+
+        # Each result carries the original index
+        temp_results = []
+        done = 0
 
         async with aiohttp.ClientSession(headers=HEADERS) as session:
             sem = asyncio.Semaphore(self.max_concurrency)
 
-            async def runner():
-                done = 0
-                # Each task carries the original index
-                tasks = [
-                    self._process_item_indexed(idx, item, session, sem)
-                    for idx, item in enumerate(self.items)
-                ]
-
-                temp_results = []
-
-                for coro in asyncio.as_completed(tasks):
-                    if self._stop_requested:
-                        self.log_update.emit("[WARN] Stop requested. Aborting remaining checks.")
-                        break
-
-                    idx, result = await coro
-                    if result is not None:
-                        temp_results.append((idx, result))
+            async def handle(entry):
+                idx, item = entry
+                return await self._process_item_indexed(idx, item, session, sem)
 
-                    done += 1
-                    self.progress_update.emit(int(done * 100 / total))
-
-                # Ensure results are in same order as spreadsheet
-                temp_results.sort(key=lambda x: x[0])
-                self.results = [r for (_, r) in temp_results]
-
-            await runner()
+            def on_result(entry, indexed_result):
+                nonlocal done
+                idx, result = indexed_result
+                if result is not None:
+                    temp_results.append((idx, result))
+                done += 1
+                if total:
+                    self.progress_update.emit(min(99, int(done * 100 / total)))
 
+            try:
+                await run_bounded(
+                    indexed(source),
+                    handle,
+                    self.max_concurrency,
+                    on_result=on_result,
+                    should_stop=lambda: self._stop_requested,
+                )
+            finally:
+                if stream is not None:
+                    stream.close()
+
+        if self._stop_requested:
+            self.log_update.emit("[WARN] Stop requested. Aborting remaining checks.")
+
+        # Ensure results are in same order as spreadsheet
+        temp_results.sort(key=lambda x: x[0])
+
+        # Normalize, match and score all rows in vectorized passes
+        self.frame = compare_frame(build_frame(r for (_, r) in temp_results))
+        self.results = to_results(self.frame)
+
+        if done == 0:
+            self.log_update.emit("[INFO] No items to check.")
         self.progress_update.emit(100)
         self.log_update.emit("[DONE] Meta Checker finished.")
 
@@ -98,13 +156,6 @@ class MetaCheckWorker(QThread):
                 "og_description": "",
                 "h1": "",
             }
-            match = {
-                "meta_title": None,
-                "meta_description": None,
-                "og_title": None,
-                "og_description": None,
-                "h1": None,
-            }
 
             if not url:
                 return None
@@ -155,56 +206,11 @@ class MetaCheckWorker(QThread):
                 except Exception as e:
                     self.log_update.emit(f"[ERROR] Parsing HTML from {url}: {e}")
 
-            # ---------- Comparison ----------
-            # Normalize fields
-            exp_mt = norm_title(expected.get("meta_title", ""))
-            cur_mt = norm_title(current["meta_title"])
-
-            exp_md = norm_text(expected.get("meta_description", ""))
-            cur_md = norm_text(current["meta_description"])
-
-            exp_ot = norm_title(expected.get("og_title", ""))
-            cur_ot = norm_title(current["og_title"])
-
-            exp_od = norm_text(expected.get("og_description", ""))
-            cur_od = norm_text(current["og_description"])
-
-            # H1 uses simple text normalization
-            exp_h1 = norm_text(expected.get("h1", ""))
-            cur_h1 = norm_text(current["h1"])
-
-            # meta title
-            if exp_mt:
-                current["meta_title"] = cur_mt
-                match["meta_title"] = (exp_mt == cur_mt)
-            # meta description
-            if exp_md:
-                current["meta_description"] = cur_md
-                match["meta_description"] = (exp_md == cur_md)
-            # og title
-            if exp_ot:
-                current["og_title"] = cur_ot
-                match["og_title"] = (exp_ot == cur_ot)
-            # og description
-            if exp_od:
-                current["og_description"] = cur_od
-                match["og_description"] = (exp_od == cur_od)
-            # h1
-            if exp_h1:
-                current["h1"] = cur_h1
-                match["h1"] = (exp_h1 == cur_h1)
-
+            # Comparison happens once for all rows in MetaCheckWorker.main
             return {
                 "url": url,
-                "expected": {
-                    "meta_title": exp_mt,
-                    "meta_description": exp_md,
-                    "og_title": exp_ot,
-                    "og_description": exp_od,
-                    "h1": exp_h1,
-                },
+                "expected": {f: expected.get(f, "") or "" for f in current},
                 "current": current,
-                "match": match,
             }
 
     async def _process_item_indexed(self, idx, item, session: aiohttp.ClientSession, sem: asyncio.Semaphore):
@@ -212,25 +218,81 @@ class MetaCheckWorker(QThread):
         return idx, result
 
 
+PRODUCT_REPORT_HEADERS = [
+    "Row", "URL", "Status", "Redirect From", "Redirect To",
+    "Expected ID", "Actual ID", "ID Match", "Expected GTIN", "Actual GTIN", "GTIN Match",
+    "GTIN Check", "ID Check", "Source",
+]
+
+# "Catalog Flags" sheet, written once every fetched page is in the catalog
+CATALOG_FLAG_HEADERS = ["Row", "URL", "Actual GTIN", "GTIN Also On", "Expected ID", "ID Without Page"]
+
+# Rows kept in memory for the GUI preview when a report workbook is written
+PRODUCT_PREVIEW_LIMIT = 500
+
+# Rows validated together by the vectorized GTIN/ID precheck
+PRECHECK_BATCH_SIZE = 1024
+
+# Completed fetches remembered for rows repeating a URL (least recently used dropped first)
+FETCH_CACHE_SIZE = 4096
+
+
 class ProductSheetWorker(QThread):
     """
     Worker to check Product ID / GTIN from a standard spreadsheet.
     Reads URL, fetches the page, captures:
       - HTTP Status (with redirect detection)
-      - Product ID (JSON-LD "@id")
-      - GTIN/EAN ("sku" field)
+      - Product ID (JSON-LD Product "@id")
+      - GTIN/EAN (Product/offer "gtin13", falling back to "sku")
     Compares with expected values and returns list of results.
+
+    Input is either `items` (list of dicts {row, url, expected_id, expected_gtin})
+    or `excel_path`, streamed row by row in the worker thread. With
+    `output_folder`, each result is written to a write-only report workbook in
+    the original row order as soon as all earlier rows are done (reorder
+    window), and only the first PRODUCT_PREVIEW_LIMIT problem rows are kept in
+    `results`; memory stays constant however long the sheet is.
+
+    With use_catalog, rows whose URL has a record in the product catalog
+    younger than max_age_hours are answered without fetching; fetched pages
+    are written back to the catalog. Once every page has been fetched (and
+    upserted), a second pass over the written rows (spooled to a temporary
+    file) flags the other URLs sharing each GTIN and expected IDs with no
+    page, in a "Catalog Flags" sheet, so the flags do not depend on which
+    rows happened to finish first.
+
+    Before any fetch, expected GTINs (check digit, GTIN-8/12/13/14 length)
+    and IDs (digits only) are validated in vectorized batches. Rows with a
+    malformed expected GTIN keep their flag and are deprioritized: they are
+    spooled to a temporary file and checked after all the other rows, and
+    written to a "Deferred (malformed GTIN)" sheet so "Products" stays in
+    row order. Rows repeating a URL share a single fetch.
     """
     progress_update = pyqtSignal(int)
     log_update = pyqtSignal(str)
-    finished = pyqtSignal(list)  # list of dicts with result per row
+    stats_update = pyqtSignal(dict)
+    finished = pyqtSignal(list)  # list of dicts with result per row (problem preview in report mode)
 
-    def __init__(self, items, max_concurrency: int = MAX_CONCURRENCY_PRODUCT):
+    def __init__(self, items=None, max_concurrency: int = MAX_CONCURRENCY_PRODUCT, use_catalog: bool = False,
+                 max_age_hours: float = PRODUCT_CATALOG_MAX_AGE_HOURS, catalog_path: str = PRODUCT_CATALOG_PATH,
+                 excel_path: str = "", output_folder: str = ""):
         super().__init__()
         self.items = items or []
+        self.excel_path = excel_path
+        self.output_folder = output_folder
         self.max_concurrency = max_concurrency
+        self.use_catalog = use_catalog
+        self.max_age_hours = max_age_hours
+        self.catalog_path = catalog_path
+        self.catalog = None
         self._stop_requested = False
         self.results = []
+        self.report_path = ""
+        self.stats = {"checked": 0, "ok": 0, "id_mismatch": 0, "gtin_mismatch": 0,
+                      "redirects": 0, "errors": 0, "cached": 0, "shared_gtin": 0, "id_without_page": 0,
+                      "invalid_format": 0, "deferred": 0, "deduplicated": 0}
+        self._in_flight = {}  # normalized URL -> Future of (status, final_url, product_id, gtin)
+        self._fetched = OrderedDict()  # normalized URL -> (status, final_url, product_id, gtin), LRU
 
     def stop(self):
         self._stop_requested = True
@@ -239,113 +301,431 @@ class ProductSheetWorker(QThread):
     def _extract_product_id(html: str) -> str:
         if not html:
             return ""
-        # Look for any "@id":"<digits only>"
-        m = re.search(r'"@id"\s*:\s*"(\d+)"', html)
-        return m.group(1) if m else ""
+        # "@id" of the Product node (not breadcrumb / organization nodes)
+        return parse_structured_data(html).product_info()["id"]
 
     @staticmethod
     def _extract_gtin(html: str) -> str:
         if not html:
             return ""
-        # Look for first "sku":"<digits only>"
-        m = re.search(r'"sku"\s*:\s*"(\d+)"', html)
-        return m.group(1) if m else ""
+        # gtin13/gtin on the Product or its offers, else a digits-only "sku"
+        return parse_structured_data(html).product_info()["gtin"]
+
+    async def _iter_list(self):
+        for item in self.items:
+            yield item
+
+    async def _prechecked(self, source, batch_size: int = PRECHECK_BATCH_SIZE):
+        """Annotate items with `gtin_check` / `id_check`, validating each batch in one pass."""
+        batch = []
+
+        def annotate(items):
+            gtin_checks = validate_gtins(it.get("expected_gtin") for it in items)
+            id_checks = validate_ids(it.get("expected_id") for it in items)
+            for it, g, i in zip(items, gtin_checks, id_checks):
+                it["gtin_check"] = g
+                it["id_check"] = i
+            return items
+
+        async for item in source:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                for it in annotate(batch):
+                    yield it
+                batch = []
+        if batch:
+            for it in annotate(batch):
+                yield it
+
+    async def _valid_first(self, source):
+        """Yield rows with a well-formed expected GTIN, then the malformed ones (spooled to disk meanwhile)."""
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as spool:
+            async for item in source:
+                if is_blocking(item.get("gtin_check", "")):
+                    spool.write(json.dumps(item, default=str) + "\n")
+                    self.stats["deferred"] += 1
+                else:
+                    yield item
+            if self.stats["deferred"]:
+                self.log_update.emit(
+                    f"[INFO] Checking {self.stats['deferred']} row(s) with a malformed GTIN after the other rows."
+                )
+                spool.seek(0)
+                for line in spool:
+                    yield json.loads(line)
 
     async def main(self):
-        total = len(self.items)
-        if total == 0:
-            self.progress_update.emit(100)
-            self.log_update.emit("[INFO] No rows to process.")
-            return
-
-        self.log_update.emit(f"[INIT] ProductSheetWorker – {total} row(s) to check.")
-
-        async with aiohttp.ClientSession(headers=HEADERS) as session:
-            sem = asyncio.Semaphore(self.max_concurrency)
-
-            async def runner():
-                done = 0
-                tasks = [self._process_item(item, session, sem) for item in self.items]
-                for coro in asyncio.as_completed(tasks):
-                    if self._stop_requested:
-                        self.log_update.emit("[WARN] Stop requested. Aborting remaining checks.")
-                        break
-                    result = await coro
-                    if result is not None:
-                        self.results.append(result)
-                    done += 1
-                    self.progress_update.emit(int(done * 100 / total))
-
-            await runner()
-
-        self.progress_update.emit(100)
-        self.log_update.emit("[DONE] ProductSheetWorker finished.")
-
-    async def _process_item(self, item, session: aiohttp.ClientSession, sem: asyncio.Semaphore):
-        async with sem:
-            if self._stop_requested:
-                return None
-
-            url_raw = item.get("url", "") or ""
-            url = url_raw.strip()
-            if not url:
-                return None
-            if not url.lower().startswith(("http://", "https://")):
-                url = "https://" + url
-
-            status =None
-            final_url = ""
-            html = ""
-
+        stream = None
+        if self.excel_path:
             try:
-                self.log_update.emit(f"[FETCH] {url}")
-                async with session.get(url, ssl=False, timeout=TIMEOUT_HEAVY, allow_redirects=True) as resp:
-                    status = resp.status
-                    final_url = str(resp.url)
-                    html = await resp.text(errors="ignore")
-            except aiohttp.ClientError as e:
-                self.log_update.emit(f"[ERROR] Network error fetching {url}: {e}")
-            except asyncio.TimeoutError:
-                self.log_update.emit(f"[ERROR] Timeout fetching {url}")
+                stream = open_product_sheet(self.excel_path)
             except Exception as e:
-                self.log_update.emit(f"[ERROR] Could not fetch {url}: {e}")
-
-            actual_id = self._extract_product_id(html)
-            actual_gtin = self._extract_gtin(html)
+                self.log_update.emit(f"[ERROR] Could not read Excel file: {e}")
+                return
+            total = stream.data_rows_hint
+            source = iterate_in_thread(product_sheet_items(stream))
+            self.log_update.emit(
+                f"[INIT] ProductSheetWorker – streaming ~{total if total is not None else '?'} row(s) "
+                f"from sheet '{stream.ws.title}'."
+            )
+        else:
+            total = len(self.items)
+            if total == 0:
+                self.progress_update.emit(100)
+                self.log_update.emit("[INFO] No rows to process.")
+                return
+            source = self._iter_list()
+            self.log_update.emit(f"[INIT] ProductSheetWorker – {total} row(s) to check.")
+
+        # The in-memory list is validated as a single batch; sheets batch by batch as they stream
+        batch_size = len(self.items) if not self.excel_path else PRECHECK_BATCH_SIZE
+        source = self._valid_first(self._prechecked(source, batch_size=max(1, batch_size)))
+
+        if self.use_catalog:
+            try:
+                self.catalog = ProductCatalog(self.catalog_path)
+                self.log_update.emit(
+                    f"[INIT] Product catalog: {self.catalog.count()} record(s), "
+                    f"fresh for {self.max_age_hours:g}h."
+                )
+            except Exception as e:
+                self.log_update.emit(f"[WARN] Product catalog unavailable, fetching all pages: {e}")
+                self.catalog = None
+
+        wb = ws = None
+        if self.output_folder:
+            os.makedirs(self.output_folder, exist_ok=True)
+            # Write-only workbook: rows are flushed in order, never held as cells
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Products")
+            ws.append([self._styled(ws, h, header=True) for h in PRODUCT_REPORT_HEADERS])
+
+        # Rows written so far, for the catalog flags pass: (index in results or None, result)
+        flag_spool = tempfile.TemporaryFile("w+", encoding="utf-8") if self.catalog is not None else None
+        deferred_ws = None
+
+        def write(result):
+            nonlocal deferred_ws
+            self._count(result)
+            kept = ws is None or (self._is_problem(result) and len(self.results) < PRODUCT_PREVIEW_LIMIT)
+            if ws is not None:
+                target = ws
+                # Deferred rows are written after all the others: own sheet, so "Products" keeps the row order
+                if is_blocking(result.get("gtin_check", "")):
+                    if deferred_ws is None:
+                        deferred_ws = wb.create_sheet("Deferred (malformed GTIN)")
+                        deferred_ws.append([self._styled(deferred_ws, h, header=True) for h in PRODUCT_REPORT_HEADERS])
+                    target = deferred_ws
+                target.append(self._report_row(target, result))
+            if kept:
+                self.results.append(result)
+            if flag_spool is not None:
+                flag_spool.write(json.dumps([len(self.results) - 1 if kept else None, result], default=str) + "\n")
+
+        ordered = OrderedWriter(write, window=max(64, self.max_concurrency * 8))
+        done = 0
 
-            exp_id = norm_num(item.get("expected_id"))
-            exp_gtin = norm_num(item.get("expected_gtin"))
-            act_id_norm = norm_num(actual_id)
-            act_gtin_norm = norm_num(actual_gtin)
+        try:
+            async with aiohttp.ClientSession(headers=HEADERS) as session:
 
-            match_id = None
-            if exp_id and act_id_norm:
-                match_id = (exp_id == act_id_norm)
+                async def handle(entry):
+                    _, item = entry
+                    return await self._process_item(item, session)
 
-            match_gtin = None
-            if exp_gtin and act_gtin_norm:
-                match_gtin = (exp_gtin == act_gtin_norm)
+                def on_result(entry, result):
+                    nonlocal done
+                    ordered.put(entry[0], result)
+                    done += 1
+                    if total:
+                        self.progress_update.emit(min(99, int(done * 100 / total)))
+                    if done % 100 == 0:
+                        self.stats_update.emit(dict(self.stats))
+
+                # No should_stop here: every numbered item must reach on_result to
+                # free its reorder slot; _process_item returns None once stopped.
+                await run_bounded(
+                    ordered.numbered(source, should_stop=lambda: self._stop_requested),
+                    handle,
+                    self.max_concurrency,
+                    on_result=on_result,
+                )
+
+            if flag_spool is not None:
+                self._flag_from_catalog(flag_spool, wb)
+        finally:
+            if stream is not None:
+                stream.close()
+            if flag_spool is not None:
+                flag_spool.close()
+            if self.catalog is not None:
+                self.catalog.close()
+                self.catalog = None
+
+        if self._stop_requested:
+            self.log_update.emit("[WARN] Stop requested. Aborting remaining checks.")
+
+        # Deferred and flag-only rows were added last; the preview follows the sheet
+        self.results.sort(key=lambda r: r["row"] or 0)
+
+        if wb is not None:
+            ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join(self.output_folder, f"product_sheet_{ts}.xlsx")
+            wb.save(path)
+            self.report_path = path
+            self.log_update.emit(f"[EXPORT] Report saved to: {path}")
+
+        if self.stats["deferred"]:
+            self.log_update.emit(
+                f"[INFO] {self.stats['deferred']} row(s) with a malformed GTIN were checked last"
+                + (" (sheet 'Deferred (malformed GTIN)')." if wb is not None else ".")
+            )
+        if self.stats["deduplicated"]:
+            self.log_update.emit(f"[INFO] {self.stats['deduplicated']} duplicate URL row(s) reused an earlier fetch.")
+        if self.use_catalog:
+            self.log_update.emit(f"[INFO] {self.stats['cached']} row(s) answered from the product catalog.")
+            if self.stats["shared_gtin"]:
+                self.log_update.emit(f"[WARN] {self.stats['shared_gtin']} row(s) have a GTIN published on other URLs.")
+            if self.stats["id_without_page"]:
+                self.log_update.emit(
+                    f"[WARN] {self.stats['id_without_page']} row(s) expect a product ID with no page in the catalog."
+                )
+
+        self.stats_update.emit(dict(self.stats))
+        self.progress_update.emit(100)
+        self.log_update.emit(f"[DONE] ProductSheetWorker finished – {self.stats['checked']} row(s).")
+
+    def _flag_from_catalog(self, spool, wb=None):
+        """
+        Second pass over the written rows, once every fetched page is in the catalog.
+
+        Adds the other URLs sharing each row's GTIN and whether its expected ID
+        has any page (indexed catalog queries, IDs looked up per batch with
+        ids_without_page) to the "Catalog Flags" sheet, the stats and the
+        results kept in memory.
+        """
+        ws = None
+        if wb is not None:
+            ws = wb.create_sheet("Catalog Flags")
+            ws.append([self._styled(ws, h, header=True) for h in CATALOG_FLAG_HEADERS])
+
+        spool.seek(0)
+        while True:
+            batch = [json.loads(line) for _, line in zip(range(PRECHECK_BATCH_SIZE), spool)]
+            if not batch:
+                break
+            missing = set(self.catalog.ids_without_page(r["expected_id"] for _, r in batch))
+            for index, r in batch:
+                gtin = r["actual_gtin"]
+                others = self.catalog.urls_for_gtin(gtin, exclude_url=r["url"]) if gtin else []
+                id_without_page = r["expected_id"] in missing if r["expected_id"] else None
+                if not others and not id_without_page:
+                    continue
+
+                if not self._is_problem(r):
+                    self.stats["ok"] -= 1
+                if others:
+                    self.stats["shared_gtin"] += 1
+                if id_without_page:
+                    self.stats["id_without_page"] += 1
+                if index is not None:
+                    r = self.results[index]
+                elif len(self.results) < PRODUCT_PREVIEW_LIMIT:
+                    self.results.append(r)
+                r["shared_gtin_urls"] = others
+                r["id_without_page"] = id_without_page
+                if ws is not None:
+                    ws.append([
+                        r["row"], r["url"], gtin, "\n".join(others),
+                        r["expected_id"], "TRUE" if id_without_page else "",
+                    ])
 
-            # Redirect detection: if final URL different from original
-            redirect_from = ""
-            redirect_to = ""
-            if final_url and final_url.rstrip("/") != url.rstrip("/"):
-                redirect_from = url_raw or url
-                redirect_to = final_url
+    @staticmethod
+    def _is_problem(r) -> bool:
+        return (
+            r["match_id"] is False or r["match_gtin"] is False or bool(r["to"])
+            or is_blocking(r.get("gtin_check", "")) or is_blocking(r.get("id_check", ""))
+            or r["status"] is None or r["status"] >= 400
+        )
+
+    def _count(self, r):
+        self.stats["checked"] += 1
+        if r["status"] is None or r["status"] >= 400:
+            self.stats["errors"] += 1
+        if is_blocking(r.get("gtin_check", "")) or is_blocking(r.get("id_check", "")):
+            self.stats["invalid_format"] += 1
+        if r["to"]:
+            self.stats["redirects"] += 1
+        if r["match_id"] is False:
+            self.stats["id_mismatch"] += 1
+        if r["match_gtin"] is False:
+            self.stats["gtin_mismatch"] += 1
+        if r.get("source") == "catalog":
+            self.stats["cached"] += 1
+        if not self._is_problem(r):
+            self.stats["ok"] += 1
+
+    _FILLS = {
+        "TRUE": PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid"),
+        "FALSE": PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"),
+    }
+    _HEADER_FILL = PatternFill(start_color="0070C0", end_color="0070C0", fill_type="solid")
+    _HEADER_FONT = Font(name="Calibri", size=11, bold=True, color="FFFFFF")
+
+    @classmethod
+    def _styled(cls, ws, value, header: bool = False):
+        cell = WriteOnlyCell(ws, value=value)
+        if header:
+            cell.fill = cls._HEADER_FILL
+            cell.font = cls._HEADER_FONT
+        elif value in cls._FILLS:
+            cell.fill = cls._FILLS[value]
+        return cell
+
+    @classmethod
+    def _report_row(cls, ws, r):
+        def flag(v):
+            return "" if v is None else ("TRUE" if v else "FALSE")
+
+        return [
+            r["row"], r["url"], r["status"], r["from"], r["to"],
+            r["expected_id"], r["actual_id"], cls._styled(ws, flag(r["match_id"])),
+            r["expected_gtin"], r["actual_gtin"], cls._styled(ws, flag(r["match_gtin"])),
+            r.get("gtin_check", "") or "OK", r.get("id_check", "") or "OK",
+            r.get("source", ""),
+        ]
+
+    async def _process_item(self, item, session: aiohttp.ClientSession):
+        if self._stop_requested:
+            return None
+
+        url_raw = item.get("url", "") or ""
+        url = url_raw.strip()
+        if not url:
+            return None
+        if not url.lower().startswith(("http://", "https://")):
+            url = "https://" + url
+
+        gtin_check = item.get("gtin_check", "")
+        record = None
+        if self.catalog is not None:
+            record = self.catalog.lookup(url, self.max_age_hours)
+
+        if record is not None:
+            source = "catalog"
+            status = record["status"]
+            final_url = record["final_url"]
+            actual_id = record["product_id"]
+            actual_gtin = record["gtin"]
+        else:
+            source = "live"
+            status, final_url, actual_id, actual_gtin = await self._fetch_once(url, session)
+
+        exp_id = norm_num(item.get("expected_id"))
+        exp_gtin = norm_num(item.get("expected_gtin"))
+        act_id_norm = norm_num(actual_id)
+        act_gtin_norm = norm_num(actual_gtin)
+
+        match_id = None
+        if exp_id and act_id_norm:
+            match_id = (exp_id == act_id_norm)
+
+        match_gtin = None
+        if exp_gtin and act_gtin_norm:
+            match_gtin = (exp_gtin == act_gtin_norm)
+
+        # Redirect detection: if final URL different from original
+        redirect_from = ""
+        redirect_to = ""
+        if final_url and final_url.rstrip("/") != url.rstrip("/"):
+            redirect_from = url_raw or url
+            redirect_to = final_url
+
+        return {
+            "row": item.get("row"),
+            "url": url_raw or url,
+            "status": status,
+            "from": redirect_from,
+            "to": redirect_to,
+            "actual_id": act_id_norm,
+            "actual_gtin": act_gtin_norm,
+            "expected_id": exp_id,
+            "expected_gtin": exp_gtin,
+            "match_id": match_id,
+            "match_gtin": match_gtin,
+            "source": source,
+            "gtin_check": gtin_check,
+            "id_check": item.get("id_check", ""),
+        }
+
+    async def _fetch_once(self, url: str, session: aiohttp.ClientSession):
+        """
+        `_fetch_product`, shared by the rows of the sheet that repeat the same URL.
+
+        Rows arriving while the URL is being fetched wait for that fetch; later
+        rows reuse the result while it is among the FETCH_CACHE_SIZE most
+        recently used ones, so memory does not grow with the number of URLs.
+        """
+        key = catalog_key(url)
+        result = self._fetched.get(key)
+        if result is not None:
+            self._fetched.move_to_end(key)
+            self.stats["deduplicated"] += 1
+            return result
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.stats["deduplicated"] += 1
+            return await asyncio.shield(future)
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await self._fetch_product(url, session)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del self._in_flight[key]
+        future.set_result(result)
+        self._fetched[key] = result
+        if len(self._fetched) > FETCH_CACHE_SIZE:
+            self._fetched.popitem(last=False)
+        return result
+
+    async def _fetch_product(self, url: str, session: aiohttp.ClientSession):
+        """Fetch one page; returns (status, final_url, product_id, gtin)."""
+        status = None
+        final_url = ""
+        html = ""
 
-            return {
-                "row": item.get("row"),
-                "url": url_raw or url,
-                "status": status,
-                "from": redirect_from,
-                "to": redirect_to,
-                "actual_id": act_id_norm,
-                "actual_gtin": act_gtin_norm,
-                "expected_id": exp_id,
-                "expected_gtin": exp_gtin,
-                "match_id": match_id,
-                "match_gtin": match_gtin,
-            }
+        try:
+            self.log_update.emit(f"[FETCH] {url}")
+            async with session.get(url, ssl=False, timeout=TIMEOUT_HEAVY, allow_redirects=True) as resp:
+                status = resp.status
+                final_url = str(resp.url)
+                html = await resp.text(errors="ignore")
+        except aiohttp.ClientError as e:
+            self.log_update.emit(f"[ERROR] Network error fetching {url}: {e}")
+        except asyncio.TimeoutError:
+            self.log_update.emit(f"[ERROR] Timeout fetching {url}")
+        except Exception as e:
+            self.log_update.emit(f"[ERROR] Could not fetch {url}: {e}")
+
+        data = parse_structured_data(html)
+        product = data.product_info()
+
+        # Only successful product pages go back into the catalog
+        if self.catalog is not None and status == 200 and data.product() is not None:
+            canonical = extract_canonical(html)
+            self.catalog.upsert(
+                url,
+                product_id=product["id"],
+                gtin=product["gtin"],
+                sku=product["sku"],
+                name=product["name"],
+                canonical_url=urljoin(final_url or url, canonical) if canonical else "",
+                final_url=final_url,
+                status=status,
+            )
+        return status, final_url, product["id"], product["gtin"]
 
     def run(self):
         try:
@@ -0,0 +1,240 @@
+"""
+RedirectMapWorker for validating old URL -> new URL redirect mappings in bulk.
+"""
+
+import os
+import datetime
+import asyncio
+import aiohttp
+from urllib.parse import urljoin, urlsplit, urlunsplit
+from openpyxl import Workbook
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from config import HEADERS, TIMEOUT_SHORT, MAX_CONCURRENCY_REDIRECT, MAX_REDIRECT_HOPS
+from utils.excel_readers import open_redirect_map, redirect_map_items
+from utils.streaming import iterate_in_thread, run_bounded
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+REPORT_HEADERS = [
+    "Row", "Old URL", "Expected URL", "Expected Status", "First Status",
+    "Final URL", "Final Status", "Hops", "Chain", "Target Match", "Status Match",
+    "Verdict", "Error",
+]
+
+
+def normalize_url_for_compare(url: str) -> str:
+    """Lowercase scheme/host, drop the fragment and any trailing slash."""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or ""
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+class RedirectMapWorker(QThread):
+    """
+    Worker for 'Redirect Map' validation:
+    - excel_path: workbook with old URL -> expected new URL rows (optionally expected status)
+    - output_folder: folder where the streamed report workbook is written
+
+    Each redirect chain is resolved hop by hop with HEAD requests (GET without
+    reading the body when HEAD is refused), so no page bodies are downloaded.
+    """
+    progress_update = pyqtSignal(int)
+    log_update = pyqtSignal(str)
+    stats_update = pyqtSignal(dict)
+    finished = pyqtSignal(str)  # path of the report workbook ('' if none)
+
+    def __init__(self, excel_path: str, output_folder: str, max_concurrency: int = MAX_CONCURRENCY_REDIRECT):
+        super().__init__()
+        self.excel_path = excel_path
+        self.output_folder = output_folder
+        self.max_concurrency = max_concurrency
+        self._stop_requested = False
+        self.report_path = ""
+        self.stats = {"checked": 0, "ok": 0, "wrong_target": 0, "wrong_status": 0,
+                      "no_redirect": 0, "broken": 0, "errors": 0}
+
+    def stop(self):
+        self._stop_requested = True
+
+    def run(self):
+        try:
+            asyncio.run(self.main())
+        except asyncio.CancelledError:
+            self.log_update.emit("[WARN] Task was cancelled")
+        except Exception as e:
+            self.log_update.emit(f"[ERROR] RedirectMapWorker crashed: {e}")
+        finally:
+            self.finished.emit(self.report_path)
+
+    async def main(self):
+        try:
+            stream = open_redirect_map(self.excel_path)
+        except Exception as e:
+            self.log_update.emit(f"[ERROR] Could not read Excel file: {e}")
+            return
+
+        total = stream.data_rows_hint
+        self.log_update.emit(
+            f"[INIT] Redirect Map – streaming {self.excel_path} "
+            f"(~{total if total is not None else '?'} row(s)), concurrency {self.max_concurrency}."
+        )
+
+        os.makedirs(self.output_folder, exist_ok=True)
+        ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.output_folder, f"redirect_map_{ts}.xlsx")
+
+        # Write-only workbook: rows are flushed as they arrive, never held as cells
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Redirects")
+        ws.append(REPORT_HEADERS)
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, ssl=False)
+        try:
+            async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+
+                async def handle(item):
+                    return await self._check_row(item, session)
+
+                def on_result(item, result):
+                    ws.append(self._report_row(result))
+                    self._count(result)
+                    done = self.stats["checked"]
+                    if total:
+                        self.progress_update.emit(min(99, int(done * 100 / total)))
+                    if done % 100 == 0:
+                        self.stats_update.emit(dict(self.stats))
+
+                try:
+                    await run_bounded(
+                        iterate_in_thread(redirect_map_items(stream)),
+                        handle,
+                        self.max_concurrency,
+                        on_result=on_result,
+                        should_stop=lambda: self._stop_requested,
+                    )
+                finally:
+                    stream.close()
+        finally:
+            # Keep every row checked so far, even when the run fails midway
+            wb.save(path)
+            self.report_path = path
+            self.stats_update.emit(dict(self.stats))
+
+        if self._stop_requested:
+            self.log_update.emit("[WARN] Stop requested. Remaining rows were not checked.")
+
+        self.progress_update.emit(100)
+        self.log_update.emit(f"[DONE] Redirect Map finished – {self.stats['checked']} row(s). Report: {path}")
+
+    async def _probe(self, url: str, session: aiohttp.ClientSession):
+        """Return (status, location) for one hop without downloading the body."""
+        async with session.head(url, allow_redirects=False, timeout=TIMEOUT_SHORT) as resp:
+            status = resp.status
+            location = resp.headers.get("Location", "")
+        if status in (403, 405, 501):
+            # HEAD refused (some CDNs answer 403): GET but leave the body unread
+            async with session.get(url, allow_redirects=False, timeout=TIMEOUT_SHORT) as resp:
+                status = resp.status
+                location = resp.headers.get("Location", "")
+        return status, location
+
+    async def _check_row(self, item, session: aiohttp.ClientSession):
+        source = item["source"]
+        if not source.lower().startswith(("http://", "https://")):
+            source = "https://" + source.lstrip("/")
+        expected = item["expected"]
+        if expected and not expected.lower().startswith(("http://", "https://")):
+            expected = urljoin(source, expected)
+
+        chain = []
+        current = source
+        error = ""
+        seen = {current}
+        try:
+            for _ in range(MAX_REDIRECT_HOPS + 1):
+                status, location = await self._probe(current, session)
+                chain.append(status)
+                if status in REDIRECT_STATUSES and location:
+                    nxt = urljoin(current, location)
+                    if nxt in seen:
+                        error = "Redirect loop"
+                        break
+                    seen.add(nxt)
+                    current = nxt
+                    continue
+                break
+            else:
+                error = f"More than {MAX_REDIRECT_HOPS} redirects"
+        except aiohttp.ClientError as e:
+            error = f"Network error: {e}"
+        except asyncio.TimeoutError:
+            error = "Timeout"
+        except Exception as e:
+            error = str(e)
+
+        first_status = chain[0] if chain else None
+        final_status = chain[-1] if chain else None
+        hops = sum(1 for s in chain if s in REDIRECT_STATUSES)
+
+        target_match = None
+        if expected and not error:
+            target_match = normalize_url_for_compare(current) == normalize_url_for_compare(expected)
+
+        status_match = None
+        if item["expected_status"] and first_status is not None:
+            status_match = first_status == item["expected_status"]
+
+        if error:
+            verdict = "Error"
+        elif final_status is not None and final_status >= 400:
+            verdict = "Broken target"
+        elif hops == 0:
+            verdict = "No redirect"
+        elif target_match is False:
+            verdict = "Wrong target"
+        elif status_match is False:
+            verdict = "Wrong status"
+        else:
+            verdict = "OK"
+
+        return {
+            "row": item["row"],
+            "source": item["source"],
+            "expected": item["expected"],
+            "expected_status": item["expected_status"],
+            "first_status": first_status,
+            "final_url": current if chain else "",
+            "final_status": final_status,
+            "hops": hops,
+            "chain": " → ".join(str(s) for s in chain),
+            "target_match": target_match,
+            "status_match": status_match,
+            "verdict": verdict,
+            "error": error,
+        }
+
+    @staticmethod
+    def _report_row(r):
+        def flag(v):
+            return "" if v is None else ("TRUE" if v else "FALSE")
+
+        return [
+            r["row"], r["source"], r["expected"], r["expected_status"], r["first_status"],
+            r["final_url"], r["final_status"], r["hops"], r["chain"],
+            flag(r["target_match"]), flag(r["status_match"]), r["verdict"], r["error"],
+        ]
+
+    def _count(self, r):
+        self.stats["checked"] += 1
+        key = {
+            "OK": "ok",
+            "Wrong target": "wrong_target",
+            "Wrong status": "wrong_status",
+            "No redirect": "no_redirect",
+            "Broken target": "broken",
+            "Error": "errors",
+        }[r["verdict"]]
+        self.stats[key] += 1